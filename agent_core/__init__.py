@@ -58,6 +58,12 @@ from agent_core.core.impl.llm.cache import (
     BYTEPLUS_MAX_INPUT_TOKENS,
     GeminiCacheManager,
 )
+from agent_core.core.impl.llm.streaming import (
+    IncrementalJSONParser,
+    LatencyMetrics,
+    get_latency_metrics,
+)
+from agent_core.core.impl.llm.replay import LLMCassette
 from agent_core.core.action import Action, Observe
 from agent_core.core.event_stream import Event, EventRecord
 from agent_core.decorators import (
@@ -143,6 +149,10 @@ from agent_core.core.hooks import (
     # Usage reporting hooks
     UsageEventData,
     ReportUsageHook,
+    # Rate limiting hooks
+    RateLimitRequest,
+    AcquireRateLimitHook,
+    AcquireRateLimitAsyncHook,
 )
 # Implementations
 from agent_core.core.impl.action import (
@@ -159,7 +169,7 @@ from agent_core.core.impl.memory import (
     MemoryChunk,
     create_memory_processing_task,
 )
-from agent_core.core.impl.llm import LLMCallType
+from agent_core.core.impl.llm import LLMCallType, LLMPriority, llm_call_context
 from agent_core.core.impl.trigger import TriggerQueue
 from agent_core.core.impl.workflow_lock import WorkflowLockManager
 from agent_core.core.impl.event_stream import (
@@ -216,6 +226,7 @@ from agent_core.core.impl.skill import (
     Skill,
     SkillMetadata,
     SkillsConfig,
+    SkillIndex,
     SkillLoader,
     SkillManager,
     skill_manager,
@@ -278,6 +289,11 @@ __all__ = [
     "BytePlusContextOverflowError",
     "BYTEPLUS_MAX_INPUT_TOKENS",
     "GeminiCacheManager",
+    # Streaming
+    "IncrementalJSONParser",
+    "LatencyMetrics",
+    "get_latency_metrics",
+    "LLMCassette",
     # Action framework
     "Action",
     "Observe",
@@ -369,6 +385,8 @@ __all__ = [
     "MemoryChunk",
     "create_memory_processing_task",
     "LLMCallType",
+    "LLMPriority",
+    "llm_call_context",
     "TriggerQueue",
     "WorkflowLockManager",
     "EventStream",
@@ -418,6 +436,10 @@ __all__ = [
     # Usage reporting hooks
     "UsageEventData",
     "ReportUsageHook",
+    # Rate limiting hooks
+    "RateLimitRequest",
+    "AcquireRateLimitHook",
+    "AcquireRateLimitAsyncHook",
     # MCP
     "MCPServerConfig",
     "MCPConfig",
@@ -431,6 +453,7 @@ __all__ = [
     "Skill",
     "SkillMetadata",
     "SkillsConfig",
+    "SkillIndex",
     "SkillLoader",
     "SkillManager",
     "skill_manager",
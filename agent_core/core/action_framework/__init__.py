@@ -5,6 +5,7 @@ from agent_core.core.action_framework.registry import (
     ActionRegistry,
     ActionMetadata,
     RegisteredAction,
+    CompiledHandler,
     action,
     registry_instance,
     install_all_action_requirements,
@@ -23,6 +24,7 @@ __all__ = [
     "ActionRegistry",
     "ActionMetadata",
     "RegisteredAction",
+    "CompiledHandler",
     # Decorator
     "action",
     # Singleton instance
@@ -7,6 +7,7 @@ and provides platform-aware action lookup.
 """
 import functools
 import platform as platform_lib
+from types import CodeType
 from typing import List, Dict, Any, Optional, Callable, Union
 from dataclasses import dataclass, field
 import logging
@@ -92,6 +93,32 @@ class RegisteredAction:
     metadata: ActionMetadata
 
 
+@dataclass
+class CompiledHandler:
+    """
+    Precompiled view of a registered handler, cached by the registry.
+
+    Holds the stripped source text exposed to the rest of the system, the
+    code object compiled from it (used when the source has to be exec'd),
+    and the live callable captured by the @action decorator so internal
+    execution can skip the exec round trip entirely.
+    """
+    source: str
+    code: Optional[CodeType]
+    handler: Callable[..., Any]
+    version: int
+    error: Optional[str] = None
+
+
+def _extract_handler_source(handler: Callable[..., Any]) -> str:
+    """Return the decorator-free source of a handler (raises on failure)."""
+    # MCP handlers are created dynamically and carry their own source
+    if hasattr(handler, '_mcp_source_code'):
+        return handler._mcp_source_code
+    raw_code = inspect.getsource(handler)
+    return _strip_decorator(textwrap.dedent(raw_code))
+
+
 class ActionRegistry:
     """Singleton registry to hold all discovered actions."""
     _instance = None
@@ -106,6 +133,22 @@ class ActionRegistry:
     # }
     _registry: Dict[str, Dict[str, RegisteredAction]] = {}
 
+    # Precompiled handlers, same shape as _registry:
+    # { "logical_action_name": { "linux": CompiledHandler(...), ... } }
+    # Entries are built lazily and dropped whenever the action is re-registered
+    # (i.e. its action file is reloaded).
+    _handler_cache: Dict[str, Dict[str, CompiledHandler]] = {}
+    # Per-action version, bumped on every (re-)registration
+    _handler_versions: Dict[str, int] = {}
+
+    # Generation counter, bumped whenever an action is registered or
+    # unregistered. Memoized views below are only valid for the generation
+    # they were built in.
+    _generation: int = 0
+    _views_generation: int = -1
+    _json_cache: Dict[str, Dict[str, Any]] = {}
+    _json_list_cache: Optional[List[Dict[str, Any]]] = None
+
     def __new__(cls):
         # Ensure singleton pattern
         if cls._instance is None:
@@ -128,6 +171,116 @@ class ActionRegistry:
             self._registry[name][platform_key] = action_def
             logger.debug(f"Registered '{name}' for platform: '{platform_key}'")
 
+        self.invalidate_handlers(name)
+        self._bump_generation()
+
+    def unregister(self, name: str) -> bool:
+        """
+        Remove every platform implementation of an action.
+
+        Returns:
+            True if the action was registered, False otherwise.
+        """
+        if self._registry.pop(name, None) is None:
+            return False
+
+        self.invalidate_handlers(name)
+        self._bump_generation()
+        logger.debug(f"Unregistered '{name}'")
+        return True
+
+    @property
+    def generation(self) -> int:
+        """Current registry generation. Changes whenever the set of actions changes."""
+        return self._generation
+
+    def _bump_generation(self) -> None:
+        self._generation += 1
+
+    def _ensure_views_current(self) -> None:
+        """Drop memoized JSON views built for an older generation."""
+        if self._views_generation == self._generation:
+            return
+        self._json_cache.clear()
+        self._json_list_cache = None
+        self._views_generation = self._generation
+
+    # ------------------------------------------------------------------
+    # Precompiled handler cache
+    # ------------------------------------------------------------------
+
+    def invalidate_handlers(self, name: Optional[str] = None) -> None:
+        """
+        Drop cached compiled handlers.
+
+        Args:
+            name: Action to invalidate. When None, the whole cache is cleared.
+        """
+        if name is None:
+            for action_name in list(self._handler_cache.keys()):
+                self._handler_versions[action_name] = self._handler_versions.get(action_name, 0) + 1
+            self._handler_cache.clear()
+            return
+
+        self._handler_cache.pop(name, None)
+        self._handler_versions[name] = self._handler_versions.get(name, 0) + 1
+
+    def get_compiled_handler(self, name: str, platform_key: str) -> Optional[CompiledHandler]:
+        """
+        Return the precompiled handler for one platform implementation of an action.
+
+        Source extraction and compilation happen once per registration; later
+        calls are dictionary lookups.
+        """
+        impl = self._registry.get(name, {}).get(platform_key)
+        if impl is None:
+            return None
+
+        cached = self._handler_cache.get(name, {}).get(platform_key)
+        if cached is not None and cached.handler is impl.handler:
+            return cached
+
+        compiled = self._compile_handler(impl)
+        self._handler_cache.setdefault(name, {})[platform_key] = compiled
+        return compiled
+
+    def resolve_handler(self, name: str, code: str) -> Optional[Callable[..., Any]]:
+        """
+        Return the live callable registered for ``name`` whose source is ``code``.
+
+        Returns None when the action is unknown or the code was changed after it
+        was read from the registry, in which case callers must fall back to
+        executing the code string.
+        """
+        for platform_key in self._registry.get(name, {}):
+            compiled = self.get_compiled_handler(name, platform_key)
+            if compiled is not None and compiled.code is not None and compiled.source == code:
+                return compiled.handler
+        return None
+
+    def _compile_handler(self, impl: RegisteredAction) -> CompiledHandler:
+        """Extract, strip and compile the source of a registered handler."""
+        name = impl.metadata.name
+        code_obj: Optional[CodeType] = None
+        error: Optional[str] = None
+        try:
+            source = _extract_handler_source(impl.handler)
+            code_obj = compile(source, f"<action:{name}>", "exec")
+        except SyntaxError as e:
+            logger.warning(f"Could not compile source for action '{name}': {e}")
+        except Exception as e:
+            logger.error(f"Could not extract source for action '{name}': {e}")
+            error = str(e)
+            source = f"# Error extracting source code: {e}"
+
+        return CompiledHandler(
+            source=source,
+            code=code_obj,
+            handler=impl.handler,
+            version=self._handler_versions.get(name, 0),
+            error=error,
+        )
+
     def get_action_implementation(self, name: str, target_platform: Optional[str] = None) -> Optional[RegisteredAction]:
         """
         Retrieves the best fit action implementation.
@@ -193,22 +346,34 @@ class ActionRegistry:
         """
         Returns the registry flattened into JSON-compatible dictionaries matching legacy requirements.
         It extracts the actual source code of the functions using the 'inspect' module.
+
+        The flattened list is memoized per registry generation. The returned list
+        is a fresh copy, but the action dictionaries are shared and must be
+        treated as read-only.
         """
-        json_actions_list = []
+        self._ensure_views_current()
 
-        for logical_name, platform_impls in self._registry.items():
-            action_json = self._get_action_as_json(platform_impls=platform_impls)
-            json_actions_list.append(action_json)
+        if self._json_list_cache is None:
+            self._json_list_cache = [
+                self.find_action_by_name(logical_name)
+                for logical_name in self._registry.keys()
+            ]
 
-        return json_actions_list
+        return list(self._json_list_cache)
 
     def find_action_by_name(self, action_name: str) -> Optional[Dict[str, Any]]:
-        """Find an action by name and return its JSON representation."""
+        """Find an action by name and return its (shared, read-only) JSON representation."""
         if action_name not in self._registry:
             return None
 
-        platform_impls = self._registry[action_name]
-        return self._get_action_as_json(platform_impls=platform_impls)
+        self._ensure_views_current()
+
+        action_json = self._json_cache.get(action_name)
+        if action_json is None:
+            platform_impls = self._registry[action_name]
+            action_json = self._get_action_as_json(platform_impls=platform_impls)
+            self._json_cache[action_name] = action_json
+        return action_json
 
     def _get_action_as_json(self, platform_impls) -> Dict[str, Any]:
         """Convert a platform_impls dict to JSON-compatible dictionary."""
@@ -221,18 +386,9 @@ class ActionRegistry:
         meta = main_impl.metadata
         logical_name = meta.name
 
-        # 1. Extract source code for the main implementation
-        # Check for stored source code first (used by MCP handlers which are dynamically created)
-        if hasattr(main_impl.handler, '_mcp_source_code'):
-            main_code_str = main_impl.handler._mcp_source_code
-        else:
-            try:
-                raw_code = inspect.getsource(main_impl.handler)
-                dedented_code = textwrap.dedent(raw_code)
-                main_code_str = _strip_decorator(dedented_code)
-            except Exception as e:
-                logger.error(f"Could not extract source for action '{logical_name}': {e}")
-                main_code_str = f"# Error extracting source code: {e}"
+        # 1. Source code for the main implementation (precompiled and cached)
+        main_key = next(k for k, v in platform_impls.items() if v is main_impl)
+        main_code_str = self.get_compiled_handler(logical_name, main_key).source
 
         # 2. Build the base JSON structure with required hardcoded fields
         action_json = {
@@ -257,16 +413,12 @@ class ActionRegistry:
             if impl == main_impl:
                 continue
 
-            if hasattr(impl.handler, '_mcp_source_code'):
-                override_code_str = impl.handler._mcp_source_code
-            else:
-                try:
-                    override_raw = inspect.getsource(impl.handler)
-                    override_dedented = textwrap.dedent(override_raw)
-                    override_code_str = _strip_decorator(override_dedented)
-                except Exception as e:
-                    logger.warning(f"Could not extract override source for {logical_name} on {platform_key}: {e}")
-                    continue
+            compiled = self.get_compiled_handler(logical_name, platform_key)
+            if compiled is None or compiled.error is not None:
+                error = compiled.error if compiled else "implementation not found"
+                logger.warning(f"Could not extract override source for {logical_name} on {platform_key}: {error}")
+                continue
+            override_code_str = compiled.source
 
             action_json["platform_overrides"][platform_key] = {
                 "code": override_code_str
@@ -110,6 +110,15 @@ class DatabaseInterface:
 
         return actions
 
+    def get_actions_generation(self) -> int:
+        """
+        Return the action registry generation.
+
+        The value changes whenever actions are registered or unregistered, so
+        callers can key their own memoized views of the action set on it.
+        """
+        return registry_instance.generation
+
     def get_action(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Fetch a stored action by case-insensitive name match.
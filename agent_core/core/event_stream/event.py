@@ -111,12 +111,16 @@ class EventRecord:
         ts: Timestamp for this record
         repeat_count: Number of times this event was repeated (for deduplication)
         _cached_tokens: Cached token count (computed lazily)
+        _cached_line: Memoized compact_line() output with the repeat_count it was built for
+        _journal_seq: Position assigned by the session journal (None if not journaled)
     """
 
     event: Event
     ts: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     repeat_count: int = 1
     _cached_tokens: int | None = field(default=None, repr=False)
+    _cached_line: tuple[int, str] | None = field(default=None, repr=False, compare=False)
+    _journal_seq: int | None = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the event record to a dictionary for persistence."""
@@ -146,13 +150,18 @@ class EventRecord:
         Generate a compact single-line representation of this event.
 
         Format: "HH:MM:SS [kind]: message" with optional " xN" suffix for repeats.
+        The line is built once and memoized; it is rebuilt if repeat_count changes.
 
         Returns:
             Compact string representation
         """
+        cached = self._cached_line
+        if cached is not None and cached[0] == self.repeat_count:
+            return cached[1]
         t = self.ts.strftime("%H:%M:%S")
-        sev = self.event.severity
         k = self.event.kind
         msg = self.event.message
         suffix = f" x{self.repeat_count}" if self.repeat_count > 1 else ""
-        return f"{t} [{k}]: {msg}{suffix}"
+        line = f"{t} [{k}]: {msg}{suffix}"
+        self._cached_line = (self.repeat_count, line)
+        return line
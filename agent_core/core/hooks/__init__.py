@@ -46,6 +46,11 @@ from agent_core.core.hooks.types import (
     ReportUsageHook,
     # Database logging hooks
     LogToDbHook,
+    # Rate limiting hooks
+    RateLimitRequest,
+    RateLimitSettleHook,
+    AcquireRateLimitHook,
+    AcquireRateLimitAsyncHook,
 )
 
 __all__ = [
@@ -75,4 +80,9 @@ __all__ = [
     "ReportUsageHook",
     # Database logging hooks
     "LogToDbHook",
+    # Rate limiting hooks
+    "RateLimitRequest",
+    "RateLimitSettleHook",
+    "AcquireRateLimitHook",
+    "AcquireRateLimitAsyncHook",
 ]
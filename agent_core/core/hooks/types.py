@@ -12,6 +12,7 @@ Hook Categories:
     - Event hooks: Event logging, event filtering
     - Context hooks: Conversation history, user info
     - State hooks: Team info, conversation state
+    - Rate limiting hooks: Admission of LLM calls under provider limits
 
 All hooks are optional - if not provided, the component operates in
 local-only mode (suitable for CraftBot).
@@ -293,3 +294,58 @@ Args:
 Used by both CraftBot and CraftBot when db_interface is provided.
 The runtime wrapper creates this hook from the db_interface.
 """
+
+
+# =============================================================================
+# Rate Limiting Hooks (LLM-specific)
+# =============================================================================
+
+class RateLimitRequest:
+    """Data class describing an LLM call awaiting admission by a rate limiter."""
+
+    def __init__(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        priority: str = "normal",
+        session_id: Optional[str] = None,
+        call_type: Optional[str] = None,
+    ):
+        self.system_prompt = system_prompt
+        self.user_prompt = user_prompt
+        self.priority = priority
+        self.session_id = session_id
+        self.call_type = call_type
+
+
+RateLimitSettleHook = Callable[[int], None]
+"""
+Reports the tokens an admitted LLM call actually used.
+
+Args:
+    tokens_used: Input + output tokens of the call (0 if it failed or was
+        cancelled before usage was known).
+
+Called exactly once per admitted call.
+"""
+
+AcquireRateLimitHook = Callable[[RateLimitRequest], Optional[RateLimitSettleHook]]
+"""
+Blocks the calling thread until an LLM call may be sent.
+
+Args:
+    request: RateLimitRequest with the prompts, priority and session.
+
+Returns:
+    A settle callback to report actual usage, or None if the call is not
+    rate limited.
+
+Used for synchronous calls (generate_response, session calls).
+"""
+
+AcquireRateLimitAsyncHook = Callable[[RateLimitRequest], Awaitable[Optional[RateLimitSettleHook]]]
+"""
+Async variant of AcquireRateLimitHook for streamed and async calls.
+
+Cancelling the awaiting task must withdraw the request from the limiter.
+"""
@@ -6,7 +6,8 @@ This module provides the ActionExecutor class that handles both sandboxed
 (isolated virtual environment) and internal (in-process) action execution.
 
 Features:
-- Sandboxed execution in ephemeral virtual environments
+- Sandboxed execution in a persistent virtual environment
+- Warm sandbox worker pool (no interpreter start-up per action)
 - Internal execution via ThreadPoolExecutor
 - Support for PyInstaller frozen executables
 - GUI mode execution via optional hooks
@@ -14,7 +15,10 @@ Features:
 """
 
 import asyncio
+import contextvars
+import functools
 import importlib
+import inspect
 import json
 import os
 import subprocess
@@ -26,6 +30,8 @@ from pathlib import Path
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Optional
 
+from agent_core.core.action_framework.registry import registry_instance
+from agent_core.core.impl.action.sandbox_pool import get_sandbox_pool
 from agent_core.utils.logger import logger
 
 # ============================================
@@ -304,6 +310,23 @@ def _restore_worker_stdio(saved_stdout, saved_stderr):
     os.close(saved_stderr)
 
 
+def _ensure_persistent_venv_quiet() -> Path:
+    """
+    Create the persistent venv with stdout/stderr suppressed.
+    Runs in a SEPARATE PROCESS via ProcessPoolExecutor, like the action workers.
+    """
+    saved_stdout, saved_stderr = _suppress_worker_stdio()
+    try:
+        return _ensure_persistent_venv()
+    finally:
+        _restore_worker_stdio(saved_stdout, saved_stderr)
+
+
+def _sandbox_python_bin() -> Path:
+    """Python binary of the persistent venv, used by the sandbox worker pool."""
+    return PROCESS_POOL.submit(_ensure_persistent_venv_quiet).result()
+
+
 def _atomic_action_venv_process(
     action_code: str,
     input_data: dict,
@@ -512,6 +535,43 @@ except Exception as e:
             return {"status": "error", "message": str(e)}
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_action_code(action_code: str):
+    """Compile an action code string once; repeated executions reuse the code object."""
+    return compile(action_code, "<action>", "exec")
+
+
+def _resolve_action_function(action_name: str, action_code: str, input_data: dict) -> Callable:
+    """
+    Resolve the callable to run for an internal action.
+
+    When ``action_code`` is the unmodified source of a registered action, the
+    live function captured by the @action decorator is returned directly from
+    the registry's precompiled handler cache. Otherwise (custom or edited code)
+    the code is exec'd, using a cached code object, to define the function.
+    """
+    handler = registry_instance.resolve_handler(action_name, action_code)
+    if handler is not None:
+        logger.debug(f"Using precompiled handler for action '{action_name}'")
+        return handler
+
+    local_ns = {
+        "input_data": input_data,
+        "json": json,
+        "asyncio": asyncio,
+    }
+    pre_exec_keys = set(local_ns.keys())
+
+    exec(_compile_action_code(action_code), local_ns, local_ns)
+
+    for key, value in local_ns.items():
+        if key not in pre_exec_keys and key != '__builtins__' and inspect.isfunction(value):
+            logger.debug(f"Found action function: '{key}'")
+            return value
+
+    raise ValueError("The action_code string did not define a callable Python function.")
+
+
 def _atomic_action_internal(
     action_name: str,
     action_code: str,
@@ -527,26 +587,7 @@ def _atomic_action_internal(
         if mode == "GUI" and action_name != "switch to CLI mode" and _gui_execute_hook:
             return _gui_execute_hook(_get_gui_target(), action_code, input_data, mode)
 
-        import inspect
-
-        local_ns = {
-            "input_data": input_data,
-            "json": json,
-            "asyncio": asyncio,
-        }
-        pre_exec_keys = set(local_ns.keys())
-
-        exec(action_code, local_ns, local_ns)
-
-        function_to_call = None
-        for key, value in local_ns.items():
-            if key not in pre_exec_keys and key != '__builtins__' and inspect.isfunction(value):
-                function_to_call = value
-                logger.debug(f"Found action function: '{key}'")
-                break
-
-        if function_to_call is None:
-            raise ValueError("The action_code string did not define a callable Python function.")
+        function_to_call = _resolve_action_function(action_name, action_code, input_data)
 
         execution_result = function_to_call(input_data)
         return execution_result
@@ -571,8 +612,10 @@ async def _atomic_action_internal_async(
         # GUI mode - delegate to GUI handler hook (sync, run in executor)
         if mode == "GUI" and action_name != "switch to CLI mode" and _gui_execute_hook:
             loop = asyncio.get_running_loop()
+            # copy_context: the hook sees the calling session's state
             return await loop.run_in_executor(
                 THREAD_POOL,
+                contextvars.copy_context().run,
                 _gui_execute_hook,
                 _get_gui_target(),
                 action_code,
@@ -580,26 +623,7 @@ async def _atomic_action_internal_async(
                 mode,
             )
 
-        import inspect
-
-        local_ns = {
-            "input_data": input_data,
-            "json": json,
-            "asyncio": asyncio,
-        }
-        pre_exec_keys = set(local_ns.keys())
-
-        exec(action_code, local_ns, local_ns)
-
-        function_to_call = None
-        for key, value in local_ns.items():
-            if key not in pre_exec_keys and key != '__builtins__' and inspect.isfunction(value):
-                function_to_call = value
-                logger.debug(f"Found action function: '{key}'")
-                break
-
-        if function_to_call is None:
-            raise ValueError("The action_code string did not define a callable Python function.")
+        function_to_call = _resolve_action_function(action_name, action_code, input_data)
 
         # Check if the function is async (coroutine function)
         if inspect.iscoroutinefunction(function_to_call):
@@ -611,6 +635,7 @@ async def _atomic_action_internal_async(
             loop = asyncio.get_running_loop()
             execution_result = await loop.run_in_executor(
                 THREAD_POOL,
+                contextvars.copy_context().run,
                 function_to_call,
                 input_data,
             )
@@ -630,7 +655,7 @@ class ActionExecutor:
     Executes actions in sandboxed or internal modes.
 
     Supports:
-    - Sandboxed execution in ephemeral virtual environments
+    - Sandboxed execution in a persistent virtual environment (warm worker pool)
     - Internal execution via ThreadPoolExecutor
     - GUI mode execution via optional hooks
     - Automatic requirement installation
@@ -687,19 +712,29 @@ class ActionExecutor:
         elif execution_mode == "sandboxed":
             requirements = getattr(action, "requirements", [])
             loop = asyncio.get_running_loop()
-            try:
-                result = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        PROCESS_POOL,
-                        _atomic_action_venv_process,
-                        action.code,
-                        input_data,
-                        effective_timeout,
-                        mode,
-                        requirements,
-                    ),
-                    timeout=effective_timeout + 5,
+            if mode == "GUI" and _gui_execute_hook:
+                # GUI actions are delegated to the GUI hook from a pool process
+                call = loop.run_in_executor(
+                    PROCESS_POOL,
+                    _atomic_action_venv_process,
+                    action.code,
+                    input_data,
+                    effective_timeout,
+                    mode,
+                    requirements,
+                )
+            else:
+                # Warm venv workers: no interpreter start-up per action
+                call = loop.run_in_executor(
+                    THREAD_POOL,
+                    get_sandbox_pool(_sandbox_python_bin).run,
+                    action.code,
+                    input_data,
+                    effective_timeout,
+                    requirements,
                 )
+            try:
+                result = await asyncio.wait_for(call, timeout=effective_timeout + 5)
             except asyncio.TimeoutError:
                 return {"status": "error", "message": f"Execution timed out after {effective_timeout}s while running sandboxed action."}
         else:
@@ -7,7 +7,7 @@ retrieving, and searching actions via DatabaseInterface.
 """
 
 import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from agent_core.core.action import Action
 from agent_core.decorators import profile, OperationCategory
@@ -31,6 +31,34 @@ class ActionLibrary:
         self.llm_interface = llm_interface
         self.db_interface = db_interface
 
+        # Hydrated Action objects, memoized per action-set generation
+        self._cache_generation: Optional[int] = None
+        self._action_cache: Dict[str, Action] = {}
+        self._default_actions_cache: Optional[List[Action]] = None
+        self._default_names_cache: Optional[frozenset[str]] = None
+
+    def _cache_is_valid(self) -> bool:
+        """
+        Sync the memoized views with the database's action generation.
+
+        Returns:
+            bool: True if memoization is available for the current db_interface.
+        """
+        get_generation = getattr(self.db_interface, "get_actions_generation", None)
+        if get_generation is None:
+            return False
+
+        generation = get_generation()
+        if generation != self._cache_generation:
+            self._clear_cache()
+            self._cache_generation = generation
+        return True
+
+    def _clear_cache(self) -> None:
+        self._action_cache.clear()
+        self._default_actions_cache = None
+        self._default_names_cache = None
+
     def store_action(self, action: Action):
         """
         Persist an action definition and stamp its update time.
@@ -41,6 +69,7 @@ class ActionLibrary:
         action_dict = action.to_dict()
         action_dict["updatedAt"] = datetime.datetime.utcnow().isoformat()
         self.db_interface.store_action(action_dict)
+        self._clear_cache()
 
     @profile("action_library_retrieve_action", OperationCategory.ACTION_LIBRARY)
     def retrieve_action(self, action_name: str) -> Optional[Action]:
@@ -53,10 +82,20 @@ class ActionLibrary:
         Returns:
             Optional[Action]: Hydrated action instance if found, otherwise ``None``.
         """
+        cacheable = self._cache_is_valid()
+        if cacheable:
+            cached = self._action_cache.get(action_name)
+            if cached is not None:
+                return cached
+
         action_data = self.db_interface.get_action(action_name)
-        if action_data:
-            return Action.from_dict(action_data)
-        return None
+        if not action_data:
+            return None
+
+        action = Action.from_dict(action_data)
+        if cacheable:
+            self._action_cache[action_name] = action
+        return action
 
     @profile("action_library_retrieve_default_action", OperationCategory.ACTION_LIBRARY)
     def retrieve_default_action(self) -> List[Action]:
@@ -67,15 +106,28 @@ class ActionLibrary:
         Returns:
             List[Action]: All default actions stored in the database.
         """
-        docs = self.db_interface.list_actions(default=True)
-        return [Action.from_dict(doc) for doc in docs]
+        cacheable = self._cache_is_valid()
+        if cacheable and self._default_actions_cache is not None:
+            return list(self._default_actions_cache)
 
-    def get_default_action_names(self) -> set[str]:
-        return {
-            action.name
-            for action in self.retrieve_default_action()
-        }
+        docs = self.db_interface.list_actions(default=True)
+        actions = [Action.from_dict(doc) for doc in docs]
+        if cacheable:
+            self._default_actions_cache = actions
+            return list(actions)
+        return actions
+
+    def get_default_action_names(self) -> frozenset[str]:
+        cacheable = self._cache_is_valid()
+        if cacheable and self._default_names_cache is not None:
+            return self._default_names_cache
+
+        names = frozenset(action.name for action in self.retrieve_default_action())
+        if cacheable:
+            self._default_names_cache = names
+        return names
 
     def delete_action(self, action_name: str):
         """Deletes an action from storage."""
         self.db_interface.delete_action(action_name)
+        self._clear_cache()
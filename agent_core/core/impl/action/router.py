@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 import ast
+import re
 from typing import Optional, List, Dict, Any, Tuple
 
 from agent_core.core.state import get_state, get_session_or_none
@@ -17,8 +18,9 @@ from agent_core.decorators import profile, OperationCategory
 from agent_core.core.protocols.action import ActionLibraryProtocol
 from agent_core.core.protocols.context import ContextEngineProtocol
 from agent_core.core.protocols.llm import LLMInterfaceProtocol
-from agent_core.core.impl.llm import LLMCallType
+from agent_core.core.impl.llm import LLMCallType, LLMInterface
 from agent_core.core.impl.llm.errors import LLMConsecutiveFailureError
+from agent_core.core.impl.llm.streaming import IncrementalJSONParser
 from agent_core.core.prompts import (
     SELECT_ACTION_PROMPT,
     SELECT_ACTION_IN_TASK_PROMPT,
@@ -453,6 +455,7 @@ class ActionRouter:
                 static_prompt=static_prompt,
                 call_type=LLMCallType.GUI_ACTION_SELECTION,
                 session_id=session_id,
+                stop_on_invalid_action=True,
             )
 
             # Check for GUI format errors
@@ -499,6 +502,7 @@ class ActionRouter:
         static_prompt: Optional[str] = None,
         call_type: str = LLMCallType.ACTION_SELECTION,
         session_id: Optional[str] = None,
+        stop_on_invalid_action: bool = False,
     ) -> Dict[str, Any]:
         """
         Prompt the LLM for an action decision with session caching support.
@@ -509,6 +513,9 @@ class ActionRouter:
             static_prompt: Optional static portion for caching.
             call_type: Type of LLM call for cache keying.
             session_id: Optional session ID for session-specific state lookup.
+            stop_on_invalid_action: For single-action responses, stop a streamed
+                response as soon as its ``action_name`` is unknown and return
+                the partial decision (the caller retries on invalid names).
         """
         max_retries = 3
         last_error: Optional[Exception] = None
@@ -536,6 +543,7 @@ class ActionRouter:
             )
 
             raw_response = None
+            streamed_decision = None
 
             try:
                 # Use session cache if we're in a task context AND session is registered
@@ -589,10 +597,14 @@ class ActionRouter:
                             self.context_engine.mark_event_stream_synced(call_type, session_id=effective_session_id)
                     else:
                         # No session registered (simple task) - use prefix cache / regular response
-                        raw_response = await self.llm_interface.generate_response_async(system_prompt, current_prompt)
+                        raw_response, streamed_decision = await self._stream_decision(
+                            system_prompt, current_prompt, stop_on_invalid_action
+                        )
                 else:
                     # Not in task context - use regular response
-                    raw_response = await self.llm_interface.generate_response_async(system_prompt, current_prompt)
+                    raw_response, streamed_decision = await self._stream_decision(
+                        system_prompt, current_prompt, stop_on_invalid_action
+                    )
 
                 # Validate response before parsing
                 if not raw_response or (isinstance(raw_response, str) and not raw_response.strip()):
@@ -601,7 +613,10 @@ class ActionRouter:
                         f"System prompt length: {len(system_prompt)}, User prompt length: {len(current_prompt)}"
                     )
                 
-                decision, parse_error = self._parse_action_decision(raw_response)
+                if streamed_decision is not None:
+                    decision, parse_error = streamed_decision, None
+                else:
+                    decision, parse_error = self._parse_action_decision(raw_response)
                 if decision is not None:
                     decision.setdefault("parameters", {})
                     decision["parameters"] = self._ensure_parameters(decision.get("parameters"))
@@ -650,6 +665,85 @@ class ActionRouter:
             raise last_error
         raise ValueError("Unable to parse LLM decision")
 
+    async def _stream_decision(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        stop_on_invalid_action: bool = False,
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Stream the LLM response through an incremental JSON parser.
+
+        Each ``action_name`` is checked against the action library, and each
+        ``parameters`` object against the action's input schema, as soon as it
+        is complete rather than after the whole response has arrived.
+
+        Returns:
+            Tuple of (raw_response, decision). ``decision`` is None when the
+            response is not a single JSON object; the caller then parses
+            ``raw_response`` itself.
+        """
+        stream = getattr(self.llm_interface, "generate_response_stream", None)
+        if stream is None:
+            raw_response = await self.llm_interface.generate_response_async(system_prompt, user_prompt)
+            return raw_response, None
+
+        parser = IncrementalJSONParser()
+        parts: List[str] = []
+        known_actions: Dict[str, Any] = {}
+        responses = stream(system_prompt, user_prompt)
+        try:
+            async for delta in responses:
+                parts.append(delta)
+                for path, value in parser.feed(delta):
+                    # Only {"action_name", "parameters"} and {"actions": [{...}]} fields
+                    if path[-1:] not in (("action_name",), ("parameters",)):
+                        continue
+                    if len(path) != 1 and (len(path) != 3 or path[0] != "actions"):
+                        continue
+                    if path[-1] == "action_name":
+                        if not isinstance(value, str) or not value:
+                            continue
+                        act = self.action_library.retrieve_action(value)
+                        known_actions[path[:-1]] = act
+                        if act is not None:
+                            continue
+                        logger.warning(f"[ACTION ROUTER] Streamed response selected unknown action '{value}'")
+                        if stop_on_invalid_action and path == ("action_name",):
+                            # The caller rejects this decision anyway - skip the rest of the response
+                            decision = dict(parser.partial)
+                            decision.setdefault("parameters", {})
+                            return "".join(parts), decision
+                    else:
+                        self._check_streamed_parameters(known_actions.get(path[:-1]), value)
+        finally:
+            await responses.aclose()
+
+        # Streamed responses are not cleaned by the LLM interface; strip code fences here
+        raw_response = re.sub(LLMInterface._CODE_BLOCK_RE, "", "".join(parts).strip())
+        if parser.done and isinstance(parser.result, dict):
+            return raw_response, parser.result
+        if parser.failed:
+            logger.debug(f"[ACTION ROUTER] Streamed response is not valid JSON ({parser.error}), parsing full text")
+        return raw_response, None
+
+    def _check_streamed_parameters(self, act: Any, parameters: Any) -> None:
+        """Log parameters that do not match the selected action's input schema."""
+        if not isinstance(parameters, dict):
+            logger.warning(
+                f"[ACTION ROUTER] Streamed parameters are {type(parameters).__name__}, expected an object"
+            )
+            return
+        input_schema = getattr(act, "input_schema", None) if act is not None else None
+        if not isinstance(input_schema, dict) or not input_schema:
+            return
+        unknown = [name for name in parameters if name not in input_schema]
+        if unknown:
+            logger.warning(
+                f"[ACTION ROUTER] Streamed parameters {unknown} are not in the input schema "
+                f"of action '{getattr(act, 'name', '')}'"
+            )
+
     def _parse_action_decision(self, raw: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         # Check for empty or None response from LLM
         if not raw or (isinstance(raw, str) and not raw.strip()):
@@ -0,0 +1,551 @@
+# -*- coding: utf-8 -*-
+"""
+Warm worker pool for sandboxed (venv) action execution.
+
+Spawning a fresh venv interpreter per sandboxed action makes interpreter
+start-up and imports dominate short actions. SandboxWorkerPool keeps a few
+long-lived worker processes running inside the persistent sandbox venv:
+
+- Requests are JSON-RPC 2.0 messages, one per line, over the worker's pipes.
+- Each action runs in a fresh namespace, so actions cannot see each other's
+  globals, but modules they import stay warm in ``sys.modules``.
+- A worker's stdout/stderr (fd 1/2, so C-level output too) are redirected to
+  per-worker capture files during a call; the protocol uses private copies
+  of the original pipes, so action output can never corrupt it.
+- Workers are recycled after ``max_calls`` calls, when they crash, and when
+  a call times out. A timed-out call is killed and reported exactly like the
+  previous one-process-per-call implementation.
+- "Requirement already installed" decisions are cached for the lifetime of
+  the pool, and checked inside a warm worker instead of via ``pip show``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import json
+import queue
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+from agent_core.utils.logger import logger
+
+# Number of warm workers kept alive
+SANDBOX_POOL_SIZE = 2
+# Recycle a worker after this many calls (bounds leaked module state)
+SANDBOX_WORKER_MAX_CALLS = 50
+# Seconds to wait for a freshly spawned worker to report ready
+SANDBOX_WORKER_START_TIMEOUT = 30
+
+# Worker program executed by the venv interpreter. Stdlib only.
+_WORKER_SOURCE = r'''
+import builtins
+import importlib
+import importlib.metadata
+import json
+import os
+import sys
+import traceback
+
+# Private copies of the protocol pipes; fd 0/1/2 belong to the action.
+_rpc_in = os.fdopen(os.dup(0), "r", encoding="utf-8")
+_rpc_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+_devnull = os.open(os.devnull, os.O_RDWR)
+os.dup2(_devnull, 0)
+os.dup2(_devnull, 1)
+os.dup2(_devnull, 2)
+
+_OUT_PATH, _ERR_PATH = sys.argv[1], sys.argv[2]
+
+
+def _reply(msg_id, result=None, error=None):
+    msg = {"jsonrpc": "2.0", "id": msg_id}
+    if error is not None:
+        msg["error"] = {"code": -32000, "message": error}
+    else:
+        msg["result"] = result
+    _rpc_out.write(json.dumps(msg) + "\n")
+    _rpc_out.flush()
+
+
+def _run_action(code, input_data):
+    """Mirror of the one-shot action script; returns the process-style exit code."""
+    namespace = {
+        "__name__": "__main__",
+        "__builtins__": builtins,
+        "json": json,
+        "sys": sys,
+        "input_data": input_data,
+    }
+    try:
+        exec(compile(code, "action.py", "exec"), namespace)
+
+        func = None
+        for name, obj in list(namespace.items()):
+            if callable(obj) and not name.startswith("_") and name not in ("input_data", "json", "sys"):
+                func = obj
+                break
+
+        if func is None:
+            if "output" in namespace:
+                print(namespace["output"])
+                return 0
+            return 1
+
+        try:
+            result = func(input_data)
+            if isinstance(result, dict):
+                print(json.dumps(result, ensure_ascii=False))
+            else:
+                print(str(result))
+            return 0
+        except Exception as e:
+            print("Execution failed: " + str(e) + "\n" + traceback.format_exc(), file=sys.stderr)
+            return 1
+    except SystemExit as e:
+        code = e.code
+        if code is None:
+            return 0
+        if isinstance(code, int):
+            return code
+        print(code, file=sys.stderr)
+        return 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+
+
+def _capture_and_run(code, input_data):
+    out = open(_OUT_PATH, "w", encoding="utf-8")
+    err = open(_ERR_PATH, "w", encoding="utf-8")
+    try:
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        try:
+            return _run_action(code, input_data)
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(_devnull, 1)
+            os.dup2(_devnull, 2)
+    finally:
+        out.close()
+        err.close()
+
+
+def _missing_distributions(names):
+    importlib.invalidate_caches()
+    missing = []
+    for name in names:
+        try:
+            importlib.metadata.distribution(name)
+        except importlib.metadata.PackageNotFoundError:
+            missing.append(name)
+    return missing
+
+
+_reply(None, {"ready": True, "pid": os.getpid()})
+for line in _rpc_in:
+    if not line.strip():
+        continue
+    try:
+        request = json.loads(line)
+    except ValueError:
+        continue
+    msg_id = request.get("id")
+    params = request.get("params") or {}
+    try:
+        if request.get("method") == "run":
+            importlib.invalidate_caches()
+            returncode = _capture_and_run(params["code"], params.get("input_data"))
+            _reply(msg_id, {"returncode": returncode})
+        elif request.get("method") == "missing_distributions":
+            _reply(msg_id, {"missing": _missing_distributions(params.get("names", []))})
+        elif request.get("method") == "ping":
+            _reply(msg_id, {"pong": True})
+        else:
+            _reply(msg_id, error="unknown method")
+    except BaseException as e:
+        _reply(msg_id, error=repr(e))
+'''
+
+# Split a requirement spec ("pkg[extra]>=1.0; marker") down to its distribution name
+_REQUIREMENT_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+class SandboxWorkerError(RuntimeError):
+    """Raised when a sandbox worker dies or stops responding."""
+
+
+class _SandboxWorker:
+    """One long-lived interpreter in the sandbox venv, driven over JSON-RPC."""
+
+    def __init__(self, python_bin: Path, worker_script: Path):
+        self.calls = 0
+        self._ids = itertools.count(1)
+        self._responses: "queue.Queue[Optional[dict]]" = queue.Queue()
+        self._dir = Path(tempfile.mkdtemp(prefix="sandbox_worker_"))
+        self.out_path = self._dir / "stdout.txt"
+        self.err_path = self._dir / "stderr.txt"
+
+        self.proc = subprocess.Popen(
+            [str(python_bin), str(worker_script), str(self.out_path), str(self.err_path)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self._reader = threading.Thread(
+            target=self._read_responses, name=f"sandbox_worker_reader:{self.proc.pid}", daemon=True
+        )
+        self._reader.start()
+
+        ready = self._next_response(SANDBOX_WORKER_START_TIMEOUT)
+        if not ready or not (ready.get("result") or {}).get("ready"):
+            self.kill()
+            raise SandboxWorkerError("Sandbox worker failed to start")
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def call(self, method: str, params: dict, timeout: Optional[float]) -> dict:
+        """
+        Send one request and wait for its response.
+
+        Raises:
+            subprocess.TimeoutExpired: No response within ``timeout``.
+            SandboxWorkerError: The worker exited before responding.
+            TypeError, ValueError: ``params`` is not JSON-serializable (nothing
+                is sent, so the worker stays usable).
+        """
+        msg_id = next(self._ids)
+        request = {"jsonrpc": "2.0", "id": msg_id, "method": method, "params": params}
+        line = json.dumps(request) + "\n"
+        try:
+            self.proc.stdin.write(line)
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as e:
+            raise SandboxWorkerError(f"Sandbox worker pipe closed: {e}")
+
+        self.calls += 1
+        response = self._next_response(timeout)
+        if response is None:
+            raise SandboxWorkerError("Sandbox worker exited unexpectedly")
+        if "error" in response:
+            raise SandboxWorkerError(response["error"].get("message", "unknown error"))
+        return response.get("result") or {}
+
+    def read_output(self) -> Dict[str, str]:
+        """Read what the last call wrote to stdout/stderr."""
+        def _read(path: Path) -> str:
+            try:
+                return path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                return ""
+        return {"stdout": _read(self.out_path), "stderr": _read(self.err_path)}
+
+    def kill(self) -> None:
+        """Terminate the worker process and remove its capture files."""
+        try:
+            if self.proc.poll() is None:
+                self.proc.kill()
+            self.proc.wait(timeout=5)
+        except Exception:
+            pass
+        for stream in (self.proc.stdin, self.proc.stdout):
+            try:
+                stream.close()
+            except Exception:
+                pass
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _next_response(self, timeout: Optional[float]) -> Optional[dict]:
+        try:
+            return self._responses.get(timeout=timeout)
+        except queue.Empty:
+            raise subprocess.TimeoutExpired(cmd="sandbox_worker", timeout=timeout)
+
+    def _read_responses(self) -> None:
+        try:
+            for line in self.proc.stdout:
+                try:
+                    self._responses.put(json.loads(line))
+                except ValueError:
+                    continue
+        except (OSError, ValueError):
+            pass
+        # EOF: the worker exited
+        self._responses.put(None)
+
+
+class SandboxWorkerPool:
+    """
+    Pool of warm sandbox workers.
+
+    ``run()`` is blocking and thread-safe; ActionExecutor calls it from its
+    thread pool so the event loop is never blocked.
+    """
+
+    def __init__(
+        self,
+        python_bin_factory: Callable[[], Path],
+        size: int = SANDBOX_POOL_SIZE,
+        max_calls: int = SANDBOX_WORKER_MAX_CALLS,
+    ):
+        self._python_bin_factory = python_bin_factory
+        self._python_bin: Optional[Path] = None
+        self._worker_script: Optional[Path] = None
+        self.size = max(1, size)
+        self.max_calls = max(1, max_calls)
+
+        self._cond = threading.Condition()
+        self._idle: List[_SandboxWorker] = []
+        self._total = 0
+        self._closed = False
+
+        self._installed: Set[str] = set()
+        self._install_lock = threading.Lock()
+
+    # ─────────────────────── Public API ───────────────────────────────────
+
+    def run(
+        self,
+        action_code: str,
+        input_data: dict,
+        timeout: int,
+        requirements: Optional[List[str]] = None,
+    ) -> dict:
+        """
+        Execute an action in a warm worker.
+
+        Returns:
+            Dict with "stdout", "stderr" and "returncode", identical in shape
+            (and in timeout behaviour) to the one-process-per-call path.
+            Waiting for a free worker counts against ``timeout``; if it runs
+            out first the action is not run at all.
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            if requirements:
+                self.ensure_requirements(requirements, deadline=deadline)
+
+            worker = self._acquire(deadline)
+        except subprocess.TimeoutExpired:
+            return {"stdout": "", "stderr": "Execution timed out", "returncode": -1}
+        except Exception as e:
+            return {"stdout": "", "stderr": f"Execution failed: {e}", "returncode": -1}
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            # Spawning the worker used up the budget
+            self._release(worker)
+            return {"stdout": "", "stderr": "Execution timed out", "returncode": -1}
+
+        recycle = False
+        try:
+            result = worker.call("run", {"code": action_code, "input_data": input_data}, remaining)
+            output = worker.read_output()
+            return {
+                "stdout": output["stdout"].strip(),
+                "stderr": output["stderr"].strip(),
+                "returncode": result.get("returncode", -1),
+            }
+        except subprocess.TimeoutExpired:
+            recycle = True
+            return {"stdout": "", "stderr": "Execution timed out", "returncode": -1}
+        except (TypeError, ValueError) as e:
+            # input_data could not be serialized; the request was never sent
+            return {"stdout": "", "stderr": f"Execution failed: {e}", "returncode": -1}
+        except SandboxWorkerError as e:
+            # Crash mid-call (e.g. os._exit, segfault): report like a dead process
+            recycle = True
+            try:
+                worker.proc.wait(timeout=5)
+            except Exception:
+                pass
+            output = worker.read_output()
+            returncode = worker.proc.returncode
+            stderr = output["stderr"].strip() or f"Execution failed: {e}"
+            return {
+                "stdout": output["stdout"].strip(),
+                "stderr": stderr,
+                "returncode": returncode if returncode is not None else -1,
+            }
+        finally:
+            self._release(worker, recycle=recycle or worker.calls >= self.max_calls)
+
+    def ensure_requirements(self, requirements: List[str], deadline: Optional[float] = None) -> None:
+        """
+        Install missing requirements into the sandbox venv.
+
+        Positive "already installed" decisions are cached for the pool's
+        lifetime, so repeated actions skip the check entirely.
+
+        Raises:
+            subprocess.TimeoutExpired: No worker became free before
+                ``deadline`` (a ``time.monotonic()`` value).
+        """
+        pending = [
+            pkg.strip() for pkg in requirements
+            if pkg and pkg.strip() and pkg.strip() not in self._installed
+        ]
+        if not pending:
+            return
+
+        with self._install_lock:
+            pending = [pkg for pkg in pending if pkg not in self._installed]
+            if not pending:
+                return
+
+            names = {}
+            for pkg in pending:
+                match = _REQUIREMENT_NAME_RE.match(pkg)
+                names[pkg] = match.group(1) if match else pkg
+
+            worker = self._acquire(deadline)
+            try:
+                missing = set(
+                    worker.call("missing_distributions", {"names": list(names.values())}, 30)
+                    .get("missing", [])
+                )
+                self._release(worker)
+            except Exception:
+                self._release(worker, recycle=True)
+                missing = set(names.values())
+
+            python_bin = self._get_python_bin()
+            for pkg in pending:
+                if names[pkg] not in missing:
+                    self._installed.add(pkg)
+                    continue
+                if self._pip_install(python_bin, pkg):
+                    self._installed.add(pkg)
+
+    def shutdown(self) -> None:
+        """Stop all idle workers; busy workers are stopped when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.kill()
+
+    # ─────────────────────── Internals ────────────────────────────────────
+
+    def _get_python_bin(self) -> Path:
+        if self._python_bin is None:
+            self._python_bin = Path(self._python_bin_factory())
+        return self._python_bin
+
+    def _get_worker_script(self) -> Path:
+        """Write the worker program next to the venv (rewritten only if changed)."""
+        if self._worker_script is None:
+            python_bin = self._get_python_bin()
+            script = python_bin.parent.parent / "sandbox_worker.py"
+            try:
+                current = script.read_text(encoding="utf-8") if script.exists() else None
+            except OSError:
+                current = None
+            if current != _WORKER_SOURCE:
+                script.write_text(_WORKER_SOURCE, encoding="utf-8")
+            self._worker_script = script
+        return self._worker_script
+
+    def _acquire(self, deadline: Optional[float] = None) -> _SandboxWorker:
+        """
+        Take an idle worker, or spawn one if the pool has room.
+
+        Raises:
+            subprocess.TimeoutExpired: The pool stayed full until ``deadline``.
+        """
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise SandboxWorkerError("Sandbox worker pool is shut down")
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.alive:
+                        return worker
+                    self._total -= 1
+                    worker.kill()
+                if self._total < self.size:
+                    self._total += 1
+                    break
+                if deadline is None:
+                    self._cond.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(cmd="sandbox_worker", timeout=0)
+                self._cond.wait(remaining)
+
+        # Spawn outside the lock; interpreter start-up is slow
+        try:
+            worker = _SandboxWorker(self._get_python_bin(), self._get_worker_script())
+            logger.debug(f"[SANDBOX] Started sandbox worker pid={worker.proc.pid}")
+            return worker
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, worker: _SandboxWorker, recycle: bool = False) -> None:
+        if recycle or not worker.alive or self._closed:
+            logger.debug(f"[SANDBOX] Recycling sandbox worker pid={worker.proc.pid} after {worker.calls} call(s)")
+            worker.kill()
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            return
+        with self._cond:
+            self._idle.append(worker)
+            self._cond.notify()
+
+    @staticmethod
+    def _pip_install(python_bin: Path, pkg: str) -> bool:
+        try:
+            pip_result = subprocess.run(
+                [str(python_bin), "-m", "pip", "install", "--quiet", pkg],
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"[SANDBOX] Installation timed out for '{pkg}'")
+            return False
+        except Exception as e:
+            logger.warning(f"[SANDBOX] Error installing '{pkg}': {e}")
+            return False
+
+        if pip_result.returncode != 0:
+            stderr_lower = pip_result.stderr.lower()
+            if "no matching distribution" not in stderr_lower and "could not find" not in stderr_lower:
+                logger.warning(f"[SANDBOX] Could not install '{pkg}': {pip_result.stderr.strip()[:100]}")
+            return False
+        logger.info(f"[SANDBOX] Installed '{pkg}' into sandbox venv")
+        return True
+
+
+_pool: Optional[SandboxWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_sandbox_pool(python_bin_factory: Callable[[], Path]) -> SandboxWorkerPool:
+    """Get the process-wide sandbox worker pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SandboxWorkerPool(python_bin_factory)
+            atexit.register(_pool.shutdown)
+        return _pool
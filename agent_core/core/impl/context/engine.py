@@ -10,10 +10,19 @@ Hooks allow runtime-specific behavior for conversation context:
 - get_conversation_history_hook: For chat history (WCA only)
 - get_chat_target_info_hook: For chat targets (WCA only)
 - get_user_info_hook: For current user info (WCA only)
+
+System prompt sections are cached and keyed on their inputs (file stat,
+OS info, prompt generation), so unchanged sections are never rebuilt and
+the assembled system prompt stays byte-identical between calls.
 """
 
+import functools
+import os
+import platform
+import time
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, Callable
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable, Hashable, List, Tuple
 
 from tzlocal import get_localzone
 
@@ -29,6 +38,7 @@ from agent_core.core.prompts import (
 )
 from agent_core.core.state import get_state, get_session_or_none
 from agent_core.core.task import Task
+from agent_core.decorators import profiler, OperationCategory
 
 
 # Import memory mode check (deferred to avoid circular imports)
@@ -44,6 +54,74 @@ def _is_memory_enabled() -> bool:
 from agent_core.utils.logger import logger
 
 
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> Tuple[str, str, str]:
+    """Host OS details; fixed for the lifetime of the process."""
+    return platform.system(), platform.release(), platform.platform()
+
+
+def _agent_file_system_path() -> Path:
+    try:
+        from app.config import AGENT_FILE_SYSTEM_PATH
+        return Path(AGENT_FILE_SYSTEM_PATH)
+    except ImportError:
+        return Path(".")
+
+
+def _file_fingerprint(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class _PromptSectionCache:
+    """Cache of built prompt sections, each keyed on a fingerprint of its inputs."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Hashable, str]] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def get(self, key: str, fingerprint: Hashable, build: Callable[[], str]) -> str:
+        stats = self._stats.setdefault(
+            key, {"hits": 0, "misses": 0, "build_ms_total": 0.0, "last_build_ms": 0.0}
+        )
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            stats["hits"] += 1
+            return entry[1]
+
+        start = time.perf_counter()
+        content = build()
+        duration_ms = (time.perf_counter() - start) * 1000
+        stats["misses"] += 1
+        stats["build_ms_total"] += duration_ms
+        stats["last_build_ms"] = duration_ms
+        self._entries[key] = (fingerprint, content)
+        profiler.record(
+            "prompt_section_build",
+            duration_ms,
+            OperationCategory.CONTEXT,
+            {"section": key},
+        )
+        return content
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        result = {}
+        for key, stats in self._stats.items():
+            total = stats["hits"] + stats["misses"]
+            result[key] = {
+                **stats,
+                "hit_rate": stats["hits"] / total if total else 0.0,
+            }
+        return result
+
+
 class ContextEngine:
     """Build structured prompts for the LLM from runtime state.
 
@@ -87,6 +165,11 @@ class ContextEngine:
         self._get_chat_target_info = get_chat_target_info_hook or (lambda: "")
         self._get_user_info = get_user_info_hook or (lambda: "")
 
+        # System prompt section cache (see make_prompt)
+        self._section_cache = _PromptSectionCache()
+        self._prompt_generation = 0
+        self._last_system_prompt: Optional[Tuple[Tuple, str]] = None
+
     def set_memory_manager(self, memory_manager) -> None:
         """Set the memory manager for context retrieval."""
         self._memory_manager = memory_manager
@@ -182,19 +265,19 @@ class ContextEngine:
 
     def create_system_environmental_context(self) -> str:
         """Create a system message block with environmental context."""
-        import platform
         try:
             from app.config import AGENT_WORKSPACE_ROOT
         except ImportError:
             AGENT_WORKSPACE_ROOT = "."
 
         local_timezone = get_localzone()
+        operating_system, os_version, os_platform = _platform_info()
         return ENVIRONMENTAL_CONTEXT_PROMPT.format(
             user_location=local_timezone,
             working_directory=AGENT_WORKSPACE_ROOT,
-            operating_system=platform.system(),
-            os_version=platform.release(),
-            os_platform=platform.platform(),
+            operating_system=operating_system,
+            os_version=os_version,
+            os_platform=os_platform,
             vm_operating_system="Linux",
             vm_os_version="6.12.13",
             vm_os_platform="Linux a5e39e32118c 6.12.13 #1 SMP Thu Mar 13 11:34:50 UTC 2025 x86_64 x86_64 x86_64 GNU/Linux",
@@ -252,6 +335,48 @@ class ContextEngine:
         """Create a system message of instruction."""
         return "Please assist the user using the context given in the conversation or event stream."
 
+    # ─────────────── SYSTEM PROMPT SECTION CACHE ───────────────
+
+    def invalidate_prompt_cache(self) -> None:
+        """Force every system prompt section to be rebuilt on the next call.
+
+        Call after bulk changes to the agent file system (e.g. a reset), where
+        file stats alone may not reveal the change.
+        """
+        self._prompt_generation += 1
+        self._section_cache.clear()
+        self._last_system_prompt = None
+
+    def get_prompt_cache_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-section hit/miss counts, hit rate and build timings (ms)."""
+        return self._section_cache.stats()
+
+    def _section_fingerprint(self, key: str) -> Hashable:
+        """Fingerprint of everything a system prompt section is built from."""
+        generation = self._prompt_generation
+        if key in ("user_profile", "soul"):
+            filename = "USER.md" if key == "user_profile" else "SOUL.md"
+            return generation, _file_fingerprint(_agent_file_system_path() / filename)
+        if key == "role_info":
+            # The role hook is cheap and may change with interface mode
+            role = self._role_info_func() if self._role_info_func else None
+            try:
+                from app.onboarding import onboarding_manager
+                agent_name = onboarding_manager.state.agent_name
+            except ImportError:
+                agent_name = None
+            return generation, role, agent_name
+        if key == "environment":
+            try:
+                from app.config import AGENT_WORKSPACE_ROOT
+            except ImportError:
+                AGENT_WORKSPACE_ROOT = "."
+            return generation, str(AGENT_WORKSPACE_ROOT), os.environ.get("TZ"), _platform_info()
+        if key == "file_system":
+            return generation, str(_agent_file_system_path())
+        # Static sections: module-level prompt constants
+        return generation
+
     # ─────────────── USER PROMPT DYNAMIC COMPONENTS ───────────────
 
     def get_event_stream(self, session_id: Optional[str] = None) -> str:
@@ -725,14 +850,24 @@ class ContextEngine:
             ("base_instruction", self.create_system_base_instruction),
         ]
 
-        system_content_list = []
+        system_content_list: List[str] = []
         for key, section_fn in system_sections:
             if system_flags.get(key):
-                section_content = section_fn()
+                section_content = self._section_cache.get(
+                    key, self._section_fingerprint(key), section_fn
+                )
                 if section_content:
                     system_content_list.append(section_content)
 
-        system_message_content = "\n".join(system_content_list).strip()
+        # Reuse the previous string when nothing changed, so the prefix sent to
+        # provider-side prompt caches is the same object, byte-for-byte
+        assembled_key = tuple(system_content_list)
+        last = self._last_system_prompt
+        if last is not None and last[0] == assembled_key:
+            system_message_content = last[1]
+        else:
+            system_message_content = "\n".join(system_content_list).strip()
+            self._last_system_prompt = (assembled_key, system_message_content)
 
         user_sections = [
             ("query", lambda: self.create_user_query(query)),
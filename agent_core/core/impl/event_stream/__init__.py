@@ -16,14 +16,19 @@ from agent_core.utils.token import count_tokens
 from agent_core.core.impl.event_stream.event_stream import (
     EventStream,
     get_cached_token_count,
+    prime_token_counts,
     SEVERITIES,
     MAX_EVENT_INLINE_CHARS,
 )
 from agent_core.core.impl.event_stream.manager import (
     EventStreamManager,
+    EVENT_LOG_FILE,
+    UNPROCESSED_EVENT_LOG_FILE,
+    MAIN_STREAM_ID,
     SKIP_UNPROCESSED_TASK_NAMES,
     SKIP_UNPROCESSED_EVENT_TYPES,
 )
+from agent_core.core.impl.event_stream.log_writer import EventLogWriter
 
 __all__ = [
     # Data classes
@@ -32,12 +37,17 @@ __all__ = [
     # Implementation classes
     "EventStream",
     "EventStreamManager",
+    "EventLogWriter",
     # Utilities
     "count_tokens",
     "get_cached_token_count",
+    "prime_token_counts",
     # Constants
     "SEVERITIES",
     "MAX_EVENT_INLINE_CHARS",
+    "EVENT_LOG_FILE",
+    "UNPROCESSED_EVENT_LOG_FILE",
+    "MAIN_STREAM_ID",
     "SKIP_UNPROCESSED_TASK_NAMES",
     "SKIP_UNPROCESSED_EVENT_TYPES",
 ]
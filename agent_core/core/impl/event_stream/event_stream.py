@@ -9,24 +9,34 @@ The event stream maintains:
 APIs:
   log(kind, message, severity="INFO") -> int (event index)
   to_prompt_snapshot(max_events=60, include_summary=True) -> str
-  summarize_if_needed()  # auto-rollup when thresholds exceeded
-  summarize_by_rule()        # force summarization of oldest chunk
+  summarize_if_needed()  # auto-rollup when thresholds exceeded (background)
+  summarize_by_rule()        # prune oldest events without the LLM
   summarize_by_LLM()        # force summarization of oldest chunk
+
+Summarization runs on a background worker: the oldest chunk is snapshotted
+under the lock, summarized off-lock, and the new head_summary is spliced in
+atomically, so log() never waits for an LLM round trip.
 """
 
 from __future__ import annotations
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 import re
 import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 from agent_core.core.event_stream.event import Event, EventRecord
 from agent_core.core.protocols.llm import LLMInterfaceProtocol
+from agent_core.core.impl.llm.rate_limit import llm_call_context
+from agent_core.core.impl.llm.types import LLMPriority
+from agent_core.core.protocols.event_stream import EventJournalProtocol
 from agent_core.core.prompts import EVENT_STREAM_SUMMARIZATION_PROMPT
 from sklearn.feature_extraction.text import TfidfVectorizer
 from agent_core.utils.logger import logger
 from agent_core.decorators import profiler, OperationCategory
-from agent_core.utils.token import count_tokens
+from agent_core.utils.token import count_tokens, count_tokens_batch
 import threading
 
 SEVERITIES = ("DEBUG", "INFO", "WARN", "ERROR")
@@ -37,6 +47,9 @@ MAX_EVENT_INLINE_CHARS = 200000
 # leaving the action displayed as "running" forever.
 MIN_KEEP_RECENT_EVENTS = 2
 
+# Shared worker pool for background summarization (LLM calls are blocking)
+SUMMARY_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="event_summarizer")
+
 
 def get_cached_token_count(rec: "EventRecord") -> int:
     """Get token count for an EventRecord, using cached value if available.
@@ -47,17 +60,52 @@ def get_cached_token_count(rec: "EventRecord") -> int:
     if rec._cached_tokens is None:
         # Cache miss - need to compute tokens (this is the slow path)
         start = time.perf_counter()
-        rec._cached_tokens = count_tokens(rec.compact_line())
+        line = rec.compact_line()
+        rec._cached_tokens = count_tokens(line)
         duration_ms = (time.perf_counter() - start) * 1000
         profiler.record(
             "token_count_compute",
             duration_ms,
             OperationCategory.OTHER,
-            {"text_length": len(rec.compact_line()), "token_count": rec._cached_tokens},
+            {"text_length": len(line), "token_count": rec._cached_tokens},
         )
     return rec._cached_tokens
 
 
+def prime_token_counts(records: Iterable["EventRecord"]) -> int:
+    """Fill the token cache for many records with one batched tokenizer call.
+
+    Used on bulk-load paths (session restore, replays) where counting events
+    one at a time dominates load time.
+
+    Returns:
+        Total token count across all records.
+    """
+    records = list(records)
+    missing = [r for r in records if r._cached_tokens is None]
+    if missing:
+        start = time.perf_counter()
+        lines = [r.compact_line() for r in missing]
+        for rec, tokens in zip(missing, count_tokens_batch(lines)):
+            rec._cached_tokens = tokens
+        profiler.record(
+            "token_count_batch",
+            (time.perf_counter() - start) * 1000,
+            OperationCategory.OTHER,
+            {"records": len(missing), "text_length": sum(len(line) for line in lines)},
+        )
+    return sum(r._cached_tokens for r in records)
+
+
+@dataclass
+class _SummaryJob:
+    """Snapshot of the oldest tail chunk handed to the summarizer."""
+    epoch: int
+    chunk: List[EventRecord]
+    tokens: int
+    prompt: str
+
+
 class EventStream:
     """
     Per-session event stream.
@@ -72,6 +120,7 @@ class EventStream:
         llm: LLMInterfaceProtocol,
         summarize_at_tokens: int = 30000,
         tail_keep_after_summarize_tokens: int = 10000,
+        summarize_high_water_tokens: int | None = None,
         temp_dir: Path | None = None,
     ) -> None:
         self.head_summary: Optional[str] = None
@@ -90,13 +139,33 @@ class EventStream:
             )
             self.tail_keep_after_summarize_tokens = summarize_at_tokens - MINIMUM_BUFFER_TOKENS_BEFORE_NEXT_SUMMARIZATION
 
+        # If the background summarizer falls behind and the tail grows past this
+        # mark, log() falls back to rule-based pruning
+        self.summarize_high_water_tokens = max(
+            summarize_high_water_tokens or summarize_at_tokens * 2,
+            summarize_at_tokens,
+        )
+
         self._lock = threading.RLock()
         self._total_tokens: int = 0
 
+        # Background summarization state (guarded by _lock)
+        self._summary_inflight = False
+        # Number of oldest tail events reserved by the in-flight summary job
+        self._inflight_chunk_len = 0
+        # Rule-based prune notes produced while a summary job was in flight
+        self._pending_rule_notes: List[str] = []
+        # Bumped by clear() so stale summary jobs are discarded
+        self._epoch = 0
+
         # Session cache tracking: maps call_type -> event_index of last synced event
         # Used to track which events have been sent to each session cache
         self._session_sync_points: dict[str, int] = {}
 
+        # Optional append-only persistence (see attach_journal)
+        self._journal: Optional[EventJournalProtocol] = None
+        self._stream_id: str = ""
+
     # ────────────────────────────── logging ──────────────────────────────
 
     def log(
@@ -137,11 +206,59 @@ class EventStream:
         with self._lock:
             self.tail_events.append(rec)
             self._total_tokens += get_cached_token_count(rec)
-            # Summarization runs inside the lock - blocks other log() calls
-            # until summarization completes
+            if self._journal is not None:
+                self._journal.append(self._stream_id, rec)
+            # Only schedules summarization; the LLM call runs off-lock
             self.summarize_if_needed()
             return len(self.tail_events) - 1
 
+    def load(self, head_summary: Optional[str], records: List[EventRecord]) -> None:
+        """
+        Replace the stream contents with previously persisted state.
+
+        Token counts for the records are computed in one batch rather than
+        per event. Any in-flight background summary for the old contents is
+        discarded when it completes. Records are expected to come from the
+        journal already; only the replaced records are checkpointed out.
+
+        Args:
+            head_summary: Restored rolled-up summary, or None.
+            records: Restored tail events, oldest first.
+        """
+        total = prime_token_counts(records)
+        with self._lock:
+            kept = {id(r) for r in records}
+            dropped = [r for r in self.tail_events if id(r) not in kept]
+            self.head_summary = head_summary
+            self.tail_events = list(records)
+            self._total_tokens = total
+            self._session_sync_points.clear()
+            self._inflight_chunk_len = 0
+            self._pending_rule_notes.clear()
+            self._epoch += 1
+            self._checkpoint(dropped)
+
+    def attach_journal(self, journal: Optional[EventJournalProtocol], stream_id: str) -> None:
+        """
+        Persist this stream through an append-only journal.
+
+        Every logged record is appended to the journal, and every summarization
+        or prune writes a checkpoint (new head summary plus dropped records),
+        so persisted state never needs a full rewrite.
+
+        Args:
+            journal: The journal receiving stream changes, or None to detach.
+            stream_id: Identifier used for this stream in the journal.
+        """
+        with self._lock:
+            self._journal = journal
+            self._stream_id = stream_id
+
+    def _checkpoint(self, dropped: List[EventRecord]) -> None:
+        """Journal the current head summary and the records just removed. Caller holds the lock."""
+        if self._journal is not None:
+            self._journal.checkpoint(self._stream_id, self.head_summary, dropped)
+
     # Convenience wrappers for common event families (optional use)
     def log_action_start(self, name: str) -> int:
         return self.log("action_start", f"{name}")
@@ -186,14 +303,35 @@ class EventStream:
         """
         Trigger summarization when the tail token count exceeds the configured threshold.
 
-        This is a SYNCHRONOUS blocking call - if summarization is needed, it runs
-        immediately and waits for completion before returning.
+        Summarization is scheduled on a background worker and this call returns
+        immediately. If a summary is already in flight and the tail has grown
+        past ``summarize_high_water_tokens``, the events between the in-flight
+        chunk and the recent tail are pruned by rule so memory stays bounded.
         """
-        if self._total_tokens < self.summarize_at_tokens:
-            return
+        with self._lock:
+            if self._total_tokens < self.summarize_at_tokens:
+                return
+
+            if self._summary_inflight:
+                if self._total_tokens >= self.summarize_high_water_tokens:
+                    logger.warning(
+                        f"[EventStream] Summarizer behind ({self._total_tokens} tokens >= "
+                        f"high-water {self.summarize_high_water_tokens}); pruning by rule"
+                    )
+                    self.summarize_by_rule()
+                return
 
-        logger.debug(f"[EventStream] Triggering summarization: {self._total_tokens} tokens >= {self.summarize_at_tokens} threshold")
-        self.summarize_by_LLM()
+            logger.debug(f"[EventStream] Scheduling summarization: {self._total_tokens} tokens >= {self.summarize_at_tokens} threshold")
+            self._summary_inflight = True
+
+        try:
+            SUMMARY_POOL.submit(self._run_summary)
+        except RuntimeError:
+            # Pool shut down (interpreter exit). Callers such as log() hold the
+            # stream lock, so prune by rule rather than calling the LLM here
+            with self._lock:
+                self._summary_inflight = False
+            self.summarize_by_rule()
 
     def _find_token_cutoff(self, events: List[EventRecord], keep_tokens: int) -> int:
         """
@@ -230,38 +368,111 @@ class EventStream:
 
     def summarize_by_LLM(self) -> None:
         """
-        Summarize the oldest tail events using the language model.
+        Summarize the oldest tail events using the language model, in the calling thread.
+
+        The lock is only held while snapshotting the chunk and splicing the
+        result, never during the LLM call, so other loggers keep appending.
+        Does nothing if a background summary is already in flight.
+        """
+        with self._lock:
+            if self._summary_inflight:
+                return
+            self._summary_inflight = True
+        self._run_summary(reschedule=False)
 
-        This is a SYNCHRONOUS blocking call that holds the lock for the entire
-        duration, including the LLM call. This ensures no events can be added
-        while summarization is in progress.
+    def summarize_by_rule(self) -> None:
+        """
+        Prune the oldest unreserved events without calling the LLM.
 
-        Called from log() which already holds the lock (RLock allows reentry).
+        Events reserved by an in-flight summary job are left alone; everything
+        older than the ``tail_keep_after_summarize_tokens`` budget after them is
+        dropped and replaced by a short rule-based note in ``head_summary``.
         """
-        if not self.tail_events:
-            return
+        with self._lock:
+            start = self._inflight_chunk_len
+            cutoff = self._find_token_cutoff(self.tail_events[start:], self.tail_keep_after_summarize_tokens)
+            if cutoff <= 0:
+                return
 
-        # Find cutoff based on tokens to keep
-        cutoff = self._find_token_cutoff(self.tail_events, self.tail_keep_after_summarize_tokens)
+            dropped = self.tail_events[start:start + cutoff]
+            self.tail_events = self.tail_events[:start] + self.tail_events[start + cutoff:]
+            self._total_tokens -= sum(get_cached_token_count(r) for r in dropped)
+            self._session_sync_points.clear()
 
-        if cutoff <= 0:
-            # Nothing old enough to summarize
-            return
+            note = self._rule_summary_note(dropped)
+            if self._summary_inflight and start > 0:
+                # Newer than the chunk being summarized - append after its summary
+                self._pending_rule_notes.append(note)
+            else:
+                self.head_summary = f"{self.head_summary}\n\n{note}" if self.head_summary else note
+            self._checkpoint(dropped)
 
-        chunk = list(self.tail_events[:cutoff])
-        first_ts = chunk[0].ts if chunk else None
-        last_ts = chunk[-1].ts if chunk else None
-        window = ""
-        if first_ts and last_ts:
-            window = f"{first_ts.isoformat()} to {last_ts.isoformat()}"
+            logger.info(f"[EventStream] Pruned {len(dropped)} events by rule. Tokens: {self._total_tokens}")
 
+    @staticmethod
+    def _rule_summary_note(dropped: List[EventRecord]) -> str:
+        """Describe a pruned chunk of events without the LLM."""
+        window = f"{dropped[0].ts.isoformat()} to {dropped[-1].ts.isoformat()}"
+        kinds = Counter(r.event.kind for r in dropped)
+        kind_summary = ", ".join(f"{kind} x{count}" for kind, count in kinds.most_common(5))
+        return f"({len(dropped)} events from {window} were pruned without summarization: {kind_summary})"
+
+    def _run_summary(self, reschedule: bool = True) -> None:
+        """Snapshot, summarize off-lock and splice. Runs on the summarizer worker."""
+        try:
+            job = self._snapshot_oldest_chunk()
+            if job is not None:
+                new_summary = self._summarize_chunk(job)
+                self._apply_summary(job, new_summary)
+        except Exception:
+            logger.exception("[EventStream] Background summarization failed")
+        finally:
+            with self._lock:
+                self._summary_inflight = False
+                self._inflight_chunk_len = 0
+                if self._pending_rule_notes:
+                    # Job discarded or failed before splicing - keep the notes
+                    notes = "\n\n".join(self._pending_rule_notes)
+                    self.head_summary = f"{self.head_summary}\n\n{notes}" if self.head_summary else notes
+                    self._pending_rule_notes.clear()
+                    self._checkpoint([])
+                if reschedule and self._total_tokens >= self.summarize_at_tokens:
+                    self.summarize_if_needed()
+
+    def _snapshot_oldest_chunk(self) -> Optional[_SummaryJob]:
+        """Reserve the oldest chunk of the tail and build its summarization prompt."""
+        with self._lock:
+            if not self.tail_events:
+                return None
+
+            # Find cutoff based on tokens to keep
+            cutoff = self._find_token_cutoff(self.tail_events, self.tail_keep_after_summarize_tokens)
+            if cutoff <= 0:
+                # Nothing old enough to summarize
+                return None
+
+            chunk = list(self.tail_events[:cutoff])
+            self._inflight_chunk_len = cutoff
+            previous_summary = self.head_summary or "(none)"
+            epoch = self._epoch
+
+        first_ts = chunk[0].ts
+        last_ts = chunk[-1].ts
+        window = f"{first_ts.isoformat()} to {last_ts.isoformat()}"
         compact_lines = "\n".join(r.compact_line() for r in chunk)
-        previous_summary = self.head_summary or "(none)"
 
         prompt = EVENT_STREAM_SUMMARIZATION_PROMPT.format(
             window=window, previous_summary=previous_summary, compact_lines=compact_lines
         )
+        return _SummaryJob(
+            epoch=epoch,
+            chunk=chunk,
+            tokens=sum(get_cached_token_count(r) for r in chunk),
+            prompt=prompt,
+        )
 
+    def _summarize_chunk(self, job: _SummaryJob) -> Optional[str]:
+        """Run the LLM on a snapshotted chunk. Returns None on failure or empty output."""
         try:
             # Skip LLM call if the LLM is already in a consecutive failure state
             max_failures = getattr(self.llm, "_max_consecutive_failures", 5)
@@ -271,41 +482,69 @@ class EventStream:
                     f"[EventStream] Skipping LLM summarization: LLM has {current_failures} "
                     f"consecutive failures (max={max_failures}). Falling back to prune."
                 )
-                raise RuntimeError("LLM in consecutive failure state, skip summarization")
-
-            logger.info(f"[EventStream] Running synchronous summarization ({self._total_tokens} tokens)")
-            llm_output = self.llm.generate_response(user_prompt=prompt)
+                return None
+
+            logger.info(f"[EventStream] Running background summarization ({job.tokens} tokens in chunk)")
+            start = time.perf_counter()
+            with llm_call_context(priority=LLMPriority.BACKGROUND):
+                llm_output = self.llm.generate_response(user_prompt=job.prompt)
+            profiler.record(
+                "event_stream_summarize",
+                (time.perf_counter() - start) * 1000,
+                OperationCategory.LLM,
+                {"chunk_events": len(job.chunk), "chunk_tokens": job.tokens},
+            )
             new_summary = (llm_output or "").strip()
 
             logger.debug(f"[EVENT STREAM SUMMARIZATION] llm_output_len={len(llm_output or '')}")
 
             if not new_summary:
-                logger.warning("[EVENT STREAM SUMMARIZATION] LLM returned empty summary; not updating.")
-                return
-
-            # Apply summary and prune events
-            self.head_summary = new_summary
-            # Calculate tokens being removed from the snapshotted chunk
-            removed_tokens = sum(get_cached_token_count(r) for r in chunk)
-            self._total_tokens -= removed_tokens
-            self.tail_events = self.tail_events[cutoff:]
-
-            # Reset all session sync points - event indices are now invalid
-            self._session_sync_points.clear()
-            logger.info(f"[EventStream] Summarization complete. Tokens: {self._total_tokens}")
+                logger.warning("[EVENT STREAM SUMMARIZATION] LLM returned empty summary; pruning without it.")
+                return None
+            return new_summary
 
         except Exception:
             logger.exception(
                 "[EventStream] LLM summarization failed. "
                 "Pruning oldest events without a summary to prevent retry spam."
             )
-            # Fallback: drop the oldest chunk without generating a summary so that
-            # _total_tokens falls below the threshold.  Without this, every subsequent
-            # log() call would immediately re-trigger summarization and flood the logs.
-            removed_tokens = sum(get_cached_token_count(r) for r in chunk)
-            self._total_tokens -= removed_tokens
-            self.tail_events = self.tail_events[cutoff:]
+            return None
+
+    def _apply_summary(self, job: _SummaryJob, new_summary: Optional[str]) -> None:
+        """
+        Atomically replace the summarized chunk with the new head summary.
+
+        When ``new_summary`` is None the chunk is still dropped (without a
+        summary) so that _total_tokens falls below the threshold; otherwise
+        every subsequent log() would immediately re-trigger summarization.
+        """
+        with self._lock:
+            n = len(job.chunk)
+            still_at_head = (
+                job.epoch == self._epoch
+                and len(self.tail_events) >= n
+                and all(a is b for a, b in zip(self.tail_events, job.chunk))
+            )
+            if not still_at_head:
+                # Stream was cleared or replaced (e.g. session restore) meanwhile
+                logger.debug("[EventStream] Discarding stale summary job")
+                return
+
+            self.tail_events = self.tail_events[n:]
+            self._total_tokens -= job.tokens
+            self._inflight_chunk_len = 0
+
+            head = new_summary if new_summary else self.head_summary
+            if self._pending_rule_notes:
+                notes = "\n\n".join(self._pending_rule_notes)
+                head = f"{head}\n\n{notes}" if head else notes
+                self._pending_rule_notes.clear()
+            self.head_summary = head
+            self._checkpoint(job.chunk)
+
+            # Reset all session sync points - event indices are now invalid
             self._session_sync_points.clear()
+            logger.info(f"[EventStream] Summarization complete. Tokens: {self._total_tokens}")
 
     # ───────────────────── utilities ─────────────────────
 
@@ -375,10 +614,16 @@ class EventStream:
         This is typically used in tests or when reusing a session identifier for
         a new task to ensure no stale context leaks between runs.
         """
-        self.head_summary = None
-        self.tail_events.clear()
-        self._total_tokens = 0
-        self._session_sync_points.clear()
+        with self._lock:
+            dropped = list(self.tail_events)
+            self.head_summary = None
+            self.tail_events.clear()
+            self._total_tokens = 0
+            self._session_sync_points.clear()
+            self._inflight_chunk_len = 0
+            self._pending_rule_notes.clear()
+            self._epoch += 1
+            self._checkpoint(dropped)
 
     # ───────────────────── Session Cache Delta Tracking ─────────────────────
 
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+core.impl.event_stream.log_writer
+
+Background group-commit writer for the markdown event logs (EVENT.md,
+EVENT_UNPROCESSED.md).
+
+Logging an event used to take a lock, stat each file, and open/append/close
+it on the caller's thread. EventLogWriter instead:
+
+- queues lines and returns immediately
+- keeps every log file open and appends a whole batch per file in one write,
+  committing when ``batch_bytes`` have accumulated or ``flush_interval``
+  has elapsed
+- tracks each file's size in memory, re-syncing it once per commit so that
+  external edits (the memory processor clearing EVENT_UNPROCESSED.md, or an
+  editor replacing the file) are picked up
+- rolls an oversized file into a segment (``EVENT.1.md`` ...) instead of
+  reading and rewriting it. Files listed in ``trim_in_place`` (the
+  unprocessed-events log, which the memory processor reads and clears as a
+  single file) are trimmed in place instead, so no pending event is moved
+  out of the processor's sight
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+from agent_core.utils.file_utils import (
+    MAX_MD_FILE_BYTES,
+    MAX_MD_SEGMENTS,
+    roll_md_segment,
+    rotate_md_file_if_needed,
+)
+from agent_core.utils.logger import logger
+
+# Commit a batch once this many bytes are pending...
+LOG_BATCH_BYTES = 64 * 1024
+# ...or once the oldest pending line has waited this long (seconds)
+LOG_FLUSH_INTERVAL = 0.05
+
+
+class _LogFile:
+    """An append handle on one log file with an in-memory size."""
+
+    def __init__(self, path: Path, max_bytes: int, max_segments: int, trim_in_place: bool = False):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_segments = max_segments
+        self.trim_in_place = trim_in_place
+        self._handle: Optional[TextIO] = None
+        self._ino: Optional[int] = None
+        self.size = 0
+
+    def append(self, data: str) -> None:
+        """Append ``data`` (one group commit), rolling to a new segment first if needed."""
+        self._sync()
+        encoded_len = len(data.encode("utf-8"))
+        if self.size and self.size + encoded_len > self.max_bytes:
+            self._roll()
+        self._handle.write(data)
+        self._handle.flush()
+        self.size += encoded_len
+
+    def close(self) -> None:
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except OSError:
+                pass
+        self._handle = None
+        self._ino = None
+
+    def _sync(self) -> None:
+        """Reopen if the file was replaced or deleted; refresh the size from disk."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            st = None
+        if self._handle is None or st is None or st.st_ino != self._ino:
+            self._open()
+        else:
+            self.size = st.st_size
+
+    def _open(self, preamble: str = "") -> None:
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(self.path, "a", encoding="utf-8")
+        if preamble:
+            self._handle.write(preamble)
+        self._handle.flush()
+        st = os.fstat(self._handle.fileno())
+        self._ino = st.st_ino
+        self.size = st.st_size
+
+    def _roll(self) -> None:
+        self.close()
+        if self.trim_in_place:
+            # Already over the limit: drop the oldest third of the live file
+            rotate_md_file_if_needed(self.path, max_bytes=0)
+            self._open()
+            return
+        try:
+            preamble = roll_md_segment(self.path, self.max_segments)
+        except OSError as e:
+            logger.warning(f"[EventLogWriter] Failed to roll {self.path.name}: {e}")
+            preamble = ""
+        self._open(preamble)
+
+
+class EventLogWriter:
+    """
+    Thread-safe, non-blocking appender for the event log files in one directory.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_bytes: int = MAX_MD_FILE_BYTES,
+        max_segments: int = MAX_MD_SEGMENTS,
+        batch_bytes: int = LOG_BATCH_BYTES,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+        trim_in_place: Iterable[str] = (),
+    ):
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+        self._max_segments = max_segments
+        # Files trimmed in place instead of rolled into segments
+        self._trim_in_place = frozenset(trim_in_place)
+        self._batch_bytes = batch_bytes
+        self._flush_interval = flush_interval
+
+        # Items: (filename, line) | (None, threading.Event) barrier | None to stop
+        self._queue: "queue.Queue[Optional[Tuple[Optional[str], object]]]" = queue.Queue()
+        self._files: Dict[str, _LogFile] = {}
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="event_log_writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, filename: str, line: str) -> None:
+        """Queue ``line`` (including its newline) for ``filename`` in the log directory."""
+        if self._closed:
+            return
+        self._queue.put((filename, line))
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until every line queued so far has been written."""
+        if self._closed or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put((None, done))
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Write out pending lines and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    # ─────────────────────── Writer Thread ────────────────────────────────
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            pending: Dict[str, List[str]] = {}
+            barriers: List[threading.Event] = []
+            pending_bytes = 0
+            deadline = time.monotonic() + self._flush_interval
+            while True:
+                filename, payload = item
+                if filename is None:
+                    # Barrier: commit immediately so flush() returns promptly
+                    barriers.append(payload)
+                    break
+                pending.setdefault(filename, []).append(payload)
+                pending_bytes += len(payload)
+                if pending_bytes >= self._batch_bytes:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+
+            self._commit(pending)
+            for barrier in barriers:
+                barrier.set()
+
+        # Drain anything queued before close()
+        pending = {}
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                continue
+            filename, payload = item
+            if filename is None:
+                payload.set()
+            else:
+                pending.setdefault(filename, []).append(payload)
+        self._commit(pending)
+        for log_file in self._files.values():
+            log_file.close()
+
+    def _commit(self, pending: Dict[str, List[str]]) -> None:
+        for filename, lines in pending.items():
+            log_file = self._files.get(filename)
+            if log_file is None:
+                log_file = _LogFile(
+                    self._directory / filename,
+                    self._max_bytes,
+                    self._max_segments,
+                    trim_in_place=filename in self._trim_in_place,
+                )
+                self._files[filename] = log_file
+            try:
+                log_file.append("".join(lines))
+            except Exception as e:
+                log_file.close()
+                logger.warning(f"[EventLogWriter] Failed to write to {filename}: {e}")
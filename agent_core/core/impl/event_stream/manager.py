@@ -9,6 +9,8 @@ Also handles file-based event logging to:
 - EVENT.md: Complete event history
 - EVENT_UNPROCESSED.md: Events pending memory processing
 
+File writes are group-committed by a background EventLogWriter.
+
 """
 
 
@@ -16,13 +18,13 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
-import threading
 
 from agent_core.core.impl.event_stream.event_stream import EventStream
+from agent_core.core.impl.event_stream.log_writer import EventLogWriter
 from agent_core.core.event_stream.event import Event
 from agent_core.core.protocols.llm import LLMInterfaceProtocol
+from agent_core.core.protocols.event_stream import EventJournalProtocol
 from agent_core.utils.logger import logger
-from agent_core.utils.file_utils import rotate_md_file_if_needed
 from agent_core.core.state.base import get_state_or_none
 
 # Import memory mode check (deferred to avoid circular imports)
@@ -34,6 +36,13 @@ def _is_memory_enabled() -> bool:
     except ImportError:
         return True  # Default to enabled if settings module not available
 
+# Markdown event logs in the agent file system
+EVENT_LOG_FILE = "EVENT.md"
+UNPROCESSED_EVENT_LOG_FILE = "EVENT_UNPROCESSED.md"
+
+# Journal stream ID for the main (non-task) event stream
+MAIN_STREAM_ID = "__main__"
+
 # Task names that should not log to EVENT_UNPROCESSED.md (to prevent infinite loops)
 SKIP_UNPROCESSED_TASK_NAMES = {"Process Memory Events"}
 
@@ -68,9 +77,15 @@ class EventStreamManager:
         agent_file_system_path: Optional[Path] = None,
         on_stream_persist: Optional[Callable[[str, "EventStream"], None]] = None,
         on_stream_remove_persist: Optional[Callable[[str], None]] = None,
+        journal: Optional[EventJournalProtocol] = None,
     ) -> None:
+        # Append-only persistence for streams and conversation history
+        self._journal = journal
+
         # Main stream for conversation mode (not task-specific)
         self._main_stream: EventStream = EventStream(llm=llm, temp_dir=None)
+        if journal is not None:
+            self._main_stream.attach_journal(journal, MAIN_STREAM_ID)
         # Per-task event streams, keyed by task_id
         self._task_streams: Dict[str, EventStream] = {}
         self.llm = llm
@@ -78,7 +93,12 @@ class EventStreamManager:
         # File-based event logging
         self._agent_file_system_path = agent_file_system_path
         self._skip_unprocessed_logging = False
-        self._file_lock = threading.Lock()
+        self._log_writer: Optional[EventLogWriter] = (
+            # The memory processor only reads and clears the live unprocessed log
+            EventLogWriter(agent_file_system_path, trim_in_place=(UNPROCESSED_EVENT_LOG_FILE,))
+            if agent_file_system_path
+            else None
+        )
 
         # Session persistence hooks
         self._on_stream_persist = on_stream_persist
@@ -116,6 +136,8 @@ class EventStreamManager:
     def create_stream(self, task_id: str, temp_dir=None) -> EventStream:
         """Create a new per-task event stream."""
         stream = EventStream(llm=self.llm, temp_dir=temp_dir)
+        if self._journal is not None:
+            stream.attach_journal(self._journal, task_id)
         self._task_streams[task_id] = stream
         logger.debug(f"[EventStreamManager] Created stream for task {task_id}")
         return stream
@@ -124,6 +146,8 @@ class EventStreamManager:
         """Remove a task's event stream on task completion."""
         removed = self._task_streams.pop(task_id, None)
         if removed:
+            # Persisted data was already removed with the task; stop journaling
+            removed.attach_journal(None, task_id)
             logger.debug(f"[EventStreamManager] Removed stream for task {task_id}")
 
     def get_stream_by_id(self, task_id: str) -> EventStream:
@@ -181,6 +205,8 @@ class EventStreamManager:
             display_message=display_message,
         )
         self._conversation_history.append(event)
+        if self._journal is not None:
+            self._journal.append_conversation(event, self._conversation_history_limit)
 
         # Trim to limit
         if len(self._conversation_history) > self._conversation_history_limit:
@@ -208,6 +234,8 @@ class EventStreamManager:
         self._task_streams.clear()
         self._main_stream.clear()
         self._conversation_history.clear()
+        if self._journal is not None:
+            self._journal.clear_conversation()
 
     # ───────────────────────── file-based logging ─────────────────────────
 
@@ -281,41 +309,44 @@ class EventStreamManager:
         """
         Append an event to EVENT.md and optionally EVENT_UNPROCESSED.md.
 
-        This method is thread-safe and handles file I/O errors gracefully.
+        This method is thread-safe and non-blocking: lines are queued for the
+        background log writer, which handles file I/O errors gracefully.
         Events are written in the format: [YYYY/MM/DD HH:MM:SS] [kind]: message
 
         Args:
             kind: Event category (e.g., "action", "trigger", "task")
             message: Event message content
         """
-        if not self._agent_file_system_path:
+        if self._log_writer is None:
             return
 
         # Format: [YYYY/MM/DD HH:MM:SS] [kind]: message
         timestamp = datetime.now(timezone.utc).strftime("%Y/%m/%d %H:%M:%S")
         event_line = f"[{timestamp}] [{kind}]: {message}\n"
 
-        with self._file_lock:
-            # Always write to EVENT.md (create if doesn't exist)
-            try:
-                event_file = self._agent_file_system_path / "EVENT.md"
-                rotate_md_file_if_needed(event_file)
-                with open(event_file, "a", encoding="utf-8") as f:
-                    f.write(event_line)
-            except Exception as e:
-                logger.warning(f"[EventStreamManager] Failed to write to EVENT.md: {e}")
-
-            # Write to EVENT_UNPROCESSED.md unless:
-            # 1. Task-level skip is active (memory processing task)
-            # 2. Event type is in the skip list (routine events)
-            if not self._should_skip_unprocessed() and not self._should_skip_event_type(kind):
-                try:
-                    unprocessed_file = self._agent_file_system_path / "EVENT_UNPROCESSED.md"
-                    rotate_md_file_if_needed(unprocessed_file)
-                    with open(unprocessed_file, "a", encoding="utf-8") as f:
-                        f.write(event_line)
-                except Exception as e:
-                    logger.warning(f"[EventStreamManager] Failed to write to EVENT_UNPROCESSED.md: {e}")
+        # Always write to EVENT.md (created if it doesn't exist)
+        self._log_writer.write(EVENT_LOG_FILE, event_line)
+
+        # Write to EVENT_UNPROCESSED.md unless:
+        # 1. Task-level skip is active (memory processing task)
+        # 2. Event type is in the skip list (routine events)
+        # Decided now, not at write time, since the skip flag changes with tasks
+        if not self._should_skip_unprocessed() and not self._should_skip_event_type(kind):
+            self._log_writer.write(UNPROCESSED_EVENT_LOG_FILE, event_line)
+
+    def flush_event_logs(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Block until every event logged so far is written to the markdown logs.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if the logs were flushed within the timeout.
+        """
+        if self._log_writer is None:
+            return True
+        return self._log_writer.flush(timeout)
 
     # ───────────────────────────── utilities ─────────────────────────────
 
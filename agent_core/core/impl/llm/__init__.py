@@ -10,8 +10,15 @@ inject the appropriate hooks for their state management systems.
 """
 
 from agent_core.core.impl.llm.interface import LLMInterface
-from agent_core.core.impl.llm.types import LLMCallType
+from agent_core.core.impl.llm.types import LLMCallType, LLMPriority
+from agent_core.core.impl.llm.rate_limit import current_llm_call_context, llm_call_context
 from agent_core.core.impl.llm.errors import LLMConsecutiveFailureError
+from agent_core.core.impl.llm.streaming import (
+    IncrementalJSONParser,
+    LatencyMetrics,
+    get_latency_metrics,
+)
+from agent_core.core.impl.llm.replay import LLMCassette
 
 # Cache management components
 from agent_core.core.impl.llm.cache import (
@@ -31,8 +38,17 @@ __all__ = [
     "LLMInterface",
     # Types
     "LLMCallType",
+    "LLMPriority",
+    # Rate limiting context
+    "llm_call_context",
+    "current_llm_call_context",
     # Errors
     "LLMConsecutiveFailureError",
+    # Streaming
+    "IncrementalJSONParser",
+    "LatencyMetrics",
+    "get_latency_metrics",
+    "LLMCassette",
     # Cache Config
     "CacheConfig",
     "get_cache_config",
@@ -9,15 +9,30 @@ Hooks allow runtime-specific behavior:
 - Token counting via get_token_count/set_token_count hooks
 - Usage reporting via report_usage hook (CraftBot only)
 - Database logging via log_to_db hook
+- Rate limiting via acquire_rate_limit/acquire_rate_limit_async hooks; the
+  priority and session of a call come from llm_call_context (see
+  core.llm.rate_limit)
+
+generate_response_async/generate_response_stream use each provider's native
+streaming API; time-to-first-token and total latency are recorded per
+provider (see core.llm.streaming).
+
+An LLMCassette (see core.llm.replay) can record every call to a fixture or
+replay calls from one offline; set it with use_cassette() or LLM_CASSETTE.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
 import hashlib
+import json
+import os
 import re
+import time
 import requests
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 from openai import OpenAI
 
@@ -30,18 +45,35 @@ from agent_core.core.impl.llm.cache import (
     get_cache_metrics,
 )
 from agent_core.core.impl.llm.errors import LLMConsecutiveFailureError
+from agent_core.core.impl.llm.rate_limit import current_llm_call_context
+from agent_core.core.impl.llm.replay import LLMCassette
+from agent_core.core.impl.llm.streaming import (
+    get_latency_metrics,
+    get_stream_http_client,
+    iter_ndjson,
+    iter_sse_data,
+    raise_for_stream_status,
+)
 from agent_core.core.hooks import (
     GetTokenCountHook,
     SetTokenCountHook,
     ReportUsageHook,
     LogToDbHook,
     UsageEventData,
+    RateLimitRequest,
+    RateLimitSettleHook,
+    AcquireRateLimitHook,
+    AcquireRateLimitAsyncHook,
 )
 
 # Logging setup - use shared agent_core logger for consistency
 from agent_core.utils.logger import logger
 
 
+# Providers served through the OpenAI-compatible chat completions client
+_OPENAI_COMPATIBLE_PROVIDERS = ("openai", "minimax", "deepseek", "moonshot", "grok")
+
+
 # Models that do NOT support assistant message prefill
 # These require output_config.format for structured JSON output
 _ANTHROPIC_NO_PREFILL_PATTERNS = (
@@ -74,6 +106,24 @@ def _model_supports_prefill(model: str) -> bool:
     return True
 
 
+class _RateLimitPermit:
+    """An admitted call: its settle hook and the tokens counted while it ran."""
+
+    __slots__ = ("settle", "tokens", "context_token")
+
+    def __init__(self, settle: RateLimitSettleHook) -> None:
+        self.settle = settle
+        self.tokens = 0
+        self.context_token: Optional[contextvars.Token] = None
+
+
+# Permit of the call running in this context; nested calls (session fallbacks)
+# are admitted with it instead of asking the limiter again.
+_active_permit: contextvars.ContextVar[Optional[_RateLimitPermit]] = contextvars.ContextVar(
+    "llm_rate_limit_permit", default=None
+)
+
+
 class LLMInterface:
     """LLM interface with multi-provider support and hook-based customization.
 
@@ -91,6 +141,11 @@ class LLMInterface:
         set_token_count: Hook to set token count in state.
         report_usage: Optional hook to report usage for cost tracking.
         log_to_db: Optional hook to log prompts to database.
+        acquire_rate_limit: Optional hook that blocks until a synchronous call
+            may be sent.
+        acquire_rate_limit_async: Optional hook that awaits admission of
+            streamed and async calls (falls back to acquire_rate_limit in a
+            worker thread).
     """
 
     _CODE_BLOCK_RE = re.compile(r"^```(?:\w+)?\s*|\s*```$", re.MULTILINE)
@@ -109,6 +164,8 @@ class LLMInterface:
         set_token_count: Optional[SetTokenCountHook] = None,
         report_usage: Optional[ReportUsageHook] = None,
         log_to_db: Optional[LogToDbHook] = None,
+        acquire_rate_limit: Optional[AcquireRateLimitHook] = None,
+        acquire_rate_limit_async: Optional[AcquireRateLimitAsyncHook] = None,
     ) -> None:
         self.temperature = temperature
         self.max_tokens = max_tokens
@@ -126,11 +183,21 @@ class LLMInterface:
         self._set_token_count = set_token_count or (lambda x: None)
         self._report_usage = report_usage
         self._log_to_db = log_to_db
+        self._acquire_rate_limit = acquire_rate_limit
+        self._acquire_rate_limit_async = acquire_rate_limit_async
 
         # Consecutive failure tracking to prevent infinite retry loops
         self._consecutive_failures = 0
         self._max_consecutive_failures = 5
 
+        # Native streaming for generate_response_async/generate_response_stream
+        self.streaming_enabled = os.getenv("LLM_STREAMING", "1") != "0"
+        # kind -> (event loop, sync client, async client) for streaming calls
+        self._async_clients: Dict[str, tuple] = {}
+
+        # Record/replay fixture (LLM_CASSETTE), see use_cassette()
+        self._cassette: Optional[LLMCassette] = LLMCassette.from_env()
+
         # Defer imports to avoid circular dependency
         from app.models.factory import ModelFactory
         from app.models.types import InterfaceType
@@ -184,7 +251,22 @@ class LLMInterface:
     @property
     def is_initialized(self) -> bool:
         """Check if the LLM client is properly initialized."""
-        return self._initialized
+        return self._initialized or (self._cassette is not None and self._cassette.replaying)
+
+    @property
+    def cassette(self) -> Optional[LLMCassette]:
+        return self._cassette
+
+    def use_cassette(self, cassette: Optional[LLMCassette]) -> None:
+        """Record calls to, or replay calls from, an LLMCassette (None turns it off).
+
+        A replaying cassette answers every call (blocking, streamed and
+        session) without contacting the provider, so the interface counts as
+        initialized even without credentials.
+        """
+        self._cassette = cassette
+        if cassette is not None:
+            logger.info(f"[LLM CASSETTE] {cassette.mode.capitalize()}ing LLM calls: {cassette.path}")
 
     def reinitialize(
         self,
@@ -343,7 +425,209 @@ class LLMInterface:
             except Exception as e:
                 logger.warning(f"[LLM] Failed to log to database: {e}")
 
+    # ───────────────────────────  Rate Limiting  ─────────────────────────────
+
+    def _rate_limit_request(
+        self,
+        system_prompt: str | None,
+        user_prompt: str,
+        call_type: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> Optional[RateLimitRequest]:
+        """Describe a call for the rate limit hooks, or None if it is not limited.
+
+        Calls nested in an admitted call and calls answered by a replaying
+        cassette are not limited.
+        """
+        if _active_permit.get() is not None:
+            return None
+        cassette = self._cassette
+        if cassette is not None and cassette.replaying:
+            return None
+        priority, context_session = current_llm_call_context()
+        return RateLimitRequest(
+            system_prompt,
+            user_prompt,
+            priority=priority.value,
+            session_id=session_id or context_session,
+            call_type=getattr(call_type, "value", call_type),
+        )
+
+    def _admit(
+        self,
+        system_prompt: str | None,
+        user_prompt: str,
+        call_type: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> Optional[_RateLimitPermit]:
+        """Block until the acquire_rate_limit hook admits a call; see _release()."""
+        if self._acquire_rate_limit is None:
+            return None
+        request = self._rate_limit_request(system_prompt, user_prompt, call_type, session_id)
+        if request is None:
+            return None
+        try:
+            settle = self._acquire_rate_limit(request)
+        except Exception as e:
+            logger.warning(f"[LLM] Rate limiter failed, sending call unthrottled: {e}")
+            return None
+        if settle is None:
+            return None
+        permit = _RateLimitPermit(settle)
+        permit.context_token = _active_permit.set(permit)
+        return permit
+
+    async def _admit_async(
+        self,
+        system_prompt: str | None,
+        user_prompt: str,
+        call_type: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> Optional[_RateLimitPermit]:
+        """Await admission of a call. Cancelling the caller withdraws the request.
+
+        The permit is not bound to the current context; callers that run the
+        call in a worker thread bind it themselves.
+        """
+        if self._acquire_rate_limit_async is None and self._acquire_rate_limit is None:
+            return None
+        request = self._rate_limit_request(system_prompt, user_prompt, call_type, session_id)
+        if request is None:
+            return None
+        try:
+            if self._acquire_rate_limit_async is not None:
+                settle = await self._acquire_rate_limit_async(request)
+            else:
+                settle = await asyncio.to_thread(self._acquire_rate_limit, request)
+        except Exception as e:
+            logger.warning(f"[LLM] Rate limiter failed, sending call unthrottled: {e}")
+            return None
+        return _RateLimitPermit(settle) if settle is not None else None
+
+    def _release(self, permit: Optional[_RateLimitPermit], tokens_used: Optional[int] = None) -> None:
+        """Settle an admitted call with its actual usage (the tokens counted under it by default)."""
+        if permit is None:
+            return
+        if permit.context_token is not None:
+            _active_permit.reset(permit.context_token)
+            permit.context_token = None
+        try:
+            permit.settle(permit.tokens if tokens_used is None else tokens_used)
+        except Exception as e:
+            logger.warning(f"[LLM] Failed to settle rate limit: {e}")
+
+    def _run_admitted(
+        self,
+        permit: _RateLimitPermit,
+        call: Callable[[], Any],
+        tokens_of: Optional[Callable[[Any], int]] = None,
+    ) -> Any:
+        """Run ``call`` under ``permit`` in a worker thread and settle the permit there.
+
+        Settling when the call returns, rather than in the awaiting coroutine,
+        means a cancelled caller cannot refund a call that is still running.
+        """
+        permit.context_token = _active_permit.set(permit)
+        tokens_used = None
+        try:
+            result = call()
+            if tokens_of is not None:
+                tokens_used = tokens_of(result)
+            return result
+        finally:
+            self._release(permit, tokens_used)
+
+    def _add_token_count(self, tokens: int) -> None:
+        """Add a response's tokens to the token count (and to the admitted call's usage)."""
+        self._set_token_count(self._get_token_count() + tokens)
+        permit = _active_permit.get()
+        if permit is not None:
+            permit.tokens += tokens
+
     # ───────────────────────────  Public helpers  ────────────────────────────
+    def _check_failure_threshold(self) -> None:
+        """Raise if the consecutive failure threshold has been reached."""
+        if self._consecutive_failures >= self._max_consecutive_failures:
+            logger.critical(
+                f"[LLM ABORT] Consecutive failure threshold reached "
+                f"({self._consecutive_failures}/{self._max_consecutive_failures}). "
+                f"Aborting to prevent infinite retries."
+            )
+            raise LLMConsecutiveFailureError(self._consecutive_failures)
+
+    def _record_failure(self, error: Exception) -> None:
+        """Track a failed call, raising once the consecutive failure threshold is reached."""
+        self._consecutive_failures += 1
+        logger.warning(
+            f"[LLM CONSECUTIVE FAILURE] Count: {self._consecutive_failures}/{self._max_consecutive_failures} | Error: {error}"
+        )
+        if self._consecutive_failures >= self._max_consecutive_failures:
+            raise LLMConsecutiveFailureError(self._consecutive_failures, last_error=error) from error
+
+    def _generate_blocking(self, system_prompt: str | None, user_prompt: str) -> Dict[str, Any]:
+        """Run a blocking (non-streaming) call against the configured provider or cassette."""
+        cassette = self._cassette
+        if cassette is not None and cassette.replaying:
+            return cassette.replay(system_prompt, user_prompt)
+        if cassette is None or not cassette.recording:
+            return self._generate_provider(system_prompt, user_prompt)
+        start = time.perf_counter()
+        response = self._generate_provider(system_prompt, user_prompt)
+        cassette.record(system_prompt, user_prompt, response, time.perf_counter() - start)
+        return response
+
+    def _generate_provider(self, system_prompt: str | None, user_prompt: str) -> Dict[str, Any]:
+        if self.provider in _OPENAI_COMPATIBLE_PROVIDERS:
+            return self._generate_openai(system_prompt, user_prompt)
+        if self.provider == "remote":
+            return self._generate_ollama(system_prompt, user_prompt)
+        if self.provider == "gemini":
+            return self._generate_gemini(system_prompt, user_prompt)
+        if self.provider == "byteplus":
+            return self._generate_byteplus(system_prompt, user_prompt)
+        if self.provider == "anthropic":
+            return self._generate_anthropic(system_prompt, user_prompt)
+        raise RuntimeError(f"Unknown provider {self.provider!r}")  # pragma: no cover
+
+    def _finalize_response(self, response: Dict[str, Any], log_response: bool) -> str:
+        """Validate a provider response, update counters and return the cleaned content."""
+        content = response.get("content", "").strip()
+
+        # Check if response is empty and provide diagnostics
+        if not content:
+            error_msg = response.get("error", "")
+            if error_msg:
+                error_detail = f"LLM provider returned error: {error_msg}"
+            else:
+                error_detail = (
+                    f"LLM returned empty response. "
+                    f"Provider: {self.provider}, Model: {self.model}. "
+                    f"This may indicate: API authentication failure, invalid API key, rate limiting, "
+                    f"connection timeout, or LLM service unavailability. "
+                    f"Check your credentials and API status."
+                )
+            logger.error(f"[LLM ERROR] {error_detail}")
+            # Track consecutive failure
+            self._consecutive_failures += 1
+            logger.warning(
+                f"[LLM CONSECUTIVE FAILURE] Count: {self._consecutive_failures}/{self._max_consecutive_failures}"
+            )
+            if self._consecutive_failures >= self._max_consecutive_failures:
+                raise LLMConsecutiveFailureError(self._consecutive_failures)
+            raise RuntimeError(error_detail)
+
+        # Success - reset consecutive failure counter
+        self._consecutive_failures = 0
+
+        cleaned = re.sub(self._CODE_BLOCK_RE, "", content)
+
+        # Update token count via hook
+        self._add_token_count(response.get("tokens_used", 0))
+
+        if log_response:
+            logger.info(f"[LLM RECV] {cleaned}")
+        return cleaned
+
     def _generate_response_sync(
         self,
         system_prompt: Optional[str] = None,
@@ -355,81 +639,33 @@ class LLMInterface:
             raise ValueError("`user_prompt` cannot be None.")
 
         # Check if we've hit the consecutive failure threshold
-        if self._consecutive_failures >= self._max_consecutive_failures:
-            logger.critical(
-                f"[LLM ABORT] Consecutive failure threshold reached "
-                f"({self._consecutive_failures}/{self._max_consecutive_failures}). "
-                f"Aborting to prevent infinite retries."
-            )
-            raise LLMConsecutiveFailureError(self._consecutive_failures)
+        self._check_failure_threshold()
 
         if log_response:
             logger.info(f"[LLM SEND] system={system_prompt} | user={user_prompt}")
 
+        permit = self._admit(system_prompt, user_prompt)
+        start = time.perf_counter()
+        response: Dict[str, Any] = {}
         try:
-            if self.provider in ("openai", "minimax", "deepseek", "moonshot", "grok"):
-                response = self._generate_openai(system_prompt, user_prompt)
-            elif self.provider == "remote":
-                response = self._generate_ollama(system_prompt, user_prompt)
-            elif self.provider == "gemini":
-                response = self._generate_gemini(system_prompt, user_prompt)
-            elif self.provider == "byteplus":
-                response = self._generate_byteplus(system_prompt, user_prompt)
-            elif self.provider == "anthropic":
-                response = self._generate_anthropic(system_prompt, user_prompt)
-            else:  # pragma: no cover
-                raise RuntimeError(f"Unknown provider {self.provider!r}")
-
-            content = response.get("content", "").strip()
-
-            # Check if response is empty and provide diagnostics
-            if not content:
-                error_msg = response.get("error", "")
-                if error_msg:
-                    error_detail = f"LLM provider returned error: {error_msg}"
-                else:
-                    error_detail = (
-                        f"LLM returned empty response. "
-                        f"Provider: {self.provider}, Model: {self.model}. "
-                        f"This may indicate: API authentication failure, invalid API key, rate limiting, "
-                        f"connection timeout, or LLM service unavailability. "
-                        f"Check your credentials and API status."
-                    )
-                logger.error(f"[LLM ERROR] {error_detail}")
-                # Track consecutive failure
-                self._consecutive_failures += 1
-                logger.warning(
-                    f"[LLM CONSECUTIVE FAILURE] Count: {self._consecutive_failures}/{self._max_consecutive_failures}"
-                )
-                if self._consecutive_failures >= self._max_consecutive_failures:
-                    raise LLMConsecutiveFailureError(self._consecutive_failures)
-                raise RuntimeError(error_detail)
-
-            # Success - reset consecutive failure counter
-            self._consecutive_failures = 0
-
-            cleaned = re.sub(self._CODE_BLOCK_RE, "", content)
-
-            # Update token count via hook
-            current_count = self._get_token_count()
-            self._set_token_count(current_count + response.get("tokens_used", 0))
-
-            if log_response:
-                logger.info(f"[LLM RECV] {cleaned}")
-            return cleaned
-
+            response = self._generate_blocking(system_prompt, user_prompt)
+            return self._finalize_response(response, log_response)
         except LLMConsecutiveFailureError:
             # Re-raise consecutive failure errors without incrementing counter
             raise
         except Exception as e:
             # Track consecutive failure for any other exception
-            self._consecutive_failures += 1
-            logger.warning(
-                f"[LLM CONSECUTIVE FAILURE] Count: {self._consecutive_failures}/{self._max_consecutive_failures} | Error: {e}"
-            )
-            if self._consecutive_failures >= self._max_consecutive_failures:
-                raise LLMConsecutiveFailureError(self._consecutive_failures, last_error=e) from e
+            self._record_failure(e)
             raise
+        finally:
+            self._release(permit)
+            get_latency_metrics().record(
+                self.provider,
+                ttft=None,
+                total=time.perf_counter() - start,
+                streamed=False,
+                error=not response.get("content"),
+            )
 
     @profile("llm_generate_response", OperationCategory.LLM)
     def generate_response(
@@ -448,13 +684,148 @@ class LLMInterface:
         user_prompt: Optional[str] = None,
         log_response: bool = True,
     ) -> str:
-        """Async wrapper that defers the blocking call to a worker thread."""
-        return await asyncio.to_thread(
-            self._generate_response_sync,
-            system_prompt,
-            user_prompt,
-            log_response,
-        )
+        """Generate a single response, streamed natively when the provider supports it."""
+        parts: List[str] = []
+        async for delta in self.generate_response_stream(system_prompt, user_prompt, log_response):
+            parts.append(delta)
+        return re.sub(self._CODE_BLOCK_RE, "", "".join(parts).strip())
+
+    async def generate_response_stream(
+        self,
+        system_prompt: Optional[str] = None,
+        user_prompt: Optional[str] = None,
+        log_response: bool = True,
+    ) -> AsyncIterator[str]:
+        """Stream a response from the configured provider as text deltas.
+
+        Uses the provider's native streaming API (OpenAI-compatible SSE, Anthropic
+        message streams, Gemini ``streamGenerateContent``, Ollama NDJSON, BytePlus
+        SSE). When streaming is disabled (``LLM_STREAMING=0``), not available for
+        the request (BytePlus prefix caching) or the stream fails before the first
+        token, the blocking call runs in a worker thread and its content is
+        yielded as a single delta.
+
+        Deltas are raw model output (code fences are not stripped). Once the
+        stream is exhausted the response is validated like ``generate_response``:
+        an empty response raises RuntimeError and counts as a failure. Closing the
+        iterator early cancels the provider request.
+
+        Time-to-first-token and total latency are recorded per provider in
+        ``get_latency_metrics()``, measured from admission by the rate limiter
+        hook when one is set.
+        """
+        if user_prompt is None:
+            raise ValueError("`user_prompt` cannot be None.")
+
+        self._check_failure_threshold()
+
+        if log_response:
+            logger.info(f"[LLM SEND] system={system_prompt} | user={user_prompt}")
+
+        permit = await self._admit_async(system_prompt, user_prompt)
+        usage: Dict[str, Any] = {}
+        stream = self._open_stream(system_prompt, user_prompt, usage) if self.streaming_enabled else None
+        streamed = stream is not None
+        start = time.perf_counter()
+        ttft: Optional[float] = None
+        parts: List[str] = []
+        exc_obj: Optional[BaseException] = None
+        response: Dict[str, Any] = {}
+
+        try:
+            if stream is not None:
+                try:
+                    async for delta in stream:
+                        if not delta:
+                            continue
+                        if ttft is None:
+                            ttft = time.perf_counter() - start
+                        parts.append(delta)
+                        yield delta
+                except Exception as exc:
+                    if parts:
+                        raise
+                    logger.warning(
+                        f"[LLM STREAM] {self.provider} stream failed before the first token, "
+                        f"falling back to a blocking call: {type(exc).__name__}: {exc}"
+                    )
+                    streamed = False
+                finally:
+                    await stream.aclose()
+
+            if streamed:
+                response = {
+                    "content": "".join(parts),
+                    "tokens_used": usage.get("input_tokens", 0) + usage.get("output_tokens", 0),
+                    "cached_tokens": usage.get("cached_tokens", 0),
+                }
+            elif permit is None:
+                response = await asyncio.to_thread(self._generate_blocking, system_prompt, user_prompt)
+            else:
+                # The worker thread settles the permit, even if we are cancelled
+                admitted, permit = permit, None
+                response = await asyncio.to_thread(
+                    self._run_admitted,
+                    admitted,
+                    functools.partial(self._generate_blocking, system_prompt, user_prompt),
+                    lambda r: r.get("tokens_used") or 0,
+                )
+                if response.get("content"):
+                    ttft = time.perf_counter() - start
+                    parts.append(response["content"])
+                    yield response["content"]
+        except (GeneratorExit, asyncio.CancelledError) as exc:
+            exc_obj = exc
+            raise
+        except LLMConsecutiveFailureError:
+            raise
+        except Exception as e:
+            exc_obj = e
+            self._record_failure(e)
+            raise
+        finally:
+            self._release(
+                permit,
+                response.get("tokens_used") or usage.get("input_tokens", 0) + usage.get("output_tokens", 0),
+            )
+            content = "".join(parts).strip()
+            cancelled = isinstance(exc_obj, (GeneratorExit, asyncio.CancelledError))
+            get_latency_metrics().record(
+                self.provider,
+                ttft=ttft,
+                total=time.perf_counter() - start,
+                streamed=streamed,
+                error=not cancelled and (exc_obj is not None or not content),
+            )
+            if streamed and not usage.get("replayed"):
+                if cancelled:
+                    status = "cancelled"
+                else:
+                    status = "success" if exc_obj is None else "failed"
+                self._call_log_to_db(
+                    system_prompt,
+                    user_prompt,
+                    content if exc_obj is None or content else str(exc_obj),
+                    status,
+                    usage.get("input_tokens", 0),
+                    usage.get("output_tokens", 0),
+                )
+                self._report_usage_async(
+                    usage.get("service_type", f"llm_{self.provider}"),
+                    usage.get("provider", self.provider),
+                    self.model,
+                    usage.get("input_tokens", 0),
+                    usage.get("output_tokens", 0),
+                    usage.get("cached_tokens", 0),
+                )
+
+        try:
+            self._finalize_response(response, log_response)
+        except LLMConsecutiveFailureError:
+            raise
+        except Exception as e:
+            self._record_failure(e)
+            raise
 
     def reset_failure_counter(self) -> None:
         """Reset the consecutive failure counter.
@@ -666,6 +1037,59 @@ class LLMInterface:
         if log_response:
             logger.info(f"[LLM SESSION] task={task_id} call_type={call_type} | user={user_prompt}")
 
+        session_key = f"{task_id}:{call_type}"
+        system_prompt = system_prompt_for_new_session or self._session_system_prompts.get(session_key)
+        permit = self._admit(system_prompt, user_prompt, call_type, task_id)
+        try:
+            return self._generate_with_session_cassette(
+                task_id, call_type, user_prompt, system_prompt_for_new_session, system_prompt, log_response
+            )
+        finally:
+            self._release(permit)
+
+    def _generate_with_session_cassette(
+        self,
+        task_id: str,
+        call_type: str,
+        user_prompt: str,
+        system_prompt_for_new_session: Optional[str],
+        system_prompt: Optional[str],
+        log_response: bool,
+    ) -> str:
+        cassette = self._cassette
+        if cassette is None or not (cassette.replaying or cassette.recording):
+            return self._generate_with_session_provider(
+                task_id, call_type, user_prompt, system_prompt_for_new_session, log_response
+            )
+
+        # Session calls are keyed by the session's system prompt and the new user prompt
+        if cassette.replaying:
+            response = cassette.replay(system_prompt, user_prompt, kind="session", call_type=call_type)
+            return self._finalize_response(response, log_response)
+
+        start = time.perf_counter()
+        with cassette.paused():
+            cleaned = self._generate_with_session_provider(
+                task_id, call_type, user_prompt, system_prompt_for_new_session, log_response
+            )
+        cassette.record(
+            system_prompt,
+            user_prompt,
+            {"content": cleaned},
+            time.perf_counter() - start,
+            kind="session",
+            call_type=call_type,
+        )
+        return cleaned
+
+    def _generate_with_session_provider(
+        self,
+        task_id: str,
+        call_type: str,
+        user_prompt: str,
+        system_prompt_for_new_session: Optional[str],
+        log_response: bool,
+    ) -> str:
         # Handle Gemini with explicit caching (per call_type)
         if self.provider == "gemini" and self._gemini_cache_manager:
             # Get stored system prompt or use provided one
@@ -681,8 +1105,7 @@ class LLMInterface:
             # Use Gemini with explicit caching (call_type passed for cache keying)
             response = self._generate_gemini(effective_system_prompt, user_prompt, call_type=call_type)
             cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
-            current_count = self._get_token_count()
-            self._set_token_count(current_count + response.get("tokens_used", 0))
+            self._add_token_count(response.get("tokens_used", 0))
             if log_response:
                 logger.info(f"[LLM RECV] {cleaned}")
             return cleaned
@@ -702,8 +1125,7 @@ class LLMInterface:
             # Use OpenAI with call_type for better cache routing via prompt_cache_key
             response = self._generate_openai(effective_system_prompt, user_prompt, call_type=call_type)
             cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
-            current_count = self._get_token_count()
-            self._set_token_count(current_count + response.get("tokens_used", 0))
+            self._add_token_count(response.get("tokens_used", 0))
             if log_response:
                 logger.info(f"[LLM RECV] {cleaned}")
             return cleaned
@@ -782,8 +1204,7 @@ class LLMInterface:
                 history.append({"role": "assistant", "content": assistant_content})
 
             cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
-            current_count = self._get_token_count()
-            self._set_token_count(current_count + response.get("tokens_used", 0))
+            self._add_token_count(response.get("tokens_used", 0))
             if log_response:
                 logger.info(f"[LLM RECV] {cleaned}")
             return cleaned
@@ -836,8 +1257,7 @@ class LLMInterface:
 
         cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
 
-        current_count = self._get_token_count()
-        self._set_token_count(current_count + response.get("tokens_used", 0))
+        self._add_token_count(response.get("tokens_used", 0))
         if log_response:
             logger.info(f"[LLM RECV] {cleaned}")
         return cleaned
@@ -985,13 +1405,35 @@ class LLMInterface:
             system_prompt_for_new_session: System prompt to use if creating new session.
             log_response: Whether to log the response.
         """
+        # Wait for the rate limiter here rather than in the worker thread, so
+        # cancelling the caller also withdraws a queued request.
+        system_prompt = system_prompt_for_new_session or self._session_system_prompts.get(
+            f"{task_id}:{call_type}"
+        )
+        permit = await self._admit_async(system_prompt, user_prompt, call_type, task_id)
+        if permit is None:
+            return await asyncio.to_thread(
+                self._generate_response_with_session_sync,
+                task_id,
+                call_type,
+                user_prompt,
+                system_prompt_for_new_session,
+                log_response,
+            )
+        # Bound in the worker thread, which counts its tokens under the permit
+        # (without being admitted a second time) and settles it when the call
+        # returns, so cancelling the caller does not refund a call still running
         return await asyncio.to_thread(
-            self._generate_response_with_session_sync,
-            task_id,
-            call_type,
-            user_prompt,
-            system_prompt_for_new_session,
-            log_response,
+            self._run_admitted,
+            permit,
+            functools.partial(
+                self._generate_response_with_session_sync,
+                task_id,
+                call_type,
+                user_prompt,
+                system_prompt_for_new_session,
+                log_response,
+            ),
         )
 
     def _generate_byteplus_with_session(
@@ -1124,6 +1566,78 @@ class LLMInterface:
         }
 
     # ───────────────────── Provider‑specific private helpers ─────────────────────
+    def _openai_request_kwargs(
+        self, system_prompt: str | None, user_prompt: str, call_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build chat completion kwargs for OpenAI-compatible providers."""
+        config = get_cache_config()
+        messages: List[Dict[str, str]] = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": user_prompt})
+
+        # Build request kwargs
+        request_kwargs: Dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+        }
+
+        # Newer OpenAI models (o1, o3, o4, gpt-5, etc.) require
+        # 'max_completion_tokens' instead of the legacy 'max_tokens' parameter.
+        model_lower = (self.model or "").lower()
+        uses_max_completion_tokens = (
+            model_lower.startswith("o1")
+            or model_lower.startswith("o3")
+            or model_lower.startswith("o4")
+            or model_lower.startswith("gpt-5")
+        )
+        if uses_max_completion_tokens:
+            request_kwargs["max_completion_tokens"] = self.max_tokens
+        else:
+            request_kwargs["max_tokens"] = self.max_tokens
+
+        # Always enforce JSON output format
+        request_kwargs["response_format"] = {"type": "json_object"}
+
+        # Add prompt_cache_key for OpenAI/DeepSeek cache routing.
+        # Grok (xAI) does not support prompt_cache_key — it uses automatic
+        # prefix caching and ignores this parameter, so skip it for Grok.
+        if self.provider != "grok" and call_type and system_prompt and len(system_prompt) >= config.min_cache_tokens:
+            prompt_hash = hashlib.sha256(system_prompt.encode()).hexdigest()[:16]
+            cache_key = f"{call_type}_{prompt_hash}"
+            request_kwargs["extra_body"] = {"prompt_cache_key": cache_key}
+            logger.debug(f"[OPENAI] Using prompt_cache_key: {cache_key}")
+
+        return request_kwargs
+
+    def _openai_cached_tokens(self, usage: Any) -> int:
+        """Extract cached prompt tokens from an OpenAI-compatible usage object."""
+        # Field name differs by provider:
+        # - OpenAI:  response.usage.prompt_tokens_details.cached_tokens
+        # - Grok (xAI): response.usage.prompt_cache_hit_tokens
+        if self.provider == "grok":
+            return getattr(usage, "prompt_cache_hit_tokens", 0) or 0
+        prompt_tokens_details = getattr(usage, "prompt_tokens_details", None)
+        if prompt_tokens_details:
+            return getattr(prompt_tokens_details, "cached_tokens", 0) or 0
+        return 0
+
+    def _record_openai_cache_metrics(
+        self, system_prompt: str | None, cache_type: str, cached_tokens: int, token_count_input: int
+    ) -> None:
+        """Record automatic prompt caching hits/misses for OpenAI-compatible providers."""
+        config = get_cache_config()
+        provider_label = self.provider  # "openai", "grok", "deepseek", etc.
+        metrics = get_cache_metrics()
+        if cached_tokens > 0:
+            logger.info(f"[CACHE] {provider_label} {cache_type} cache hit: {cached_tokens}/{token_count_input} tokens from cache")
+            metrics.record_hit(provider_label, cache_type, cached_tokens=cached_tokens, total_tokens=token_count_input)
+        elif system_prompt and len(system_prompt) >= config.min_cache_tokens:
+            # Caching should have been attempted (prompt long enough)
+            # This is a miss - either first call or cache expired
+            metrics.record_miss(provider_label, cache_type, total_tokens=token_count_input)
+
     @profile("llm_openai_call", OperationCategory.LLM)
     def _generate_openai(
         self, system_prompt: str | None, user_prompt: str, call_type: Optional[str] = None
@@ -1151,73 +1665,17 @@ class LLMInterface:
         status = "failed"
         content: Optional[str] = None
         exc_obj: Optional[Exception] = None
-        config = get_cache_config()
         cache_type = f"automatic_{call_type}" if call_type else "automatic"
 
         try:
-            messages: List[Dict[str, str]] = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": user_prompt})
-
-            # Build request kwargs
-            request_kwargs: Dict[str, Any] = {
-                "model": self.model,
-                "messages": messages,
-                "temperature": self.temperature,
-            }
-
-            # Newer OpenAI models (o1, o3, o4, gpt-5, etc.) require
-            # 'max_completion_tokens' instead of the legacy 'max_tokens' parameter.
-            model_lower = (self.model or "").lower()
-            uses_max_completion_tokens = (
-                model_lower.startswith("o1")
-                or model_lower.startswith("o3")
-                or model_lower.startswith("o4")
-                or model_lower.startswith("gpt-5")
-            )
-            if uses_max_completion_tokens:
-                request_kwargs["max_completion_tokens"] = self.max_tokens
-            else:
-                request_kwargs["max_tokens"] = self.max_tokens
-
-            # Always enforce JSON output format
-            request_kwargs["response_format"] = {"type": "json_object"}
-
-            # Add prompt_cache_key for OpenAI/DeepSeek cache routing.
-            # Grok (xAI) does not support prompt_cache_key — it uses automatic
-            # prefix caching and ignores this parameter, so skip it for Grok.
-            if self.provider != "grok" and call_type and system_prompt and len(system_prompt) >= config.min_cache_tokens:
-                prompt_hash = hashlib.sha256(system_prompt.encode()).hexdigest()[:16]
-                cache_key = f"{call_type}_{prompt_hash}"
-                request_kwargs["extra_body"] = {"prompt_cache_key": cache_key}
-                logger.debug(f"[OPENAI] Using prompt_cache_key: {cache_key}")
-
+            request_kwargs = self._openai_request_kwargs(system_prompt, user_prompt, call_type)
             response = self.client.chat.completions.create(**request_kwargs)
             content = response.choices[0].message.content.strip()
             token_count_input = response.usage.prompt_tokens
             token_count_output = response.usage.completion_tokens
 
-            # Extract cached tokens — field name differs by provider:
-            # - OpenAI:  response.usage.prompt_tokens_details.cached_tokens
-            # - Grok (xAI): response.usage.prompt_cache_hit_tokens
-            if self.provider == "grok":
-                cached_tokens = getattr(response.usage, "prompt_cache_hit_tokens", 0) or 0
-            else:
-                prompt_tokens_details = getattr(response.usage, "prompt_tokens_details", None)
-                if prompt_tokens_details:
-                    cached_tokens = getattr(prompt_tokens_details, "cached_tokens", 0) or 0
-
-            # Record cache metrics
-            provider_label = self.provider  # "openai", "grok", "deepseek", etc.
-            metrics = get_cache_metrics()
-            if cached_tokens > 0:
-                logger.info(f"[CACHE] {provider_label} {cache_type} cache hit: {cached_tokens}/{token_count_input} tokens from cache")
-                metrics.record_hit(provider_label, cache_type, cached_tokens=cached_tokens, total_tokens=token_count_input)
-            elif system_prompt and len(system_prompt) >= config.min_cache_tokens:
-                # Caching should have been attempted (prompt long enough)
-                # This is a miss - either first call or cache expired
-                metrics.record_miss(provider_label, cache_type, total_tokens=token_count_input)
+            cached_tokens = self._openai_cached_tokens(response.usage)
+            self._record_openai_cache_metrics(system_prompt, cache_type, cached_tokens, token_count_input)
 
             status = "success"
         except Exception as exc:
@@ -1674,6 +2132,81 @@ class LLMInterface:
             result["content"] = content or ""
         return result
 
+    def _anthropic_message_kwargs(
+        self,
+        system_prompt: str | None,
+        user_prompt: str,
+        call_type: Optional[str] = None,
+        messages: Optional[List[dict]] = None,
+    ) -> Dict[str, Any]:
+        """Build Messages API kwargs, marking long system prompts for caching."""
+        config = get_cache_config()
+        # Build the message - use pre-built messages for multi-turn, or single-turn
+        # Anthropic requires max_tokens; use 16384 (Claude 4 default) to avoid truncation
+        message_kwargs: Dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": 16384,
+            "messages": messages if messages is not None else [
+                {"role": "user", "content": user_prompt},
+            ],
+        }
+
+        if system_prompt:
+            # Use caching if system prompt is long enough
+            if len(system_prompt) >= config.min_cache_tokens:
+                # Format system as list of content blocks with cache_control
+                # Use extended 1-hour TTL when call_type is provided for better
+                # cache hit rates when alternating between different call types
+                cache_control: Dict[str, str] = {"type": "ephemeral"}
+                if call_type:
+                    # Extended TTL: cache writes cost 100% more, reads 90% cheaper
+                    # Better for alternating call types where 5-minute TTL might expire
+                    cache_control["ttl"] = "1h"
+                    logger.debug(f"[ANTHROPIC] Using 1-hour TTL for call_type: {call_type}")
+
+                message_kwargs["system"] = [
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": cache_control,
+                    }
+                ]
+            else:
+                # Short prompt - use simple string format (no caching)
+                message_kwargs["system"] = system_prompt
+
+        # Always pass temperature for Anthropic (their default is 1.0, not 0.0)
+        message_kwargs["temperature"] = self.temperature
+        return message_kwargs
+
+    def _anthropic_usage(self, usage: Any, system_prompt: str | None, cache_type: str) -> tuple:
+        """Return (input, output, cached) tokens from an Anthropic usage object and record cache metrics."""
+        config = get_cache_config()
+        # Anthropic reports input_tokens as non-cached input only.
+        # cache_creation_input_tokens: tokens written to cache (first call)
+        # cache_read_input_tokens: tokens read from cache (subsequent calls)
+        # Total input = input_tokens + cache_creation + cache_read
+        base_input = usage.input_tokens
+        token_count_output = usage.output_tokens
+        cache_creation = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        token_count_input = base_input + cache_creation + cache_read
+
+        # Record metrics
+        metrics = get_cache_metrics()
+        if cache_read > 0:
+            logger.info(f"[CACHE] Anthropic {cache_type} cache hit: {cache_read}/{token_count_input} tokens from cache")
+            metrics.record_hit("anthropic", cache_type, cached_tokens=cache_read, total_tokens=token_count_input)
+        elif cache_creation > 0:
+            logger.info(f"[CACHE] Anthropic {cache_type} cache created: {cache_creation} tokens cached")
+            # Cache creation is a "miss" for the current call but sets up future hits
+            metrics.record_miss("anthropic", cache_type, total_tokens=token_count_input)
+        elif system_prompt and len(system_prompt) >= config.min_cache_tokens:
+            # Caching was attempted but no cache info returned - unexpected
+            metrics.record_miss("anthropic", cache_type, total_tokens=token_count_input)
+
+        return token_count_input, token_count_output, cache_read
+
     @profile("llm_anthropic_call", OperationCategory.LLM)
     def _generate_anthropic(
         self, system_prompt: str | None, user_prompt: str,
@@ -1711,50 +2244,13 @@ class LLMInterface:
         status = "failed"
         content: Optional[str] = None
         exc_obj: Optional[Exception] = None
-        config = get_cache_config()
         cache_type = f"ephemeral_{call_type}" if call_type else "ephemeral"
 
         try:
             if not self._anthropic_client:
                 raise RuntimeError("Anthropic client was not initialised.")
 
-            # Build the message - use pre-built messages for multi-turn, or single-turn
-            # Anthropic requires max_tokens; use 16384 (Claude 4 default) to avoid truncation
-            message_kwargs: Dict[str, Any] = {
-                "model": self.model,
-                "max_tokens": 16384,
-                "messages": messages if messages is not None else [
-                    {"role": "user", "content": user_prompt},
-                ],
-            }
-
-            if system_prompt:
-                # Use caching if system prompt is long enough
-                if len(system_prompt) >= config.min_cache_tokens:
-                    # Format system as list of content blocks with cache_control
-                    # Use extended 1-hour TTL when call_type is provided for better
-                    # cache hit rates when alternating between different call types
-                    cache_control: Dict[str, str] = {"type": "ephemeral"}
-                    if call_type:
-                        # Extended TTL: cache writes cost 100% more, reads 90% cheaper
-                        # Better for alternating call types where 5-minute TTL might expire
-                        cache_control["ttl"] = "1h"
-                        logger.debug(f"[ANTHROPIC] Using 1-hour TTL for call_type: {call_type}")
-
-                    message_kwargs["system"] = [
-                        {
-                            "type": "text",
-                            "text": system_prompt,
-                            "cache_control": cache_control,
-                        }
-                    ]
-                else:
-                    # Short prompt - use simple string format (no caching)
-                    message_kwargs["system"] = system_prompt
-
-            # Always pass temperature for Anthropic (their default is 1.0, not 0.0)
-            message_kwargs["temperature"] = self.temperature
-
+            message_kwargs = self._anthropic_message_kwargs(system_prompt, user_prompt, call_type, messages)
             response = self._anthropic_client.messages.create(**message_kwargs)
 
             # Extract content from the response
@@ -1764,31 +2260,10 @@ class LLMInterface:
                     content += block.text
             content = content.strip()
 
-            # Token usage from Anthropic response
-            # Anthropic reports input_tokens as non-cached input only.
-            # cache_creation_input_tokens: tokens written to cache (first call)
-            # cache_read_input_tokens: tokens read from cache (subsequent calls)
-            # Total input = input_tokens + cache_creation + cache_read
-            base_input = response.usage.input_tokens
-            token_count_output = response.usage.output_tokens
-            cache_creation = getattr(response.usage, "cache_creation_input_tokens", 0) or 0
-            cache_read = getattr(response.usage, "cache_read_input_tokens", 0) or 0
-            token_count_input = base_input + cache_creation + cache_read
+            token_count_input, token_count_output, cached_tokens = self._anthropic_usage(
+                response.usage, system_prompt, cache_type
+            )
             total_tokens = token_count_input + token_count_output
-            cached_tokens = cache_read
-
-            # Record metrics
-            metrics = get_cache_metrics()
-            if cache_read > 0:
-                logger.info(f"[CACHE] Anthropic {cache_type} cache hit: {cache_read}/{token_count_input} tokens from cache")
-                metrics.record_hit("anthropic", cache_type, cached_tokens=cache_read, total_tokens=token_count_input)
-            elif cache_creation > 0:
-                logger.info(f"[CACHE] Anthropic {cache_type} cache created: {cache_creation} tokens cached")
-                # Cache creation is a "miss" for the current call but sets up future hits
-                metrics.record_miss("anthropic", cache_type, total_tokens=token_count_input)
-            elif system_prompt and len(system_prompt) >= config.min_cache_tokens:
-                # Caching was attempted but no cache info returned - unexpected
-                metrics.record_miss("anthropic", cache_type, total_tokens=token_count_input)
 
             status = "success"
 
@@ -1821,6 +2296,206 @@ class LLMInterface:
             result["content"] = content or ""
         return result
 
+    # ───────────────────── Provider-specific streaming ─────────────────────
+    # Each stream yields text deltas and fills ``usage`` (service_type, provider,
+    # input_tokens, output_tokens, cached_tokens) for generate_response_stream,
+    # which does the logging and usage reporting.
+
+    def _open_stream(
+        self, system_prompt: str | None, user_prompt: str, usage: Dict[str, Any]
+    ) -> Optional[AsyncIterator[str]]:
+        """Return the provider's (or cassette's) stream, or None to use the blocking call."""
+        cassette = self._cassette
+        if cassette is not None and cassette.replaying:
+            return cassette.open_stream(system_prompt, user_prompt, usage)
+        stream = self._open_provider_stream(system_prompt, user_prompt, usage)
+        if stream is not None and cassette is not None and cassette.recording:
+            return cassette.record_stream(stream, system_prompt, user_prompt, usage)
+        return stream
+
+    def _open_provider_stream(
+        self, system_prompt: str | None, user_prompt: str, usage: Dict[str, Any]
+    ) -> Optional[AsyncIterator[str]]:
+        if self.provider in _OPENAI_COMPATIBLE_PROVIDERS:
+            return self._stream_openai(system_prompt, user_prompt, usage)
+        if self.provider == "remote":
+            return self._stream_ollama(system_prompt, user_prompt, usage)
+        if self.provider == "gemini":
+            return self._stream_gemini(system_prompt, user_prompt, usage)
+        if self.provider == "byteplus":
+            config = get_cache_config()
+            if system_prompt and len(system_prompt) >= config.min_cache_tokens and self._byteplus_cache_manager:
+                # Prefix caching goes through the Responses API session flow
+                return None
+            return self._stream_byteplus(system_prompt, user_prompt, usage)
+        if self.provider == "anthropic":
+            return self._stream_anthropic(system_prompt, user_prompt, usage)
+        return None
+
+    def _get_async_client(self, kind: str) -> Any:
+        """Async SDK client mirroring the sync ``openai``/``anthropic`` client, per event loop."""
+        loop = asyncio.get_running_loop()
+        source = self.client if kind == "openai" else self._anthropic_client
+        if source is None:
+            raise RuntimeError(f"{kind.capitalize()} client was not initialised.")
+        cached = self._async_clients.get(kind)
+        if cached and cached[0] is loop and cached[1] is source:
+            return cached[2]
+        if kind == "openai":
+            from openai import AsyncOpenAI
+            client = AsyncOpenAI(api_key=source.api_key, base_url=str(source.base_url))
+        else:
+            from anthropic import AsyncAnthropic
+            client = AsyncAnthropic(api_key=source.api_key, base_url=str(source.base_url))
+        self._async_clients[kind] = (loop, source, client)
+        return client
+
+    async def _stream_openai(
+        self, system_prompt: str | None, user_prompt: str, usage: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        usage.update(service_type="llm_openai", provider="openai")
+        client = self._get_async_client("openai")
+        request_kwargs = self._openai_request_kwargs(system_prompt, user_prompt)
+        stream = await client.chat.completions.create(
+            **request_kwargs,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        final_usage = None
+        try:
+            async for chunk in stream:
+                if chunk.usage:
+                    final_usage = chunk.usage
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        yield delta
+        finally:
+            await stream.close()
+
+        if final_usage:
+            usage["input_tokens"] = final_usage.prompt_tokens or 0
+            usage["output_tokens"] = final_usage.completion_tokens or 0
+            usage["cached_tokens"] = self._openai_cached_tokens(final_usage)
+            self._record_openai_cache_metrics(
+                system_prompt, "automatic", usage["cached_tokens"], usage["input_tokens"]
+            )
+
+    async def _stream_anthropic(
+        self, system_prompt: str | None, user_prompt: str, usage: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        usage.update(service_type="llm_anthropic", provider="anthropic")
+        client = self._get_async_client("anthropic")
+        message_kwargs = self._anthropic_message_kwargs(system_prompt, user_prompt)
+        async with client.messages.stream(**message_kwargs) as stream:
+            async for text in stream.text_stream:
+                yield text
+            message = await stream.get_final_message()
+
+        (
+            usage["input_tokens"],
+            usage["output_tokens"],
+            usage["cached_tokens"],
+        ) = self._anthropic_usage(message.usage, system_prompt, "ephemeral")
+
+    async def _stream_gemini(
+        self, system_prompt: str | None, user_prompt: str, usage: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        usage.update(service_type="llm_gemini", provider="gemini")
+        if not self._gemini_client:
+            raise RuntimeError("Gemini client was not initialised.")
+        metadata: Dict[str, Any] = {}
+        async for chunk in self._gemini_client.stream_text(
+            get_stream_http_client(),
+            self.model,
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            temperature=self.temperature,
+            max_output_tokens=self.max_tokens,
+            json_mode=True,
+        ):
+            metadata = chunk.get("usageMetadata") or metadata
+            text = self._gemini_client.chunk_text(chunk)
+            if text:
+                yield text
+
+        usage["input_tokens"] = metadata.get("promptTokenCount", 0)
+        usage["output_tokens"] = metadata.get("candidatesTokenCount", 0)
+        usage["cached_tokens"] = cached_tokens = metadata.get("cachedContentTokenCount", 0)
+
+        config = get_cache_config()
+        metrics = get_cache_metrics()
+        if cached_tokens > 0:
+            logger.info(f"[CACHE] Gemini implicit cache hit: {cached_tokens}/{usage['input_tokens']} tokens from cache")
+            metrics.record_hit("gemini", "implicit", cached_tokens=cached_tokens, total_tokens=usage["input_tokens"])
+        elif system_prompt and len(system_prompt) >= config.min_cache_tokens:
+            metrics.record_miss("gemini", "implicit", total_tokens=usage["input_tokens"])
+
+    async def _stream_ollama(
+        self, system_prompt: str | None, user_prompt: str, usage: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        usage.update(service_type="llm_ollama", provider="remote")
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "prompt": user_prompt,
+            "stream": True,
+            "format": "json",
+            "options": {
+                "temperature": self.temperature,
+            }
+        }
+        if system_prompt:
+            payload["system"] = system_prompt
+        url = f"{self.remote_url.rstrip('/')}/api/generate"
+
+        async with get_stream_http_client().stream("POST", url, json=payload) as response:
+            await raise_for_stream_status(response)
+            async for chunk in iter_ndjson(response):
+                if chunk.get("error"):
+                    raise RuntimeError(f"Ollama error: {chunk['error']}")
+                if chunk.get("response"):
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    usage["input_tokens"] = chunk.get("prompt_eval_count", 0)
+                    usage["output_tokens"] = chunk.get("eval_count", 0)
+                    break
+
+    async def _stream_byteplus(
+        self, system_prompt: str | None, user_prompt: str, usage: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        usage.update(service_type="llm_byteplus", provider="byteplus")
+        messages: List[Dict[str, str]] = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": user_prompt})
+
+        url = f"{self.byteplus_base_url.rstrip('/')}/chat/completions"
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+        logger.info(f"[BYTEPLUS STREAM REQUEST] URL: {url}, Model: {self.model}")
+
+        async with get_stream_http_client().stream("POST", url, json=payload, headers=headers) as response:
+            await raise_for_stream_status(response)
+            async for data in iter_sse_data(response):
+                chunk = json.loads(data)
+                if chunk.get("usage"):
+                    usage["input_tokens"] = int(chunk["usage"].get("prompt_tokens", 0))
+                    usage["output_tokens"] = int(chunk["usage"].get("completion_tokens", 0))
+                for choice in chunk.get("choices") or []:
+                    delta = (choice.get("delta") or {}).get("content")
+                    if delta:
+                        yield delta
+
     # ─────────────────── CLI helper for ad‑hoc testing ───────────────────
     def _cli(self) -> None:  # pragma: no cover
         """Run a quick interactive shell for manual testing."""
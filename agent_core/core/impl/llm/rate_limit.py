@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Per-call context for LLM rate limiting.
+
+Callers describe the calls they are about to make with ``llm_call_context``;
+LLMInterface passes the current priority and session to its rate limit hook
+(see ``RateLimitRequest`` in core.hooks). The context is held in contextvars,
+so it follows the call into ``asyncio.to_thread`` workers and asyncio tasks
+created inside the block.
+
+Example:
+    with llm_call_context(priority=LLMPriority.BACKGROUND):
+        summary = llm.generate_response(user_prompt=prompt)
+"""
+
+from __future__ import annotations
+
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+from agent_core.core.impl.llm.types import LLMPriority
+
+_call_priority: contextvars.ContextVar[Optional[LLMPriority]] = contextvars.ContextVar(
+    "llm_call_priority", default=None
+)
+_call_session: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "llm_call_session", default=None
+)
+
+
+@contextmanager
+def llm_call_context(
+    *,
+    priority: Optional[LLMPriority] = None,
+    session_id: Optional[str] = None,
+) -> Iterator[None]:
+    """Set the priority and/or session of the LLM calls made inside the block.
+
+    Arguments left as None keep the value of the enclosing context.
+    """
+    tokens = []
+    if priority is not None:
+        tokens.append((_call_priority, _call_priority.set(LLMPriority(priority))))
+    if session_id:
+        tokens.append((_call_session, _call_session.set(session_id)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def current_llm_call_context() -> Tuple[LLMPriority, Optional[str]]:
+    """Return (priority, session_id) of the current context; priority defaults to NORMAL."""
+    return _call_priority.get() or LLMPriority.NORMAL, _call_session.get()
@@ -0,0 +1,448 @@
+# -*- coding: utf-8 -*-
+"""
+Record/replay fixtures for LLM calls.
+
+An ``LLMCassette`` sits behind ``LLMInterface``. In record mode every
+provider call (blocking, streamed and session-cached) is appended to a JSONL
+fixture; in replay mode calls are answered from that fixture without
+touching the network, which makes agent runs and benchmarks deterministic
+and runnable offline.
+
+Replayed calls are matched by prompt hash, in this order:
+
+1. SHA-256 of the exact (system prompt, user prompt) pair
+2. the same hash after masking volatile text (timestamps, UUIDs, long hex
+   ids), so a fixture recorded yesterday still matches today's prompts
+3. unless ``strict``, the next unused entry in recording order; hand-written
+   fixtures (entries without a ``key``) are served this way
+
+Entries recorded for the same prompt are replayed in recording order.
+Synthetic latency (``ttft`` + ``token_latency`` per output token, plus
+``latency_scale`` x the recorded latency) lets replayed calls take realistic
+time; streamed calls are replayed in chunks.
+
+Enable with ``LLMInterface.use_cassette()`` or the environment:
+``LLM_CASSETTE=<path>``, ``LLM_CASSETTE_MODE=record|replay`` (default
+replay), ``LLM_CASSETTE_STRICT=1``, ``LLM_REPLAY_TTFT``,
+``LLM_REPLAY_TOKEN_LATENCY`` and ``LLM_REPLAY_LATENCY_SCALE``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional
+
+from agent_core.utils.logger import logger
+
+CASSETTE_MODES = ("record", "replay")
+# Per-call log kept for reporting (sizes and hashes only unless keep_prompts)
+CALL_LOG_SIZE = 10_000
+# Characters of the user prompt stored in each entry to make fixtures readable
+PREVIEW_CHARS = 200
+
+# Volatile text masked before hashing; order matters (datetimes before dates/times)
+_VOLATILE_PATTERNS = (
+    (re.compile(
+        r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:[.,]\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?"
+    ), "<datetime>"),
+    (re.compile(
+        r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.IGNORECASE
+    ), "<uuid>"),
+    (re.compile(r"\b\d{4}-\d{2}-\d{2}\b"), "<date>"),
+    (re.compile(r"\b\d{1,2}:\d{2}(?::\d{2})?(?:\s?[AP]M)?\b", re.IGNORECASE), "<time>"),
+    (re.compile(r"\b\d{10,13}(?:\.\d+)?\b"), "<epoch>"),
+    (re.compile(r"\b(?=[0-9a-f]*\d)[0-9a-f]{6,}\b"), "<hex>"),
+    (re.compile(r"\d+(?:\.\d+)?\s?(?:ms|s|sec|seconds)\b"), "<duration>"),
+)
+
+
+def normalize_prompt(text: Optional[str]) -> str:
+    """Mask volatile text (timestamps, UUIDs, hex ids, durations) in a prompt."""
+    if not text:
+        return ""
+    for pattern, placeholder in _VOLATILE_PATTERNS:
+        text = pattern.sub(placeholder, text)
+    return text
+
+
+def prompt_key(system_prompt: Optional[str], user_prompt: Optional[str]) -> str:
+    """Stable hash of a (system prompt, user prompt) pair."""
+    digest = hashlib.sha256()
+    for part in (system_prompt or "", user_prompt or ""):
+        encoded = part.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def _estimate_tokens(text: Optional[str]) -> int:
+    return (len(text) + 3) // 4 if text else 0
+
+
+class LLMCassette:
+    """
+    JSONL fixture of LLM calls, recorded from a provider or replayed offline.
+
+    Each fixture line is one call::
+
+        {"key": ..., "normalized_key": ..., "kind": "generate"|"stream"|"session",
+         "call_type": ..., "system_chars": ..., "user_chars": ..., "user_preview": ...,
+         "content": ..., "input_tokens": ..., "output_tokens": ..., "tokens_used": ...,
+         "ttft_s": ..., "latency_s": ...}
+
+    Only ``content`` is required; a fixture of bare ``{"content": ...}`` lines
+    scripts a run in order.
+
+    Args:
+        path: Fixture file. Record mode truncates it.
+        mode: "record" or "replay".
+        strict: In replay mode, fail calls whose prompt hash is not in the
+            fixture instead of serving the next unused entry.
+        ttft: Synthetic seconds before the first token of a replayed call.
+        token_latency: Synthetic seconds per output token of a replayed call.
+        latency_scale: Multiplier on the recorded latency, added to the above.
+        chunk_chars: Size of the chunks a streamed replay yields.
+        keep_prompts: Keep full prompts in ``calls`` (for reporting tools).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: str = "replay",
+        *,
+        strict: bool = False,
+        ttft: float = 0.0,
+        token_latency: float = 0.0,
+        latency_scale: float = 0.0,
+        chunk_chars: int = 16,
+        keep_prompts: bool = False,
+    ) -> None:
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected one of {CASSETTE_MODES}")
+        self.path = Path(path)
+        self.mode = mode
+        self.strict = strict
+        self.ttft = ttft
+        self.token_latency = token_latency
+        self.latency_scale = latency_scale
+        self.chunk_chars = max(1, chunk_chars)
+        self.keep_prompts = keep_prompts
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._entries: List[Dict[str, Any]] = []
+        self._used: List[bool] = []
+        self._by_key: Dict[str, Deque[int]] = {}
+        self._by_normalized: Dict[str, Deque[int]] = {}
+        self._cursor = 0
+        self.calls: Deque[Dict[str, Any]] = deque(maxlen=CALL_LOG_SIZE)
+        self._stats = {"exact": 0, "normalized": 0, "sequence": 0, "misses": 0, "recorded": 0}
+
+        if mode == "replay":
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("", encoding="utf-8")
+
+    @classmethod
+    def from_env(cls) -> Optional["LLMCassette"]:
+        """Cassette configured by ``LLM_CASSETTE*`` environment variables, if any."""
+        path = os.getenv("LLM_CASSETTE")
+        if not path:
+            return None
+        return cls(
+            path,
+            os.getenv("LLM_CASSETTE_MODE", "replay"),
+            strict=os.getenv("LLM_CASSETTE_STRICT", "0") == "1",
+            ttft=float(os.getenv("LLM_REPLAY_TTFT", "0")),
+            token_latency=float(os.getenv("LLM_REPLAY_TOKEN_LATENCY", "0")),
+            latency_scale=float(os.getenv("LLM_REPLAY_LATENCY_SCALE", "0")),
+        )
+
+    # ───────────────────────────── Fixture ─────────────────────────────
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            raise FileNotFoundError(f"LLM cassette not found: {self.path}")
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{self.path}:{line_no}: invalid cassette entry: {e}") from e
+                if not isinstance(entry, dict) or "content" not in entry:
+                    raise ValueError(f"{self.path}:{line_no}: cassette entry needs a 'content' field")
+                self._add(entry)
+        logger.info(f"[LLM CASSETTE] Replaying {len(self._entries)} call(s) from {self.path}")
+
+    def _add(self, entry: Dict[str, Any]) -> None:
+        index = len(self._entries)
+        self._entries.append(entry)
+        self._used.append(False)
+        if entry.get("key"):
+            self._by_key.setdefault(entry["key"], deque()).append(index)
+        if entry.get("normalized_key"):
+            self._by_normalized.setdefault(entry["normalized_key"], deque()).append(index)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @property
+    def recording(self) -> bool:
+        """True in record mode, except inside ``paused()`` on this thread."""
+        return self.mode == "record" and not getattr(self._local, "paused", False)
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """Don't record calls made on this thread (e.g. a fallback inside a recorded call)."""
+        previous = getattr(self._local, "paused", False)
+        self._local.paused = True
+        try:
+            yield
+        finally:
+            self._local.paused = previous
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "path": str(self.path),
+                "entries": len(self._entries),
+                "unused": self._used.count(False),
+                **self._stats,
+            }
+
+    # ───────────────────────────── Replay ─────────────────────────────
+
+    def _take(self, queue: Optional[Deque[int]]) -> Optional[int]:
+        while queue:
+            index = queue.popleft()
+            if not self._used[index]:
+                return index
+        return None
+
+    def _match(self, system_prompt: Optional[str], user_prompt: str) -> tuple:
+        """Claim the entry answering a prompt; returns (entry or None, how, key)."""
+        key = prompt_key(system_prompt, user_prompt)
+        with self._lock:
+            index = self._take(self._by_key.get(key))
+            how = "exact"
+            if index is None:
+                normalized = prompt_key(normalize_prompt(system_prompt), normalize_prompt(user_prompt))
+                index = self._take(self._by_normalized.get(normalized))
+                how = "normalized"
+            if index is None and not self.strict:
+                while self._cursor < len(self._used) and self._used[self._cursor]:
+                    self._cursor += 1
+                if self._cursor < len(self._used):
+                    index = self._cursor
+                    how = "sequence"
+            if index is None:
+                return None, "miss", key
+            self._used[index] = True
+            return self._entries[index], how, key
+
+    def _log_call(
+        self,
+        how: str,
+        key: str,
+        kind: str,
+        call_type: Optional[str],
+        system_prompt: Optional[str],
+        user_prompt: str,
+        content: str,
+        latency: float,
+    ) -> None:
+        call_type = getattr(call_type, "value", call_type)
+        call = {
+            "match": how,
+            "key": key,
+            "kind": kind,
+            "call_type": call_type,
+            "system_chars": len(system_prompt or ""),
+            "user_chars": len(user_prompt),
+            "content_chars": len(content),
+            "latency_s": latency,
+        }
+        if self.keep_prompts:
+            call.update(system_prompt=system_prompt, user_prompt=user_prompt, content=content)
+        with self._lock:
+            self._stats["misses" if how == "miss" else how] += 1
+            self.calls.append(call)
+
+    def _miss(self, key: str, kind: str, call_type: Optional[str], system_prompt, user_prompt) -> Dict[str, Any]:
+        self._log_call("miss", key, kind, call_type, system_prompt, user_prompt, "", 0.0)
+        preview = user_prompt[:80].replace("\n", " ")
+        logger.warning(f"[LLM CASSETTE] No recorded response for prompt {key[:12]} ({preview!r})")
+        return {"content": "", "error": f"No recorded response in {self.path.name} for prompt {key[:12]}"}
+
+    def _usage(self, entry: Dict[str, Any], system_prompt: Optional[str], user_prompt: str) -> tuple:
+        content = entry.get("content", "")
+        input_tokens = entry.get("input_tokens")
+        if input_tokens is None:
+            input_tokens = _estimate_tokens(system_prompt) + _estimate_tokens(user_prompt)
+        output_tokens = entry.get("output_tokens")
+        if output_tokens is None:
+            output_tokens = _estimate_tokens(content)
+        return input_tokens, output_tokens
+
+    def _delays(self, entry: Dict[str, Any], output_tokens: int) -> tuple:
+        """Synthetic (time to first token, remaining time) for a replayed entry."""
+        recorded_total = float(entry.get("latency_s") or 0.0)
+        recorded_ttft = float(entry.get("ttft_s") or recorded_total)
+        first = self.ttft + self.latency_scale * recorded_ttft
+        rest = self.token_latency * output_tokens + self.latency_scale * max(0.0, recorded_total - recorded_ttft)
+        return first, rest
+
+    def replay(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        *,
+        kind: str = "generate",
+        call_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Answer a blocking call from the fixture, in the provider response format."""
+        entry, how, key = self._match(system_prompt, user_prompt)
+        if entry is None:
+            return self._miss(key, kind, call_type, system_prompt, user_prompt)
+        start = time.perf_counter()
+        input_tokens, output_tokens = self._usage(entry, system_prompt, user_prompt)
+        first, rest = self._delays(entry, output_tokens)
+        if first + rest > 0:
+            time.sleep(first + rest)
+        content = entry.get("content", "")
+        self._log_call(how, key, kind, call_type, system_prompt, user_prompt, content, time.perf_counter() - start)
+        return {
+            "content": content,
+            "tokens_used": entry.get("tokens_used", input_tokens + output_tokens),
+            "cached_tokens": entry.get("cached_tokens", 0),
+        }
+
+    def open_stream(
+        self, system_prompt: Optional[str], user_prompt: str, usage: Dict[str, Any]
+    ) -> Optional[AsyncIterator[str]]:
+        """
+        Replay stream for a streamed call, or None if nothing matches.
+
+        The entry is claimed right away; on a miss the caller falls back to a
+        blocking call, which reports the miss through ``replay``.
+        """
+        entry, how, key = self._match(system_prompt, user_prompt)
+        if entry is None:
+            return None
+        input_tokens, output_tokens = self._usage(entry, system_prompt, user_prompt)
+        usage.update(
+            replayed=True,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cached_tokens=entry.get("cached_tokens", 0),
+        )
+        return self._replay_stream(entry, how, key, system_prompt, user_prompt, output_tokens)
+
+    async def _replay_stream(
+        self,
+        entry: Dict[str, Any],
+        how: str,
+        key: str,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        output_tokens: int,
+    ) -> AsyncIterator[str]:
+        start = time.perf_counter()
+        content = entry.get("content", "")
+        chunks = [content[i:i + self.chunk_chars] for i in range(0, len(content), self.chunk_chars)]
+        first, rest = self._delays(entry, output_tokens)
+        per_chunk = rest / len(chunks) if chunks else 0.0
+        if first > 0:
+            await asyncio.sleep(first)
+        for i, chunk in enumerate(chunks):
+            if i and per_chunk > 0:
+                await asyncio.sleep(per_chunk)
+            yield chunk
+        self._log_call(how, key, "stream", None, system_prompt, user_prompt, content, time.perf_counter() - start)
+
+    # ───────────────────────────── Record ─────────────────────────────
+
+    def record(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        response: Dict[str, Any],
+        latency: float,
+        *,
+        kind: str = "generate",
+        call_type: Optional[str] = None,
+        ttft: Optional[float] = None,
+    ) -> None:
+        """Append a provider response to the fixture (failed calls are not recorded)."""
+        content = response.get("content", "")
+        if not content or response.get("error"):
+            return
+        key = prompt_key(system_prompt, user_prompt)
+        entry: Dict[str, Any] = {
+            "key": key,
+            "normalized_key": prompt_key(normalize_prompt(system_prompt), normalize_prompt(user_prompt)),
+            "kind": kind,
+            "call_type": getattr(call_type, "value", call_type),
+            "system_chars": len(system_prompt or ""),
+            "user_chars": len(user_prompt),
+            "user_preview": user_prompt[:PREVIEW_CHARS],
+            "content": content,
+        }
+        for field in ("input_tokens", "output_tokens", "tokens_used", "cached_tokens"):
+            if response.get(field) is not None:
+                entry[field] = response[field]
+        if ttft is not None:
+            entry["ttft_s"] = round(ttft, 4)
+        entry["latency_s"] = round(latency, 4)
+
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._add(entry)
+            self._used[-1] = True
+        self._log_call("recorded", key, kind, call_type, system_prompt, user_prompt, content, latency)
+
+    async def record_stream(
+        self,
+        stream: AsyncIterator[str],
+        system_prompt: Optional[str],
+        user_prompt: str,
+        usage: Dict[str, Any],
+    ) -> AsyncIterator[str]:
+        """Pass a provider stream through, recording it once it completes."""
+        start = time.perf_counter()
+        ttft: Optional[float] = None
+        parts: List[str] = []
+        try:
+            async for delta in stream:
+                if delta and ttft is None:
+                    ttft = time.perf_counter() - start
+                parts.append(delta)
+                yield delta
+        finally:
+            await stream.aclose()
+        response = {
+            "content": "".join(parts),
+            "input_tokens": usage.get("input_tokens"),
+            "output_tokens": usage.get("output_tokens"),
+            "cached_tokens": usage.get("cached_tokens"),
+        }
+        self.record(
+            system_prompt, user_prompt, response, time.perf_counter() - start, kind="stream", ttft=ttft
+        )
@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+"""
+core.llm.streaming
+
+Helpers for streamed LLM responses:
+
+- IncrementalJSONParser: parses a JSON document fed in arbitrary chunks and
+  reports every value (with its path) as soon as it is complete, so callers
+  can act on e.g. ``actions[0].action_name`` before the response ends
+- iter_sse_data / iter_ndjson: decode server-sent-event and newline-delimited
+  JSON response bodies from an ``httpx`` streaming response
+- LatencyMetrics: time-to-first-token and total latency per provider
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import threading
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from json.decoder import scanstring
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple, Union
+
+# Logging setup
+try:
+    from agent_core.utils.logger import logger
+except Exception:  # pragma: no cover
+    logger = logging.getLogger(__name__)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+
+JSONPath = Tuple[Union[str, int], ...]
+JSONEvent = Tuple[JSONPath, Any]
+
+_NUMBER_RE = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_NUMBER_CHARS_RE = re.compile(r"[-+.eE\d]*")
+_LITERALS = {"true": True, "false": False, "null": None}
+_WHITESPACE = " \t\n\r"
+
+# Container frame states
+_KEY_OR_END, _KEY, _COLON, _VALUE, _COMMA_OR_END, _VALUE_OR_END = range(6)
+
+
+class _Frame:
+    __slots__ = ("container", "path", "state", "key")
+
+    def __init__(self, container: Union[dict, list], path: JSONPath, state: int) -> None:
+        self.container = container
+        self.path = path
+        self.state = state
+        self.key: Optional[str] = None
+
+
+class IncrementalJSONParser:
+    """Incremental parser for one JSON value (object or array) arriving in chunks.
+
+    Text before the first ``{`` or ``[`` (e.g. a ```json fence) is skipped and
+    anything after the value is complete is ignored.
+
+    Usage:
+        parser = IncrementalJSONParser()
+        for chunk in stream:
+            for path, value in parser.feed(chunk):
+                if path[-1:] == ("action_name",):
+                    ...
+            if parser.done:
+                break
+        decision = parser.result
+    """
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._started = False
+        self._string_scan = 0  # where to resume looking for a closing quote
+        self.done = False
+        self.result: Any = None
+        self.error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    @property
+    def partial(self) -> Any:
+        """The root value parsed so far (complete children only), or None before it starts."""
+        if self._stack:
+            return self._stack[0].container
+        return self.result
+
+    def feed(self, chunk: str) -> List[JSONEvent]:
+        """Consume a chunk and return the (path, value) of every value it completed."""
+        if self.done or self.error or not chunk:
+            return []
+        self._buf = self._buf[self._pos:] + chunk
+        self._string_scan = max(0, self._string_scan - self._pos)
+        self._pos = 0
+        events: List[JSONEvent] = []
+        try:
+            self._parse(events)
+        except ValueError as e:
+            self.error = str(e)
+            logger.debug(f"[STREAM JSON] Parse error: {e}")
+        return events
+
+    # ─────────────── Parsing ───────────────
+
+    def _parse(self, events: List[JSONEvent]) -> None:
+        buf = self._buf
+        n = len(buf)
+
+        if not self._started:
+            starts = [i for i in (buf.find("{", self._pos), buf.find("[", self._pos)) if i >= 0]
+            if not starts:
+                self._pos = n
+                return
+            self._pos = min(starts)
+            self._started = True
+            self._open(buf[self._pos], ())
+            self._pos += 1
+
+        while self._stack:
+            pos = self._pos
+            while pos < n and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos >= n:
+                return
+            frame = self._stack[-1]
+            char = buf[pos]
+            state = frame.state
+
+            if state in (_KEY_OR_END, _KEY):
+                if char == "}" and state == _KEY_OR_END:
+                    self._pos += 1
+                    self._close(events)
+                elif char == '"':
+                    key = self._read_string()
+                    if key is None:
+                        return
+                    frame.key = key
+                    frame.state = _COLON
+                else:
+                    raise ValueError(f"expected object key at offset {pos}, got {char!r}")
+            elif state == _COLON:
+                if char != ":":
+                    raise ValueError(f"expected ':' at offset {pos}, got {char!r}")
+                self._pos += 1
+                frame.state = _VALUE
+            elif state == _COMMA_OR_END:
+                self._pos += 1
+                if char == ",":
+                    frame.state = _KEY if isinstance(frame.container, dict) else _VALUE
+                elif char == ("}" if isinstance(frame.container, dict) else "]"):
+                    self._close(events)
+                else:
+                    raise ValueError(f"expected ',' or closing bracket at offset {pos}, got {char!r}")
+            else:  # _VALUE or _VALUE_OR_END
+                if char == "]" and state == _VALUE_OR_END:
+                    self._pos += 1
+                    self._close(events)
+                    continue
+                if char in "{[":
+                    self._pos += 1
+                    self._open(char, self._child_path(frame))
+                    continue
+                found, value = self._read_scalar(char)
+                if not found:
+                    return
+                self._store(frame, value, events)
+
+    def _child_path(self, frame: _Frame) -> JSONPath:
+        if isinstance(frame.container, dict):
+            return frame.path + (frame.key,)
+        return frame.path + (len(frame.container),)
+
+    def _open(self, char: str, path: JSONPath) -> None:
+        if char == "{":
+            self._stack.append(_Frame({}, path, _KEY_OR_END))
+        else:
+            self._stack.append(_Frame([], path, _VALUE_OR_END))
+
+    def _close(self, events: List[JSONEvent]) -> None:
+        frame = self._stack.pop()
+        if self._stack:
+            self._store(self._stack[-1], frame.container, events)
+        else:
+            events.append((frame.path, frame.container))
+            self.result = frame.container
+            self.done = True
+
+    def _store(self, frame: _Frame, value: Any, events: List[JSONEvent]) -> None:
+        if isinstance(frame.container, dict):
+            frame.container[frame.key] = value
+            events.append((frame.path + (frame.key,), value))
+        else:
+            events.append((frame.path + (len(frame.container),), value))
+            frame.container.append(value)
+        frame.state = _COMMA_OR_END
+
+    def _read_string(self) -> Optional[str]:
+        """Decode the string starting at the current position, or None if it is incomplete."""
+        buf = self._buf
+        start = self._pos
+        scan = max(start + 1, self._string_scan)
+        while True:
+            end = buf.find('"', scan)
+            if end < 0:
+                self._string_scan = len(buf)
+                return None
+            backslashes = 0
+            i = end - 1
+            while i > start and buf[i] == "\\":
+                backslashes += 1
+                i -= 1
+            if backslashes % 2 == 0:
+                break
+            scan = end + 1
+        value, self._pos = scanstring(buf, start + 1, True)
+        self._string_scan = 0
+        return value
+
+    def _read_scalar(self, char: str) -> Tuple[bool, Any]:
+        buf = self._buf
+        if char == '"':
+            value = self._read_string()
+            return (value is not None), value
+        if char == "-" or char.isdigit():
+            end = _NUMBER_CHARS_RE.match(buf, self._pos).end()
+            if end == len(buf):
+                # The number may continue in the next chunk
+                return False, None
+            text = buf[self._pos:end]
+            if not _NUMBER_RE.fullmatch(text):
+                raise ValueError(f"invalid number {text!r} at offset {self._pos}")
+            self._pos = end
+            return True, float(text) if any(c in text for c in ".eE") else int(text)
+        for literal, value in _LITERALS.items():
+            if buf.startswith(literal, self._pos):
+                self._pos += len(literal)
+                return True, value
+            if literal.startswith(buf[self._pos:]):
+                return False, None
+        raise ValueError(f"unexpected {char!r} at offset {self._pos}")
+
+
+# ─────────────── Streaming response bodies ───────────────
+
+async def iter_sse_data(response: Any) -> AsyncIterator[str]:
+    """Yield the ``data`` payload of each server-sent event until ``[DONE]``."""
+    data: List[str] = []
+    async for line in response.aiter_lines():
+        if not line:
+            if data:
+                payload = "\n".join(data)
+                data = []
+                if payload.strip() == "[DONE]":
+                    return
+                yield payload
+            continue
+        if line.startswith("data:"):
+            data.append(line[5:].lstrip(" "))
+    if data:
+        payload = "\n".join(data)
+        if payload.strip() != "[DONE]":
+            yield payload
+
+
+async def iter_ndjson(response: Any) -> AsyncIterator[Dict[str, Any]]:
+    """Yield each object of a newline-delimited JSON response body."""
+    async for line in response.aiter_lines():
+        if line.strip():
+            yield json.loads(line)
+
+
+async def raise_for_stream_status(response: Any) -> None:
+    """Like ``raise_for_status()``, but reads the error body of a streaming response first."""
+    if response.status_code >= 400:
+        await response.aread()
+        logger.warning(f"[LLM STREAM] HTTP {response.status_code}: {response.text[:1000]}")
+        response.raise_for_status()
+
+
+# Event loop -> shared httpx.AsyncClient for REST-based providers
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+_http_lock = threading.Lock()
+
+
+def get_stream_http_client() -> Any:
+    """Get the shared ``httpx.AsyncClient`` for streaming requests on the running loop."""
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    with _http_lock:
+        client = _http_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(timeout=httpx.Timeout(600.0, connect=30.0))
+            _http_clients[loop] = client
+        return client
+
+
+# ─────────────── Latency metrics ───────────────
+
+# Recent samples kept per provider for percentiles
+LATENCY_SAMPLES = 200
+
+
+@dataclass
+class LatencyEntry:
+    """Latency statistics for one provider."""
+    calls: int = 0
+    errors: int = 0
+    streamed: int = 0
+    ttft: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+    total: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+
+    @staticmethod
+    def _percentile(samples: Deque[float], pct: float) -> float:
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "streamed": self.streamed,
+            "ttft_p50_ms": self._percentile(self.ttft, 0.5) * 1000,
+            "ttft_p95_ms": self._percentile(self.ttft, 0.95) * 1000,
+            "total_p50_ms": self._percentile(self.total, 0.5) * 1000,
+            "total_p95_ms": self._percentile(self.total, 0.95) * 1000,
+        }
+
+
+class LatencyMetrics:
+    """Tracks time-to-first-token and total latency of LLM calls per provider.
+
+    Usage:
+        metrics = get_latency_metrics()
+        metrics.record("openai", ttft=0.42, total=1.9, streamed=True)
+        print(metrics.get_summary())
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, LatencyEntry] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        provider: str,
+        *,
+        ttft: Optional[float],
+        total: float,
+        streamed: bool = True,
+        error: bool = False,
+    ) -> None:
+        """Record one call. ``ttft`` is None when no token arrived."""
+        with self._lock:
+            entry = self._entries.setdefault(provider, LatencyEntry())
+            entry.calls += 1
+            if error:
+                entry.errors += 1
+                return
+            if streamed:
+                entry.streamed += 1
+            if ttft is not None:
+                entry.ttft.append(ttft)
+            entry.total.append(total)
+
+    def get(self, provider: str) -> Dict[str, float]:
+        with self._lock:
+            entry = self._entries.get(provider)
+            return entry.summary() if entry else LatencyEntry().summary()
+
+    def get_summary(self) -> str:
+        """Get a formatted summary of latency per provider."""
+        lines = ["=" * 60, "LLM LATENCY SUMMARY", "=" * 60]
+        with self._lock:
+            for provider, entry in self._entries.items():
+                s = entry.summary()
+                lines.append(
+                    f"\n{provider.upper()}:"
+                    f"\n    Calls: {s['calls']} (streamed={s['streamed']}, errors={s['errors']})"
+                    f"\n    Time to first token: p50 {s['ttft_p50_ms']:.0f} ms, p95 {s['ttft_p95_ms']:.0f} ms"
+                    f"\n    Total: p50 {s['total_p50_ms']:.0f} ms, p95 {s['total_p95_ms']:.0f} ms"
+                )
+        lines.append("=" * 60)
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Reset all metrics."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global latency metrics instance
+_latency_metrics: Optional[LatencyMetrics] = None
+
+
+def get_latency_metrics() -> LatencyMetrics:
+    """Get the global latency metrics instance."""
+    global _latency_metrics
+    if _latency_metrics is None:
+        _latency_metrics = LatencyMetrics()
+    return _latency_metrics
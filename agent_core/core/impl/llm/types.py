@@ -20,3 +20,15 @@ class LLMCallType(str, Enum):
     ACTION_SELECTION = "action_selection"
     GUI_REASONING = "gui_reasoning"
     GUI_ACTION_SELECTION = "gui_action_selection"
+
+
+class LLMPriority(str, Enum):
+    """Scheduling class of an LLM call, used by rate limiters.
+
+    Interactive calls (replies the user is waiting on) may use capacity that
+    normal and background calls have to leave free, and are served first
+    when calls queue up.
+    """
+    INTERACTIVE = "interactive"
+    NORMAL = "normal"
+    BACKGROUND = "background"
@@ -279,9 +279,6 @@ class MCPActionAdapter:
         """
         Unregister all MCP tools from a specific server.
 
-        Note: The ActionRegistry doesn't have a built-in unregister method,
-        so this creates a workaround by removing from the internal registry.
-
         Args:
             server_name: Name of the MCP server
 
@@ -298,8 +295,8 @@ class MCPActionAdapter:
         ]
 
         for action_name in actions_to_remove:
-            del registry_instance._registry[action_name]
-            count += 1
-            logger.debug(f"Unregistered MCP action: {action_name}")
+            if registry_instance.unregister(action_name):
+                count += 1
+                logger.debug(f"Unregistered MCP action: {action_name}")
 
         return count
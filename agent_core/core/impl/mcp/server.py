@@ -9,12 +9,14 @@ Manages connections to individual MCP servers with support for multiple transpor
 """
 
 import asyncio
+import json
 import os
 import shutil
 import sys
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from agent_core.utils.logger import logger
 from agent_core.core.impl.mcp.config import MCPServerConfig
@@ -23,6 +25,12 @@ from agent_core.core.impl.mcp.config import MCPServerConfig
 DEFAULT_CLIENT_NAME = "Agent"
 DEFAULT_CLIENT_VERSION = "1.0.0"
 
+# Seconds to wait for a JSON-RPC response before giving up on a request
+DEFAULT_REQUEST_TIMEOUT = 30.0
+
+# Lines of subprocess stderr kept for error reports
+STDERR_TAIL_LINES = 50
+
 # Module-level client info (can be set by runtime)
 _client_name: str = DEFAULT_CLIENT_NAME
 _client_version: str = DEFAULT_CLIENT_VERSION
@@ -82,17 +90,50 @@ class MCPTransport(ABC):
         """Check if the transport is connected."""
         pass
 
+    def set_notification_handler(self, handler: Optional[Callable[[str, Dict[str, Any]], None]]) -> None:
+        """Register a callback for server-initiated notifications (method, params)."""
+        self._notification_handler = handler
+
+    def _notify(self, method: str, params: Dict[str, Any]) -> None:
+        handler = getattr(self, "_notification_handler", None)
+        if handler is None:
+            return
+        try:
+            handler(method, params)
+        except Exception as e:
+            logger.warning(f"[MCP] Notification handler failed for '{method}': {e}")
+
 
 class StdioTransport(MCPTransport):
-    """Stdio transport using subprocess communication."""
+    """
+    Stdio transport using subprocess communication.
+
+    Requests are multiplexed over the subprocess pipes: a single reader task
+    dispatches responses to pending futures by JSON-RPC ``id`` and a writer
+    task drains an outgoing queue, so any number of requests can be in
+    flight at once. Timed-out or cancelled requests are reported to the
+    server with ``notifications/cancelled``.
+    """
 
-    def __init__(self, command: str, args: List[str], env: Dict[str, str]):
+    def __init__(
+        self,
+        command: str,
+        args: List[str],
+        env: Dict[str, str],
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ):
         self.command = command
         self.args = args
         self.env = env
+        self.request_timeout = request_timeout
         self._process: Optional[asyncio.subprocess.Process] = None
         self._request_id = 0
-        self._lock = asyncio.Lock()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._stderr_tail: Deque[str] = deque(maxlen=STDERR_TAIL_LINES)
 
     @property
     def is_connected(self) -> bool:
@@ -177,6 +218,12 @@ class StdioTransport(MCPTransport):
 
             logger.debug(f"[StdioTransport] Subprocess started with PID {self._process.pid}")
 
+            # Start the I/O tasks before the first request
+            self._write_queue = asyncio.Queue()
+            self._reader_task = asyncio.create_task(self._read_loop())
+            self._writer_task = asyncio.create_task(self._write_loop())
+            self._stderr_task = asyncio.create_task(self._drain_stderr())
+
             # Send initialize request
             client_info = get_client_info()
             init_response = await self.send_request("initialize", {
@@ -191,17 +238,9 @@ class StdioTransport(MCPTransport):
                     error_msg = error_msg.get('message', str(error_msg))
                 logger.error(f"[StdioTransport] MCP initialize failed: {error_msg}")
 
-                # Try to read stderr for more info
-                if self._process and self._process.stderr:
-                    try:
-                        stderr_data = await asyncio.wait_for(
-                            self._process.stderr.read(1024),
-                            timeout=1.0
-                        )
-                        if stderr_data:
-                            logger.error(f"[StdioTransport] Subprocess stderr: {stderr_data.decode()}")
-                    except:
-                        pass
+                stderr = await self._collect_stderr()
+                if stderr:
+                    logger.error(f"[StdioTransport] Subprocess stderr: {stderr}")
 
                 await self.disconnect()
                 return False
@@ -215,17 +254,9 @@ class StdioTransport(MCPTransport):
         except Exception as e:
             logger.error(f"[StdioTransport] Failed to connect: {type(e).__name__}: {e}")
 
-            # Try to capture stderr if process exists
-            if self._process and self._process.stderr:
-                try:
-                    stderr_data = await asyncio.wait_for(
-                        self._process.stderr.read(1024),
-                        timeout=1.0
-                    )
-                    if stderr_data:
-                        logger.error(f"[StdioTransport] Subprocess stderr: {stderr_data.decode()}")
-                except:
-                    pass
+            stderr = await self._collect_stderr()
+            if stderr:
+                logger.error(f"[StdioTransport] Subprocess stderr: {stderr}")
 
             await self.disconnect()
             return False
@@ -243,111 +274,219 @@ class StdioTransport(MCPTransport):
             finally:
                 self._process = None
 
-    async def send_request(self, method: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Send a JSON-RPC request and wait for response."""
-        import json
+        for task in (self._reader_task, self._writer_task, self._stderr_task):
+            if task and task is not asyncio.current_task():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._reader_task = self._writer_task = self._stderr_task = None
+        self._write_queue = None
 
-        if not self.is_connected:
-            return {"error": {"code": -1, "message": "Not connected"}}
+        self._fail_pending("Connection closed")
 
-        async with self._lock:
-            self._request_id += 1
-            request_id = self._request_id
+    async def send_request(
+        self,
+        method: str,
+        params: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request and wait for its response.
 
-            request = {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "method": method,
-            }
-            if params is not None:
-                request["params"] = params
+        Safe to call concurrently; requests are pipelined over the pipe.
 
-            try:
-                # Send request
-                request_line = json.dumps(request) + "\n"
-                logger.debug(f"[StdioTransport] Sending: {request_line.strip()}")
-                self._process.stdin.write(request_line.encode())
-                await self._process.stdin.drain()
-
-                # Read response - keep reading until we get a response with matching id
-                # (skip notifications which don't have an id)
-                while True:
-                    response_line = await asyncio.wait_for(
-                        self._process.stdout.readline(),
-                        timeout=30.0
-                    )
+        Args:
+            method: JSON-RPC method name.
+            params: Optional request parameters.
+            timeout: Seconds to wait for the response (defaults to request_timeout).
 
-                    if not response_line:
-                        # Check if process has died
-                        if self._process.returncode is not None:
-                            # Try to read stderr
-                            stderr = ""
-                            try:
-                                stderr_data = await asyncio.wait_for(
-                                    self._process.stderr.read(),
-                                    timeout=1.0
-                                )
-                                stderr = stderr_data.decode() if stderr_data else ""
-                            except:
-                                pass
-                            return {"error": {"code": -1, "message": f"Process exited with code {self._process.returncode}. Stderr: {stderr}"}}
-                        return {"error": {"code": -1, "message": "No response from server (empty line)"}}
-
-                    response_str = response_line.decode().strip()
-                    if not response_str:
-                        continue  # Skip empty lines
-
-                    logger.debug(f"[StdioTransport] Received: {response_str[:200]}...")
-
-                    try:
-                        response = json.loads(response_str)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"[StdioTransport] Invalid JSON, skipping: {response_str[:100]}")
-                        continue
-
-                    # Check if this is a response to our request
-                    if "id" in response and response["id"] == request_id:
-                        return response
-                    elif "id" not in response:
-                        # This is a notification, skip it
-                        logger.debug(f"[StdioTransport] Received notification: {response.get('method', 'unknown')}")
-                        continue
-                    else:
-                        # Response for a different request (shouldn't happen with sequential requests)
-                        logger.warning(f"[StdioTransport] Received response for different request id: {response.get('id')}")
-                        continue
+        Returns:
+            The JSON-RPC response, or a dict with an "error" entry.
+        """
+        if not self.is_connected or self._write_queue is None:
+            return {"error": {"code": -1, "message": "Not connected"}}
 
-            except asyncio.TimeoutError:
-                logger.error(f"[StdioTransport] Request timeout for method '{method}'")
-                return {"error": {"code": -1, "message": f"Request timeout waiting for response to '{method}'"}}
-            except json.JSONDecodeError as e:
-                logger.error(f"[StdioTransport] Invalid JSON response: {e}")
-                return {"error": {"code": -1, "message": f"Invalid JSON response: {e}"}}
-            except Exception as e:
-                logger.error(f"[StdioTransport] Error sending request: {type(e).__name__}: {e}")
-                return {"error": {"code": -1, "message": str(e)}}
+        self._request_id += 1
+        request_id = self._request_id
 
-    async def _send_notification(self, method: str, params: Optional[Dict] = None) -> None:
-        """Send a JSON-RPC notification (no response expected)."""
-        import json
+        request = {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method,
+        }
+        if params is not None:
+            request["params"] = params
 
-        if not self.is_connected:
-            return
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            request_line = json.dumps(request) + "\n"
+            logger.debug(f"[StdioTransport] Sending: {request_line.strip()[:200]}")
+            self._write_queue.put_nowait(request_line.encode())
+            return await asyncio.wait_for(future, timeout=timeout or self.request_timeout)
 
+        except asyncio.TimeoutError:
+            logger.error(f"[StdioTransport] Request timeout for method '{method}'")
+            self._cancel_on_server(request_id, "Request timed out")
+            return {"error": {"code": -1, "message": f"Request timeout waiting for response to '{method}'"}}
+        except asyncio.CancelledError:
+            self._cancel_on_server(request_id, "Request cancelled by client")
+            raise
+        except Exception as e:
+            logger.error(f"[StdioTransport] Error sending request: {type(e).__name__}: {e}")
+            return {"error": {"code": -1, "message": str(e)}}
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _send_notification(self, method: str, params: Optional[Dict] = None) -> None:
+        """Send a JSON-RPC notification (no response expected)."""
         notification = {
             "jsonrpc": "2.0",
             "method": method,
         }
         if params is not None:
             notification["params"] = params
+        self._enqueue_message(notification)
+
+    # ─────────────────────── I/O Tasks ────────────────────────────────────
 
+    def _enqueue_message(self, message: Dict[str, Any]) -> None:
+        if not self.is_connected or self._write_queue is None:
+            return
         try:
-            notification_line = json.dumps(notification) + "\n"
-            self._process.stdin.write(notification_line.encode())
-            await self._process.stdin.drain()
+            self._write_queue.put_nowait((json.dumps(message) + "\n").encode())
         except Exception as e:
             logger.warning(f"Failed to send notification: {e}")
 
+    def _cancel_on_server(self, request_id: int, reason: str) -> None:
+        """Tell the server to stop working on an abandoned request."""
+        self._enqueue_message({
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": request_id, "reason": reason},
+        })
+
+    async def _write_loop(self) -> None:
+        """Write queued messages, draining once per burst."""
+        stdin = self._process.stdin
+        try:
+            while True:
+                data = await self._write_queue.get()
+                chunks = [data]
+                while not self._write_queue.empty():
+                    chunks.append(self._write_queue.get_nowait())
+                stdin.write(b"".join(chunks))
+                await stdin.drain()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # Broken pipe: the reader sees EOF and fails pending requests
+            logger.warning(f"[StdioTransport] Write failed: {type(e).__name__}: {e}")
+
+    async def _read_loop(self) -> None:
+        """Dispatch responses by id; answer server requests; log notifications."""
+        stdout = self._process.stdout
+        try:
+            while True:
+                try:
+                    line = await stdout.readline()
+                except ValueError as e:
+                    # Line exceeded the stream limit; it has been discarded
+                    logger.warning(f"[StdioTransport] Dropped oversized message: {e}")
+                    continue
+                if not line:
+                    break
+
+                message_str = line.decode().strip()
+                if not message_str:
+                    continue  # Skip empty lines
+
+                try:
+                    message = json.loads(message_str)
+                except json.JSONDecodeError:
+                    logger.warning(f"[StdioTransport] Invalid JSON, skipping: {message_str[:100]}")
+                    continue
+                if not isinstance(message, dict):
+                    continue
+
+                logger.debug(f"[StdioTransport] Received: {message_str[:200]}...")
+                self._dispatch(message)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            logger.error(f"[StdioTransport] Reader error: {type(e).__name__}: {e}")
+
+        # EOF: the server exited (or closed stdout)
+        process = self._process
+        returncode = None
+        if process is not None:
+            try:
+                returncode = await asyncio.wait_for(process.wait(), timeout=1.0)
+            except (asyncio.TimeoutError, Exception):
+                returncode = process.returncode
+        if returncode is not None:
+            stderr = await self._collect_stderr()
+            self._fail_pending(f"Process exited with code {returncode}. Stderr: {stderr}")
+        else:
+            self._fail_pending("No response from server (stdout closed)")
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        method = message.get("method")
+        if method is None:
+            # Response to one of our requests
+            future = self._pending.get(message.get("id"))
+            if future is not None and not future.done():
+                future.set_result(message)
+            else:
+                logger.debug(f"[StdioTransport] Response for unknown or abandoned request id: {message.get('id')}")
+            return
+
+        if "id" in message:
+            # Server-initiated request; this client only implements ping
+            if method == "ping":
+                self._enqueue_message({"jsonrpc": "2.0", "id": message["id"], "result": {}})
+            else:
+                self._enqueue_message({
+                    "jsonrpc": "2.0",
+                    "id": message["id"],
+                    "error": {"code": -32601, "message": f"Method not found: {method}"},
+                })
+            return
+
+        logger.debug(f"[StdioTransport] Received notification: {method}")
+        self._notify(method, message.get("params") or {})
+
+    async def _drain_stderr(self) -> None:
+        """Keep reading stderr so a chatty server never blocks on a full pipe."""
+        stderr = self._process.stderr
+        try:
+            while True:
+                line = await stderr.readline()
+                if not line:
+                    return
+                self._stderr_tail.append(line.decode(errors="replace").rstrip())
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            pass
+
+    async def _collect_stderr(self) -> str:
+        """Recent stderr output, giving the drain task a moment to catch up."""
+        if self._stderr_task and not self._stderr_task.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(self._stderr_task), timeout=0.5)
+            except (asyncio.TimeoutError, asyncio.CancelledError, Exception):
+                pass
+        return "\n".join(self._stderr_tail)
+
+    def _fail_pending(self, message: str) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_result({"error": {"code": -1, "message": message}})
+        self._pending.clear()
+
 
 class SSETransport(MCPTransport):
     """SSE (Server-Sent Events) transport for HTTP-based MCP servers."""
@@ -439,6 +578,8 @@ class SSETransport(MCPTransport):
                                 future = self._pending_requests.pop(message["id"])
                                 if not future.done():
                                     future.set_result(message)
+                            elif "method" in message and "id" not in message:
+                                self._notify(message["method"], message.get("params") or {})
                         except json.JSONDecodeError:
                             continue
         except asyncio.CancelledError:
@@ -576,6 +717,8 @@ class WebSocketTransport(MCPTransport):
                         future = self._pending_requests.pop(data["id"])
                         if not future.done():
                             future.set_result(data)
+                    elif "method" in data and "id" not in data:
+                        self._notify(data["method"], data.get("params") or {})
                 except json.JSONDecodeError:
                     continue
         except asyncio.CancelledError:
@@ -650,6 +793,7 @@ class MCPServerConnection:
         self.config = config
         self._transport: Optional[MCPTransport] = None
         self._tools: List[MCPTool] = []
+        self._refresh_task: Optional[asyncio.Task] = None
 
     @property
     def is_connected(self) -> bool:
@@ -698,6 +842,8 @@ class MCPServerConnection:
             logger.debug(f"[MCPServer:{self.config.name}] Creating {self.config.transport} transport...")
             self._transport = self._create_transport()
 
+            self._transport.set_notification_handler(self._on_notification)
+
             logger.debug(f"[MCPServer:{self.config.name}] Connecting transport...")
             if not await self._transport.connect():
                 logger.error(f"[MCPServer:{self.config.name}] Transport connection failed")
@@ -739,6 +885,12 @@ class MCPServerConnection:
         await self.disconnect()
         return await self.connect()
 
+    def _on_notification(self, method: str, params: Dict[str, Any]) -> None:
+        """Handle server-initiated notifications."""
+        if method == "notifications/tools/list_changed" and self.is_connected:
+            logger.info(f"[MCPServer:{self.config.name}] Tool list changed, refreshing")
+            self._refresh_task = asyncio.create_task(self._discover_tools())
+
     async def _discover_tools(self) -> None:
         """Discover available tools from the server."""
         if not self.is_connected:
@@ -6,18 +6,25 @@ This module provides a RAG-based memory system that:
 - Chunks the agent file system (markdown files) into semantic sections
 - Stores chunks in ChromaDB for fast retrieval (uses ChromaDB's built-in embeddings)
 - Supports retrieval via semantic query (returns pointers, not full content)
-- Supports incremental updates (only re-index changed files/sections)
+- Supports incremental updates (only re-index changed files/sections;
+  within a changed file, only chunks whose content_hash changed are re-embedded)
 
 The memory manager returns "memory pointers" - small pieces of information
 that tell the agent WHERE to find the full content, rather than returning
 the full content directly. This keeps retrieval lightweight.
+
+Retrieval is cached at two levels: query embeddings (LRU keyed on normalized
+query text) and retrieval results (keyed on the query plus the index
+generation, which every index mutation bumps).
 """
 
 from __future__ import annotations
 
 import hashlib
 import re
+import threading
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -104,6 +111,40 @@ class FileIndex:
     indexed_at: str = ""               # When this file was last indexed
 
 
+class _LRUCache:
+    """Small thread-safe LRU mapping used for retrieval caches."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 # ───────────────────────────── Memory Manager ─────────────────────────────
 
 
@@ -141,6 +182,10 @@ class MemoryManager:
     COLLECTION_NAME = "agent_memory"
     FILE_INDEX_COLLECTION = "agent_memory_file_index"
 
+    # Retrieval cache sizes
+    QUERY_EMBEDDING_CACHE_SIZE = 256
+    RESULT_CACHE_SIZE = 128
+
     def __init__(
         self,
         agent_file_system_path: str = "./agent_file_system",
@@ -179,6 +224,15 @@ class MemoryManager:
         self._file_index_cache: Dict[str, FileIndex] = {}
         self._load_file_index_cache()
 
+        # Cumulative chunk embeddings skipped by content_hash reuse
+        self._embeddings_avoided = 0
+
+        # Retrieval caches. Results are keyed on _index_generation, which is
+        # bumped whenever the chunk collection changes.
+        self._index_generation = 0
+        self._query_embedding_cache = _LRUCache(self.QUERY_EMBEDDING_CACHE_SIZE)
+        self._result_cache = _LRUCache(self.RESULT_CACHE_SIZE)
+
         logger.info(f"MemoryManager initialized. Agent FS: {self.agent_fs_path}, ChromaDB: {chroma_path}")
 
     # ───────────────────────────── Public API ─────────────────────────────
@@ -210,6 +264,19 @@ class MemoryManager:
             logger.warning("Empty query provided to retrieve()")
             return []
 
+        normalized_query = self._normalize_query(query)
+        result_key = (
+            self._index_generation,
+            self._compute_content_hash(normalized_query),
+            top_k,
+            min_relevance,
+            tuple(file_filter) if file_filter else None,
+        )
+        cached = self._result_cache.get(result_key)
+        if cached is not None:
+            logger.debug(f"[MEMORY QUERY] Result cache hit: {query[:50]}")
+            return list(cached)
+
         # Check if collection has any documents
         collection_count = self.collection.count()
         if collection_count == 0:
@@ -224,8 +291,14 @@ class MemoryManager:
         # Query ChromaDB
         logger.info(f"[MEMORY QUERY] Query: {query}")
         try:
+            embedding = self._get_query_embedding(normalized_query)
+            query_args = (
+                {"query_embeddings": [embedding]}
+                if embedding is not None
+                else {"query_texts": [query]}
+            )
             results = self.collection.query(
-                query_texts=[query],
+                **query_args,
                 n_results=min(top_k, collection_count),
                 where=where_filter,
                 include=["metadatas", "distances", "documents"],
@@ -272,9 +345,38 @@ class MemoryManager:
         # Sort by relevance (highest first)
         pointers.sort(key=lambda p: p.relevance_score, reverse=True)
 
+        self._result_cache.put(result_key, list(pointers))
         logger.info(f"Retrieved {len(pointers)} memory pointers for query: {query[:50]}...")
         return pointers
 
+    def _get_query_embedding(self, normalized_query: str) -> Optional[List[float]]:
+        """
+        Embed a query once and reuse it for identical normalized queries.
+
+        Returns None if the collection's embedding function is not accessible,
+        in which case the caller falls back to ChromaDB's query_texts path.
+        """
+        embedding = self._query_embedding_cache.get(normalized_query)
+        if embedding is not None:
+            return embedding
+
+        embedding_function = getattr(self.collection, "_embedding_function", None)
+        if embedding_function is None:
+            return None
+        embedding = list(embedding_function([normalized_query])[0])
+        self._query_embedding_cache.put(normalized_query, embedding)
+        return embedding
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Collapse whitespace so trivially different queries share cache entries."""
+        return " ".join(query.split())
+
+    def _invalidate_retrieval_cache(self) -> None:
+        """Mark cached retrieval results stale after the chunk collection changed."""
+        self._index_generation += 1
+        self._result_cache.clear()
+
     def retrieve_full_content(self, chunk_id: str) -> Optional[str]:
         """
         Retrieve the full content of a specific chunk by its ID.
@@ -318,6 +420,7 @@ class MemoryManager:
             "files_removed": 0,
             "chunks_added": 0,
             "chunks_removed": 0,
+            "embeddings_avoided": 0,
         }
 
         # Get current files in agent file system
@@ -332,6 +435,9 @@ class MemoryManager:
 
         # Remove deleted files from index
         for file_path in removed_files:
+            old_index = self._file_index_cache.get(file_path)
+            if old_index:
+                stats["chunks_removed"] += len(old_index.chunk_ids)
             self._remove_file_from_index(file_path)
             stats["files_removed"] += 1
 
@@ -352,19 +458,14 @@ class MemoryManager:
             stats["files_added"] += 1
             stats["chunks_added"] += chunks_added
 
-        # Re-index modified files
+        # Re-index modified files, re-embedding only chunks whose content changed
         for file_path in modified_files:
             full_path = self.agent_fs_path / file_path
-            # Remove old chunks first
-            old_index = self._file_index_cache.get(file_path)
-            if old_index:
-                stats["chunks_removed"] += len(old_index.chunk_ids)
-                self._remove_file_from_index(file_path)
-
-            # Re-index
-            chunks_added = self._index_file(full_path)
+            diff = self._reindex_file(full_path)
             stats["files_updated"] += 1
-            stats["chunks_added"] += chunks_added
+            stats["chunks_added"] += diff["added"]
+            stats["chunks_removed"] += diff["removed"]
+            stats["embeddings_avoided"] += diff["reused"]
 
         logger.info(f"Memory update complete: {stats}")
         return stats
@@ -388,6 +489,7 @@ class MemoryManager:
             "files_processed": 0,
             "chunks_created": 0,
             "files_skipped": 0,
+            "embeddings_avoided": 0,
         }
 
         markdown_files = self._get_all_markdown_files()
@@ -402,6 +504,13 @@ class MemoryManager:
                     stats["files_skipped"] += 1
                     continue
 
+                # Changed since last index - reuse unchanged chunk embeddings
+                diff = self._reindex_file(file_path)
+                stats["files_processed"] += 1
+                stats["chunks_created"] += diff["added"]
+                stats["embeddings_avoided"] += diff["reused"]
+                continue
+
             chunks_created = self._index_file(file_path)
             stats["files_processed"] += 1
             stats["chunks_created"] += chunks_created
@@ -419,6 +528,18 @@ class MemoryManager:
         return {
             "total_chunks": self.collection.count(),
             "total_files_indexed": len(self._file_index_cache),
+            "embeddings_avoided": self._embeddings_avoided,
+            "index_generation": self._index_generation,
+            "query_embedding_cache": {
+                "size": len(self._query_embedding_cache),
+                "hits": self._query_embedding_cache.hits,
+                "misses": self._query_embedding_cache.misses,
+            },
+            "result_cache": {
+                "size": len(self._result_cache),
+                "hits": self._result_cache.hits,
+                "misses": self._result_cache.misses,
+            },
             "agent_fs_path": str(self.agent_fs_path),
             "chroma_path": self.chroma_path,
         }
@@ -706,16 +827,7 @@ class MemoryManager:
         for chunk in chunks:
             chunk_ids.append(chunk.chunk_id)
             documents.append(chunk.content)
-            metadatas.append({
-                "file_path": chunk.file_path,
-                "section_path": chunk.section_path,
-                "title": chunk.title,
-                "summary": chunk.summary,
-                "content_hash": chunk.content_hash,
-                "file_modified_at": chunk.file_modified_at,
-                "indexed_at": chunk.indexed_at,
-                **chunk.metadata,
-            })
+            metadatas.append(self._chunk_metadata(chunk))
 
         try:
             self.collection.add(
@@ -726,6 +838,7 @@ class MemoryManager:
         except Exception as e:
             logger.error(f"Error adding chunks to ChromaDB: {e}")
             return 0
+        self._invalidate_retrieval_cache()
 
         # Update file index cache
         file_index = FileIndex(
@@ -741,6 +854,109 @@ class MemoryManager:
         logger.debug(f"Indexed {len(chunks)} chunks from {rel_path}")
         return len(chunks)
 
+    def _reindex_file(self, file_path: Path) -> Dict[str, int]:
+        """
+        Re-index a changed file by diffing its chunks against the stored ones.
+
+        Chunks are matched by content_hash: matched chunks keep their ID and
+        embedding (only their metadata is refreshed), new or changed chunks
+        are embedded and added, and chunks no longer present are deleted.
+        Falls back to a full re-index if the stored chunks cannot be read.
+
+        Returns:
+            Dict with "added", "removed" and "reused" chunk counts.
+        """
+        rel_path = str(file_path.relative_to(self.agent_fs_path))
+        old_index = self._file_index_cache.get(rel_path)
+        if not old_index:
+            return {"added": self._index_file(file_path), "removed": 0, "reused": 0}
+
+        try:
+            content = file_path.read_text(encoding="utf-8")
+            stored = (
+                self.collection.get(ids=old_index.chunk_ids, include=["metadatas"])
+                if old_index.chunk_ids
+                else {"ids": [], "metadatas": []}
+            )
+        except Exception as e:
+            logger.warning(f"Incremental re-index failed for {rel_path}, re-indexing fully: {e}")
+            removed = len(old_index.chunk_ids)
+            self._remove_file_from_index(rel_path)
+            return {"added": self._index_file(file_path), "removed": removed, "reused": 0}
+
+        # content_hash -> stored chunk IDs (a list, since sections can repeat)
+        stored_by_hash: Dict[str, List[str]] = {}
+        for chunk_id, meta in zip(stored.get("ids") or [], stored.get("metadatas") or []):
+            stored_by_hash.setdefault((meta or {}).get("content_hash", ""), []).append(chunk_id)
+
+        file_hash = self._compute_file_hash(file_path)
+        file_modified = datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+        chunks = self._chunk_markdown(content, rel_path)
+
+        new_chunks: List[MemoryChunk] = []
+        reused_chunks: List[MemoryChunk] = []
+        for chunk in chunks:
+            chunk.file_modified_at = file_modified
+            matches = stored_by_hash.get(chunk.content_hash)
+            if matches:
+                chunk.chunk_id = matches.pop()
+                reused_chunks.append(chunk)
+            else:
+                new_chunks.append(chunk)
+        stale_ids = [chunk_id for ids in stored_by_hash.values() for chunk_id in ids]
+
+        try:
+            if stale_ids:
+                self.collection.delete(ids=stale_ids)
+            if reused_chunks:
+                # Metadata-only update: no documents, so nothing is re-embedded
+                self.collection.update(
+                    ids=[c.chunk_id for c in reused_chunks],
+                    metadatas=[self._chunk_metadata(c) for c in reused_chunks],
+                )
+            if new_chunks:
+                self.collection.add(
+                    ids=[c.chunk_id for c in new_chunks],
+                    documents=[c.content for c in new_chunks],
+                    metadatas=[self._chunk_metadata(c) for c in new_chunks],
+                )
+        except Exception as e:
+            logger.error(f"Error updating chunks for {rel_path} in ChromaDB: {e}")
+            self._invalidate_retrieval_cache()
+            return {"added": 0, "removed": 0, "reused": 0}
+        self._invalidate_retrieval_cache()
+
+        file_index = FileIndex(
+            file_path=rel_path,
+            content_hash=file_hash,
+            modified_at=file_modified,
+            chunk_ids=[c.chunk_id for c in chunks],
+            indexed_at=datetime.utcnow().isoformat(),
+        )
+        self._file_index_cache[rel_path] = file_index
+        self._save_file_index(file_index)
+        self._embeddings_avoided += len(reused_chunks)
+
+        logger.debug(
+            f"Re-indexed {rel_path}: {len(new_chunks)} embedded, "
+            f"{len(reused_chunks)} reused, {len(stale_ids)} removed"
+        )
+        return {"added": len(new_chunks), "removed": len(stale_ids), "reused": len(reused_chunks)}
+
+    @staticmethod
+    def _chunk_metadata(chunk: MemoryChunk) -> Dict[str, Any]:
+        """Build the ChromaDB metadata stored alongside a chunk."""
+        return {
+            "file_path": chunk.file_path,
+            "section_path": chunk.section_path,
+            "title": chunk.title,
+            "summary": chunk.summary,
+            "content_hash": chunk.content_hash,
+            "file_modified_at": chunk.file_modified_at,
+            "indexed_at": chunk.indexed_at,
+            **chunk.metadata,
+        }
+
     def _remove_file_from_index(self, file_path: str) -> None:
         """Remove all chunks for a file from the index."""
         file_index = self._file_index_cache.get(file_path)
@@ -753,6 +969,7 @@ class MemoryManager:
                 self.collection.delete(ids=file_index.chunk_ids)
             except Exception as e:
                 logger.error(f"Error removing chunks from ChromaDB: {e}")
+            self._invalidate_retrieval_cache()
 
         # Remove from file index
         try:
@@ -788,6 +1005,7 @@ class MemoryManager:
         )
 
         self._file_index_cache.clear()
+        self._invalidate_retrieval_cache()
 
     # ───────────────────────────── File Index Persistence ─────────────────────────────
 
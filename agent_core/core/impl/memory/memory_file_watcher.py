@@ -168,7 +168,8 @@ class MemoryFileWatcher:
                 f"added={stats['files_added']}, "
                 f"updated={stats['files_updated']}, "
                 f"removed={stats['files_removed']}, "
-                f"chunks +{stats['chunks_added']}/-{stats['chunks_removed']}"
+                f"chunks +{stats['chunks_added']}/-{stats['chunks_removed']}, "
+                f"embeddings avoided={stats.get('embeddings_avoided', 0)}"
             )
         except Exception as e:
             logger.error(f"[MemoryFileWatcher] Failed to update index: {e}")
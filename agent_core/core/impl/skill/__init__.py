@@ -5,6 +5,7 @@ Skill System Module
 Provides skill management for agents, including:
 - SkillConfig: Configuration dataclasses
 - SkillLoader: SKILL.md parsing
+- SkillIndex: Persisted frontmatter/BM25 index for discovery and prefiltering
 - SkillManager: Singleton for skill lifecycle management
 """
 
@@ -13,6 +14,7 @@ from agent_core.core.impl.skill.config import (
     SkillMetadata,
     SkillsConfig,
 )
+from agent_core.core.impl.skill.index import SkillIndex
 from agent_core.core.impl.skill.loader import SkillLoader
 from agent_core.core.impl.skill.manager import (
     SkillManager,
@@ -24,6 +26,8 @@ __all__ = [
     "Skill",
     "SkillMetadata",
     "SkillsConfig",
+    # Index
+    "SkillIndex",
     # Loader
     "SkillLoader",
     # Manager
@@ -55,16 +55,50 @@ class SkillMetadata:
         }
 
 
-@dataclass
+@dataclass(init=False)
 class Skill:
-    """Full skill definition including instructions."""
+    """
+    Full skill definition including instructions.
+
+    Skills discovered through the skill index are created without their
+    instructions; the body of SKILL.md is read on first access.
+    """
 
     metadata: SkillMetadata
-    instructions: str                                   # Markdown content after frontmatter
     source_path: Path                                   # Path to SKILL.md file
     directory: Path                                     # Skill directory (for supporting files)
     enabled: bool = True
 
+    def __init__(
+        self,
+        metadata: SkillMetadata,
+        instructions: Optional[str],                    # Markdown content after frontmatter (None = lazy)
+        source_path: Path,
+        directory: Path,
+        enabled: bool = True,
+    ):
+        self.metadata = metadata
+        self._instructions = instructions
+        self.source_path = source_path
+        self.directory = directory
+        self.enabled = enabled
+
+    @property
+    def instructions(self) -> str:
+        """Markdown content after frontmatter, loaded from SKILL.md on first access."""
+        if self._instructions is None:
+            from agent_core.core.impl.skill.loader import SkillLoader
+            self._instructions = SkillLoader.load_instructions(self.source_path)
+        return self._instructions
+
+    @instructions.setter
+    def instructions(self, value: str) -> None:
+        self._instructions = value
+
+    @property
+    def instructions_loaded(self) -> bool:
+        return self._instructions is not None
+
     @property
     def name(self) -> str:
         """Get the skill name."""
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+Skill Index Module
+
+Persisted index of SKILL.md frontmatter and search terms, used to:
+
+- discover skills without YAML-parsing every SKILL.md at startup (an entry is
+  rebuilt only when its file's mtime or size changes)
+- prefilter the enabled skills to the top-K candidates for a task with BM25
+  (optionally blended with an embedding similarity) before the LLM selection
+  call, so the selection prompt no longer grows with the catalog
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from agent_core.utils.logger import logger
+
+INDEX_VERSION = 2
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Field weights: a term in the name counts 3x, in the description 2x
+NAME_WEIGHT = 3
+DESCRIPTION_WEIGHT = 2
+# Body text indexed per skill (headings are always indexed)
+BODY_INDEX_CHARS = 2000
+
+# Share of the final score given to embedding similarity when available
+EMBEDDING_WEIGHT = 0.5
+
+EmbeddingFunction = Callable[[List[str]], List[List[float]]]
+
+# Unicode word characters, so non-Latin task text still yields query terms
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_HEADING_PATTERN = re.compile(r"^#+\s+(.*)$", re.MULTILINE)
+_STOPWORDS = frozenset(
+    "a an and any are as at be but by can do for from has have how if in into is it its "
+    "not of on or so such that the their them then there these this to use used using was "
+    "what when which while who will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stopwords removed and a light plural strip."""
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        # Single ASCII characters carry no signal; a single CJK character can
+        if token in _STOPWORDS or (len(token) < 2 and token.isascii()):
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def index_terms(name: str, description: str, argument_hint: str, body: str) -> Counter:
+    """Weighted term frequencies for one skill."""
+    terms: Counter = Counter()
+    for _ in range(NAME_WEIGHT):
+        terms.update(tokenize(name.replace("-", " ")))
+    for _ in range(DESCRIPTION_WEIGHT):
+        terms.update(tokenize(description))
+    terms.update(tokenize(argument_hint))
+    terms.update(tokenize(" ".join(_HEADING_PATTERN.findall(body))))
+    terms.update(tokenize(body[:BODY_INDEX_CHARS]))
+    return terms
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class SkillIndex:
+    """
+    On-disk cache of parsed skill frontmatter plus BM25 terms per SKILL.md.
+
+    Entries are keyed by the SKILL.md path and validated by (mtime_ns, size).
+    """
+
+    def __init__(self, index_path: Optional[Path] = None, embedding_function: Optional[EmbeddingFunction] = None):
+        self.index_path = Path(index_path) if index_path else None
+        self.embedding_function = embedding_function
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._loaded = False
+
+    # ─────────────────────── Persistence ───────────────────────
+
+    def load(self) -> None:
+        """Load the index from disk (once). A missing or stale-format file is ignored."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.index_path or not self.index_path.exists():
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if data.get("version") == INDEX_VERSION:
+                self._entries = data.get("skills", {})
+        except Exception as e:
+            logger.warning(f"[SKILLS] Ignoring unreadable skill index {self.index_path}: {e}")
+            self._entries = {}
+
+    def save(self) -> None:
+        """Write the index if it changed (atomically)."""
+        if not self._dirty or not self.index_path:
+            return
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(self.index_path.suffix + ".tmp")
+            tmp_path.write_text(
+                json.dumps({"version": INDEX_VERSION, "skills": self._entries}, default=str),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.index_path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"[SKILLS] Failed to save skill index {self.index_path}: {e}")
+
+    # ─────────────────────── Entries ───────────────────────
+
+    @staticmethod
+    def _stat_key(skill_path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            st = skill_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def get_frontmatter(self, skill_path: Path) -> Optional[Dict[str, Any]]:
+        """Cached frontmatter for ``skill_path``, or None if missing or out of date."""
+        self.load()
+        entry = self._entries.get(str(skill_path))
+        stat_key = self._stat_key(skill_path)
+        if entry is None or stat_key is None or tuple(entry.get("stat", ())) != stat_key:
+            return None
+        return entry["frontmatter"]
+
+    def update(self, skill_path: Path, frontmatter: Dict[str, Any], body: str) -> None:
+        """Record a freshly parsed SKILL.md."""
+        self.load()
+        stat_key = self._stat_key(skill_path)
+        if stat_key is None:
+            return
+        terms = index_terms(
+            str(frontmatter.get("name", "")),
+            str(frontmatter.get("description", "")),
+            str(frontmatter.get("argument-hint", frontmatter.get("argument_hint", "")) or ""),
+            body,
+        )
+        self._entries[str(skill_path)] = {
+            "stat": list(stat_key),
+            "frontmatter": frontmatter,
+            "terms": dict(terms),
+            "length": sum(terms.values()),
+        }
+        self._dirty = True
+
+    def prune(self, live_paths: Iterable[Path]) -> None:
+        """Drop entries for SKILL.md files that no longer exist."""
+        live = {str(p) for p in live_paths}
+        stale = [key for key in self._entries if key not in live]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+
+    # ─────────────────────── Search ───────────────────────
+
+    def rank(self, query: str, skill_paths: Dict[str, Path]) -> List[Tuple[str, float]]:
+        """
+        Score skills against ``query``.
+
+        Args:
+            query: Task name and description.
+            skill_paths: Candidate skill name -> SKILL.md path.
+
+        Returns:
+            (skill name, score) pairs, best first. Ties keep the input order.
+        """
+        docs = []
+        for name, path in skill_paths.items():
+            entry = self._entries.get(str(path))
+            if entry is None:
+                docs.append((name, {}, 0, None))
+            else:
+                docs.append((name, entry["terms"], entry["length"], entry))
+        if not docs:
+            return []
+
+        query_terms = set(tokenize(query))
+        n_docs = len(docs)
+        avg_len = (sum(length for _, _, length, _ in docs) / n_docs) or 1.0
+        doc_freq = Counter()
+        for _, terms, _, _ in docs:
+            doc_freq.update(term for term in query_terms if term in terms)
+
+        scores = []
+        for name, terms, length, _ in docs:
+            score = 0.0
+            for term in query_terms:
+                tf = terms.get(term)
+                if not tf:
+                    continue
+                idf = math.log(1 + (n_docs - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+                score += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_len))
+            scores.append(score)
+
+        if self.embedding_function is not None:
+            scores = self._blend_embeddings(query, docs, scores)
+
+        order = sorted(range(n_docs), key=lambda i: -scores[i])
+        return [(docs[i][0], scores[i]) for i in order]
+
+    def _blend_embeddings(self, query: str, docs: List[tuple], scores: List[float]) -> List[float]:
+        """Mix normalized BM25 with cosine similarity of skill and query embeddings."""
+        try:
+            missing = [entry for _, _, _, entry in docs if entry is not None and self._embedding_stale(entry)]
+            if missing:
+                texts = [self._embedding_text(entry) for entry in missing]
+                for entry, vector in zip(missing, self.embedding_function(texts)):
+                    entry["embedding"] = [float(x) for x in vector]
+                    entry["embedding_key"] = self._embedding_key(entry)
+                self._dirty = True
+                self.save()
+            query_vector = self.embedding_function([query])[0]
+        except Exception as e:
+            logger.warning(f"[SKILLS] Skill embedding failed, using BM25 only: {e}")
+            return scores
+
+        top = max(scores) or 1.0
+        blended = []
+        for (_, _, _, entry), score in zip(docs, scores):
+            similarity = _cosine(query_vector, entry["embedding"]) if entry and entry.get("embedding") else 0.0
+            blended.append((1 - EMBEDDING_WEIGHT) * score / top + EMBEDDING_WEIGHT * similarity)
+        return blended
+
+    @staticmethod
+    def _embedding_text(entry: Dict[str, Any]) -> str:
+        frontmatter = entry["frontmatter"]
+        return f"{frontmatter.get('name', '')}: {frontmatter.get('description', '')}"
+
+    @classmethod
+    def _embedding_key(cls, entry: Dict[str, Any]) -> str:
+        return hashlib.sha1(cls._embedding_text(entry).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _embedding_stale(cls, entry: Dict[str, Any]) -> bool:
+        return not entry.get("embedding") or entry.get("embedding_key") != cls._embedding_key(entry)
@@ -7,12 +7,13 @@ Handles discovery and parsing of SKILL.md files from the filesystem.
 
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 import yaml
 
 from agent_core.utils.logger import logger
 from agent_core.core.impl.skill.config import Skill, SkillMetadata, SkillsConfig
+from agent_core.core.impl.skill.index import SkillIndex
 
 
 class SkillLoader:
@@ -25,18 +26,26 @@ class SkillLoader:
     )
 
     @staticmethod
-    def discover_skills(search_dirs: List[Path], config: Optional[SkillsConfig] = None) -> List[Skill]:
+    def discover_skills(
+        search_dirs: List[Path],
+        config: Optional[SkillsConfig] = None,
+        index: Optional[SkillIndex] = None,
+    ) -> List[Skill]:
         """
         Find all valid skill directories and parse SKILL.md files.
 
         Args:
             search_dirs: List of directories to search for skills.
             config: Optional config to check enabled/disabled status.
+            index: Optional skill index. Unchanged SKILL.md files are then
+                   loaded from the index without being read, and instructions
+                   are loaded lazily on first use.
 
         Returns:
             List of parsed Skill objects.
         """
         skills: Dict[str, Skill] = {}  # name -> Skill (later dirs override earlier)
+        seen_files: List[Path] = []
 
         for search_dir in search_dirs:
             if not search_dir.exists():
@@ -52,8 +61,12 @@ class SkillLoader:
                 if not skill_file.exists():
                     continue
 
+                seen_files.append(skill_file)
                 try:
-                    skill = SkillLoader.parse_skill_file(skill_file)
+                    if index is not None:
+                        skill = SkillLoader._load_indexed_skill(skill_file, index)
+                    else:
+                        skill = SkillLoader.parse_skill_file(skill_file)
 
                     # Check if skill is enabled via config
                     if config and not config.is_skill_enabled(skill.name):
@@ -68,8 +81,42 @@ class SkillLoader:
                     logger.warning(f"Failed to parse skill at {skill_file}: {e}")
                     continue
 
+        if index is not None:
+            index.prune(seen_files)
+            index.save()
+
         return list(skills.values())
 
+    @staticmethod
+    def _load_indexed_skill(skill_path: Path, index: SkillIndex) -> Skill:
+        """Build a skill from the index, re-parsing SKILL.md only if it changed."""
+        frontmatter = index.get_frontmatter(skill_path)
+        if frontmatter is None:
+            content = skill_path.read_text(encoding="utf-8")
+            frontmatter, instructions = SkillLoader._parse_content(content, skill_path)
+            index.update(skill_path, frontmatter, instructions)
+        # Instructions are read from disk only when the skill is used
+        return SkillLoader._build_skill(dict(frontmatter), skill_path, None)
+
+    @staticmethod
+    def load_instructions(skill_path: Path) -> str:
+        """
+        Read only the instructions (body after the frontmatter) of a SKILL.md.
+
+        Args:
+            skill_path: Path to the SKILL.md file.
+
+        Returns:
+            The instructions, or an empty string if the file cannot be read.
+        """
+        try:
+            content = Path(skill_path).read_text(encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Failed to read skill instructions from {skill_path}: {e}")
+            return ""
+        match = SkillLoader.FRONTMATTER_PATTERN.match(content)
+        return match.group(2).strip() if match else ""
+
     @staticmethod
     def parse_skill_file(skill_path: Path) -> Skill:
         """
@@ -90,7 +137,17 @@ class SkillLoader:
             raise ValueError(f"Skill file does not exist: {skill_path}")
 
         content = skill_path.read_text(encoding="utf-8")
+        frontmatter, instructions = SkillLoader._parse_content(content, skill_path)
+        return SkillLoader._build_skill(frontmatter, skill_path, instructions)
 
+    @staticmethod
+    def _parse_content(content: str, skill_path: Path) -> Tuple[Dict[str, Any], str]:
+        """
+        Split SKILL.md content into frontmatter (with name/description filled in) and instructions.
+
+        Raises:
+            ValueError: If the content cannot be parsed.
+        """
         # Parse frontmatter and instructions
         match = SkillLoader.FRONTMATTER_PATTERN.match(content)
 
@@ -120,6 +177,10 @@ class SkillLoader:
             first_para = re.sub(r'^#+\s+.*\n', '', first_para).strip()
             frontmatter["description"] = first_para[:200] if first_para else "No description"
 
+        return frontmatter, instructions
+
+    @staticmethod
+    def _build_skill(frontmatter: Dict[str, Any], skill_path: Path, instructions: Optional[str]) -> Skill:
         # Create metadata
         metadata = SkillMetadata.from_dict(frontmatter)
 
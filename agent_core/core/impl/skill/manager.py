@@ -10,8 +10,12 @@ from typing import Dict, List, Optional, Any
 
 from agent_core.utils.logger import logger
 from agent_core.core.impl.skill.config import Skill, SkillsConfig
+from agent_core.core.impl.skill.index import EmbeddingFunction, SkillIndex
 from agent_core.core.impl.skill.loader import SkillLoader
 
+# Skill index file, written next to skills_config.json by default
+SKILL_INDEX_FILENAME = ".skills_index.json"
+
 
 class SkillManager:
     """
@@ -38,16 +42,24 @@ class SkillManager:
         self._skills: Dict[str, Skill] = {}
         self._config: Optional[SkillsConfig] = None
         self._config_path: Optional[Path] = None
+        self._index: Optional[SkillIndex] = None
+        self._embedding_function: Optional[EmbeddingFunction] = None
         self._initialized = True
 
-    async def initialize(self, config_path: Optional[Path] = None) -> None:
+    async def initialize(self, config_path: Optional[Path] = None, index_path: Optional[Path] = None) -> None:
         """
         Load configuration and discover skills.
 
         Args:
             config_path: Path to skills_config.json. If None, uses defaults.
+            index_path: Path of the persisted skill index. Defaults to
+                        SKILL_INDEX_FILENAME next to config_path; without
+                        either, the index is kept in memory only.
         """
         self._config_path = config_path
+        if index_path is None and config_path is not None:
+            index_path = Path(config_path).parent / SKILL_INDEX_FILENAME
+        self._index = SkillIndex(index_path, self._embedding_function)
 
         # Load configuration
         if config_path and Path(config_path).exists():
@@ -70,7 +82,9 @@ class SkillManager:
 
         logger.info(f"[SKILLS] Searching for skills in: {search_dirs}")
 
-        skills = SkillLoader.discover_skills(search_dirs, self._config)
+        if self._index is None:
+            self._index = SkillIndex(None, self._embedding_function)
+        skills = SkillLoader.discover_skills(search_dirs, self._config, self._index)
 
         # Store skills by name
         self._skills.clear()
@@ -176,16 +190,65 @@ class SkillManager:
 
     # ─────────────────────── Selection Helpers ───────────────────────
 
-    def list_skills_for_selection(self) -> Dict[str, str]:
+    # Enabled skills offered to the LLM selection call when a task query is given
+    PREFILTER_TOP_K = 12
+
+    def set_embedding_function(self, embedding_function: Optional[EmbeddingFunction]) -> None:
+        """
+        Set an optional local embedding function used alongside BM25 when prefiltering.
+
+        Args:
+            embedding_function: Callable mapping a list of texts to a list of vectors.
+        """
+        self._embedding_function = embedding_function
+        if self._index is not None:
+            self._index.embedding_function = embedding_function
+
+    def prefilter_skills(self, query: Optional[str] = None, top_k: Optional[int] = None) -> List[Skill]:
+        """
+        Enabled skills most relevant to ``query``, best first.
+
+        Args:
+            query: Task name/description. If empty, all enabled skills are returned.
+            top_k: Maximum number of skills (default: PREFILTER_TOP_K).
+
+        Returns:
+            Up to top_k enabled skills; all of them if there are no more than
+            top_k, or if nothing in the query matched any skill (ranking by
+            catalog order would silently hide relevant skills).
+        """
+        enabled = self.get_enabled_skills()
+        top_k = top_k or self.PREFILTER_TOP_K
+        if not query or len(enabled) <= top_k or self._index is None:
+            return enabled
+
+        by_name = {skill.name: skill for skill in enabled}
+        ranked = self._index.rank(query, {skill.name: skill.source_path for skill in enabled})
+        if not ranked or ranked[0][1] <= 0:
+            logger.debug("[SKILLS] No skill matched the task text; offering all enabled skills")
+            return enabled
+        selected = [by_name[name] for name, _ in ranked[:top_k]]
+        logger.debug(
+            f"[SKILLS] Prefiltered {len(enabled)} enabled skills to {len(selected)}: "
+            f"{[skill.name for skill in selected]}"
+        )
+        return selected
+
+    def list_skills_for_selection(self, query: Optional[str] = None, top_k: Optional[int] = None) -> Dict[str, str]:
         """
         Format skills for LLM selection prompt.
 
+        Args:
+            query: Optional task text; when given, only the top_k most relevant
+                   enabled skills are listed (see prefilter_skills).
+            top_k: Maximum number of skills when query is given.
+
         Returns:
             Dictionary mapping skill name to description.
         """
         return {
             skill.name: skill.description
-            for skill in self.get_enabled_skills()
+            for skill in self.prefilter_skills(query, top_k)
         }
 
     # Maximum tokens for skill instructions (approximate: ~4 chars per token)
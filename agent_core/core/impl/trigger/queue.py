@@ -12,9 +12,11 @@ import json
 import logging
 import time
 from collections import defaultdict, OrderedDict
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, Set, TYPE_CHECKING
 
-from agent_core.decorators import profile, OperationCategory
+from agent_core.decorators import profile, profiler, OperationCategory
+from agent_core.core.impl.llm.rate_limit import llm_call_context
+from agent_core.core.impl.llm.types import LLMPriority
 from agent_core.core.trigger import Trigger
 from agent_core.core.state import get_state_or_none
 
@@ -35,6 +37,12 @@ except Exception:
 class TriggerQueue:
     """
     Concurrency-safe priority queue for Trigger.
+
+    Several consumers may call :meth:`get` concurrently. A session handed out
+    by :meth:`get` is leased in ``_leases`` until the consumer calls
+    :meth:`release`, and no other trigger for that session is dispatched in
+    the meantime, so work stays strictly ordered within a session while
+    different sessions run in parallel.
     """
 
     def __init__(
@@ -64,6 +72,9 @@ class TriggerQueue:
         """
         self._heap: List[Trigger] = []
         self._active: Dict[str, Trigger] = {}  # Triggers being processed (session_id -> trigger)
+        # Sessions handed out by get() and not yet released. Kept apart from
+        # _active, which task cleanup may clear while a consumer still runs
+        self._leases: Set[str] = set()
         self._cv = asyncio.Condition()
         self.llm = llm
         self._route_to_session_prompt = route_to_session_prompt
@@ -160,7 +171,7 @@ class TriggerQueue:
 
         The queue is cleared under the protection of the condition variable so
         waiting consumers are notified immediately that the queue state has
-        changed.
+        changed. Session leases stay until their consumers release them.
         """
         async with self._cv:
             self._heap.clear()
@@ -304,10 +315,12 @@ class TriggerQueue:
             )
 
             logger.debug(f"[UNIFIED ROUTING PROMPT]:\n{usr_msg}")
-            response = await self.llm.generate_response_async(
-                system_prompt="You are a session routing system.",
-                user_prompt=usr_msg,
-            )
+            # Routing gates the reply to an incoming message
+            with llm_call_context(priority=LLMPriority.INTERACTIVE):
+                response = await self.llm.generate_response_async(
+                    system_prompt="You are a session routing system.",
+                    user_prompt=usr_msg,
+                )
             logger.debug(f"[UNIFIED ROUTING RESPONSE]: {response}")
 
             # Parse routing response
@@ -368,9 +381,13 @@ class TriggerQueue:
 
         The method drains all triggers that are ready to fire, merges triggers
         belonging to the same session, and returns the highest-priority
-        combined trigger. If no trigger is ready, it waits until either the
-        earliest trigger's ``fire_at`` time arrives or a producer notifies the
-        condition.
+        combined trigger. Triggers whose session is currently leased by
+        another consumer stay queued until that session is released. If no
+        trigger is ready, it waits until either the earliest trigger's
+        ``fire_at`` time arrives or a producer notifies the condition.
+
+        The returned trigger's session is leased until :meth:`release` is
+        called for it.
 
         Returns:
             The next merged :class:`Trigger` ready for execution.
@@ -382,10 +399,18 @@ class TriggerQueue:
             while True:
                 now = time.time()
 
-                # collect ready triggers
+                # collect ready triggers, holding back sessions leased by other consumers
                 ready: List[Trigger] = []
+                leased: List[Trigger] = []
                 while self._heap and self._heap[0].fire_at <= now:
-                    ready.append(heapq.heappop(self._heap))
+                    t = heapq.heappop(self._heap)
+                    if t.session_id and t.session_id in self._leases:
+                        leased.append(t)
+                    else:
+                        ready.append(t)
+
+                for t in leased:
+                    heapq.heappush(self._heap, t)
 
                 if ready:
                     logger.debug(f"[GET] {len(ready)} trigger(s) are ready")
@@ -403,26 +428,63 @@ class TriggerQueue:
                     for t in merged_ready:
                         heapq.heappush(self._heap, t)
 
-                    # Track as active so fire() can find it while processing
+                    # Lease the session so no other consumer picks it up, and so
+                    # fire() can find it while processing
                     if trig.session_id:
+                        self._leases.add(trig.session_id)
                         self._active[trig.session_id] = trig
 
+                    self._record_dispatch(trig, now)
                     self._print_queue("QUEUE AFTER GET (POST-MERGE)")
                     return trig
 
-                # wait for next trigger
-                if self._heap:
-                    next_fire = self._heap[0].fire_at
-                    delay = next_fire - now
-                    if delay <= 0:
-                        continue
+                # wait for the next trigger that is not held back by a lease;
+                # releases notify the condition
+                next_fire = min(
+                    (t.fire_at for t in self._heap if t.fire_at > now),
+                    default=None,
+                )
+                if next_fire is not None:
                     try:
-                        await asyncio.wait_for(self._cv.wait(), timeout=delay)
+                        await asyncio.wait_for(self._cv.wait(), timeout=next_fire - now)
                     except asyncio.TimeoutError:
                         continue
                 else:
                     await self._cv.wait()
 
+    async def release(self, session_id: Optional[str]) -> None:
+        """
+        Release the lease taken by :meth:`get` once a consumer finished a trigger.
+
+        Queued triggers for the session become eligible for dispatch again and
+        waiting consumers are woken up.
+
+        Args:
+            session_id: Session whose trigger finished processing. ``None`` is
+                accepted (triggers without a session are never leased).
+        """
+        if not session_id:
+            return
+        async with self._cv:
+            self._leases.discard(session_id)
+            self._active.pop(session_id, None)
+            self._cv.notify_all()
+
+    def _record_dispatch(self, trig: Trigger, now: float) -> None:
+        """Report queue depth and how long the trigger waited past its fire time."""
+        if not profiler.enabled:
+            return
+        profiler.record(
+            "trigger_queue_wait",
+            max(0.0, now - trig.fire_at) * 1000,
+            OperationCategory.TRIGGER,
+            {
+                "session_id": trig.session_id,
+                "queue_depth": len(self._heap),
+                "active_sessions": len(self._leases),
+            },
+        )
+
     # =================================================================
     # SIZE / LIST
     # =================================================================
@@ -519,6 +581,9 @@ class TriggerQueue:
         """
         Remove all triggers that belong to the provided session identifiers.
 
+        A session still leased by a consumer stays leased until that consumer
+        calls :meth:`release`.
+
         Args:
             session_ids: Sessions whose queued triggers should be discarded.
                 An empty list leaves the queue unchanged.
@@ -538,7 +603,8 @@ class TriggerQueue:
         Remove a session from active tracking when processing completes.
 
         This should be called when a task/session ends to clean up the
-        _active dict.
+        _active dict. It does not release the session lease; consumers of
+        :meth:`get` call :meth:`release` for that.
 
         Args:
             session_id: The session that finished processing.
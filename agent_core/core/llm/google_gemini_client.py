@@ -11,9 +11,10 @@ from __future__ import annotations
 
 
 import base64
+import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
 
 import requests
 
@@ -119,28 +120,9 @@ class GeminiClient:
         Returns:
             Dict with generation results and token counts
         """
-        contents = [
-            {
-                "role": "user",
-                "parts": [{"text": prompt}],
-            }
-        ]
-
-        generation_config: Dict[str, Any] = {}
-        if temperature is not None:
-            generation_config["temperature"] = temperature
-        if max_output_tokens is not None:
-            generation_config["maxOutputTokens"] = max_output_tokens
-        if json_mode:
-            generation_config["responseMimeType"] = "application/json"
-
-        payload: Dict[str, Any] = {"contents": contents}
-        if system_prompt:
-            payload["systemInstruction"] = {
-                "parts": [{"text": system_prompt}],
-            }
-        if generation_config:
-            payload["generationConfig"] = generation_config
+        payload = self._text_payload(
+            prompt, system_prompt, temperature, max_output_tokens, json_mode
+        )
 
         response = self._post_json(
             f"{_normalise_model_name(model)}:generateContent", payload
@@ -475,9 +457,107 @@ class GeminiClient:
             "cached_tokens": cached_tokens,
         }
 
+    async def stream_text(
+        self,
+        http_client: Any,
+        model: str,
+        *,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        json_mode: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a purely textual generation via ``streamGenerateContent``.
+
+        Yields each response chunk as returned by the API; use ``chunk_text``
+        to get its text. The last chunk carries the final ``usageMetadata``.
+
+        Args:
+            http_client: An ``httpx.AsyncClient`` to send the request with.
+            model: Model identifier (e.g., "gemini-2.5-flash")
+            prompt: The user prompt
+            system_prompt: Optional system instruction
+            temperature: Sampling temperature
+            max_output_tokens: Maximum output tokens
+            json_mode: If True, enforce JSON output format
+        """
+        from agent_core.core.impl.llm.streaming import iter_sse_data
+
+        payload = self._text_payload(
+            prompt, system_prompt, temperature, max_output_tokens, json_mode
+        )
+        async with http_client.stream(
+            "POST",
+            self._endpoint(f"{_normalise_model_name(model)}:streamGenerateContent"),
+            params={"key": self._api_key, "alt": "sse"},
+            json=payload,
+            timeout=self._timeout,
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                logger.warning(
+                    f"[GEMINI ERROR] Status: {response.status_code}, "
+                    f"Raw text: {response.text[:1000]}"
+                )
+                response.raise_for_status()
+            async for data in iter_sse_data(response):
+                yield json.loads(data)
+
+    @staticmethod
+    def chunk_text(chunk: Dict[str, Any]) -> str:
+        """Extract the text of one streamed chunk (empty if it has none)."""
+        feedback = chunk.get("promptFeedback")
+        if isinstance(feedback, dict) and feedback.get("blockReason"):
+            raise GeminiAPIError(f"Prompt blocked by Gemini: {feedback['blockReason']}")
+
+        for candidate in chunk.get("candidates", []) or []:
+            if candidate.get("finishReason") == "SAFETY":
+                raise GeminiAPIError(
+                    f"Response blocked for safety: {candidate.get('safetyRatings', [])}"
+                )
+            parts = (candidate.get("content") or {}).get("parts", []) or []
+            text = "".join(part.get("text", "") for part in parts if isinstance(part, dict))
+            if text:
+                return text
+        return ""
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    @staticmethod
+    def _text_payload(
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_output_tokens: Optional[int],
+        json_mode: bool,
+    ) -> Dict[str, Any]:
+        """Build a generateContent payload for a purely textual prompt."""
+        contents = [
+            {
+                "role": "user",
+                "parts": [{"text": prompt}],
+            }
+        ]
+
+        generation_config: Dict[str, Any] = {}
+        if temperature is not None:
+            generation_config["temperature"] = temperature
+        if max_output_tokens is not None:
+            generation_config["maxOutputTokens"] = max_output_tokens
+        if json_mode:
+            generation_config["responseMimeType"] = "application/json"
+
+        payload: Dict[str, Any] = {"contents": contents}
+        if system_prompt:
+            payload["systemInstruction"] = {
+                "parts": [{"text": system_prompt}],
+            }
+        if generation_config:
+            payload["generationConfig"] = generation_config
+        return payload
+
     def _endpoint(self, path: str) -> str:
         """Build full API endpoint URL."""
         return f"{self._api_base}/{self._api_version}/{path.lstrip('/')}"
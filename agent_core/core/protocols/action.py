@@ -59,7 +59,7 @@ class ActionLibraryProtocol(Protocol):
         """
         ...
 
-    def get_default_action_names(self) -> set:
+    def get_default_action_names(self) -> frozenset:
         """
         Get names of default actions.
 
@@ -47,6 +47,15 @@ class DatabaseInterfaceProtocol(Protocol):
         """
         ...
 
+    def get_actions_generation(self) -> int:
+        """
+        Return a counter that changes whenever the set of actions changes.
+
+        Returns:
+            The current action registry generation.
+        """
+        ...
+
     def store_action(self, action_dict: Dict[str, Any]) -> None:
         """
         Persist an action definition to disk.
@@ -8,7 +8,56 @@ This module defines protocols for event stream operations.
 from typing import Any, List, Optional, Protocol, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from agent_core import EventRecord
+    from agent_core import Event, EventRecord
+
+
+class EventJournalProtocol(Protocol):
+    """
+    Protocol for append-only persistence of event streams.
+
+    Implementations must only enqueue work; they are called while the
+    stream's lock is held.
+    """
+
+    def append(self, stream_id: str, record: "EventRecord") -> None:
+        """
+        Journal a newly logged event.
+
+        Args:
+            stream_id: Identifier of the stream the event belongs to.
+            record: The appended record.
+        """
+        ...
+
+    def checkpoint(
+        self,
+        stream_id: str,
+        head_summary: Optional[str],
+        dropped: List["EventRecord"],
+    ) -> None:
+        """
+        Journal a summarization or prune.
+
+        Args:
+            stream_id: Identifier of the stream.
+            head_summary: The stream's head summary after the change.
+            dropped: Records removed from the tail.
+        """
+        ...
+
+    def append_conversation(self, event: "Event", keep_last: int) -> None:
+        """
+        Journal a conversation history message.
+
+        Args:
+            event: The recorded message.
+            keep_last: Number of most recent messages to retain.
+        """
+        ...
+
+    def clear_conversation(self) -> None:
+        """Journal that the conversation history was cleared."""
+        ...
 
 
 class EventStreamProtocol(Protocol):
@@ -64,7 +113,21 @@ class EventStreamProtocol(Protocol):
         ...
 
     def summarize_if_needed(self) -> None:
-        """Trigger summarization when threshold exceeded (synchronous, blocking)."""
+        """Schedule background summarization when threshold exceeded (non-blocking)."""
+        ...
+
+    def load(self, head_summary: Optional[str], records: List["EventRecord"]) -> None:
+        """Replace the stream contents with restored state, batch-counting tokens."""
+        ...
+
+    def attach_journal(self, journal: Optional[EventJournalProtocol], stream_id: str) -> None:
+        """
+        Persist appends and summaries through an append-only journal.
+
+        Args:
+            journal: The journal receiving stream changes, or None to detach.
+            stream_id: Identifier used for this stream in the journal.
+        """
         ...
 
     def mark_session_synced(self, call_type: str) -> None:
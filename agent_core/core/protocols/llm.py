@@ -6,7 +6,7 @@ This module defines the LLMInterfaceProtocol that specifies the
 interface for LLM operations.
 """
 
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, AsyncIterator, Dict, List, Optional, Protocol
 
 
 class LLMInterfaceProtocol(Protocol):
@@ -41,6 +41,25 @@ class LLMInterfaceProtocol(Protocol):
         """
         ...
 
+    def generate_response_stream(
+        self,
+        system_prompt: Optional[str] = None,
+        user_prompt: Optional[str] = None,
+        log_response: bool = True,
+    ) -> AsyncIterator[str]:
+        """
+        Stream an LLM response as text deltas.
+
+        Args:
+            system_prompt: Optional system prompt.
+            user_prompt: The user message to send.
+            log_response: Whether to log the request and response.
+
+        Returns:
+            An async iterator over the response text.
+        """
+        ...
+
     def generate_response(
         self,
         user_prompt: str,
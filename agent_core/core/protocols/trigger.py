@@ -21,6 +21,10 @@ class TriggerQueueProtocol(Protocol):
         """Retrieve the next trigger to execute."""
         ...
 
+    async def release(self, session_id: Optional[str]) -> None:
+        """Release the session lease taken by get() once the trigger is processed."""
+        ...
+
     async def size(self) -> int:
         """Count how many triggers are currently queued."""
         ...
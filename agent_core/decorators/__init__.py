@@ -8,6 +8,8 @@ from agent_core.decorators.profiler import (
     ProfileRecord,
     OperationStats,
     LoopStats,
+    QuantileSketch,
+    SpanContext,
     profile,
     profile_loop,
     profiler,
@@ -30,6 +32,8 @@ __all__ = [
     "ProfileRecord",
     "OperationStats",
     "LoopStats",
+    "QuantileSketch",
+    "SpanContext",
     # Profiler decorators
     "profile",
     "profile_loop",
@@ -26,19 +26,37 @@ Configuration:
 
     Set "enabled" to true to turn on profiling.
     Set "auto_save_interval" to N to save after every N loops (0 = only at exit).
+
+Memory is bounded for long-running agents:
+- per-operation statistics are streaming (count/mean/stdev plus a fixed-size
+  quantile sketch for median/p90/p99) rather than lists of every duration
+- only the last "max_recent_spans" raw records and "max_loops" loops are kept
+- every record is also appended to a rolling Chrome trace file
+  (log_dir/trace_<session>.json, rotated at "trace_file_max_mb" keeping
+  "trace_file_backups" old files) that opens directly in chrome://tracing or
+  Perfetto
+
+Records are spans: @profile, @profile_loop and ProfileContext propagate a
+parent span through contextvars (and so into asyncio tasks created inside
+them), and each trace (a react loop, or any top-level span) is drawn as its
+own row, giving a whole-task flame view.
 """
 
 from __future__ import annotations
 
 import atexit
 import asyncio
+import contextvars
 import functools
+import itertools
 import json
+import math
+import os
 import statistics
 import threading
 import time
 import uuid
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
@@ -55,8 +73,23 @@ DEFAULT_CONFIG = {
     "enabled": False,  # Disabled by default - user must explicitly enable
     "auto_save_interval": 5,  # Save every N loops (0 = only at exit)
     "log_dir": "decorators/logs",
+    "max_recent_spans": 10000,  # Raw records kept in memory (ring buffer)
+    "max_loops": 1000,  # Loop summaries kept in memory
+    "trace_file": True,  # Append every span to a rolling Chrome trace file
+    "trace_file_max_mb": 50,  # Rotate the trace file at this size
+    "trace_file_backups": 3,  # Rotated trace files to keep
 }
 
+# Resource usage (CPU %, RSS) is sampled at most this often, not per record
+RESOURCE_SAMPLE_INTERVAL = 1.0
+# Buffered trace events are appended to the trace file in batches of this size
+TRACE_FLUSH_EVERY = 256
+# Trace id of records made outside any span; they share one row in trace views
+UNTRACED = 0
+
+# Reused encoder (json.dumps with keyword arguments builds a new one per call)
+_TRACE_ENCODER = json.JSONEncoder(default=str)
+
 CONFIG_PATH = Path(__file__).parent / "profiler_config.json"
 
 
@@ -94,9 +127,60 @@ class OperationCategory(str, Enum):
     OTHER = "other"
 
 
+class QuantileSketch:
+    """
+    Fixed-memory quantile estimator (a log-bucketed histogram, as in DDSketch).
+
+    Values are counted in buckets whose bounds grow by a factor of
+    gamma = (1 + a) / (1 - a), so every quantile is estimated within relative
+    error ``a``. Millisecond durations from 1us to 1h need ~1100 buckets at
+    1%; past ``max_buckets`` the lowest buckets are merged, which only
+    affects the lowest quantiles.
+    """
+
+    __slots__ = ("relative_accuracy", "max_buckets", "count", "_gamma", "_log_gamma", "_buckets", "_zero_count")
+
+    # Values at or below this are counted as zero
+    MIN_VALUE = 1e-6
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.count = 0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value <= self.MIN_VALUE:
+            self._zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        if len(self._buckets) > self.max_buckets:
+            lowest, second = sorted(self._buckets)[:2]
+            self._buckets[second] += self._buckets.pop(lowest)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile (0..1). Returns 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if rank < seen:
+                return 2 * self._gamma ** key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
+
+
 @dataclass
 class ProfileRecord:
-    """A single profiling record for an operation."""
+    """A single profiling record (a span) for an operation."""
     timestamp: float
     name: str
     category: str
@@ -106,21 +190,55 @@ class ProfileRecord:
     cpu_percent: Optional[float] = None
     memory_mb: Optional[float] = None
     meta: Dict[str, Any] = field(default_factory=dict)
+    span_id: Optional[int] = None
+    parent_id: Optional[int] = None
+    trace_id: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def to_trace_event(self, pid: int) -> Dict[str, Any]:
+        """Chrome trace-event ("complete" event) for this span; one row per trace."""
+        args = {"span_id": self.span_id, "parent_id": self.parent_id, "loop_id": self.loop_id}
+        args.update(self.meta)
+        return {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": round((self.timestamp * 1000 - self.duration_ms) * 1000, 1),
+            "dur": round(self.duration_ms * 1000, 1),
+            "pid": pid,
+            "tid": self.trace_id or UNTRACED,
+            "args": args,
+        }
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """The active span, propagated to nested spans and child asyncio tasks."""
+    span_id: int
+    trace_id: int
+    parent_id: Optional[int] = None
+    loop_id: Optional[str] = None
+
+
+_current_span: contextvars.ContextVar[Optional[SpanContext]] = contextvars.ContextVar(
+    "profiler_current_span", default=None
+)
+
 
 @dataclass
 class OperationStats:
-    """Aggregated statistics for a single operation type."""
+    """Streaming statistics for a single operation type (constant memory)."""
     name: str
     category: str
     count: int = 0
     total_ms: float = 0.0
     min_ms: float = float('inf')
     max_ms: float = 0.0
-    durations: List[float] = field(default_factory=list)
+    sketch: QuantileSketch = field(default_factory=QuantileSketch, repr=False)
+    _mean: float = field(default=0.0, repr=False)
+    _m2: float = field(default=0.0, repr=False)
 
     @property
     def avg_ms(self) -> float:
@@ -128,18 +246,30 @@ class OperationStats:
 
     @property
     def median_ms(self) -> float:
-        return statistics.median(self.durations) if self.durations else 0.0
+        return self.sketch.quantile(0.5)
+
+    @property
+    def p90_ms(self) -> float:
+        return self.sketch.quantile(0.9)
+
+    @property
+    def p99_ms(self) -> float:
+        return self.sketch.quantile(0.99)
 
     @property
     def std_dev_ms(self) -> float:
-        return statistics.stdev(self.durations) if len(self.durations) > 1 else 0.0
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
 
     def add_duration(self, duration_ms: float) -> None:
         self.count += 1
         self.total_ms += duration_ms
         self.min_ms = min(self.min_ms, duration_ms)
         self.max_ms = max(self.max_ms, duration_ms)
-        self.durations.append(duration_ms)
+        self.sketch.add(duration_ms)
+        # Welford's online variance
+        delta = duration_ms - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (duration_ms - self._mean)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -151,6 +281,8 @@ class OperationStats:
             "min_ms": round(self.min_ms, 3) if self.min_ms != float('inf') else 0.0,
             "max_ms": round(self.max_ms, 3),
             "median_ms": round(self.median_ms, 3),
+            "p90_ms": round(self.p90_ms, 3),
+            "p99_ms": round(self.p99_ms, 3),
             "std_dev_ms": round(self.std_dev_ms, 3),
         }
 
@@ -162,7 +294,8 @@ class LoopStats:
     loop_number: int
     start_time: float
     end_time: Optional[float] = None
-    operations: List[ProfileRecord] = field(default_factory=list)
+    operation_count: int = 0
+    breakdown: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
 
     @property
     def duration_ms(self) -> float:
@@ -171,21 +304,19 @@ class LoopStats:
         return (self.end_time - self.start_time) * 1000
 
     def add_operation(self, record: ProfileRecord) -> None:
-        self.operations.append(record)
+        self.operation_count += 1
+        self.breakdown[record.category] += record.duration_ms
 
     def get_breakdown(self) -> Dict[str, float]:
         """Get time breakdown by category."""
-        breakdown: Dict[str, float] = defaultdict(float)
-        for op in self.operations:
-            breakdown[op.category] += op.duration_ms
-        return dict(breakdown)
+        return dict(self.breakdown)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "loop_id": self.loop_id,
             "loop_number": self.loop_number,
             "duration_ms": round(self.duration_ms, 3),
-            "operation_count": len(self.operations),
+            "operation_count": self.operation_count,
             "breakdown_by_category": {k: round(v, 3) for k, v in self.get_breakdown().items()},
         }
 
@@ -195,18 +326,23 @@ class AgentProfiler:
     Comprehensive profiler for tracking agent performance.
 
     Features:
-    - Tracks individual operations with timing and metadata
-    - Aggregates statistics by operation name and category
+    - Tracks individual operations as nested spans with timing and metadata
+    - Aggregates streaming statistics by operation name and category
     - Tracks per-loop performance metrics
-    - Thread-safe logging
-    - Generates human-readable and JSON reports
+    - Thread-safe logging with bounded memory
+    - Generates human-readable and JSON reports, and Chrome trace files
     - Auto-saves at configurable intervals and on exit
 
     Configuration is loaded from decorators/profiler_config.json:
     {
         "enabled": true,    # Set to true to enable profiling
         "auto_save_interval": 5,  # Save every N loops (0 = only at exit)
-        "log_dir": "decorators/logs"
+        "log_dir": "decorators/logs",
+        "max_recent_spans": 10000,  # Raw records kept in memory
+        "max_loops": 1000,  # Loop summaries kept in memory
+        "trace_file": true,  # Rolling Chrome trace file in log_dir
+        "trace_file_max_mb": 50,
+        "trace_file_backups": 3
     }
     """
 
@@ -234,6 +370,12 @@ class AgentProfiler:
         self.enabled = enabled if enabled is not None else config.get("enabled", False)
         self._auto_save_interval = config.get("auto_save_interval", 5)
         log_dir = log_dir or config.get("log_dir", "decorators/logs")
+        self._max_loops = max(1, int(config.get("max_loops", DEFAULT_CONFIG["max_loops"])))
+        self._trace_file_enabled = bool(config.get("trace_file", DEFAULT_CONFIG["trace_file"]))
+        self._trace_file_max_bytes = int(
+            float(config.get("trace_file_max_mb", DEFAULT_CONFIG["trace_file_max_mb"])) * 1024 * 1024
+        )
+        self._trace_file_backups = int(config.get("trace_file_backups", DEFAULT_CONFIG["trace_file_backups"]))
 
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -241,15 +383,31 @@ class AgentProfiler:
         # Generate unique session ID
         self.session_id = f"{int(time.time())}_{uuid.uuid4().hex[:8]}"
         self.log_path = self.log_dir / f"profile_{self.session_id}.json"
+        self.trace_path = self.log_dir / f"trace_{self.session_id}.json"
 
         # Thread safety
         self._write_lock = threading.Lock()
+        self._trace_lock = threading.Lock()
 
-        # Storage
-        self._records: List[ProfileRecord] = []
+        # Storage (bounded)
+        self._records: deque[ProfileRecord] = deque(
+            maxlen=max(1, int(config.get("max_recent_spans", DEFAULT_CONFIG["max_recent_spans"])))
+        )
+        self._record_count = 0
         self._stats: Dict[str, OperationStats] = {}
         self._category_stats: Dict[str, OperationStats] = {}
-        self._loops: Dict[str, LoopStats] = {}
+        self._loops: "OrderedDict[str, LoopStats]" = OrderedDict()
+        self._loop_durations = OperationStats(name="agent_loop", category=OperationCategory.AGENT_LOOP.value)
+
+        # Spans and trace file
+        self._span_ids = itertools.count(1)
+        self._pid = os.getpid()
+        self._trace_pending: List[str] = []
+
+        # Resource sampling (one psutil.Process, sampled at most once per interval)
+        self._process: Optional[psutil.Process] = None
+        self._resource_sampled_at = 0.0
+        self._resource_sample: tuple = (None, None)
 
         # Current loop tracking
         self._current_loop_id: Optional[str] = None
@@ -271,6 +429,7 @@ class AgentProfiler:
         """Save profiling data on process exit."""
         if self._has_data and self.enabled:
             try:
+                self.flush_trace()
                 self.save_report()
                 self.save_json()
             except Exception:
@@ -289,6 +448,7 @@ class AgentProfiler:
         with cls._lock:
             if cls._instance and cls._instance._has_data:
                 try:
+                    cls._instance.flush_trace()
                     cls._instance.save_report()
                     cls._instance.save_json()
                 except Exception:
@@ -336,6 +496,8 @@ class AgentProfiler:
                 loop_number=self._loop_counter,
                 start_time=time.time(),
             )
+            while len(self._loops) > self._max_loops:
+                self._loops.popitem(last=False)
 
         return loop_id
 
@@ -354,10 +516,14 @@ class AgentProfiler:
             return
 
         with self._write_lock:
-            self._loops[loop_id].end_time = time.time()
+            loop = self._loops[loop_id]
+            loop.end_time = time.time()
+            self._loop_durations.add_duration(loop.duration_ms)
             if self._current_loop_id == loop_id:
                 self._current_loop_id = None
 
+        self.flush_trace()
+
         # Auto-save if interval is configured
         if self._auto_save_interval > 0:
             loops_since_save = self._loop_counter - self._last_save_loop
@@ -383,15 +549,18 @@ class AgentProfiler:
         duration_ms: float,
         category: Union[OperationCategory, str] = OperationCategory.OTHER,
         meta: Optional[Dict[str, Any]] = None,
+        span: Optional[SpanContext] = None,
     ) -> None:
         """
         Record a profiling entry.
 
         Args:
             name: Name of the operation.
-            duration_ms: Duration in milliseconds.
+            duration_ms: Duration in milliseconds, ending now.
             category: Operation category for grouping.
             meta: Additional metadata to store.
+            span: The span being closed (from begin_span). If omitted, the
+                entry becomes a leaf span under the current span.
         """
         if not self.enabled:
             return
@@ -399,29 +568,36 @@ class AgentProfiler:
         if isinstance(category, OperationCategory):
             category = category.value
 
-        # Get resource usage
-        try:
-            process = psutil.Process()
-            cpu_percent = process.cpu_percent(interval=None)
-            memory_mb = process.memory_info().rss / 1e6
-        except Exception:
-            cpu_percent = None
-            memory_mb = None
-
-        record = ProfileRecord(
-            timestamp=time.time(),
-            name=name,
-            category=category,
-            duration_ms=round(duration_ms, 3),
-            loop_id=self._current_loop_id,
-            loop_number=self._loop_counter if self._current_loop_id else None,
-            cpu_percent=cpu_percent,
-            memory_mb=round(memory_mb, 3) if memory_mb else None,
-            meta=meta or {},
-        )
+        if span is None:
+            parent = _current_span.get()
+            span_id = next(self._span_ids)
+            if parent is None:
+                span = SpanContext(span_id, UNTRACED)
+            else:
+                span = SpanContext(span_id, parent.trace_id, parent.span_id, parent.loop_id)
+
+        cpu_percent, memory_mb = self._sample_resources()
+        loop_id = span.loop_id or self._current_loop_id
 
         with self._write_lock:
+            loop = self._loops.get(loop_id) if loop_id else None
+            record = ProfileRecord(
+                timestamp=time.time(),
+                name=name,
+                category=category,
+                duration_ms=round(duration_ms, 3),
+                loop_id=loop_id,
+                loop_number=loop.loop_number if loop else None,
+                cpu_percent=cpu_percent,
+                memory_mb=memory_mb,
+                meta=meta or {},
+                span_id=span.span_id,
+                parent_id=span.parent_id,
+                trace_id=span.trace_id,
+            )
+
             self._records.append(record)
+            self._record_count += 1
             self._has_data = True  # Mark that we have data to save
 
             # Update operation stats
@@ -434,9 +610,177 @@ class AgentProfiler:
                 self._category_stats[category] = OperationStats(name=category, category=category)
             self._category_stats[category].add_duration(duration_ms)
 
-            # Add to current loop if active
-            if self._current_loop_id and self._current_loop_id in self._loops:
-                self._loops[self._current_loop_id].add_operation(record)
+            # Add to its loop if still tracked
+            if loop is not None:
+                loop.add_operation(record)
+
+            if self._trace_file_enabled:
+                self._queue_trace_event(record)
+                flush = len(self._trace_pending) >= TRACE_FLUSH_EVERY
+            else:
+                flush = False
+
+        if flush:
+            self.flush_trace()
+
+    def _sample_resources(self) -> tuple:
+        """(cpu_percent, memory_mb) of this process, refreshed at most every RESOURCE_SAMPLE_INTERVAL."""
+        now = time.monotonic()
+        if now - self._resource_sampled_at < RESOURCE_SAMPLE_INTERVAL:
+            return self._resource_sample
+        self._resource_sampled_at = now
+        try:
+            if self._process is None:
+                self._process = psutil.Process()
+            self._resource_sample = (
+                self._process.cpu_percent(interval=None),
+                round(self._process.memory_info().rss / 1e6, 3),
+            )
+        except Exception:
+            self._resource_sample = (None, None)
+        return self._resource_sample
+
+    # =========================================================================
+    # Spans
+    # =========================================================================
+
+    def begin_span(self, loop_id: Optional[str] = None) -> tuple:
+        """
+        Open a span as a child of the current one and make it current.
+
+        Spans opened (and asyncio tasks created) until end_span() become its
+        children. Pass the returned pair to end_span().
+
+        Args:
+            loop_id: Loop this span belongs to. Inherited from the parent if not provided.
+
+        Returns:
+            (SpanContext, token) for end_span().
+        """
+        parent = _current_span.get()
+        span_id = next(self._span_ids)
+        if parent is None:
+            span = SpanContext(span_id, span_id, None, loop_id)
+        else:
+            span = SpanContext(span_id, parent.trace_id, parent.span_id, loop_id or parent.loop_id)
+        return span, _current_span.set(span)
+
+    def end_span(
+        self,
+        span_and_token: tuple,
+        name: str,
+        duration_ms: float,
+        category: Union[OperationCategory, str] = OperationCategory.OTHER,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Close a span from begin_span(), restore its parent and record it."""
+        span, token = span_and_token
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            pass  # Closed from a different context (e.g. a generator resumed elsewhere)
+        self.record(name, duration_ms, category, meta, span=span)
+
+    @staticmethod
+    def current_span() -> Optional[SpanContext]:
+        """The span active in the current context, if any."""
+        return _current_span.get()
+
+    # =========================================================================
+    # Trace export
+    # =========================================================================
+
+    def _queue_trace_event(self, record: ProfileRecord) -> None:
+        """Buffer a record for the trace file (call with _write_lock held)."""
+        self._trace_pending.append(_TRACE_ENCODER.encode(record.to_trace_event(self._pid)))
+        if record.parent_id is None and record.trace_id != UNTRACED:
+            # Name the trace's row after its root span
+            self._trace_pending.append(json.dumps({
+                "name": "thread_name", "ph": "M", "pid": self._pid, "tid": record.trace_id,
+                "args": {"name": f"{record.name} #{record.trace_id}"},
+            }))
+
+    def flush_trace(self) -> None:
+        """
+        Append buffered spans to the rolling trace file.
+
+        The file uses Chrome's JSON array format without the closing bracket,
+        which chrome://tracing and Perfetto accept, so it can be opened at any
+        point. It is rotated to trace_<session>.1.json, .2.json, ... once it
+        exceeds trace_file_max_mb.
+        """
+        with self._write_lock:
+            pending, self._trace_pending = self._trace_pending, []
+        if not pending:
+            return
+        with self._trace_lock:
+            try:
+                self._rotate_trace_file()
+                is_new = not self.trace_path.exists()
+                with open(self.trace_path, "a", encoding="utf-8") as f:
+                    if is_new:
+                        f.write("[\n")
+                        f.write(json.dumps(self._untraced_row_name()) + ",\n")
+                    f.write(",\n".join(pending))
+                    f.write(",\n")
+            except Exception:
+                pass  # Profiling must never break the agent
+
+    def _untraced_row_name(self) -> Dict[str, Any]:
+        return {
+            "name": "thread_name", "ph": "M", "pid": self._pid, "tid": UNTRACED,
+            "args": {"name": "(outside any span)"},
+        }
+
+    def _rotate_trace_file(self) -> None:
+        try:
+            if self.trace_path.stat().st_size < self._trace_file_max_bytes:
+                return
+        except FileNotFoundError:
+            return
+        stem = self.trace_path.with_suffix("")
+        if self._trace_file_backups <= 0:
+            self.trace_path.unlink()
+            return
+        for i in range(self._trace_file_backups - 1, 0, -1):
+            older = Path(f"{stem}.{i}.json")
+            if older.exists():
+                os.replace(older, f"{stem}.{i + 1}.json")
+        os.replace(self.trace_path, f"{stem}.1.json")
+
+    def export_chrome_trace(self, filename: Optional[str] = None) -> Path:
+        """
+        Write the recent spans (the in-memory ring buffer) as a Chrome
+        trace-event JSON file.
+
+        Args:
+            filename: Optional custom filename. Auto-generated if not provided.
+
+        Returns:
+            Path to the saved trace file.
+        """
+        if filename is None:
+            filename = f"trace_recent_{self.session_id}.json"
+
+        with self._write_lock:
+            records = list(self._records)
+        events = [r.to_trace_event(self._pid) for r in records]
+        events.append(self._untraced_row_name())
+        events.extend(
+            {
+                "name": "thread_name", "ph": "M", "pid": self._pid, "tid": r.trace_id,
+                "args": {"name": f"{r.name} #{r.trace_id}"},
+            }
+            for r in records if r.parent_id is None and r.trace_id != UNTRACED
+        )
+
+        trace_path = self.log_dir / filename
+        trace_path.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms",
+                        "otherData": {"session_id": self.session_id}}, default=str),
+            encoding="utf-8",
+        )
+        return trace_path
 
     # =========================================================================
     # Reporting
@@ -486,8 +830,8 @@ class AgentProfiler:
         lines.append(f"Session ID: {self.session_id}")
         lines.append(f"Generated at: {datetime.now().isoformat()}")
         lines.append(f"Total duration: {(time.time() - self._session_start) * 1000:.1f}ms")
-        lines.append(f"Total operations recorded: {len(self._records)}")
-        lines.append(f"Agent loops completed: {len(self.get_loop_stats())}")
+        lines.append(f"Total operations recorded: {self._record_count}")
+        lines.append(f"Agent loops completed: {self._loop_durations.count}")
         lines.append("")
 
         # Category summary
@@ -542,12 +886,16 @@ class AgentProfiler:
             lines.append("-" * 80)
 
             loop_durations = [l.duration_ms for l in loop_stats]
-            lines.append(f"Total loops: {len(loop_stats)}")
-            lines.append(f"Average loop duration: {statistics.mean(loop_durations):.1f}ms")
-            lines.append(f"Min loop duration: {min(loop_durations):.1f}ms")
-            lines.append(f"Max loop duration: {max(loop_durations):.1f}ms")
-            if len(loop_durations) > 1:
-                lines.append(f"Std dev: {statistics.stdev(loop_durations):.1f}ms")
+            all_loops = self._loop_durations
+            lines.append(f"Total loops: {all_loops.count}")
+            lines.append(f"Average loop duration: {all_loops.avg_ms:.1f}ms")
+            lines.append(f"Min loop duration: {all_loops.min_ms:.1f}ms")
+            lines.append(f"Max loop duration: {all_loops.max_ms:.1f}ms")
+            lines.append(
+                f"Median / p90 / p99: {all_loops.median_ms:.1f} / {all_loops.p90_ms:.1f} / {all_loops.p99_ms:.1f}ms"
+            )
+            if all_loops.count > 1:
+                lines.append(f"Std dev: {all_loops.std_dev_ms:.1f}ms")
             lines.append("")
 
             # Show individual loop breakdown (last 10 loops)
@@ -561,7 +909,7 @@ class AgentProfiler:
                     f"{k}: {v:.0f}ms" for k, v in sorted(loop.get_breakdown().items(), key=lambda x: x[1], reverse=True)[:4]
                 )
                 lines.append(
-                    f"{loop.loop_number:<8} {loop.duration_ms:>14.1f} {len(loop.operations):>12} {breakdown_str}"
+                    f"{loop.loop_number:<8} {loop.duration_ms:>14.1f} {loop.operation_count:>12} {breakdown_str}"
                 )
             lines.append("")
 
@@ -583,7 +931,10 @@ class AgentProfiler:
         lines.append("-" * 80)
         lines.append("ALL OPERATIONS DETAIL")
         lines.append("-" * 80)
-        lines.append(f"{'Operation':<45} {'Cat':<12} {'Count':>6} {'Avg':>8} {'Min':>8} {'Max':>8} {'Total':>10}")
+        lines.append(
+            f"{'Operation':<45} {'Cat':<12} {'Count':>6} {'Avg':>8} {'Min':>8} {'Max':>8} "
+            f"{'p50':>8} {'p99':>8} {'Total':>10}"
+        )
         lines.append("-" * 80)
 
         for stat in sorted(self._stats.values(), key=lambda x: x.total_ms, reverse=True):
@@ -592,7 +943,8 @@ class AgentProfiler:
             min_val = stat.min_ms if stat.min_ms != float('inf') else 0
             lines.append(
                 f"{op_name:<45} {cat_short:<12} {stat.count:>6} {stat.avg_ms:>8.1f} "
-                f"{min_val:>8.1f} {stat.max_ms:>8.1f} {stat.total_ms:>10.1f}"
+                f"{min_val:>8.1f} {stat.max_ms:>8.1f} {stat.median_ms:>8.1f} {stat.p99_ms:>8.1f} "
+                f"{stat.total_ms:>10.1f}"
             )
 
         lines.append("")
@@ -621,7 +973,10 @@ class AgentProfiler:
 
     def save_json(self, filename: Optional[str] = None) -> Path:
         """
-        Save all profiling data to a JSON file.
+        Save aggregated statistics and the recent raw records to a JSON file.
+
+        Only the last max_recent_spans records are kept in memory; the full
+        span history is in the rolling trace file (trace_path).
 
         Args:
             filename: Optional custom filename. Auto-generated if not provided.
@@ -639,11 +994,13 @@ class AgentProfiler:
             "operation_stats": {k: v.to_dict() for k, v in self._stats.items()},
             "category_stats": {k: v.to_dict() for k, v in self._category_stats.items()},
             "loop_stats": [l.to_dict() for l in self.get_loop_stats()],
-            "records": [r.to_dict() for r in self._records],
+            "records_total": self._record_count,
+            "records": [r.to_dict() for r in list(self._records)],
+            "trace_file": str(self.trace_path) if self._trace_file_enabled else None,
         }
 
         json_path = self.log_dir / filename
-        json_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        json_path.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
         return json_path
 
     def print_report(self) -> None:
@@ -654,9 +1011,12 @@ class AgentProfiler:
         """Clear all recorded data."""
         with self._write_lock:
             self._records.clear()
+            self._record_count = 0
             self._stats.clear()
             self._category_stats.clear()
             self._loops.clear()
+            self._loop_durations = OperationStats(name="agent_loop", category=OperationCategory.AGENT_LOOP.value)
+            self._trace_pending.clear()
             self._current_loop_id = None
             self._loop_counter = 0
             self._session_start = time.time()
@@ -708,21 +1068,24 @@ def profile(
             if not profiler.enabled:
                 return await fn(*args, **kwargs)
 
+            span = profiler.begin_span()
             start = time.perf_counter()
+            result = None
             try:
                 result = await fn(*args, **kwargs)
                 return result
             finally:
                 end = time.perf_counter()
                 duration_ms = (end - start) * 1000
-                meta = meta_fn(result, *args, **kwargs) if meta_fn else None
-                profiler.record(op_name, duration_ms, category, meta)
+                meta = meta_fn(result, *args, **kwargs) if meta_fn and result is not None else None
+                profiler.end_span(span, op_name, duration_ms, category, meta)
 
         @functools.wraps(fn)
         def sync_wrapper(*args, **kwargs):
             if not profiler.enabled:
                 return fn(*args, **kwargs)
 
+            span = profiler.begin_span()
             start = time.perf_counter()
             result = None
             try:
@@ -732,7 +1095,7 @@ def profile(
                 end = time.perf_counter()
                 duration_ms = (end - start) * 1000
                 meta = meta_fn(result, *args, **kwargs) if meta_fn and result is not None else None
-                profiler.record(op_name, duration_ms, category, meta)
+                profiler.end_span(span, op_name, duration_ms, category, meta)
 
         if asyncio.iscoroutinefunction(fn):
             return async_wrapper  # type: ignore
@@ -747,6 +1110,8 @@ def profile_loop(fn: F) -> F:
 
     This decorator:
     - Starts/ends loop tracking
+    - Opens the loop's span, so everything profiled during the loop
+      (including in tasks it starts) nests under it
     - Records the total loop time
 
     Example:
@@ -760,6 +1125,7 @@ def profile_loop(fn: F) -> F:
             return await fn(*args, **kwargs)
 
         loop_id = profiler.start_loop()
+        span = profiler.begin_span(loop_id=loop_id)
         start = time.perf_counter()
         try:
             result = await fn(*args, **kwargs)
@@ -767,7 +1133,7 @@ def profile_loop(fn: F) -> F:
         finally:
             end = time.perf_counter()
             duration_ms = (end - start) * 1000
-            profiler.record("react_loop_total", duration_ms, OperationCategory.AGENT_LOOP)
+            profiler.end_span(span, "react_loop_total", duration_ms, OperationCategory.AGENT_LOOP)
             profiler.end_loop(loop_id)
 
     return wrapper  # type: ignore
@@ -793,24 +1159,32 @@ class ProfileContext:
         self.category = category
         self.meta = meta
         self.start_time: Optional[float] = None
+        self._span: Optional[tuple] = None
 
-    async def __aenter__(self) -> "ProfileContext":
+    def _enter(self) -> None:
+        self._span = profiler.begin_span() if profiler.enabled else None
         self.start_time = time.perf_counter()
+
+    def _exit(self) -> None:
+        if self.start_time is None or self._span is None:
+            return
+        duration_ms = (time.perf_counter() - self.start_time) * 1000
+        span, self._span = self._span, None
+        profiler.end_span(span, self.name, duration_ms, self.category, self.meta)
+
+    async def __aenter__(self) -> "ProfileContext":
+        self._enter()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self.start_time and profiler.enabled:
-            duration_ms = (time.perf_counter() - self.start_time) * 1000
-            profiler.record(self.name, duration_ms, self.category, self.meta)
+        self._exit()
 
     def __enter__(self) -> "ProfileContext":
-        self.start_time = time.perf_counter()
+        self._enter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self.start_time and profiler.enabled:
-            duration_ms = (time.perf_counter() - self.start_time) * 1000
-            profiler.record(self.name, duration_ms, self.category, self.meta)
+        self._exit()
 
 
 # =============================================================================
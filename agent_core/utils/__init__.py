@@ -2,6 +2,6 @@
 """Utility modules for agent-core."""
 
 from agent_core.utils.logger import logger, define_log_level, configure_logging
-from agent_core.utils.token import count_tokens
+from agent_core.utils.token import count_tokens, count_tokens_batch
 
-__all__ = ["logger", "define_log_level", "configure_logging", "count_tokens"]
+__all__ = ["logger", "define_log_level", "configure_logging", "count_tokens", "count_tokens_batch"]
@@ -21,3 +21,57 @@ def rotate_md_file_if_needed(file_path: Path, max_bytes: int = MAX_MD_FILE_BYTES
         file_path.write_text("".join(lines[keep_from:]), encoding="utf-8")
     except Exception:
         pass  # Never block a write due to trim failure
+
+
+# Archived segments kept per MD log by roll_md_segment (FILE.1.md is the newest)
+MAX_MD_SEGMENTS = 3
+
+# Bytes read from the head of a log when carrying its preamble into a new segment
+_PREAMBLE_SCAN_BYTES = 8 * 1024
+
+
+def md_segment_path(file_path: Path, index: int) -> Path:
+    """Return the path of archived segment *index* of *file_path* (``EVENT.md`` -> ``EVENT.1.md``)."""
+    return file_path.with_name(f"{file_path.stem}.{index}{file_path.suffix}")
+
+
+def roll_md_segment(file_path: Path, max_segments: int = MAX_MD_SEGMENTS) -> str:
+    """Archive *file_path* as a segment file and return its preamble.
+
+    Unlike :func:`rotate_md_file_if_needed` the log is never read or rewritten:
+    older segments are shifted (``FILE.1.md`` -> ``FILE.2.md`` ...), the oldest
+    beyond *max_segments* is deleted, and the live file is renamed to
+    ``FILE.1.md``. The caller then starts a fresh file, seeding it with the
+    returned preamble (the header lines that precede the first ``[`` event
+    line) so templated logs keep their heading.
+
+    Only for logs that are read as history: anything that consumes and clears
+    the live file (EVENT_UNPROCESSED.md) would never see the rolled segments.
+    """
+    preamble = ""
+    try:
+        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+            head = f.read(_PREAMBLE_SCAN_BYTES)
+        lines = []
+        for line in head.splitlines(keepends=True):
+            if line.startswith("[") or not line.endswith("\n"):
+                break
+            lines.append(line)
+        else:
+            if len(head) >= _PREAMBLE_SCAN_BYTES:
+                lines = []  # no event line within the scanned head: not a preamble
+        preamble = "".join(lines)
+    except OSError:
+        pass
+
+    if max_segments <= 0:
+        file_path.unlink(missing_ok=True)
+        return preamble
+
+    md_segment_path(file_path, max_segments).unlink(missing_ok=True)
+    for index in range(max_segments - 1, 0, -1):
+        segment = md_segment_path(file_path, index)
+        if segment.exists():
+            segment.replace(md_segment_path(file_path, index + 1))
+    file_path.replace(md_segment_path(file_path, 1))
+    return preamble
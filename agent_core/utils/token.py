@@ -6,6 +6,8 @@ Provides a cached tokenizer and token counting functions used
 across agent_core and app layers.
 """
 
+from typing import List, Sequence
+
 import tiktoken
 
 # Ensure tiktoken extension encodings (cl100k_base, etc.) are registered.
@@ -17,6 +19,11 @@ except ImportError:
 
 _tokenizer = None
 
+# Below this many texts a plain loop beats the batch encoder's thread fan-out
+BATCH_MIN_TEXTS = 64
+# Worker threads for tiktoken's batch encoder (encoding releases the GIL)
+BATCH_NUM_THREADS = 8
+
 
 def _get_tokenizer():
     """Get or create the tiktoken tokenizer (cached for performance)."""
@@ -35,3 +42,35 @@ def count_tokens(text: str) -> int:
     if not text:
         return 0
     return len(_get_tokenizer().encode(text))
+
+
+def count_tokens_batch(texts: Sequence[str], num_threads: int = BATCH_NUM_THREADS) -> List[int]:
+    """
+    Count tokens for many texts at once.
+
+    Uses tiktoken's ``encode_ordinary_batch``, which encodes on a thread pool
+    and releases the GIL, so bulk loads (session restore, replays) avoid
+    paying one Python-level ``encode`` call per text. Small inputs fall back
+    to ``count_tokens``.
+
+    Args:
+        texts: Texts to count.
+        num_threads: Worker threads used by the batch encoder.
+
+    Returns:
+        Token counts in the same order as ``texts``.
+    """
+    if len(texts) < BATCH_MIN_TEXTS:
+        return [count_tokens(t) for t in texts]
+
+    counts = [0] * len(texts)
+    indices = [i for i, t in enumerate(texts) if t]
+    if not indices:
+        return counts
+
+    encoded = _get_tokenizer().encode_ordinary_batch(
+        [texts[i] for i in indices], num_threads=num_threads
+    )
+    for i, tokens in zip(indices, encoded):
+        counts[i] = len(tokens)
+    return counts
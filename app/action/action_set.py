@@ -8,7 +8,7 @@ retrieval during task execution, improving performance and predictability.
 """
 
 import platform as platform_lib
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Tuple
 import logging
 
 logger = logging.getLogger("ActionSetManager")
@@ -36,11 +36,23 @@ class ActionSetManager:
     """
     _instance: Optional["ActionSetManager"] = None
 
+    # Compiled views, valid for a single registry generation
+    _cache_generation: int = -1
+    _compiled_cache: Dict[Tuple[str, str, Tuple[str, ...]], List[str]] = {}
+    _sets_cache: Optional[Dict[str, str]] = None
+
     def __new__(cls) -> "ActionSetManager":
         if cls._instance is None:
             cls._instance = super(ActionSetManager, cls).__new__(cls)
         return cls._instance
 
+    def _sync_cache(self, generation: int) -> None:
+        """Drop compiled views if the registry changed since they were built."""
+        if generation != self._cache_generation:
+            self._compiled_cache.clear()
+            self._sets_cache = None
+            self._cache_generation = generation
+
     def compile_action_list(
         self,
         selected_sets: List[str],
@@ -70,6 +82,12 @@ class ActionSetManager:
         # Get current platform for implementation lookup
         current_platform = platform_lib.system().lower()
 
+        self._sync_cache(registry_instance.generation)
+        cache_key = (current_platform, (mode or "").upper(), tuple(sorted(required_sets)))
+        cached = self._compiled_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         for action_name, platform_impls in registry_instance._registry.items():
             # Get the best implementation for current platform
             impl = platform_impls.get(current_platform) or platform_impls.get(PLATFORM_ALL)
@@ -96,7 +114,8 @@ class ActionSetManager:
             compiled.append(action_name)
 
         logger.debug(f"Compiled {len(compiled)} actions from sets: {required_sets}")
-        return compiled
+        self._compiled_cache[cache_key] = compiled
+        return list(compiled)
 
     def _action_in_sets(self, action_sets: List[str], required_sets: Set[str]) -> bool:
         """Check if an action belongs to any of the required sets."""
@@ -132,6 +151,10 @@ class ActionSetManager:
         """
         from agent_core import registry_instance, PLATFORM_ALL
 
+        self._sync_cache(registry_instance.generation)
+        if self._sets_cache is not None:
+            return dict(self._sets_cache)
+
         current_platform = platform_lib.system().lower()
         discovered_sets: Dict[str, str] = {}
 
@@ -152,7 +175,8 @@ class ActionSetManager:
                     )
                     discovered_sets[set_name] = desc
 
-        return discovered_sets
+        self._sets_cache = discovered_sets
+        return dict(discovered_sets)
 
     def get_set_description(self, set_name: str) -> Optional[str]:
         """
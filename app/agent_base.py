@@ -63,7 +63,7 @@ from agent_core import (
 )
 from app.context_engine import ContextEngine
 from app.state.state_manager import StateManager
-from app.state.agent_state import STATE
+from app.state.agent_state import STATE, drop_session_state, session_state
 from app.trigger import Trigger, TriggerQueue
 from app.prompt import ROUTE_TO_SESSION_PROMPT
 from app.state.types import ReasoningResult
@@ -81,6 +81,7 @@ from app.ui_layer.settings.memory_settings import (
     get_memory_prune_target,
 )
 from agent_core import profile, profile_loop, OperationCategory
+from agent_core import LLMPriority, llm_call_context
 from agent_core import (
     # Registries for dependency injection
     DatabaseRegistry,
@@ -192,6 +193,7 @@ class AgentBase:
         self.event_stream_manager = EventStreamManager(
             self.llm,
             agent_file_system_path=AGENT_FILE_SYSTEM_PATH,
+            journal=self._get_session_journal(),
         )
         
         # action & task layers
@@ -375,11 +377,26 @@ class AgentBase:
         4. SIMPLE TASK: Quick tasks that auto-complete
         5. CONVERSATION: No active task, handle user messages
 
+        Reactions for different sessions may run concurrently, so each one
+        works on its own session state (see app.state.agent_state). LLM calls
+        made while reacting are tagged with the trigger's session and priority
+        (see _llm_priority) for the Slow Mode rate limiter.
+
         Args:
             trigger: The Trigger that wakes the agent up and describes
                 when and why the agent should act.
         """
         session_id = trigger.session_id
+        with session_state(session_id), llm_call_context(
+            priority=self._llm_priority(trigger), session_id=session_id
+        ):
+            await self._react(trigger)
+        # Sessions without a task (conversation turns) keep nothing between reactions
+        if session_id and not self.state_manager.is_running_task(session_id):
+            drop_session_state(session_id)
+
+    async def _react(self, trigger: Trigger) -> None:
+        session_id = trigger.session_id
 
         try:
             logger.debug("[REACT] starting...")
@@ -579,6 +596,8 @@ class AgentBase:
             return False
 
         # Early-exit if there's nothing to process (avoid touching the lock for a no-op).
+        # Events are written by a background writer; make sure recent ones are on disk.
+        await asyncio.to_thread(self.event_stream_manager.flush_event_logs)
         unprocessed_file = AGENT_FILE_SYSTEM_PATH / "EVENT_UNPROCESSED.md"
         if not unprocessed_file.exists():
             logger.debug("[MEMORY] EVENT_UNPROCESSED.md not found")
@@ -722,6 +741,23 @@ class AgentBase:
         trigger_type = trigger.payload.get("type", "")
         return trigger_type in ("proactive_heartbeat", "proactive_planner")
 
+    def _llm_priority(self, trigger: Trigger) -> LLMPriority:
+        """Priority of the LLM calls made while reacting to a trigger.
+
+        Conversation replies and messages routed into a task are interactive;
+        memory, proactive and other workflow tasks run in the background.
+        """
+        if self._is_memory_trigger(trigger) or self._is_proactive_trigger(trigger):
+            return LLMPriority.BACKGROUND
+        task = None
+        if trigger.session_id and self.task_manager:
+            task = self.task_manager.tasks.get(trigger.session_id)
+        if task is None or (trigger.payload or {}).get("pending_user_message"):
+            return LLMPriority.INTERACTIVE
+        if task.workflow_id:
+            return LLMPriority.BACKGROUND
+        return LLMPriority.NORMAL
+
     def _is_gui_task_mode(self, session_id: str | None = None) -> bool:
         """Check if in GUI task execution mode."""
         return self.state_manager.is_running_task(session_id=session_id) and STATE.gui_mode
@@ -1536,8 +1572,9 @@ class AgentBase:
             return
 
         # Reset counters
-        STATE.set_agent_property("action_count", 0)
-        STATE.set_agent_property("token_count", 0)
+        with session_state(session_id):
+            STATE.set_agent_property("action_count", 0)
+            STATE.set_agent_property("token_count", 0)
 
         # Also reset on the StateSession for this session
         from agent_core.core.state.session import StateSession
@@ -1617,7 +1654,8 @@ class AgentBase:
 
     async def _cleanup_session_triggers(self, session_id: str) -> None:
         """
-        Remove all triggers associated with a session when its task ends.
+        Remove all triggers associated with a session when its task ends,
+        and forget the session's agent state.
 
         This callback is invoked by TaskManager when a task completes, errors,
         or is cancelled, ensuring that stale triggers no longer appear as
@@ -1626,6 +1664,7 @@ class AgentBase:
         Args:
             session_id: The task/session ID whose triggers should be removed.
         """
+        drop_session_state(session_id)
         try:
             await self.triggers.remove_sessions([session_id])
             logger.debug(f"[TRIGGER] Cleaned up triggers for session={session_id}")
@@ -1922,10 +1961,11 @@ class AgentBase:
         )
 
         logger.debug(f"[UNIFIED ROUTING PROMPT]:\n{prompt}")
-        response = await self.llm.generate_response_async(
-            system_prompt="You are a session routing system.",
-            user_prompt=prompt,
-        )
+        with llm_call_context(priority=LLMPriority.INTERACTIVE):
+            response = await self.llm.generate_response_async(
+                system_prompt="You are a session routing system.",
+                user_prompt=prompt,
+            )
         logger.debug(f"[UNIFIED ROUTING RESPONSE]: {response}")
 
         try:
@@ -2444,22 +2484,22 @@ class AgentBase:
         try:
             # Clear chat messages
             chat_storage = get_chat_storage()
-            chat_count = chat_storage.clear_messages()
+            chat_count = await chat_storage.clear_messages_async()
             logger.info(f"[RESET] Cleared {chat_count} chat messages")
 
             # Clear action items
             action_storage = get_action_storage()
-            action_count = action_storage.clear_items()
+            action_count = await action_storage.clear_items_async()
             logger.info(f"[RESET] Cleared {action_count} action items")
 
             # Clear task events
             task_storage = get_task_storage()
-            task_count = task_storage.clear_tasks()
+            task_count = await task_storage.clear_tasks_async()
             logger.info(f"[RESET] Cleared {task_count} task events")
 
             # Clear usage events
             usage_storage = get_usage_storage()
-            usage_count = usage_storage.clear_events()
+            usage_count = await usage_storage.clear_events_async()
             logger.info(f"[RESET] Cleared {usage_count} usage events")
 
         except Exception as e:
@@ -2473,6 +2513,8 @@ class AgentBase:
         """
         # Run blocking file operations in a thread to avoid freezing the UI
         await asyncio.to_thread(self._reset_agent_file_system_sync)
+        # Templates are copied with their original mtimes; rebuild prompt sections
+        self.context_engine.invalidate_prompt_cache()
 
     def _reset_agent_file_system_sync(self) -> None:
         """
@@ -2724,6 +2766,16 @@ class AgentBase:
     # Session Persistence & Restoration
     # =====================================
 
+    @staticmethod
+    def _get_session_journal():
+        """Return the session journal for event stream persistence, or None if unavailable."""
+        try:
+            from app.usage.session_storage import get_session_storage
+            return get_session_storage().journal
+        except Exception as e:
+            logger.warning(f"[PERSIST] Session journal unavailable: {e}")
+            return None
+
     def _restore_sessions(self) -> set:
         """
         Restore active tasks and event streams from the previous session.
@@ -2735,18 +2787,13 @@ class AgentBase:
         restored_ids = set()
         try:
             from app.usage.session_storage import get_session_storage
-            from agent_core.core.impl.event_stream.event_stream import get_cached_token_count
             storage = get_session_storage()
 
             # 1. Restore main event stream
             head_summary, records = storage.get_event_stream("__main__")
             if head_summary or records:
                 main_stream = self.event_stream_manager.get_main_stream()
-                main_stream.head_summary = head_summary
-                main_stream.tail_events = records
-                main_stream._total_tokens = sum(
-                    get_cached_token_count(r) for r in records
-                )
+                main_stream.load(head_summary, records)
                 logger.info(
                     f"[RESTORE] Restored main event stream "
                     f"({len(records)} events)"
@@ -2781,11 +2828,7 @@ class AgentBase:
                         task_id, temp_dir
                     )
                     t_head, t_records = storage.get_event_stream(task_id)
-                    stream.head_summary = t_head
-                    stream.tail_events = t_records
-                    stream._total_tokens = sum(
-                        get_cached_token_count(r) for r in t_records
-                    )
+                    stream.load(t_head, t_records)
 
                     # Log restoration event
                     self.event_stream_manager.log(
@@ -2834,45 +2877,30 @@ class AgentBase:
 
     def _persist_all_sessions(self) -> None:
         """
-        Persist all active tasks, event streams, and conversation history.
+        Persist all active tasks and flush the session journal.
 
-        Called during graceful shutdown to ensure state survives restarts.
+        Event streams and conversation history are journaled incrementally as
+        events are logged, so shutdown only has to upsert task state and wait
+        for the journal writer to drain.
         """
         try:
             from app.usage.session_storage import get_session_storage
             storage = get_session_storage()
 
-            # 1. Persist all active tasks and their event streams
+            # 1. Persist all active tasks
             task_count = 0
             for task_id, task in self.task_manager.tasks.items():
                 try:
                     storage.persist_task(task)
-                    # Persist this task's event stream
-                    stream = self.event_stream_manager.get_stream_by_id(task_id)
-                    if stream:
-                        storage.persist_event_stream(task_id, stream)
                     task_count += 1
                 except Exception as e:
                     logger.warning(
                         f"[PERSIST] Failed to persist task {task_id}: {e}"
                     )
 
-            # 2. Persist main event stream
-            try:
-                main_stream = self.event_stream_manager.get_main_stream()
-                storage.persist_main_stream(main_stream)
-            except Exception as e:
-                logger.warning(f"[PERSIST] Failed to persist main stream: {e}")
-
-            # 3. Persist conversation history
-            try:
-                conv_history = self.event_stream_manager._conversation_history
-                if conv_history:
-                    storage.persist_conversation_history(conv_history)
-            except Exception as e:
-                logger.warning(
-                    f"[PERSIST] Failed to persist conversation history: {e}"
-                )
+            # 2. Flush journaled event streams and conversation history
+            if not storage.flush():
+                logger.warning("[PERSIST] Timed out flushing session journal")
 
             if task_count > 0:
                 logger.info(
@@ -94,6 +94,7 @@ def _get_default_settings() -> Dict[str, Any]:
             "vlm_model": None,
             "slow_mode": False,
             "slow_mode_tpm_limit": 30000,
+            "slow_mode_rpm_limit": 0,
         },
         "api_keys": {
             "openai": "",
@@ -114,6 +115,9 @@ def _get_default_settings() -> Dict[str, Any]:
             "enabled": True,
             "use_omniparser": False,
             "omniparser_url": "http://127.0.0.1:7861",
+            "screen_cache": True,
+            "screen_cache_hash_distance": 6,
+            "screen_cache_cell_threshold": 4,
         },
     }
 
@@ -314,6 +318,12 @@ def get_slow_mode_tpm_limit() -> int:
     return settings.get("model", {}).get("slow_mode_tpm_limit", 30000)
 
 
+def get_slow_mode_rpm_limit() -> int:
+    """Get the requests-per-minute limit for slow mode (0 = no request limit)."""
+    settings = get_settings()
+    return settings.get("model", {}).get("slow_mode_rpm_limit", 0)
+
+
 def save_settings(settings: Dict[str, Any]) -> None:
     """Save settings to settings.json.
 
@@ -11,7 +11,12 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Coroutine, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Optional
+
+from app.external_comms.http import get_async_client, get_sync_client
+
+if TYPE_CHECKING:
+    import httpx
 
 try:
     from app.logger import logger
@@ -61,6 +66,16 @@ class BasePlatformClient(ABC):
     def is_listening(self) -> bool:
         return self._listening
 
+    @property
+    def http(self) -> "httpx.Client":
+        """Shared keep-alive HTTP client for this platform's synchronous methods."""
+        return get_sync_client(self.PLATFORM_ID)
+
+    @property
+    def async_http(self) -> "httpx.AsyncClient":
+        """Shared keep-alive HTTP client for this platform on the running event loop."""
+        return get_async_client(self.PLATFORM_ID)
+
     @abstractmethod
     def has_credentials(self) -> bool:
         """Check if credentials are available for this platform."""
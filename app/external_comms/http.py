@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+app.external_comms.http
+
+Shared, pooled HTTP clients for platform clients.
+
+Platform clients used to open a new httpx client (and a new TCP + TLS
+connection) for every request. Instead, each platform gets long-lived
+clients with HTTP keep-alive:
+
+- ``get_async_client(platform_id)``: an ``httpx.AsyncClient`` for async code,
+  one per event loop (an httpx connection pool is bound to the loop it was
+  first used on)
+- ``get_sync_client(platform_id)``: a thread-safe ``httpx.Client`` for the
+  synchronous API methods called from actions
+
+Clients use HTTP/2 when the ``h2`` package is installed and the platform's
+API supports it, and the per-platform timeouts and connection limits in
+PLATFORM_HTTP_CONFIGS. A ``timeout=`` passed on a request still overrides the
+client default (e.g. for long-polling).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict
+
+import httpx
+
+try:
+    from app.logger import logger
+except Exception:
+    logger = logging.getLogger(__name__)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class HttpClientConfig:
+    """Connection settings for one platform's HTTP clients."""
+
+    timeout: float = 15.0
+    connect_timeout: float = 10.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    http2: bool = True
+
+
+DEFAULT_HTTP_CONFIG = HttpClientConfig()
+
+# Maps PLATFORM_ID -> HTTP settings (platforms not listed use the default)
+PLATFORM_HTTP_CONFIGS: Dict[str, HttpClientConfig] = {
+    # Long-polling holds one connection; sends share the pool
+    "telegram_bot": HttpClientConfig(timeout=10.0),
+    "discord": HttpClientConfig(),
+    "slack": HttpClientConfig(timeout=10.0),
+    "github": HttpClientConfig(),
+    "jira": HttpClientConfig(),
+    "google_workspace": HttpClientConfig(),
+    "outlook": HttpClientConfig(),
+    "notion": HttpClientConfig(),
+    "twitter": HttpClientConfig(),
+    # Image uploads pass their own (longer) timeout per request
+    "linkedin": HttpClientConfig(),
+    "whatsapp_business": HttpClientConfig(),
+}
+
+
+def get_http_config(platform_id: str) -> HttpClientConfig:
+    return PLATFORM_HTTP_CONFIGS.get(platform_id, DEFAULT_HTTP_CONFIG)
+
+
+def _client_kwargs(platform_id: str) -> Dict[str, Any]:
+    config = get_http_config(platform_id)
+    return {
+        "timeout": httpx.Timeout(config.timeout, connect=config.connect_timeout),
+        "limits": httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        "http2": config.http2 and HTTP2_AVAILABLE,
+    }
+
+
+# Event loop -> {PLATFORM_ID: AsyncClient}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+# PLATFORM_ID -> Client
+_sync_clients: Dict[str, httpx.Client] = {}
+_lock = threading.Lock()
+
+
+def get_async_client(platform_id: str) -> httpx.AsyncClient:
+    """
+    Get the shared async client for a platform on the running event loop.
+
+    Do not close it or use it as a context manager; call
+    ``close_http_clients()`` on shutdown instead.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(platform_id)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(**_client_kwargs(platform_id))
+            clients[platform_id] = client
+        return client
+
+
+def get_sync_client(platform_id: str) -> httpx.Client:
+    """Get the shared synchronous client for a platform (safe to use from any thread)."""
+    with _lock:
+        client = _sync_clients.get(platform_id)
+        if client is None or client.is_closed:
+            client = httpx.Client(**_client_kwargs(platform_id))
+            _sync_clients[platform_id] = client
+        return client
+
+
+async def close_http_clients() -> None:
+    """Close the running loop's async clients and all sync clients."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        async_clients = list(_async_clients.pop(loop, {}).values())
+        sync_clients = list(_sync_clients.values())
+        _sync_clients.clear()
+
+    for client in async_clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug(f"[EXTERNAL_COMMS] Error closing HTTP client: {e}")
+    for client in sync_clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug(f"[EXTERNAL_COMMS] Error closing HTTP client: {e}")
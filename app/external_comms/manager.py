@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from app.external_comms.base import PlatformMessage
 from app.external_comms.config import get_config
+from app.external_comms.http import close_http_clients
 
 if TYPE_CHECKING:
     from app.agent_base import AgentBase
@@ -165,6 +166,7 @@ class ExternalCommsManager:
                 logger.warning(f"[EXTERNAL_COMMS] Error stopping {platform_id}: {e}")
 
         self._active_clients.clear()
+        await close_http_clients()
         self._running = False
         logger.info("[EXTERNAL_COMMS] All channels stopped")
 
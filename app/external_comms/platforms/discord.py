@@ -25,8 +25,6 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote as _url_quote
 
-import httpx
-
 from app.external_comms.base import BasePlatformClient, PlatformMessage, MessageCallback
 from app.external_comms.credentials import has_credential, load_credential, save_credential, remove_credential
 from app.external_comms.registry import register_client
@@ -137,7 +135,7 @@ class DiscordClient(BasePlatformClient):
             raise RuntimeError("No Discord bot token for Gateway connection")
 
         # Verify token by fetching bot user info
-        bot_info = self.get_bot_user()
+        bot_info = await asyncio.to_thread(self.get_bot_user)
         if "error" in bot_info:
             raise RuntimeError(f"Invalid Discord bot token: {bot_info.get('error')}")
         self._bot_user_id = bot_info["result"]["id"]
@@ -332,7 +330,9 @@ class DiscordClient(BasePlatformClient):
 
     async def send_message(self, recipient: str, text: str, **kwargs) -> Dict[str, Any]:
         """Send a message to a channel (uses bot token by default)."""
-        return self.bot_send_message(channel_id=recipient, content=text, **kwargs)
+        return await asyncio.to_thread(
+            self.bot_send_message, channel_id=recipient, content=text, **kwargs
+        )
 
     # ══════════════════════════════════════════════════════════════════════
     # BOT METHODS
@@ -343,7 +343,7 @@ class DiscordClient(BasePlatformClient):
     def get_bot_user(self) -> Dict[str, Any]:
         """Get the bot's own user information."""
         try:
-            r = httpx.get(f"{DISCORD_API_BASE}/users/@me", headers=self._bot_headers(), timeout=15)
+            r = self.http.get(f"{DISCORD_API_BASE}/users/@me", headers=self._bot_headers(), timeout=15)
             if r.status_code == 200:
                 data = r.json()
                 return {
@@ -363,7 +363,7 @@ class DiscordClient(BasePlatformClient):
     def get_bot_guilds(self, limit: int = 100) -> Dict[str, Any]:
         """Get guilds (servers) the bot is a member of."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/users/@me/guilds",
                 headers=self._bot_headers(),
                 params={"limit": limit},
@@ -380,7 +380,7 @@ class DiscordClient(BasePlatformClient):
     def get_guild_channels(self, guild_id: str) -> Dict[str, Any]:
         """Get all channels in a guild."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/guilds/{guild_id}/channels",
                 headers=self._bot_headers(),
                 timeout=15,
@@ -406,7 +406,7 @@ class DiscordClient(BasePlatformClient):
     def get_channel(self, channel_id: str) -> Dict[str, Any]:
         """Get a channel by ID."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/channels/{channel_id}",
                 headers=self._bot_headers(),
                 timeout=15,
@@ -434,7 +434,7 @@ class DiscordClient(BasePlatformClient):
             payload["message_reference"] = {"message_id": reply_to}
 
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{DISCORD_API_BASE}/channels/{channel_id}/messages",
                 headers=self._bot_headers(),
                 json=payload,
@@ -470,7 +470,7 @@ class DiscordClient(BasePlatformClient):
             params["after"] = after
 
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/channels/{channel_id}/messages",
                 headers=self._bot_headers(),
                 params=params,
@@ -511,7 +511,7 @@ class DiscordClient(BasePlatformClient):
     ) -> Dict[str, Any]:
         """Edit a message the bot sent."""
         try:
-            r = httpx.patch(
+            r = self.http.patch(
                 f"{DISCORD_API_BASE}/channels/{channel_id}/messages/{message_id}",
                 headers=self._bot_headers(),
                 json={"content": content},
@@ -530,7 +530,7 @@ class DiscordClient(BasePlatformClient):
     ) -> Dict[str, Any]:
         """Delete a message."""
         try:
-            r = httpx.delete(
+            r = self.http.delete(
                 f"{DISCORD_API_BASE}/channels/{channel_id}/messages/{message_id}",
                 headers=self._bot_headers(),
                 timeout=15,
@@ -546,7 +546,7 @@ class DiscordClient(BasePlatformClient):
     def create_dm_channel(self, recipient_id: str) -> Dict[str, Any]:
         """Create (or retrieve) a DM channel with a user (bot token)."""
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{DISCORD_API_BASE}/users/@me/channels",
                 headers=self._bot_headers(),
                 json={"recipient_id": recipient_id},
@@ -584,7 +584,7 @@ class DiscordClient(BasePlatformClient):
     def get_user(self, user_id: str) -> Dict[str, Any]:
         """Get a user by ID (bot token)."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/users/{user_id}",
                 headers=self._bot_headers(),
                 timeout=15,
@@ -598,7 +598,7 @@ class DiscordClient(BasePlatformClient):
     def get_guild_member(self, guild_id: str, user_id: str) -> Dict[str, Any]:
         """Get a member of a guild."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/guilds/{guild_id}/members/{user_id}",
                 headers=self._bot_headers(),
                 timeout=15,
@@ -612,7 +612,7 @@ class DiscordClient(BasePlatformClient):
     def list_guild_members(self, guild_id: str, limit: int = 100) -> Dict[str, Any]:
         """List members of a guild."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/guilds/{guild_id}/members",
                 headers=self._bot_headers(),
                 params={"limit": min(limit, 1000)},
@@ -635,7 +635,7 @@ class DiscordClient(BasePlatformClient):
         """Add a reaction to a message."""
         encoded_emoji = _url_quote(emoji, safe="")
         try:
-            r = httpx.put(
+            r = self.http.put(
                 f"{DISCORD_API_BASE}/channels/{channel_id}/messages/{message_id}/reactions/{encoded_emoji}/@me",
                 headers=self._bot_headers(),
                 timeout=15,
@@ -653,7 +653,7 @@ class DiscordClient(BasePlatformClient):
     def user_get_current_user(self) -> Dict[str, Any]:
         """Get the authenticated user's own profile."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/users/@me",
                 headers=self._user_headers(),
                 timeout=15,
@@ -677,7 +677,7 @@ class DiscordClient(BasePlatformClient):
     def user_get_guilds(self, limit: int = 100) -> Dict[str, Any]:
         """Get guilds the user account is in."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/users/@me/guilds",
                 headers=self._user_headers(),
                 params={"limit": limit},
@@ -692,7 +692,7 @@ class DiscordClient(BasePlatformClient):
     def user_get_dm_channels(self) -> Dict[str, Any]:
         """Get the user's DM channel list."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/users/@me/channels",
                 headers=self._user_headers(),
                 timeout=15,
@@ -736,7 +736,7 @@ class DiscordClient(BasePlatformClient):
             payload["message_reference"] = {"message_id": reply_to}
 
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{DISCORD_API_BASE}/channels/{channel_id}/messages",
                 headers=self._user_headers(),
                 json=payload,
@@ -772,7 +772,7 @@ class DiscordClient(BasePlatformClient):
             params["after"] = after
 
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/channels/{channel_id}/messages",
                 headers=self._user_headers(),
                 params=params,
@@ -811,7 +811,7 @@ class DiscordClient(BasePlatformClient):
         """Send a DM as the user account."""
         # Create / retrieve the DM channel first
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{DISCORD_API_BASE}/users/@me/channels",
                 headers=self._user_headers(),
                 json={"recipient_id": recipient_id},
@@ -828,7 +828,7 @@ class DiscordClient(BasePlatformClient):
     def user_get_relationships(self) -> Dict[str, Any]:
         """Get the user's relationships (friends, blocked, pending)."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/users/@me/relationships",
                 headers=self._user_headers(),
                 timeout=15,
@@ -867,7 +867,7 @@ class DiscordClient(BasePlatformClient):
     ) -> Dict[str, Any]:
         """Search messages in a guild (user token — not available to bots)."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DISCORD_API_BASE}/guilds/{guild_id}/messages/search",
                 headers=self._user_headers(),
                 params={"content": query, "limit": limit},
@@ -10,7 +10,6 @@ users restrict triggers to issue/PR comments mentioning a tag
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -20,6 +19,7 @@ import httpx
 
 from app.external_comms.base import BasePlatformClient, PlatformMessage, MessageCallback
 from app.external_comms.credentials import has_credential, load_credential, save_credential, remove_credential
+from app.external_comms.polling import AdaptivePoller, PollResult, load_cursor, rate_limit_delay, save_cursor
 from app.external_comms.registry import register_client
 
 try:
@@ -31,8 +31,13 @@ except Exception:
 GITHUB_API = "https://api.github.com"
 CREDENTIAL_FILE = "github.json"
 
-POLL_INTERVAL = 15      # seconds between polls
+POLL_INTERVAL = 15      # seconds between polls while active (GitHub's X-Poll-Interval wins if longer)
+MAX_POLL_INTERVAL = 300 # seconds between polls once idle
 RETRY_DELAY = 30        # seconds to wait after a poll error
+CURSOR_MAX_AGE = 86400  # resume from a saved cursor at most this old after a restart
+NOTIFICATIONS_PER_PAGE = 50
+MAX_PAGES = 5           # notification pages fetched per poll
+SEEN_IDS_KEPT = 200
 
 
 @dataclass
@@ -53,9 +58,12 @@ class GitHubClient(BasePlatformClient):
     def __init__(self) -> None:
         super().__init__()
         self._cred: Optional[GitHubCredential] = None
-        self._poll_task: Optional[asyncio.Task] = None
+        self._poller: Optional[AdaptivePoller] = None
+        self._cursor_resource: str = ""
         self._last_modified: Optional[str] = None  # If-Modified-Since header
-        self._seen_ids: set = set()
+        self._etag: Optional[str] = None  # If-None-Match header (valid for the current since)
+        self._since: Optional[str] = None  # only notifications updated after this (ISO 8601)
+        self._seen_ids: Dict[str, None] = {}  # "thread_id:updated_at", insertion-ordered
         self._catchup_done: bool = False
 
     # ------------------------------------------------------------------
@@ -98,7 +106,10 @@ class GitHubClient(BasePlatformClient):
         try:
             # Parse "owner/repo#number"
             repo_part, number = recipient.rsplit("#", 1)
-            return await self.create_comment(repo_part.strip(), int(number), text)
+            result = await self.create_comment(repo_part.strip(), int(number), text)
+            if self._poller:
+                self._poller.reset()  # A reply is likely soon
+            return result
         except (ValueError, IndexError):
             return {"error": f"Invalid recipient format. Use 'owner/repo#number', got: {recipient}"}
 
@@ -156,11 +167,27 @@ class GitHubClient(BasePlatformClient):
             save_credential(CREDENTIAL_FILE, cred)
             self._cred = cred
 
-        # Catchup: mark current time so we skip old notifications
-        self._last_modified = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")
+        # Resume from the saved cursor; without one, skip old notifications
+        self._cursor_resource = f"notifications:{username}"
+        cursor = load_cursor(self.PLATFORM_ID, self._cursor_resource, max_age=CURSOR_MAX_AGE)
+        if cursor.get("since"):
+            self._since = cursor["since"]
+            self._last_modified = cursor.get("last_modified")
+            self._etag = cursor.get("etag")
+            self._seen_ids = dict.fromkeys(cursor.get("seen", []))
+            logger.info(f"[GITHUB] Resuming from notifications updated after {self._since}")
+        else:
+            now = datetime.now(timezone.utc)
+            self._since = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+            self._last_modified = now.strftime("%a, %d %b %Y %H:%M:%S GMT")
+            self._etag = None
         self._catchup_done = True
         self._listening = True
-        self._poll_task = asyncio.create_task(self._poll_loop())
+        self._poller = AdaptivePoller(
+            "GITHUB", self._check_notifications,
+            min_interval=POLL_INTERVAL, max_interval=MAX_POLL_INTERVAL, error_delay=RETRY_DELAY,
+        )
+        self._poller.start()
 
         tag_info = cred.watch_tag or "(disabled — all events)"
         repos_info = ", ".join(cred.watch_repos) if cred.watch_repos else "(all repos)"
@@ -170,74 +197,100 @@ class GitHubClient(BasePlatformClient):
         if not self._listening:
             return
         self._listening = False
-        if self._poll_task and not self._poll_task.done():
-            self._poll_task.cancel()
-            try:
-                await self._poll_task
-            except asyncio.CancelledError:
-                pass
-        self._poll_task = None
+        if self._poller:
+            await self._poller.stop()
+        self._poller = None
         logger.info("[GITHUB] Poller stopped")
 
-    async def _poll_loop(self) -> None:
-        while self._listening:
-            try:
-                await self._check_notifications()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"[GITHUB] Poll error: {e}")
-                await asyncio.sleep(RETRY_DELAY)
-                continue
-            await asyncio.sleep(POLL_INTERVAL)
-
-    async def _check_notifications(self) -> None:
-        headers = self._headers()
-        if self._last_modified:
-            headers["If-Modified-Since"] = self._last_modified
-
+    async def _check_notifications(self) -> PollResult:
         cred = self._load()
-
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{GITHUB_API}/notifications",
-                headers=headers,
-                params={"all": "false", "participating": "true"},
-                timeout=30,
-            )
+        client = self.async_http
+        since = self._since
+        params = {"all": "false", "participating": "true", "per_page": str(NOTIFICATIONS_PER_PAGE)}
+        if since:
+            params["since"] = since
+
+        notifications: List[Dict[str, Any]] = []
+        url: Optional[str] = f"{GITHUB_API}/notifications"
+        retry_after = None
+        min_interval = None
+        for page in range(MAX_PAGES):
+            headers = self._headers()
+            if page == 0:
+                # Conditional request: 304s don't count against the rate limit
+                if self._etag:
+                    headers["If-None-Match"] = self._etag
+                if self._last_modified:
+                    headers["If-Modified-Since"] = self._last_modified
+            resp = await client.get(url, headers=headers, params=params if page == 0 else None, timeout=30)
+
+            poll_interval = resp.headers.get("X-Poll-Interval")
+            if poll_interval and poll_interval.isdigit():
+                min_interval = float(poll_interval)
 
             if resp.status_code == 304:
-                return  # No new notifications
+                return PollResult(min_interval=min_interval, retry_after=rate_limit_delay(resp.headers))
             if resp.status_code == 401:
                 logger.warning("[GITHUB] Authentication expired (401)")
-                return
+                return PollResult(retry_after=MAX_POLL_INTERVAL)
+            if resp.status_code in (403, 429):
+                delay = rate_limit_delay(resp.headers)
+                logger.warning(f"[GITHUB] Rate limited ({resp.status_code}), next poll in {delay or RETRY_DELAY:.0f}s")
+                return PollResult(retry_after=delay or RETRY_DELAY)
             if resp.status_code != 200:
                 logger.warning(f"[GITHUB] Notifications API error: {resp.status_code}")
-                return
+                return PollResult()
+
+            if page == 0:
+                # Update validators for next poll
+                self._etag = resp.headers.get("ETag") or None
+                self._last_modified = resp.headers.get("Last-Modified") or self._last_modified
+                retry_after = rate_limit_delay(resp.headers)
 
-            # Update Last-Modified for next poll
-            lm = resp.headers.get("Last-Modified")
-            if lm:
-                self._last_modified = lm
+            notifications.extend(resp.json())
+            url = resp.links.get("next", {}).get("url")
+            if not url:
+                break
+        else:
+            # Pages are newest first, so the rest is older than the new since cursor
+            logger.warning(f"[GITHUB] Over {MAX_PAGES * NOTIFICATIONS_PER_PAGE} notifications since last poll, skipping older ones")
+
+        # Newest first from the API; dispatch oldest first
+        notifications.sort(key=lambda n: n.get("updated_at", ""))
+        activity = 0
+        for notif in notifications:
+            seen_key = f"{notif.get('id', '')}:{notif.get('updated_at', '')}"
+            if seen_key in self._seen_ids:
+                continue
+            self._seen_ids[seen_key] = None
+            activity += 1
 
-            notifications = resp.json()
+            # Filter by watched repos
+            repo_full = notif.get("repository", {}).get("full_name", "")
+            if cred.watch_repos and repo_full not in cred.watch_repos:
+                continue
 
-            for notif in notifications:
-                notif_id = notif.get("id", "")
-                if notif_id in self._seen_ids:
-                    continue
-                self._seen_ids.add(notif_id)
+            await self._dispatch_notification(client, notif)
 
-                # Filter by watched repos
-                repo_full = notif.get("repository", {}).get("full_name", "")
-                if cred.watch_repos and repo_full not in cred.watch_repos:
-                    continue
+        if notifications:
+            newest = notifications[-1].get("updated_at") or since
+            if newest and (not since or newest > since):
+                self._since = newest
+                # Validators belong to the previous since; the next poll is unconditional
+                self._etag = None
+                self._last_modified = None
 
-                await self._dispatch_notification(client, notif)
+        # Cap seen set
+        if len(self._seen_ids) > 500:
+            self._seen_ids = dict.fromkeys(list(self._seen_ids)[-SEEN_IDS_KEPT:])
 
-            # Cap seen set
-            if len(self._seen_ids) > 500:
-                self._seen_ids = set(list(self._seen_ids)[-200:])
+        save_cursor(self.PLATFORM_ID, self._cursor_resource, {
+            "since": self._since,
+            "last_modified": self._last_modified,
+            "etag": self._etag,
+            "seen": list(self._seen_ids)[-SEEN_IDS_KEPT:],
+        })
+        return PollResult(activity=activity, retry_after=retry_after, min_interval=min_interval)
 
     async def _dispatch_notification(self, client: httpx.AsyncClient, notif: Dict[str, Any]) -> None:
         if not self._message_callback:
@@ -334,81 +387,81 @@ class GitHubClient(BasePlatformClient):
     async def get_authenticated_user(self) -> Dict[str, Any]:
         """Get the authenticated user's info."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(f"{GITHUB_API}/user", headers=self._headers(), timeout=15)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return {"ok": True, "result": {"login": data.get("login"), "name": data.get("name"), "id": data.get("id")}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(f"{GITHUB_API}/user", headers=self._headers(), timeout=15)
+            if resp.status_code == 200:
+                data = resp.json()
+                return {"ok": True, "result": {"login": data.get("login"), "name": data.get("name"), "id": data.get("id")}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
     async def list_repos(self, per_page: int = 30, sort: str = "updated") -> Dict[str, Any]:
         """List repositories for the authenticated user."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{GITHUB_API}/user/repos",
-                    headers=self._headers(),
-                    params={"per_page": per_page, "sort": sort},
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    repos = [{"full_name": r.get("full_name"), "name": r.get("name"), "private": r.get("private"), "description": r.get("description", "")} for r in resp.json()]
-                    return {"ok": True, "result": {"repos": repos}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(
+                f"{GITHUB_API}/user/repos",
+                headers=self._headers(),
+                params={"per_page": per_page, "sort": sort},
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                repos = [{"full_name": r.get("full_name"), "name": r.get("name"), "private": r.get("private"), "description": r.get("description", "")} for r in resp.json()]
+                return {"ok": True, "result": {"repos": repos}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
     async def get_repo(self, owner_repo: str) -> Dict[str, Any]:
         """Get repository info."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(f"{GITHUB_API}/repos/{owner_repo}", headers=self._headers(), timeout=15)
-                if resp.status_code == 200:
-                    return {"ok": True, "result": resp.json()}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(f"{GITHUB_API}/repos/{owner_repo}", headers=self._headers(), timeout=15)
+            if resp.status_code == 200:
+                return {"ok": True, "result": resp.json()}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
     async def list_issues(self, owner_repo: str, state: str = "open", per_page: int = 30) -> Dict[str, Any]:
         """List issues for a repository."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{GITHUB_API}/repos/{owner_repo}/issues",
-                    headers=self._headers(),
-                    params={"state": state, "per_page": per_page},
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    issues = [
-                        {
-                            "number": i.get("number"),
-                            "title": i.get("title"),
-                            "state": i.get("state"),
-                            "user": i.get("user", {}).get("login", ""),
-                            "labels": [l.get("name") for l in i.get("labels", [])],
-                            "assignees": [a.get("login") for a in i.get("assignees", [])],
-                            "created_at": i.get("created_at"),
-                            "updated_at": i.get("updated_at"),
-                            "is_pr": "pull_request" in i,
-                        }
-                        for i in resp.json()
-                    ]
-                    return {"ok": True, "result": {"issues": issues}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(
+                f"{GITHUB_API}/repos/{owner_repo}/issues",
+                headers=self._headers(),
+                params={"state": state, "per_page": per_page},
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                issues = [
+                    {
+                        "number": i.get("number"),
+                        "title": i.get("title"),
+                        "state": i.get("state"),
+                        "user": i.get("user", {}).get("login", ""),
+                        "labels": [l.get("name") for l in i.get("labels", [])],
+                        "assignees": [a.get("login") for a in i.get("assignees", [])],
+                        "created_at": i.get("created_at"),
+                        "updated_at": i.get("updated_at"),
+                        "is_pr": "pull_request" in i,
+                    }
+                    for i in resp.json()
+                ]
+                return {"ok": True, "result": {"issues": issues}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
     async def get_issue(self, owner_repo: str, number: int) -> Dict[str, Any]:
         """Get a specific issue or PR."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(f"{GITHUB_API}/repos/{owner_repo}/issues/{number}", headers=self._headers(), timeout=15)
-                if resp.status_code == 200:
-                    return {"ok": True, "result": resp.json()}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(f"{GITHUB_API}/repos/{owner_repo}/issues/{number}", headers=self._headers(), timeout=15)
+            if resp.status_code == 200:
+                return {"ok": True, "result": resp.json()}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -422,117 +475,117 @@ class GitHubClient(BasePlatformClient):
         if assignees:
             payload["assignees"] = assignees
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(f"{GITHUB_API}/repos/{owner_repo}/issues", headers=self._headers(), json=payload, timeout=15)
-                if resp.status_code in (200, 201):
-                    data = resp.json()
-                    return {"ok": True, "result": {"number": data.get("number"), "html_url": data.get("html_url"), "title": data.get("title")}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.post(f"{GITHUB_API}/repos/{owner_repo}/issues", headers=self._headers(), json=payload, timeout=15)
+            if resp.status_code in (200, 201):
+                data = resp.json()
+                return {"ok": True, "result": {"number": data.get("number"), "html_url": data.get("html_url"), "title": data.get("title")}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
     async def create_comment(self, owner_repo: str, number: int, body: str) -> Dict[str, Any]:
         """Create a comment on an issue or PR."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    f"{GITHUB_API}/repos/{owner_repo}/issues/{number}/comments",
-                    headers=self._headers(),
-                    json={"body": body},
-                    timeout=15,
-                )
-                if resp.status_code in (200, 201):
-                    data = resp.json()
-                    return {"ok": True, "result": {"id": data.get("id"), "html_url": data.get("html_url")}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.post(
+                f"{GITHUB_API}/repos/{owner_repo}/issues/{number}/comments",
+                headers=self._headers(),
+                json={"body": body},
+                timeout=15,
+            )
+            if resp.status_code in (200, 201):
+                data = resp.json()
+                return {"ok": True, "result": {"id": data.get("id"), "html_url": data.get("html_url")}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
     async def list_pull_requests(self, owner_repo: str, state: str = "open", per_page: int = 30) -> Dict[str, Any]:
         """List pull requests for a repository."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{GITHUB_API}/repos/{owner_repo}/pulls",
-                    headers=self._headers(),
-                    params={"state": state, "per_page": per_page},
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    prs = [
-                        {
-                            "number": p.get("number"),
-                            "title": p.get("title"),
-                            "state": p.get("state"),
-                            "user": p.get("user", {}).get("login", ""),
-                            "head": p.get("head", {}).get("ref", ""),
-                            "base": p.get("base", {}).get("ref", ""),
-                            "draft": p.get("draft", False),
-                            "created_at": p.get("created_at"),
-                        }
-                        for p in resp.json()
-                    ]
-                    return {"ok": True, "result": {"pull_requests": prs}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(
+                f"{GITHUB_API}/repos/{owner_repo}/pulls",
+                headers=self._headers(),
+                params={"state": state, "per_page": per_page},
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                prs = [
+                    {
+                        "number": p.get("number"),
+                        "title": p.get("title"),
+                        "state": p.get("state"),
+                        "user": p.get("user", {}).get("login", ""),
+                        "head": p.get("head", {}).get("ref", ""),
+                        "base": p.get("base", {}).get("ref", ""),
+                        "draft": p.get("draft", False),
+                        "created_at": p.get("created_at"),
+                    }
+                    for p in resp.json()
+                ]
+                return {"ok": True, "result": {"pull_requests": prs}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
     async def search_issues(self, query: str, per_page: int = 20) -> Dict[str, Any]:
         """Search issues and PRs."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{GITHUB_API}/search/issues",
-                    headers=self._headers(),
-                    params={"q": query, "per_page": per_page},
-                    timeout=30,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    items = [
-                        {
-                            "number": i.get("number"),
-                            "title": i.get("title"),
-                            "state": i.get("state"),
-                            "repo": i.get("repository_url", "").split("/repos/")[-1] if i.get("repository_url") else "",
-                            "user": i.get("user", {}).get("login", ""),
-                            "html_url": i.get("html_url"),
-                        }
-                        for i in data.get("items", [])
-                    ]
-                    return {"ok": True, "result": {"total_count": data.get("total_count", 0), "items": items}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(
+                f"{GITHUB_API}/search/issues",
+                headers=self._headers(),
+                params={"q": query, "per_page": per_page},
+                timeout=30,
+            )
+            if resp.status_code == 200:
+                data = resp.json()
+                items = [
+                    {
+                        "number": i.get("number"),
+                        "title": i.get("title"),
+                        "state": i.get("state"),
+                        "repo": i.get("repository_url", "").split("/repos/")[-1] if i.get("repository_url") else "",
+                        "user": i.get("user", {}).get("login", ""),
+                        "html_url": i.get("html_url"),
+                    }
+                    for i in data.get("items", [])
+                ]
+                return {"ok": True, "result": {"total_count": data.get("total_count", 0), "items": items}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
     async def add_labels(self, owner_repo: str, number: int, labels: List[str]) -> Dict[str, Any]:
         """Add labels to an issue/PR."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    f"{GITHUB_API}/repos/{owner_repo}/issues/{number}/labels",
-                    headers=self._headers(),
-                    json={"labels": labels},
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    return {"ok": True, "result": {"labels_added": labels}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.post(
+                f"{GITHUB_API}/repos/{owner_repo}/issues/{number}/labels",
+                headers=self._headers(),
+                json={"labels": labels},
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                return {"ok": True, "result": {"labels_added": labels}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
     async def close_issue(self, owner_repo: str, number: int) -> Dict[str, Any]:
         """Close an issue."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.patch(
-                    f"{GITHUB_API}/repos/{owner_repo}/issues/{number}",
-                    headers=self._headers(),
-                    json={"state": "closed"},
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    return {"ok": True, "result": {"closed": True, "number": number}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.patch(
+                f"{GITHUB_API}/repos/{owner_repo}/issues/{number}",
+                headers=self._headers(),
+                json={"state": "closed"},
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                return {"ok": True, "result": {"closed": True, "number": number}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
@@ -21,6 +21,7 @@ import httpx
 
 from app.external_comms.base import BasePlatformClient, PlatformMessage, MessageCallback
 from app.external_comms.credentials import has_credential, load_credential, save_credential, remove_credential
+from app.external_comms.polling import AdaptivePoller, PollResult, load_cursor, rate_limit_delay, save_cursor
 from app.external_comms.registry import register_client
 
 try:
@@ -35,8 +36,11 @@ DRIVE_API_BASE = "https://www.googleapis.com/drive/v3"
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 CREDENTIAL_FILE = "google.json"
 
-POLL_INTERVAL = 5       # seconds between Gmail polls
+POLL_INTERVAL = 5       # seconds between Gmail polls while active
+MAX_POLL_INTERVAL = 60  # seconds between Gmail polls once idle
 RETRY_DELAY = 10        # seconds to wait after a poll error
+CURSOR_MAX_AGE = 86400  # resume from a saved historyId at most this old after a restart
+MAX_HISTORY_PAGES = 5   # history.list pages fetched per poll
 
 
 @dataclass
@@ -56,7 +60,8 @@ class GoogleWorkspaceClient(BasePlatformClient):
     def __init__(self):
         super().__init__()
         self._cred: Optional[GoogleCredential] = None
-        self._poll_task: Optional[asyncio.Task] = None
+        self._poller: Optional[AdaptivePoller] = None
+        self._cursor_resource: str = ""
         self._history_id: Optional[str] = None
         self._seen_message_ids: set = set()
 
@@ -88,7 +93,7 @@ class GoogleWorkspaceClient(BasePlatformClient):
         if not all([cred.client_id, cred.client_secret, cred.refresh_token]):
             return None
         try:
-            r = httpx.post(
+            r = self.http.post(
                 GOOGLE_TOKEN_URL,
                 data={
                     "client_id": cred.client_id,
@@ -130,7 +135,7 @@ class GoogleWorkspaceClient(BasePlatformClient):
     async def send_message(self, recipient: str, text: str, **kwargs) -> Dict[str, Any]:
         """Send an email (maps the generic interface to send_email)."""
         subject = kwargs.get("subject", "")
-        result = self.send_email(to=recipient, subject=subject, body=text)
+        result = await asyncio.to_thread(self.send_email, to=recipient, subject=subject, body=text)
         return result
 
     # ------------------------------------------------------------------
@@ -148,122 +153,132 @@ class GoogleWorkspaceClient(BasePlatformClient):
         self._message_callback = callback
         self._load()
 
-        # Verify token works and get current historyId for catchup
+        # Verify token works; resume from the saved historyId, else catch up to the current one
         try:
             profile = await self._async_get_profile()
-            self._history_id = profile.get("historyId")
-            logger.info(f"[GOOGLE] Gmail profile: {profile.get('emailAddress')}, historyId: {self._history_id}")
         except Exception as e:
             raise RuntimeError(f"Failed to connect to Gmail: {e}")
+        self._cursor_resource = f"history:{profile.get('emailAddress', '')}"
+        cursor = load_cursor(self.PLATFORM_ID, self._cursor_resource, max_age=CURSOR_MAX_AGE)
+        self._history_id = cursor.get("history_id") or profile.get("historyId")
+        logger.info(
+            f"[GOOGLE] Gmail profile: {profile.get('emailAddress')}, historyId: {self._history_id}"
+            + (" (resumed)" if cursor.get("history_id") else "")
+        )
 
         self._listening = True
-        self._poll_task = asyncio.create_task(self._poll_loop())
+        self._poller = AdaptivePoller(
+            "GOOGLE", self._check_history,
+            min_interval=POLL_INTERVAL, max_interval=MAX_POLL_INTERVAL, error_delay=RETRY_DELAY,
+        )
+        self._poller.start()
         logger.info("[GOOGLE] Gmail poller started")
 
     async def stop_listening(self) -> None:
         if not self._listening:
             return
         self._listening = False
-        if self._poll_task and not self._poll_task.done():
-            self._poll_task.cancel()
-            try:
-                await self._poll_task
-            except asyncio.CancelledError:
-                pass
-        self._poll_task = None
+        if self._poller:
+            await self._poller.stop()
+        self._poller = None
         logger.info("[GOOGLE] Gmail poller stopped")
 
     async def _async_get_profile(self) -> Dict[str, Any]:
         """Get Gmail profile (async)."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{GMAIL_API_BASE}/users/me/profile",
-                headers=self._auth_header(),
-                timeout=15,
-            )
-            if resp.status_code != 200:
-                raise RuntimeError(f"Gmail profile API error: {resp.status_code}")
-            return resp.json()
-
-    async def _poll_loop(self) -> None:
-        """Poll Gmail for new messages using the History API."""
-        logger.info("[GOOGLE] Catchup complete — watching for new emails")
+        client = self.async_http
+        resp = await client.get(
+            f"{GMAIL_API_BASE}/users/me/profile",
+            headers=self._auth_header(),
+            timeout=15,
+        )
+        if resp.status_code != 200:
+            raise RuntimeError(f"Gmail profile API error: {resp.status_code}")
+        return resp.json()
 
-        while self._listening:
-            try:
-                await self._check_history()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"[GOOGLE] Poll error: {e}")
-                # If historyId is stale, reset it
-                if "404" in str(e) or "historyId" in str(e).lower():
-                    try:
-                        profile = await self._async_get_profile()
-                        self._history_id = profile.get("historyId")
-                        logger.info(f"[GOOGLE] Reset historyId to {self._history_id}")
-                    except Exception:
-                        pass
-                await asyncio.sleep(RETRY_DELAY)
-                continue
-            await asyncio.sleep(POLL_INTERVAL)
-
-    async def _check_history(self) -> None:
+    async def _check_history(self) -> PollResult:
         """Check Gmail history for new messages since last historyId."""
         if not self._history_id:
-            return
+            return PollResult()
 
-        async with httpx.AsyncClient() as client:
+        client = self.async_http
+        history_records = []
+        new_history_id = None
+        more = False
+        params = {
+            "startHistoryId": self._history_id,
+            "historyTypes": "messageAdded",
+            "labelId": "INBOX",
+        }
+        for _ in range(MAX_HISTORY_PAGES):
             resp = await client.get(
                 f"{GMAIL_API_BASE}/users/me/history",
                 headers=self._auth_header(),
-                params={
-                    "startHistoryId": self._history_id,
-                    "historyTypes": "messageAdded",
-                    "labelId": "INBOX",
-                },
+                params=params,
                 timeout=15,
             )
 
             if resp.status_code == 404:
                 # historyId too old — reset
-                raise RuntimeError("historyId expired (404)")
-
+                profile = await self._async_get_profile()
+                self._history_id = profile.get("historyId")
+                logger.info(f"[GOOGLE] historyId expired, reset to {self._history_id}")
+                self._save_cursor()
+                return PollResult()
+            if resp.status_code == 429:
+                delay = rate_limit_delay(resp.headers) or RETRY_DELAY
+                logger.warning(f"[GOOGLE] Rate limited (429), next poll in {delay:.0f}s")
+                return PollResult(retry_after=delay)
             if resp.status_code != 200:
                 logger.warning(f"[GOOGLE] history.list error: {resp.status_code}")
-                return
+                return PollResult()
 
             data = resp.json()
-            new_history_id = data.get("historyId")
-            if new_history_id:
-                self._history_id = new_history_id
-
-            history_records = data.get("history", [])
-            if not history_records:
-                return
-
-            # Collect unique new message IDs
-            new_msg_ids = []
-            for record in history_records:
-                for added in record.get("messagesAdded", []):
-                    msg = added.get("message", {})
-                    msg_id = msg.get("id", "")
-                    labels = msg.get("labelIds", [])
-                    # Only process INBOX messages we haven't seen
-                    if msg_id and "INBOX" in labels and msg_id not in self._seen_message_ids:
-                        new_msg_ids.append(msg_id)
-                        self._seen_message_ids.add(msg_id)
-
-            # Cap seen set size
-            if len(self._seen_message_ids) > 500:
-                self._seen_message_ids = set(list(self._seen_message_ids)[-200:])
-
-            # Fetch and dispatch each new message
-            for msg_id in new_msg_ids:
-                try:
-                    await self._fetch_and_dispatch(client, msg_id)
-                except Exception as e:
-                    logger.debug(f"[GOOGLE] Error processing message {msg_id}: {e}")
+            history_records.extend(data.get("history", []))
+            new_history_id = data.get("historyId") or new_history_id
+            page_token = data.get("nextPageToken")
+            if not page_token:
+                break
+            params = {**params, "pageToken": page_token}
+        else:
+            # Resume after the last record fetched rather than the mailbox's current historyId
+            more = True
+            new_history_id = history_records[-1].get("id") if history_records else new_history_id
+
+        if new_history_id:
+            self._history_id = new_history_id
+            self._save_cursor()
+
+        if not history_records:
+            return PollResult()
+
+        # Collect unique new message IDs
+        new_msg_ids = []
+        for record in history_records:
+            for added in record.get("messagesAdded", []):
+                msg = added.get("message", {})
+                msg_id = msg.get("id", "")
+                labels = msg.get("labelIds", [])
+                # Only process INBOX messages we haven't seen
+                if msg_id and "INBOX" in labels and msg_id not in self._seen_message_ids:
+                    new_msg_ids.append(msg_id)
+                    self._seen_message_ids.add(msg_id)
+
+        # Cap seen set size
+        if len(self._seen_message_ids) > 500:
+            self._seen_message_ids = set(list(self._seen_message_ids)[-200:])
+
+        # Fetch and dispatch each new message
+        for msg_id in new_msg_ids:
+            try:
+                await self._fetch_and_dispatch(client, msg_id)
+            except Exception as e:
+                logger.debug(f"[GOOGLE] Error processing message {msg_id}: {e}")
+
+        return PollResult(activity=len(new_msg_ids), more=more)
+
+    def _save_cursor(self) -> None:
+        if self._cursor_resource and self._history_id:
+            save_cursor(self.PLATFORM_ID, self._cursor_resource, {"history_id": str(self._history_id)})
 
     async def _fetch_and_dispatch(self, client: httpx.AsyncClient, msg_id: str) -> None:
         """Fetch a single Gmail message and dispatch to callback."""
@@ -378,7 +393,7 @@ class GoogleWorkspaceClient(BasePlatformClient):
         sender = from_email or cred.email
         raw = self._encode_email(to, sender, subject, body, attachments)
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{GMAIL_API_BASE}/users/me/messages/send",
                 headers=self._headers(),
                 json={"raw": raw},
@@ -399,7 +414,7 @@ class GoogleWorkspaceClient(BasePlatformClient):
         if unread_only:
             params["q"] = "is:unread"
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{GMAIL_API_BASE}/users/me/messages",
                 headers=self._auth_header(),
                 params=params,
@@ -420,7 +435,7 @@ class GoogleWorkspaceClient(BasePlatformClient):
             "metadataHeaders": ["From", "To", "Subject", "Date"],
         }
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{GMAIL_API_BASE}/users/me/messages/{message_id}",
                 headers=self._auth_header(),
                 params=params,
@@ -481,7 +496,7 @@ class GoogleWorkspaceClient(BasePlatformClient):
     ) -> Dict[str, Any]:
         """Create a calendar event (with optional Google Meet conference)."""
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{CALENDAR_API_BASE}/calendars/{calendar_id}/events",
                 headers=self._headers(),
                 params={"conferenceDataVersion": 1},
@@ -511,7 +526,7 @@ class GoogleWorkspaceClient(BasePlatformClient):
             "items": [{"id": calendar_id}],
         }
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{CALENDAR_API_BASE}/freeBusy",
                 headers=self._headers(),
                 json=payload,
@@ -542,7 +557,7 @@ class GoogleWorkspaceClient(BasePlatformClient):
             "fields": fields or "files(id,name,mimeType,parents)",
         }
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DRIVE_API_BASE}/files",
                 headers=self._auth_header(),
                 params=params,
@@ -567,7 +582,7 @@ class GoogleWorkspaceClient(BasePlatformClient):
         if parent_folder_id:
             payload["parents"] = [parent_folder_id]
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{DRIVE_API_BASE}/files",
                 headers=self._headers(),
                 json=payload,
@@ -587,7 +602,7 @@ class GoogleWorkspaceClient(BasePlatformClient):
         """Get metadata for a single Drive file."""
         params = {"fields": fields or "id,parents"}
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DRIVE_API_BASE}/files/{file_id}",
                 headers=self._auth_header(),
                 params=params,
@@ -613,7 +628,7 @@ class GoogleWorkspaceClient(BasePlatformClient):
         if remove_parents:
             params["removeParents"] = remove_parents
         try:
-            r = httpx.patch(
+            r = self.http.patch(
                 f"{DRIVE_API_BASE}/files/{file_id}",
                 headers=self._auth_header(),
                 params=params,
@@ -643,7 +658,7 @@ class GoogleWorkspaceClient(BasePlatformClient):
             "fields": "files(id,name)",
         }
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{DRIVE_API_BASE}/files",
                 headers=self._auth_header(),
                 params=params,
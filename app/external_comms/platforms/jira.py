@@ -12,17 +12,16 @@ users restrict events to issues carrying specific labels.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
-
-import httpx
+from zoneinfo import ZoneInfo
 
 from app.external_comms.base import BasePlatformClient, PlatformMessage, MessageCallback
 from app.external_comms.credentials import has_credential, load_credential, save_credential, remove_credential
+from app.external_comms.polling import AdaptivePoller, PollResult, load_cursor, rate_limit_delay, save_cursor
 from app.external_comms.registry import register_client
 
 try:
@@ -34,8 +33,12 @@ except Exception:
 JIRA_CLOUD_API = "https://api.atlassian.com/ex/jira"
 CREDENTIAL_FILE = "jira.json"
 
-POLL_INTERVAL = 10      # seconds between polls
+POLL_INTERVAL = 10      # seconds between polls while active
+MAX_POLL_INTERVAL = 120 # seconds between polls once idle
 RETRY_DELAY = 15        # seconds to wait after a poll error
+CURSOR_MAX_AGE = 86400  # resume from a saved cursor at most this old after a restart
+SEARCH_PAGE_SIZE = 50
+SEEN_KEYS_KEPT = 200
 
 
 @dataclass
@@ -64,9 +67,11 @@ class JiraClient(BasePlatformClient):
     def __init__(self) -> None:
         super().__init__()
         self._cred: Optional[JiraCredential] = None
-        self._poll_task: Optional[asyncio.Task] = None
-        self._last_poll_time: Optional[str] = None  # ISO 8601
-        self._seen_issue_keys: set = set()
+        self._poller: Optional[AdaptivePoller] = None
+        self._cursor_resource: str = ""
+        self._updated_cursor: Optional[datetime] = None  # newest issue "updated" seen
+        self._jql_tz: Union[timezone, ZoneInfo] = timezone.utc  # JQL dates are in the user's time zone
+        self._seen_issue_keys: Dict[str, None] = {}  # insertion-ordered
         self._catchup_done: bool = False
 
     # ------------------------------------------------------------------
@@ -130,7 +135,10 @@ class JiraClient(BasePlatformClient):
             recipient: Issue key (e.g. "PROJ-123").
             text: Comment body text.
         """
-        return await self.add_comment(recipient, text)
+        result = await self.add_comment(recipient, text)
+        if self._poller:
+            self._poller.reset()  # A reply is likely soon
+        return result
 
     # ------------------------------------------------------------------
     # Watch-label configuration
@@ -211,14 +219,30 @@ class JiraClient(BasePlatformClient):
         if "error" in me:
             raise RuntimeError(f"Invalid Jira credentials: {me.get('error')}")
 
-        display = me.get("result", {}).get("displayName", "unknown")
+        result = me.get("result", {})
+        display = result.get("displayName", "unknown")
         logger.info(f"[JIRA] Authenticated as: {display}")
-
-        # Catchup: set last poll time to now
-        self._last_poll_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")
+        try:
+            self._jql_tz = ZoneInfo(result.get("timeZone") or "UTC")
+        except Exception:
+            self._jql_tz = timezone.utc
+
+        # Resume from the saved cursor; without one, start from now
+        self._cursor_resource = f"search:{result.get('accountId', '')}"
+        cursor = load_cursor(self.PLATFORM_ID, self._cursor_resource, max_age=CURSOR_MAX_AGE)
+        self._updated_cursor = _parse_jira_time(cursor.get("updated", ""))
+        if self._updated_cursor:
+            self._seen_issue_keys = dict.fromkeys(cursor.get("seen", []))
+            logger.info(f"[JIRA] Resuming from issues updated since {self._updated_cursor.isoformat()}")
+        else:
+            self._updated_cursor = datetime.now(timezone.utc)
         self._catchup_done = True
         self._listening = True
-        self._poll_task = asyncio.create_task(self._poll_loop())
+        self._poller = AdaptivePoller(
+            "JIRA", self._check_updates,
+            min_interval=POLL_INTERVAL, max_interval=MAX_POLL_INTERVAL, error_delay=RETRY_DELAY,
+        )
+        self._poller.start()
 
         cred = self._load()
         labels_info = ", ".join(cred.watch_labels) if cred.watch_labels else "(all)"
@@ -229,81 +253,82 @@ class JiraClient(BasePlatformClient):
         if not self._listening:
             return
         self._listening = False
-        if self._poll_task and not self._poll_task.done():
-            self._poll_task.cancel()
-            try:
-                await self._poll_task
-            except asyncio.CancelledError:
-                pass
-        self._poll_task = None
+        if self._poller:
+            await self._poller.stop()
+        self._poller = None
         logger.info("[JIRA] Poller stopped")
 
-    async def _poll_loop(self) -> None:
-        while self._listening:
-            try:
-                await self._check_updates()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"[JIRA] Poll error: {e}")
-                await asyncio.sleep(RETRY_DELAY)
-                continue
-            await asyncio.sleep(POLL_INTERVAL)
-
-    async def _check_updates(self) -> None:
-        if not self._last_poll_time:
-            return
+    async def _check_updates(self) -> PollResult:
+        if not self._updated_cursor:
+            return PollResult()
 
         cred = self._load()
 
-        # Build JQL
-        jql_parts = [f'updated >= "{self._last_poll_time}"']
+        # Build JQL (minute precision, so issues at the cursor minute come back and are deduped)
+        since = self._updated_cursor.astimezone(self._jql_tz).strftime("%Y-%m-%d %H:%M")
+        jql_parts = [f'updated >= "{since}"']
         if cred.watch_labels:
             label_clauses = " OR ".join(f'labels = "{lbl}"' for lbl in cred.watch_labels)
             jql_parts.append(f"({label_clauses})")
         jql = " AND ".join(jql_parts)
         jql += " ORDER BY updated ASC"
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{self._base_url()}/search/jql",
-                headers=self._headers(),
-                json={
-                    "jql": jql,
-                    "maxResults": 50,
-                    "fields": ["summary", "status", "assignee", "reporter", "labels", "updated", "comment", "issuetype", "priority", "project"],
-                },
-                timeout=30,
-            )
-
-            if resp.status_code == 401:
-                logger.warning("[JIRA] Authentication expired (401)")
-                return
-            if resp.status_code != 200:
-                logger.warning(f"[JIRA] Search API error: {resp.status_code} — {resp.text[:300]}")
-                return
-
-            data = resp.json()
-            issues = data.get("issues", [])
-
-            for issue in issues:
-                issue_key = issue.get("key", "")
-                updated = issue.get("fields", {}).get("updated", "")
+        client = self.async_http
+        resp = await client.post(
+            f"{self._base_url()}/search/jql",
+            headers=self._headers(),
+            json={
+                "jql": jql,
+                "maxResults": SEARCH_PAGE_SIZE,
+                "fields": ["summary", "status", "assignee", "reporter", "labels", "updated", "comment", "issuetype", "priority", "project"],
+            },
+            timeout=30,
+        )
 
-                # Build a dedup key from issue key + updated timestamp
-                dedup_key = f"{issue_key}:{updated}"
-                if dedup_key in self._seen_issue_keys:
-                    continue
-                self._seen_issue_keys.add(dedup_key)
+        if resp.status_code == 401:
+            logger.warning("[JIRA] Authentication expired (401)")
+            return PollResult(retry_after=MAX_POLL_INTERVAL)
+        if resp.status_code == 429:
+            delay = rate_limit_delay(resp.headers) or RETRY_DELAY
+            logger.warning(f"[JIRA] Rate limited (429), next poll in {delay:.0f}s")
+            return PollResult(retry_after=delay)
+        if resp.status_code != 200:
+            logger.warning(f"[JIRA] Search API error: {resp.status_code} — {resp.text[:300]}")
+            return PollResult()
+
+        data = resp.json()
+        issues = data.get("issues", [])
+
+        activity = 0
+        for issue in issues:
+            issue_key = issue.get("key", "")
+            updated = issue.get("fields", {}).get("updated", "")
+
+            # Advance the cursor (results are oldest first)
+            updated_at = _parse_jira_time(updated)
+            if updated_at and updated_at > self._updated_cursor:
+                self._updated_cursor = updated_at
+
+            # Build a dedup key from issue key + updated timestamp
+            dedup_key = f"{issue_key}:{updated}"
+            if dedup_key in self._seen_issue_keys:
+                continue
+            self._seen_issue_keys[dedup_key] = None
+            activity += 1
 
-                await self._dispatch_issue(issue)
+            await self._dispatch_issue(issue)
 
-            # Update poll time
-            self._last_poll_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")
+        # Cap seen set
+        if len(self._seen_issue_keys) > 500:
+            self._seen_issue_keys = dict.fromkeys(list(self._seen_issue_keys)[-SEEN_KEYS_KEPT:])
 
-            # Cap seen set
-            if len(self._seen_issue_keys) > 500:
-                self._seen_issue_keys = set(list(self._seen_issue_keys)[-200:])
+        save_cursor(self.PLATFORM_ID, self._cursor_resource, {
+            "updated": self._updated_cursor.isoformat(),
+            "seen": list(self._seen_issue_keys)[-SEEN_KEYS_KEPT:],
+        })
+        # A full page with new issues means more are waiting past the cursor
+        more = activity > 0 and (data.get("nextPageToken") is not None or len(issues) >= SEARCH_PAGE_SIZE)
+        return PollResult(activity=activity, more=more)
 
     async def _dispatch_issue(self, issue: Dict[str, Any]) -> None:
         if not self._message_callback:
@@ -344,7 +369,7 @@ class JiraClient(BasePlatformClient):
                     comment_dedup = f"{issue_key}:comment:{comment_id}"
                     if comment_dedup in self._seen_issue_keys:
                         continue
-                    self._seen_issue_keys.add(comment_dedup)
+                    self._seen_issue_keys[comment_dedup] = None
                     matching_comment = comment
                     break
 
@@ -445,24 +470,25 @@ class JiraClient(BasePlatformClient):
     async def get_myself(self) -> Dict[str, Any]:
         """Get the authenticated user's info."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{self._base_url()}/myself",
-                    headers=self._headers(),
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return {
-                        "ok": True,
-                        "result": {
-                            "accountId": data.get("accountId"),
-                            "displayName": data.get("displayName"),
-                            "emailAddress": data.get("emailAddress", ""),
-                            "active": data.get("active", True),
-                        },
-                    }
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(
+                f"{self._base_url()}/myself",
+                headers=self._headers(),
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                data = resp.json()
+                return {
+                    "ok": True,
+                    "result": {
+                        "accountId": data.get("accountId"),
+                        "displayName": data.get("displayName"),
+                        "emailAddress": data.get("emailAddress", ""),
+                        "active": data.get("active", True),
+                        "timeZone": data.get("timeZone", ""),
+                    },
+                }
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -490,23 +516,23 @@ class JiraClient(BasePlatformClient):
             payload["fields"] = fields_list
 
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    f"{self._base_url()}/search/jql",
-                    headers=self._headers(),
-                    json=payload,
-                    timeout=30,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return {
-                        "ok": True,
-                        "result": {
-                            "total": data.get("total", 0),
-                            "issues": data.get("issues", []),
-                        },
-                    }
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.post(
+                f"{self._base_url()}/search/jql",
+                headers=self._headers(),
+                json=payload,
+                timeout=30,
+            )
+            if resp.status_code == 200:
+                data = resp.json()
+                return {
+                    "ok": True,
+                    "result": {
+                        "total": data.get("total", 0),
+                        "issues": data.get("issues", []),
+                    },
+                }
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -529,16 +555,16 @@ class JiraClient(BasePlatformClient):
             params["fields"] = ",".join(fields_list)
 
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{self._base_url()}/issue/{issue_key}",
-                    headers=self._headers(),
-                    params=params,
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    return {"ok": True, "result": resp.json()}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(
+                f"{self._base_url()}/issue/{issue_key}",
+                headers=self._headers(),
+                params=params,
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                return {"ok": True, "result": resp.json()}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -586,24 +612,24 @@ class JiraClient(BasePlatformClient):
             fields_payload.update(extra_fields)
 
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    f"{self._base_url()}/issue",
-                    headers=self._headers(),
-                    json={"fields": fields_payload},
-                    timeout=15,
-                )
-                if resp.status_code in (200, 201):
-                    data = resp.json()
-                    return {
-                        "ok": True,
-                        "result": {
-                            "id": data.get("id"),
-                            "key": data.get("key"),
-                            "self": data.get("self"),
-                        },
-                    }
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.post(
+                f"{self._base_url()}/issue",
+                headers=self._headers(),
+                json={"fields": fields_payload},
+                timeout=15,
+            )
+            if resp.status_code in (200, 201):
+                data = resp.json()
+                return {
+                    "ok": True,
+                    "result": {
+                        "id": data.get("id"),
+                        "key": data.get("key"),
+                        "self": data.get("self"),
+                    },
+                }
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -622,16 +648,16 @@ class JiraClient(BasePlatformClient):
             API response or error.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.put(
-                    f"{self._base_url()}/issue/{issue_key}",
-                    headers=self._headers(),
-                    json={"fields": fields_update},
-                    timeout=15,
-                )
-                if resp.status_code == 204:
-                    return {"ok": True, "result": {"updated": True, "key": issue_key}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.put(
+                f"{self._base_url()}/issue/{issue_key}",
+                headers=self._headers(),
+                json={"fields": fields_update},
+                timeout=15,
+            )
+            if resp.status_code == 204:
+                return {"ok": True, "result": {"updated": True, "key": issue_key}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -650,24 +676,24 @@ class JiraClient(BasePlatformClient):
             API response with comment details or error.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    f"{self._base_url()}/issue/{issue_key}/comment",
-                    headers=self._headers(),
-                    json={"body": _text_to_adf(body)},
-                    timeout=15,
-                )
-                if resp.status_code in (200, 201):
-                    data = resp.json()
-                    return {
-                        "ok": True,
-                        "result": {
-                            "id": data.get("id"),
-                            "created": data.get("created"),
-                            "author": (data.get("author") or {}).get("displayName", ""),
-                        },
-                    }
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.post(
+                f"{self._base_url()}/issue/{issue_key}/comment",
+                headers=self._headers(),
+                json={"body": _text_to_adf(body)},
+                timeout=15,
+            )
+            if resp.status_code in (200, 201):
+                data = resp.json()
+                return {
+                    "ok": True,
+                    "result": {
+                        "id": data.get("id"),
+                        "created": data.get("created"),
+                        "author": (data.get("author") or {}).get("displayName", ""),
+                    },
+                }
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -681,24 +707,24 @@ class JiraClient(BasePlatformClient):
             API response with list of transitions or error.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{self._base_url()}/issue/{issue_key}/transitions",
-                    headers=self._headers(),
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    transitions = [
-                        {
-                            "id": t.get("id"),
-                            "name": t.get("name"),
-                            "to": (t.get("to") or {}).get("name", ""),
-                        }
-                        for t in data.get("transitions", [])
-                    ]
-                    return {"ok": True, "result": {"transitions": transitions}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(
+                f"{self._base_url()}/issue/{issue_key}/transitions",
+                headers=self._headers(),
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                data = resp.json()
+                transitions = [
+                    {
+                        "id": t.get("id"),
+                        "name": t.get("name"),
+                        "to": (t.get("to") or {}).get("name", ""),
+                    }
+                    for t in data.get("transitions", [])
+                ]
+                return {"ok": True, "result": {"transitions": transitions}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -727,16 +753,16 @@ class JiraClient(BasePlatformClient):
             }
 
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    f"{self._base_url()}/issue/{issue_key}/transitions",
-                    headers=self._headers(),
-                    json=payload,
-                    timeout=15,
-                )
-                if resp.status_code == 204:
-                    return {"ok": True, "result": {"transitioned": True, "key": issue_key}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.post(
+                f"{self._base_url()}/issue/{issue_key}/transitions",
+                headers=self._headers(),
+                json=payload,
+                timeout=15,
+            )
+            if resp.status_code == 204:
+                return {"ok": True, "result": {"transitioned": True, "key": issue_key}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -755,16 +781,16 @@ class JiraClient(BasePlatformClient):
             API response or error.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.put(
-                    f"{self._base_url()}/issue/{issue_key}/assignee",
-                    headers=self._headers(),
-                    json={"accountId": account_id},
-                    timeout=15,
-                )
-                if resp.status_code == 204:
-                    return {"ok": True, "result": {"assigned": True, "key": issue_key}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.put(
+                f"{self._base_url()}/issue/{issue_key}/assignee",
+                headers=self._headers(),
+                json={"accountId": account_id},
+                timeout=15,
+            )
+            if resp.status_code == 204:
+                return {"ok": True, "result": {"assigned": True, "key": issue_key}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -778,26 +804,26 @@ class JiraClient(BasePlatformClient):
             API response with projects list or error.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{self._base_url()}/project/search",
-                    headers=self._headers(),
-                    params={"maxResults": max_results},
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    projects = [
-                        {
-                            "id": p.get("id"),
-                            "key": p.get("key"),
-                            "name": p.get("name"),
-                            "style": p.get("style", ""),
-                        }
-                        for p in data.get("values", [])
-                    ]
-                    return {"ok": True, "result": {"projects": projects}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(
+                f"{self._base_url()}/project/search",
+                headers=self._headers(),
+                params={"maxResults": max_results},
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                data = resp.json()
+                projects = [
+                    {
+                        "id": p.get("id"),
+                        "key": p.get("key"),
+                        "name": p.get("name"),
+                        "style": p.get("style", ""),
+                    }
+                    for p in data.get("values", [])
+                ]
+                return {"ok": True, "result": {"projects": projects}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -816,25 +842,25 @@ class JiraClient(BasePlatformClient):
             API response with matching users or error.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{self._base_url()}/user/search",
-                    headers=self._headers(),
-                    params={"query": query, "maxResults": max_results},
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    users = [
-                        {
-                            "accountId": u.get("accountId"),
-                            "displayName": u.get("displayName"),
-                            "emailAddress": u.get("emailAddress", ""),
-                            "active": u.get("active", True),
-                        }
-                        for u in resp.json()
-                    ]
-                    return {"ok": True, "result": {"users": users}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(
+                f"{self._base_url()}/user/search",
+                headers=self._headers(),
+                params={"query": query, "maxResults": max_results},
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                users = [
+                    {
+                        "accountId": u.get("accountId"),
+                        "displayName": u.get("displayName"),
+                        "emailAddress": u.get("emailAddress", ""),
+                        "active": u.get("active", True),
+                    }
+                    for u in resp.json()
+                ]
+                return {"ok": True, "result": {"users": users}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -853,27 +879,27 @@ class JiraClient(BasePlatformClient):
             API response with comments or error.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{self._base_url()}/issue/{issue_key}/comment",
-                    headers=self._headers(),
-                    params={"maxResults": max_results, "orderBy": "-created"},
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    comments = [
-                        {
-                            "id": c.get("id"),
-                            "author": (c.get("author") or {}).get("displayName", ""),
-                            "body": _extract_adf_text(c.get("body", {})),
-                            "created": c.get("created"),
-                            "updated": c.get("updated"),
-                        }
-                        for c in data.get("comments", [])
-                    ]
-                    return {"ok": True, "result": {"comments": comments, "total": data.get("total", 0)}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(
+                f"{self._base_url()}/issue/{issue_key}/comment",
+                headers=self._headers(),
+                params={"maxResults": max_results, "orderBy": "-created"},
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                data = resp.json()
+                comments = [
+                    {
+                        "id": c.get("id"),
+                        "author": (c.get("author") or {}).get("displayName", ""),
+                        "body": _extract_adf_text(c.get("body", {})),
+                        "created": c.get("created"),
+                        "updated": c.get("updated"),
+                    }
+                    for c in data.get("comments", [])
+                ]
+                return {"ok": True, "result": {"comments": comments, "total": data.get("total", 0)}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -887,15 +913,15 @@ class JiraClient(BasePlatformClient):
             API response with statuses or error.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{self._base_url()}/project/{project_key}/statuses",
-                    headers=self._headers(),
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    return {"ok": True, "result": resp.json()}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(
+                f"{self._base_url()}/project/{project_key}/statuses",
+                headers=self._headers(),
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                return {"ok": True, "result": resp.json()}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -919,16 +945,16 @@ class JiraClient(BasePlatformClient):
             },
         }
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.put(
-                    f"{self._base_url()}/issue/{issue_key}",
-                    headers=self._headers(),
-                    json=update_payload,
-                    timeout=15,
-                )
-                if resp.status_code == 204:
-                    return {"ok": True, "result": {"labels_added": labels, "key": issue_key}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.put(
+                f"{self._base_url()}/issue/{issue_key}",
+                headers=self._headers(),
+                json=update_payload,
+                timeout=15,
+            )
+            if resp.status_code == 204:
+                return {"ok": True, "result": {"labels_added": labels, "key": issue_key}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -952,16 +978,16 @@ class JiraClient(BasePlatformClient):
             },
         }
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.put(
-                    f"{self._base_url()}/issue/{issue_key}",
-                    headers=self._headers(),
-                    json=update_payload,
-                    timeout=15,
-                )
-                if resp.status_code == 204:
-                    return {"ok": True, "result": {"labels_removed": labels, "key": issue_key}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.put(
+                f"{self._base_url()}/issue/{issue_key}",
+                headers=self._headers(),
+                json=update_payload,
+                timeout=15,
+            )
+            if resp.status_code == 204:
+                return {"ok": True, "result": {"labels_removed": labels, "key": issue_key}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -970,6 +996,22 @@ class JiraClient(BasePlatformClient):
 # ADF (Atlassian Document Format) helpers
 # ------------------------------------------------------------------
 
+def _parse_jira_time(value: str) -> Optional[datetime]:
+    """Parse a Jira timestamp (e.g. "2024-01-15T10:30:00.000+0000") to an aware datetime."""
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            pass
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
 def _text_to_adf(text: str) -> Dict[str, Any]:
     """Convert plain text to Atlassian Document Format (ADF)."""
     paragraphs = text.split("\n")
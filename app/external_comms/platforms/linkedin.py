@@ -3,13 +3,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote
 
-import httpx
-
 from app.external_comms.base import BasePlatformClient
 from app.external_comms.credentials import has_credential, load_credential, save_credential, remove_credential
 from app.external_comms.registry import register_client
@@ -82,7 +81,8 @@ class LinkedInClient(BasePlatformClient):
         """Send a LinkedIn message. Wraps send_message_to_recipients for the base interface."""
         cred = self._load()
         sender_urn = f"urn:li:person:{cred.linkedin_id}" if cred.linkedin_id else ""
-        return self.send_message_to_recipients(
+        return await asyncio.to_thread(
+            self.send_message_to_recipients,
             sender_urn=sender_urn,
             recipient_urns=[recipient],
             subject=kwargs.get("subject", ""),
@@ -112,7 +112,7 @@ class LinkedInClient(BasePlatformClient):
         }
 
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{LINKEDIN_OAUTH_BASE}/accessToken",
                 data=payload,
                 timeout=15,
@@ -141,7 +141,7 @@ class LinkedInClient(BasePlatformClient):
         """
         headers = {"Authorization": f"Bearer {self._ensure_token()}"}
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/userinfo", headers=headers, timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/userinfo", headers=headers, timeout=15)
             if r.status_code == 200:
                 data = r.json()
                 return {
@@ -165,7 +165,7 @@ class LinkedInClient(BasePlatformClient):
         Uses the /me endpoint.
         """
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/me", headers=self._headers(), timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/me", headers=self._headers(), timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -183,7 +183,7 @@ class LinkedInClient(BasePlatformClient):
         """
         params = {"q": "viewer", "count": min(count, 50), "start": start}
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/connections", headers=self._headers(), params=params, timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/connections", headers=self._headers(), params=params, timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -201,7 +201,7 @@ class LinkedInClient(BasePlatformClient):
         """
         params = {"q": "search", "keywords": keywords, "count": min(count, 50), "start": start}
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/people", headers=self._headers(), params=params, timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/people", headers=self._headers(), params=params, timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             return {
@@ -223,7 +223,7 @@ class LinkedInClient(BasePlatformClient):
         if location:
             params["locationGeoUrn"] = location
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/jobSearch", headers=self._headers(), params=params, timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/jobSearch", headers=self._headers(), params=params, timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             return {
@@ -237,7 +237,7 @@ class LinkedInClient(BasePlatformClient):
     def get_job_details(self, job_id: str) -> Dict[str, Any]:
         """Get details about a specific job posting."""
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/jobs/{job_id}", headers=self._headers(), timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/jobs/{job_id}", headers=self._headers(), timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -248,7 +248,7 @@ class LinkedInClient(BasePlatformClient):
         """Search for companies/organizations on LinkedIn."""
         params = {"q": "vanityName", "vanityName": keywords}
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/organizationLookup", headers=self._headers(), params=params, timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/organizationLookup", headers=self._headers(), params=params, timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             # Try alternative search endpoint
@@ -258,7 +258,7 @@ class LinkedInClient(BasePlatformClient):
                 "count": min(count, 50),
                 "start": start,
             }
-            alt_r = httpx.get(f"{LINKEDIN_API_BASE}/organizations", headers=self._headers(), params=alt_params, timeout=15)
+            alt_r = self.http.get(f"{LINKEDIN_API_BASE}/organizations", headers=self._headers(), params=alt_params, timeout=15)
             if alt_r.status_code == 200:
                 return {"ok": True, "result": alt_r.json()}
             return {
@@ -276,7 +276,7 @@ class LinkedInClient(BasePlatformClient):
         """
         params = {"q": "vanityName", "vanityName": vanity_name}
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/organizations", headers=self._headers(), params=params, timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/organizations", headers=self._headers(), params=params, timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -291,7 +291,7 @@ class LinkedInClient(BasePlatformClient):
             person_id: LinkedIn person ID (numeric, not URN).
         """
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/people/(id:{person_id})", headers=self._headers(), timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/people/(id:{person_id})", headers=self._headers(), timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -313,7 +313,7 @@ class LinkedInClient(BasePlatformClient):
             "projection": "(elements*(organization~,roleAssignee))",
         }
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/organizationAcls", headers=self._headers(), params=params, timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/organizationAcls", headers=self._headers(), params=params, timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -328,7 +328,7 @@ class LinkedInClient(BasePlatformClient):
             organization_id: Organization ID (numeric, not URN).
         """
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{LINKEDIN_API_BASE}/organizations/{organization_id}",
                 headers=self._headers(),
                 timeout=15,
@@ -347,7 +347,7 @@ class LinkedInClient(BasePlatformClient):
             "organizationalEntity": f"urn:li:organization:{org_id}",
         }
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{LINKEDIN_API_BASE}/organizationalEntityFollowerStatistics",
                 headers=self._headers(),
                 params=params,
@@ -386,7 +386,7 @@ class LinkedInClient(BasePlatformClient):
             "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": visibility},
         }
         try:
-            r = httpx.post(f"{LINKEDIN_API_BASE}/ugcPosts", headers=self._headers(), json=payload, timeout=15)
+            r = self.http.post(f"{LINKEDIN_API_BASE}/ugcPosts", headers=self._headers(), json=payload, timeout=15)
             if r.status_code in (200, 201):
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -432,7 +432,7 @@ class LinkedInClient(BasePlatformClient):
             "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": visibility},
         }
         try:
-            r = httpx.post(f"{LINKEDIN_API_BASE}/ugcPosts", headers=self._headers(), json=payload, timeout=15)
+            r = self.http.post(f"{LINKEDIN_API_BASE}/ugcPosts", headers=self._headers(), json=payload, timeout=15)
             if r.status_code in (200, 201):
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -470,7 +470,7 @@ class LinkedInClient(BasePlatformClient):
             "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": visibility},
         }
         try:
-            r = httpx.post(f"{LINKEDIN_API_BASE}/ugcPosts", headers=self._headers(), json=payload, timeout=15)
+            r = self.http.post(f"{LINKEDIN_API_BASE}/ugcPosts", headers=self._headers(), json=payload, timeout=15)
             if r.status_code in (200, 201):
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -511,7 +511,7 @@ class LinkedInClient(BasePlatformClient):
             "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": visibility},
         }
         try:
-            r = httpx.post(f"{LINKEDIN_API_BASE}/ugcPosts", headers=self._headers(), json=payload, timeout=15)
+            r = self.http.post(f"{LINKEDIN_API_BASE}/ugcPosts", headers=self._headers(), json=payload, timeout=15)
             if r.status_code in (200, 201):
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -526,7 +526,7 @@ class LinkedInClient(BasePlatformClient):
             post_urn: URN of the post (urn:li:share:xxx or urn:li:ugcPost:xxx).
         """
         try:
-            r = httpx.delete(
+            r = self.http.delete(
                 f"{LINKEDIN_API_BASE}/ugcPosts/{_encode_urn(post_urn)}",
                 headers=self._headers(),
                 timeout=15,
@@ -545,7 +545,7 @@ class LinkedInClient(BasePlatformClient):
             post_urn: URN of the post (urn:li:share:xxx or urn:li:ugcPost:xxx).
         """
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{LINKEDIN_API_BASE}/ugcPosts/{_encode_urn(post_urn)}",
                 headers=self._headers(),
                 timeout=15,
@@ -574,7 +574,7 @@ class LinkedInClient(BasePlatformClient):
             "start": start,
         }
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/ugcPosts", headers=self._headers(), params=params, timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/ugcPosts", headers=self._headers(), params=params, timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -609,7 +609,7 @@ class LinkedInClient(BasePlatformClient):
             "body": body,
         }
         try:
-            r = httpx.post(f"{LINKEDIN_API_BASE}/messages", headers=self._headers(), json=payload, timeout=15)
+            r = self.http.post(f"{LINKEDIN_API_BASE}/messages", headers=self._headers(), json=payload, timeout=15)
             if r.status_code in (200, 201):
                 return {"ok": True, "result": r.json() if r.text else {"sent": True}}
             return {
@@ -638,7 +638,7 @@ class LinkedInClient(BasePlatformClient):
         if message:
             payload["message"] = message[:300]
         try:
-            r = httpx.post(f"{LINKEDIN_API_BASE}/invitations", headers=self._headers(), json=payload, timeout=15)
+            r = self.http.post(f"{LINKEDIN_API_BASE}/invitations", headers=self._headers(), json=payload, timeout=15)
             if r.status_code in (200, 201):
                 return {"ok": True, "result": r.json() if r.text else {"sent": True}}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -648,7 +648,7 @@ class LinkedInClient(BasePlatformClient):
     def withdraw_connection_request(self, invitation_urn: str) -> Dict[str, Any]:
         """Withdraw a pending connection request."""
         try:
-            r = httpx.delete(
+            r = self.http.delete(
                 f"{LINKEDIN_API_BASE}/invitations/{_encode_urn(invitation_urn)}",
                 headers=self._headers(),
                 timeout=15,
@@ -663,7 +663,7 @@ class LinkedInClient(BasePlatformClient):
         """Get sent connection invitations (pending)."""
         params = {"q": "inviter", "count": min(count, 50), "start": start}
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/invitations", headers=self._headers(), params=params, timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/invitations", headers=self._headers(), params=params, timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -674,7 +674,7 @@ class LinkedInClient(BasePlatformClient):
         """Get received connection invitations (pending)."""
         params = {"q": "invitee", "count": min(count, 50), "start": start}
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/invitations", headers=self._headers(), params=params, timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/invitations", headers=self._headers(), params=params, timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -691,7 +691,7 @@ class LinkedInClient(BasePlatformClient):
         """
         payload = {"action": action.upper()}
         try:
-            r = httpx.patch(
+            r = self.http.patch(
                 f"{LINKEDIN_API_BASE}/invitations/{_encode_urn(invitation_urn)}",
                 headers=self._headers(),
                 json=payload,
@@ -714,7 +714,7 @@ class LinkedInClient(BasePlatformClient):
         """
         params = {"count": min(count, 50), "start": start}
         try:
-            r = httpx.get(f"{LINKEDIN_API_BASE}/conversations", headers=self._headers(), params=params, timeout=15)
+            r = self.http.get(f"{LINKEDIN_API_BASE}/conversations", headers=self._headers(), params=params, timeout=15)
             if r.status_code == 200:
                 return {"ok": True, "result": r.json()}
             return {
@@ -739,7 +739,7 @@ class LinkedInClient(BasePlatformClient):
         """
         payload = {"actor": actor_urn}
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{LINKEDIN_API_BASE}/socialActions/{_encode_urn(post_urn)}/likes",
                 headers=self._headers(),
                 json=payload,
@@ -761,7 +761,7 @@ class LinkedInClient(BasePlatformClient):
         """
         composite_key = quote(f"(liker:{actor_urn})", safe="")
         try:
-            r = httpx.delete(
+            r = self.http.delete(
                 f"{LINKEDIN_API_BASE}/socialActions/{_encode_urn(post_urn)}/likes/{composite_key}",
                 headers=self._headers(),
                 timeout=15,
@@ -783,7 +783,7 @@ class LinkedInClient(BasePlatformClient):
         """
         params = {"count": min(count, 100), "start": start}
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{LINKEDIN_API_BASE}/socialActions/{_encode_urn(post_urn)}/likes",
                 headers=self._headers(),
                 params=params,
@@ -822,7 +822,7 @@ class LinkedInClient(BasePlatformClient):
         if parent_comment_urn:
             payload["parentComment"] = parent_comment_urn
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{LINKEDIN_API_BASE}/socialActions/{_encode_urn(post_urn)}/comments",
                 headers=self._headers(),
                 json=payload,
@@ -845,7 +845,7 @@ class LinkedInClient(BasePlatformClient):
         """
         params = {"count": min(count, 100), "start": start}
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{LINKEDIN_API_BASE}/socialActions/{_encode_urn(post_urn)}/comments",
                 headers=self._headers(),
                 params=params,
@@ -868,7 +868,7 @@ class LinkedInClient(BasePlatformClient):
         """
         params = {"actor": actor_urn}
         try:
-            r = httpx.delete(
+            r = self.http.delete(
                 f"{LINKEDIN_API_BASE}/socialActions/{_encode_urn(post_urn)}/comments/{_encode_urn(comment_urn)}",
                 headers=self._headers(),
                 params=params,
@@ -896,7 +896,7 @@ class LinkedInClient(BasePlatformClient):
             "shares": ",".join(share_urns),
         }
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{LINKEDIN_API_BASE}/organizationalEntityShareStatistics",
                 headers=self._headers(),
                 params=params,
@@ -906,7 +906,7 @@ class LinkedInClient(BasePlatformClient):
                 return {"ok": True, "result": r.json()}
             # Try alternative endpoint for personal posts
             alt_params = {"ids": f"List({','.join(share_urns)})"}
-            alt_r = httpx.get(
+            alt_r = self.http.get(
                 f"{LINKEDIN_API_BASE}/socialMetadata",
                 headers=self._headers(),
                 params=alt_params,
@@ -926,7 +926,7 @@ class LinkedInClient(BasePlatformClient):
             post_urn: URN of the post.
         """
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{LINKEDIN_API_BASE}/socialMetadata/{_encode_urn(post_urn)}",
                 headers=self._headers(),
                 timeout=15,
@@ -951,7 +951,7 @@ class LinkedInClient(BasePlatformClient):
             "organization": f"urn:li:organization:{org_id}",
         }
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{LINKEDIN_API_BASE}/organizationPageStatistics",
                 headers=self._headers(),
                 params=params,
@@ -981,7 +981,7 @@ class LinkedInClient(BasePlatformClient):
             "follower": follower_urn,
         }
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{LINKEDIN_API_BASE}/organizationFollows",
                 headers=self._headers(),
                 json=payload,
@@ -1004,7 +1004,7 @@ class LinkedInClient(BasePlatformClient):
         org_id = organization_urn.split(":")[-1] if ":" in organization_urn else organization_urn
         followee_urn = f"urn:li:organization:{org_id}"
         try:
-            r = httpx.delete(
+            r = self.http.delete(
                 f"{LINKEDIN_API_BASE}/organizationFollows/follower={_encode_urn(follower_urn)}&followee={_encode_urn(followee_urn)}",
                 headers=self._headers(),
                 timeout=15,
@@ -1040,7 +1040,7 @@ class LinkedInClient(BasePlatformClient):
             }
         }
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{LINKEDIN_API_BASE}/assets?action=registerUpload",
                 headers=self._headers(),
                 json=payload,
@@ -1079,7 +1079,7 @@ class LinkedInClient(BasePlatformClient):
             "Content-Type": "application/octet-stream",
         }
         try:
-            r = httpx.put(upload_url, headers=headers, content=image_data, timeout=60)
+            r = self.http.put(upload_url, headers=headers, content=image_data, timeout=60)
             if r.status_code in (200, 201):
                 return {"ok": True, "result": {"uploaded": True}}
             return {"error": f"API error: {r.status_code}", "details": r.text}
@@ -1123,7 +1123,7 @@ class LinkedInClient(BasePlatformClient):
             "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": visibility},
         }
         try:
-            r = httpx.post(f"{LINKEDIN_API_BASE}/ugcPosts", headers=self._headers(), json=payload, timeout=15)
+            r = self.http.post(f"{LINKEDIN_API_BASE}/ugcPosts", headers=self._headers(), json=payload, timeout=15)
             if r.status_code in (200, 201):
                 return {"ok": True, "result": r.json()}
             return {"error": f"API error: {r.status_code}", "details": r.text}
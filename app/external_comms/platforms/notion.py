@@ -6,8 +6,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-import httpx
-
 from app.external_comms.base import BasePlatformClient
 from app.external_comms.credentials import has_credential, load_credential, save_credential, remove_credential
 from app.external_comms.registry import register_client
@@ -64,19 +62,19 @@ class NotionClient(BasePlatformClient):
         payload: Dict[str, Any] = {"query": query, "page_size": page_size}
         if filter_type in ("page", "database"):
             payload["filter"] = {"property": "object", "value": filter_type}
-        r = httpx.post(f"{NOTION_API_BASE}/search", headers=self._headers(), json=payload)
+        r = self.http.post(f"{NOTION_API_BASE}/search", headers=self._headers(), json=payload)
         data = r.json()
         if r.status_code != 200:
             return [{"error": data}]
         return data.get("results", [])
 
     def get_page(self, page_id: str) -> Dict[str, Any]:
-        r = httpx.get(f"{NOTION_API_BASE}/pages/{page_id}", headers=self._headers())
+        r = self.http.get(f"{NOTION_API_BASE}/pages/{page_id}", headers=self._headers())
         data = r.json()
         return {"error": data} if r.status_code != 200 else data
 
     def get_database(self, database_id: str) -> Dict[str, Any]:
-        r = httpx.get(f"{NOTION_API_BASE}/databases/{database_id}", headers=self._headers())
+        r = self.http.get(f"{NOTION_API_BASE}/databases/{database_id}", headers=self._headers())
         data = r.json()
         return {"error": data} if r.status_code != 200 else data
 
@@ -92,7 +90,7 @@ class NotionClient(BasePlatformClient):
             payload["filter"] = filter_obj
         if sorts:
             payload["sorts"] = sorts
-        r = httpx.post(f"{NOTION_API_BASE}/databases/{database_id}/query", headers=self._headers(), json=payload)
+        r = self.http.post(f"{NOTION_API_BASE}/databases/{database_id}/query", headers=self._headers(), json=payload)
         data = r.json()
         return {"error": data} if r.status_code != 200 else data
 
@@ -106,31 +104,31 @@ class NotionClient(BasePlatformClient):
         payload: Dict[str, Any] = {"parent": {parent_type: parent_id}, "properties": properties}
         if children:
             payload["children"] = children
-        r = httpx.post(f"{NOTION_API_BASE}/pages", headers=self._headers(), json=payload)
+        r = self.http.post(f"{NOTION_API_BASE}/pages", headers=self._headers(), json=payload)
         data = r.json()
         return {"error": data} if r.status_code != 200 else data
 
     def update_page(self, page_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
-        r = httpx.patch(f"{NOTION_API_BASE}/pages/{page_id}", headers=self._headers(), json={"properties": properties})
+        r = self.http.patch(f"{NOTION_API_BASE}/pages/{page_id}", headers=self._headers(), json={"properties": properties})
         data = r.json()
         return {"error": data} if r.status_code != 200 else data
 
     def get_block_children(self, block_id: str, page_size: int = 100) -> Dict[str, Any]:
-        r = httpx.get(f"{NOTION_API_BASE}/blocks/{block_id}/children", headers=self._headers(), params={"page_size": page_size})
+        r = self.http.get(f"{NOTION_API_BASE}/blocks/{block_id}/children", headers=self._headers(), params={"page_size": page_size})
         data = r.json()
         return {"error": data} if r.status_code != 200 else data
 
     def append_block_children(self, block_id: str, children: List[Dict[str, Any]]) -> Dict[str, Any]:
-        r = httpx.patch(f"{NOTION_API_BASE}/blocks/{block_id}/children", headers=self._headers(), json={"children": children})
+        r = self.http.patch(f"{NOTION_API_BASE}/blocks/{block_id}/children", headers=self._headers(), json={"children": children})
         data = r.json()
         return {"error": data} if r.status_code != 200 else data
 
     def delete_block(self, block_id: str) -> Dict[str, Any]:
-        r = httpx.delete(f"{NOTION_API_BASE}/blocks/{block_id}", headers=self._headers())
+        r = self.http.delete(f"{NOTION_API_BASE}/blocks/{block_id}", headers=self._headers())
         data = r.json()
         return {"error": data} if r.status_code != 200 else data
 
     def get_user(self, user_id: str = "me") -> Dict[str, Any]:
-        r = httpx.get(f"{NOTION_API_BASE}/users/{user_id}", headers=self._headers())
+        r = self.http.get(f"{NOTION_API_BASE}/users/{user_id}", headers=self._headers())
         data = r.json()
         return {"error": data} if r.status_code != 200 else data
@@ -10,8 +10,6 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-import httpx
-
 from app.external_comms.base import BasePlatformClient, PlatformMessage, MessageCallback
 from app.external_comms.credentials import has_credential, load_credential, save_credential, remove_credential
 from app.external_comms.registry import register_client
@@ -78,7 +76,7 @@ class OutlookClient(BasePlatformClient):
         if not all([cred.client_id, cred.refresh_token]):
             return None
         try:
-            r = httpx.post(
+            r = self.http.post(
                 MS_TOKEN_URL,
                 data={
                     "client_id": cred.client_id,
@@ -125,7 +123,7 @@ class OutlookClient(BasePlatformClient):
 
     async def send_message(self, recipient: str, text: str, **kwargs) -> Dict[str, Any]:
         subject = kwargs.get("subject", "")
-        return self.send_email(to=recipient, subject=subject, body=text)
+        return await asyncio.to_thread(self.send_email, to=recipient, subject=subject, body=text)
 
     # ------------------------------------------------------------------
     # Listening support (email polling via Graph API)
@@ -170,15 +168,15 @@ class OutlookClient(BasePlatformClient):
         logger.info("[OUTLOOK] Email poller stopped")
 
     async def _async_get_profile(self) -> Dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{GRAPH_API_BASE}/me",
-                headers=self._auth_header(),
-                timeout=15,
-            )
-            if resp.status_code != 200:
-                raise RuntimeError(f"Graph /me error: {resp.status_code}")
-            return resp.json()
+        client = self.async_http
+        resp = await client.get(
+            f"{GRAPH_API_BASE}/me",
+            headers=self._auth_header(),
+            timeout=15,
+        )
+        if resp.status_code != 200:
+            raise RuntimeError(f"Graph /me error: {resp.status_code}")
+        return resp.json()
 
     async def _poll_loop(self) -> None:
         logger.info("[OUTLOOK] Catchup complete — watching for new emails")
@@ -191,7 +189,7 @@ class OutlookClient(BasePlatformClient):
             except Exception as e:
                 logger.error(f"[OUTLOOK] Poll error: {e}")
                 if "401" in str(e):
-                    self.refresh_access_token()
+                    await asyncio.to_thread(self.refresh_access_token)
                 await asyncio.sleep(RETRY_DELAY)
                 continue
             await asyncio.sleep(POLL_INTERVAL)
@@ -200,45 +198,45 @@ class OutlookClient(BasePlatformClient):
         if not self._last_poll_time:
             return
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{GRAPH_API_BASE}/me/messages",
-                headers=self._auth_header(),
-                params={
-                    "$filter": f"receivedDateTime ge {self._last_poll_time}",
-                    "$orderby": "receivedDateTime asc",
-                    "$top": "50",
-                    "$select": "id,from,subject,bodyPreview,receivedDateTime,conversationId",
-                },
-                timeout=15,
-            )
-            if resp.status_code == 401:
-                self.refresh_access_token()
-                return
-            if resp.status_code != 200:
-                logger.warning(f"[OUTLOOK] messages API error: {resp.status_code}")
-                return
-
-            data = resp.json()
-            messages = data.get("value", [])
-
-            for msg in messages:
-                msg_id = msg.get("id", "")
-                if not msg_id or msg_id in self._seen_message_ids:
-                    continue
-
-                self._seen_message_ids.add(msg_id)
-                await self._dispatch_message(msg)
-
-            # Update last poll time to the most recent message's time
-            if messages:
-                last_received = messages[-1].get("receivedDateTime", "")
-                if last_received:
-                    self._last_poll_time = last_received
-
-            # Cap seen set
-            if len(self._seen_message_ids) > 500:
-                self._seen_message_ids = set(list(self._seen_message_ids)[-200:])
+        client = self.async_http
+        resp = await client.get(
+            f"{GRAPH_API_BASE}/me/messages",
+            headers=self._auth_header(),
+            params={
+                "$filter": f"receivedDateTime ge {self._last_poll_time}",
+                "$orderby": "receivedDateTime asc",
+                "$top": "50",
+                "$select": "id,from,subject,bodyPreview,receivedDateTime,conversationId",
+            },
+            timeout=15,
+        )
+        if resp.status_code == 401:
+            await asyncio.to_thread(self.refresh_access_token)
+            return
+        if resp.status_code != 200:
+            logger.warning(f"[OUTLOOK] messages API error: {resp.status_code}")
+            return
+
+        data = resp.json()
+        messages = data.get("value", [])
+
+        for msg in messages:
+            msg_id = msg.get("id", "")
+            if not msg_id or msg_id in self._seen_message_ids:
+                continue
+
+            self._seen_message_ids.add(msg_id)
+            await self._dispatch_message(msg)
+
+        # Update last poll time to the most recent message's time
+        if messages:
+            last_received = messages[-1].get("receivedDateTime", "")
+            if last_received:
+                self._last_poll_time = last_received
+
+        # Cap seen set
+        if len(self._seen_message_ids) > 500:
+            self._seen_message_ids = set(list(self._seen_message_ids)[-200:])
 
     async def _dispatch_message(self, msg: Dict[str, Any]) -> None:
         from_obj = msg.get("from", {}).get("emailAddress", {})
@@ -297,7 +295,7 @@ class OutlookClient(BasePlatformClient):
             ]
 
         try:
-            r = httpx.post(
+            r = self.http.post(
                 f"{GRAPH_API_BASE}/me/sendMail",
                 headers=self._headers(),
                 json={"message": message, "saveToSentItems": True},
@@ -324,7 +322,7 @@ class OutlookClient(BasePlatformClient):
             params["$filter"] = "isRead eq false"
 
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{GRAPH_API_BASE}/me/mailFolders/{folder}/messages",
                 headers=self._auth_header(),
                 params=params,
@@ -351,7 +349,7 @@ class OutlookClient(BasePlatformClient):
     def get_email(self, message_id: str) -> Dict[str, Any]:
         """Get full email by ID."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{GRAPH_API_BASE}/me/messages/{message_id}",
                 headers=self._auth_header(),
                 params={"$select": "id,from,toRecipients,subject,body,receivedDateTime,conversationId"},
@@ -380,7 +378,7 @@ class OutlookClient(BasePlatformClient):
     def mark_as_read(self, message_id: str) -> Dict[str, Any]:
         """Mark email as read."""
         try:
-            r = httpx.patch(
+            r = self.http.patch(
                 f"{GRAPH_API_BASE}/me/messages/{message_id}",
                 headers=self._headers(),
                 json={"isRead": True},
@@ -395,7 +393,7 @@ class OutlookClient(BasePlatformClient):
     def list_folders(self) -> Dict[str, Any]:
         """List mail folders."""
         try:
-            r = httpx.get(
+            r = self.http.get(
                 f"{GRAPH_API_BASE}/me/mailFolders",
                 headers=self._auth_header(),
                 params={"$select": "id,displayName,totalItemCount,unreadItemCount"},
@@ -10,8 +10,6 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-import httpx
-
 from app.external_comms.base import BasePlatformClient, PlatformMessage, MessageCallback
 from app.external_comms.credentials import has_credential, load_credential, save_credential, remove_credential
 from app.external_comms.registry import register_client
@@ -85,15 +83,15 @@ class SlackClient(BasePlatformClient):
         cred = self._load()
 
         # Verify token by calling auth.test
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{SLACK_API_BASE}/auth.test",
-                headers={"Authorization": f"Bearer {cred.bot_token}"},
-            )
-            data = resp.json()
-            if not data.get("ok"):
-                raise RuntimeError(f"Invalid Slack token: {data.get('error', 'unknown')}")
-            self._bot_user_id = data.get("user_id")
+        client = self.async_http
+        resp = await client.post(
+            f"{SLACK_API_BASE}/auth.test",
+            headers={"Authorization": f"Bearer {cred.bot_token}"},
+        )
+        data = resp.json()
+        if not data.get("ok"):
+            raise RuntimeError(f"Invalid Slack token: {data.get('error', 'unknown')}")
+        self._bot_user_id = data.get("user_id")
 
         logger.info(f"[SLACK] Bot user ID: {self._bot_user_id}")
 
@@ -141,32 +139,32 @@ class SlackClient(BasePlatformClient):
     async def _get_joined_channels(self) -> List[Dict[str, Any]]:
         """Get all channels/DMs the bot is a member of."""
         channels: List[Dict[str, Any]] = []
-        async with httpx.AsyncClient() as client:
-            for ch_type in ("public_channel,private_channel", "mpim,im"):
-                cursor = None
-                while True:
-                    params: Dict[str, Any] = {
-                        "types": ch_type,
-                        "exclude_archived": True,
-                        "limit": 200,
-                    }
-                    if cursor:
-                        params["cursor"] = cursor
-                    resp = await client.get(
-                        f"{SLACK_API_BASE}/conversations.list",
-                        headers=self._headers(),
-                        params=params,
-                    )
-                    data = resp.json()
-                    if not data.get("ok"):
-                        logger.warning(f"[SLACK] conversations.list failed: {data.get('error')}")
-                        break
-                    for ch in data.get("channels", []):
-                        if ch.get("is_member") or ch.get("is_im") or ch.get("is_mpim"):
-                            channels.append(ch)
-                    cursor = data.get("response_metadata", {}).get("next_cursor")
-                    if not cursor:
-                        break
+        client = self.async_http
+        for ch_type in ("public_channel,private_channel", "mpim,im"):
+            cursor = None
+            while True:
+                params: Dict[str, Any] = {
+                    "types": ch_type,
+                    "exclude_archived": True,
+                    "limit": 200,
+                }
+                if cursor:
+                    params["cursor"] = cursor
+                resp = await client.get(
+                    f"{SLACK_API_BASE}/conversations.list",
+                    headers=self._headers(),
+                    params=params,
+                )
+                data = resp.json()
+                if not data.get("ok"):
+                    logger.warning(f"[SLACK] conversations.list failed: {data.get('error')}")
+                    break
+                for ch in data.get("channels", []):
+                    if ch.get("is_member") or ch.get("is_im") or ch.get("is_mpim"):
+                        channels.append(ch)
+                cursor = data.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
         return channels
 
     async def _refresh_channel_timestamps(self) -> None:
@@ -188,40 +186,40 @@ class SlackClient(BasePlatformClient):
             if ch_id and ch_id not in self._last_timestamps:
                 self._last_timestamps[ch_id] = now_ts
 
-        async with httpx.AsyncClient() as client:
-            for ch_id, oldest_ts in list(self._last_timestamps.items()):
-                try:
-                    resp = await client.get(
-                        f"{SLACK_API_BASE}/conversations.history",
-                        headers=self._headers(),
-                        params={
-                            "channel": ch_id,
-                            "oldest": oldest_ts,
-                            "limit": 50,
-                        },
-                    )
-                    data = resp.json()
-                    if not data.get("ok"):
-                        if data.get("error") in ("channel_not_found", "not_in_channel"):
-                            self._last_timestamps.pop(ch_id, None)
-                        continue
-
-                    messages = data.get("messages", [])
-                    if not messages:
-                        continue
-
-                    # Messages are newest-first; process oldest-first
-                    messages.sort(key=lambda m: float(m.get("ts", "0")))
-
-                    for msg in messages:
-                        await self._process_message(msg, ch_id)
-
-                    # Advance timestamp past the newest message
-                    newest_ts = messages[-1].get("ts", oldest_ts)
-                    self._last_timestamps[ch_id] = newest_ts
-
-                except Exception as e:
-                    logger.debug(f"[SLACK] Error polling channel {ch_id}: {e}")
+        client = self.async_http
+        for ch_id, oldest_ts in list(self._last_timestamps.items()):
+            try:
+                resp = await client.get(
+                    f"{SLACK_API_BASE}/conversations.history",
+                    headers=self._headers(),
+                    params={
+                        "channel": ch_id,
+                        "oldest": oldest_ts,
+                        "limit": 50,
+                    },
+                )
+                data = resp.json()
+                if not data.get("ok"):
+                    if data.get("error") in ("channel_not_found", "not_in_channel"):
+                        self._last_timestamps.pop(ch_id, None)
+                    continue
+
+                messages = data.get("messages", [])
+                if not messages:
+                    continue
+
+                # Messages are newest-first; process oldest-first
+                messages.sort(key=lambda m: float(m.get("ts", "0")))
+
+                for msg in messages:
+                    await self._process_message(msg, ch_id)
+
+                # Advance timestamp past the newest message
+                newest_ts = messages[-1].get("ts", oldest_ts)
+                self._last_timestamps[ch_id] = newest_ts
+
+            except Exception as e:
+                logger.debug(f"[SLACK] Error polling channel {ch_id}: {e}")
 
     async def _process_message(self, msg: Dict[str, Any], channel_id: str) -> None:
         """Process a single Slack message and dispatch to callback."""
@@ -244,7 +242,7 @@ class SlackClient(BasePlatformClient):
         # Resolve user name
         sender_name = user_id
         try:
-            info = self.get_user_info(user_id)
+            info = await asyncio.to_thread(self.get_user_info, user_id)
             if info.get("ok"):
                 profile = info.get("user", {}).get("profile", {})
                 sender_name = profile.get("display_name") or profile.get("real_name") or user_id
@@ -296,7 +294,7 @@ class SlackClient(BasePlatformClient):
         if blocks:
             payload["blocks"] = blocks
 
-        r = httpx.post(f"{SLACK_API_BASE}/chat.postMessage", headers=self._headers(), json=payload)
+        r = await self.async_http.post(f"{SLACK_API_BASE}/chat.postMessage", headers=self._headers(), json=payload)
         data = r.json()
 
         if not data.get("ok"):
@@ -330,7 +328,7 @@ class SlackClient(BasePlatformClient):
             "exclude_archived": exclude_archived,
         }
 
-        r = httpx.get(f"{SLACK_API_BASE}/conversations.list", headers=self._headers(), params=params)
+        r = self.http.get(f"{SLACK_API_BASE}/conversations.list", headers=self._headers(), params=params)
         data = r.json()
 
         if not data.get("ok"):
@@ -347,7 +345,7 @@ class SlackClient(BasePlatformClient):
         Returns:
             API response with channel info or error.
         """
-        r = httpx.get(f"{SLACK_API_BASE}/conversations.info", headers=self._headers(), params={"channel": channel})
+        r = self.http.get(f"{SLACK_API_BASE}/conversations.info", headers=self._headers(), params={"channel": channel})
         data = r.json()
 
         if not data.get("ok"):
@@ -383,7 +381,7 @@ class SlackClient(BasePlatformClient):
         if latest:
             params["latest"] = latest
 
-        r = httpx.get(f"{SLACK_API_BASE}/conversations.history", headers=self._headers(), params=params)
+        r = self.http.get(f"{SLACK_API_BASE}/conversations.history", headers=self._headers(), params=params)
         data = r.json()
 
         if not data.get("ok"):
@@ -406,7 +404,7 @@ class SlackClient(BasePlatformClient):
             "is_private": is_private,
         }
 
-        r = httpx.post(f"{SLACK_API_BASE}/conversations.create", headers=self._headers(), json=payload)
+        r = self.http.post(f"{SLACK_API_BASE}/conversations.create", headers=self._headers(), json=payload)
         data = r.json()
 
         if not data.get("ok"):
@@ -429,7 +427,7 @@ class SlackClient(BasePlatformClient):
             "users": ",".join(users),
         }
 
-        r = httpx.post(f"{SLACK_API_BASE}/conversations.invite", headers=self._headers(), json=payload)
+        r = self.http.post(f"{SLACK_API_BASE}/conversations.invite", headers=self._headers(), json=payload)
         data = r.json()
 
         if not data.get("ok"):
@@ -450,7 +448,7 @@ class SlackClient(BasePlatformClient):
         Returns:
             API response with users list or error.
         """
-        r = httpx.get(f"{SLACK_API_BASE}/users.list", headers=self._headers(), params={"limit": limit})
+        r = self.http.get(f"{SLACK_API_BASE}/users.list", headers=self._headers(), params={"limit": limit})
         data = r.json()
 
         if not data.get("ok"):
@@ -467,7 +465,7 @@ class SlackClient(BasePlatformClient):
         Returns:
             API response with user info or error.
         """
-        r = httpx.get(f"{SLACK_API_BASE}/users.info", headers=self._headers(), params={"user": user_id})
+        r = self.http.get(f"{SLACK_API_BASE}/users.info", headers=self._headers(), params={"user": user_id})
         data = r.json()
 
         if not data.get("ok"):
@@ -490,7 +488,7 @@ class SlackClient(BasePlatformClient):
         """
         payload: Dict[str, Any] = {"users": ",".join(users)}
 
-        r = httpx.post(f"{SLACK_API_BASE}/conversations.open", headers=self._headers(), json=payload)
+        r = self.http.post(f"{SLACK_API_BASE}/conversations.open", headers=self._headers(), json=payload)
         data = r.json()
 
         if not data.get("ok"):
@@ -523,7 +521,7 @@ class SlackClient(BasePlatformClient):
             "sort_dir": sort_dir,
         }
 
-        r = httpx.get(f"{SLACK_API_BASE}/search.messages", headers=self._headers(), params=params)
+        r = self.http.get(f"{SLACK_API_BASE}/search.messages", headers=self._headers(), params=params)
         data = r.json()
 
         if not data.get("ok"):
@@ -580,7 +578,7 @@ class SlackClient(BasePlatformClient):
             form_data["content"] = content
 
         try:
-            r = httpx.post(f"{SLACK_API_BASE}/files.upload", headers=headers, data=form_data, files=files)
+            r = self.http.post(f"{SLACK_API_BASE}/files.upload", headers=headers, data=form_data, files=files)
         finally:
             if files:
                 files["file"].close()
@@ -116,9 +116,9 @@ class TelegramBotClient(BasePlatformClient):
         if disable_notification:
             payload["disable_notification"] = True
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(self._api_url("sendMessage"), json=payload)
-            data = resp.json()
+        client = self.async_http
+        resp = await client.post(self._api_url("sendMessage"), json=payload)
+        data = resp.json()
 
         if not data.get("ok"):
             return {"error": data.get("description", "Unknown error"), "details": data}
@@ -207,24 +207,23 @@ class TelegramBotClient(BasePlatformClient):
     async def _poll_updates(self) -> Dict[str, Any]:
         """Fetch updates from Telegram using long-polling."""
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(POLL_TIMEOUT + 10)
-            ) as client:
-                resp = await client.get(
-                    self._api_url("getUpdates"),
-                    params={
-                        "offset": self._poll_offset,
-                        "timeout": POLL_TIMEOUT,
-                        "allowed_updates": ["message"],
-                    },
-                )
-                data = resp.json()
-
-                if data.get("ok"):
-                    return data
-                else:
-                    logger.warning(f"[TELEGRAM_BOT] getUpdates failed: {data}")
-                    return {"result": []}
+            client = self.async_http
+            resp = await client.get(
+                self._api_url("getUpdates"),
+                params={
+                    "offset": self._poll_offset,
+                    "timeout": POLL_TIMEOUT,
+                    "allowed_updates": ["message"],
+                },
+                timeout=POLL_TIMEOUT + 10,
+            )
+            data = resp.json()
+
+            if data.get("ok"):
+                return data
+            else:
+                logger.warning(f"[TELEGRAM_BOT] getUpdates failed: {data}")
+                return {"result": []}
 
         except httpx.TimeoutException:
             return {"result": []}
@@ -287,9 +286,9 @@ class TelegramBotClient(BasePlatformClient):
         Returns:
             API response with bot info or error.
         """
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(self._api_url("getMe"))
-            data = resp.json()
+        client = self.async_http
+        resp = await client.get(self._api_url("getMe"))
+        data = resp.json()
 
         if not data.get("ok"):
             return {"error": data.get("description", "Unknown error"), "details": data}
@@ -324,9 +323,9 @@ class TelegramBotClient(BasePlatformClient):
         if parse_mode:
             payload["parse_mode"] = parse_mode
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(self._api_url("sendPhoto"), json=payload)
-            data = resp.json()
+        client = self.async_http
+        resp = await client.post(self._api_url("sendPhoto"), json=payload)
+        data = resp.json()
 
         if not data.get("ok"):
             return {"error": data.get("description", "Unknown error"), "details": data}
@@ -361,9 +360,9 @@ class TelegramBotClient(BasePlatformClient):
         if parse_mode:
             payload["parse_mode"] = parse_mode
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(self._api_url("sendDocument"), json=payload)
-            data = resp.json()
+        client = self.async_http
+        resp = await client.post(self._api_url("sendDocument"), json=payload)
+        data = resp.json()
 
         if not data.get("ok"):
             return {"error": data.get("description", "Unknown error"), "details": data}
@@ -398,11 +397,9 @@ class TelegramBotClient(BasePlatformClient):
         if allowed_updates:
             payload["allowed_updates"] = allowed_updates
 
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout + 10)
-        ) as client:
-            resp = await client.post(self._api_url("getUpdates"), json=payload)
-            data = resp.json()
+        client = self.async_http
+        resp = await client.post(self._api_url("getUpdates"), json=payload, timeout=timeout + 10)
+        data = resp.json()
 
         if not data.get("ok"):
             return {"error": data.get("description", "Unknown error"), "details": data}
@@ -423,9 +420,9 @@ class TelegramBotClient(BasePlatformClient):
         """
         payload = {"chat_id": chat_id}
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(self._api_url("getChat"), json=payload)
-            data = resp.json()
+        client = self.async_http
+        resp = await client.post(self._api_url("getChat"), json=payload)
+        data = resp.json()
 
         if not data.get("ok"):
             return {"error": data.get("description", "Unknown error"), "details": data}
@@ -451,9 +448,9 @@ class TelegramBotClient(BasePlatformClient):
             "user_id": user_id,
         }
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(self._api_url("getChatMember"), json=payload)
-            data = resp.json()
+        client = self.async_http
+        resp = await client.post(self._api_url("getChatMember"), json=payload)
+        data = resp.json()
 
         if not data.get("ok"):
             return {"error": data.get("description", "Unknown error"), "details": data}
@@ -474,9 +471,9 @@ class TelegramBotClient(BasePlatformClient):
         """
         payload = {"chat_id": chat_id}
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(self._api_url("getChatMembersCount"), json=payload)
-            data = resp.json()
+        client = self.async_http
+        resp = await client.post(self._api_url("getChatMembersCount"), json=payload)
+        data = resp.json()
 
         if not data.get("ok"):
             return {"error": data.get("description", "Unknown error"), "details": data}
@@ -510,9 +507,9 @@ class TelegramBotClient(BasePlatformClient):
         if disable_notification:
             payload["disable_notification"] = True
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(self._api_url("forwardMessage"), json=payload)
-            data = resp.json()
+        client = self.async_http
+        resp = await client.post(self._api_url("forwardMessage"), json=payload)
+        data = resp.json()
 
         if not data.get("ok"):
             return {"error": data.get("description", "Unknown error"), "details": data}
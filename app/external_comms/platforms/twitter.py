@@ -19,8 +19,6 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-import httpx
-
 from app.external_comms.base import BasePlatformClient, PlatformMessage, MessageCallback
 from app.external_comms.credentials import has_credential, load_credential, save_credential, remove_credential
 from app.external_comms.registry import register_client
@@ -242,16 +240,16 @@ class TwitterClient(BasePlatformClient):
         params = {"max_results": "5", "tweet.fields": "created_at,author_id,text"}
         auth = self._auth_header("GET", url, params)
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers={**auth}, params=params, timeout=15)
-            if resp.status_code == 200:
-                data = resp.json()
-                tweets = data.get("data", [])
-                if tweets:
-                    self._since_id = tweets[0].get("id")
-                    for t in tweets:
-                        self._seen_ids.add(t.get("id"))
-                    logger.info(f"[TWITTER] Catchup complete — since_id: {self._since_id}")
+        client = self.async_http
+        resp = await client.get(url, headers={**auth}, params=params, timeout=15)
+        if resp.status_code == 200:
+            data = resp.json()
+            tweets = data.get("data", [])
+            if tweets:
+                self._since_id = tweets[0].get("id")
+                for t in tweets:
+                    self._seen_ids.add(t.get("id"))
+                logger.info(f"[TWITTER] Catchup complete — since_id: {self._since_id}")
 
     async def _check_mentions(self) -> None:
         cred = self._load()
@@ -270,40 +268,40 @@ class TwitterClient(BasePlatformClient):
 
         auth = self._auth_header("GET", url, params)
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers={**auth}, params=params, timeout=15)
+        client = self.async_http
+        resp = await client.get(url, headers={**auth}, params=params, timeout=15)
 
-            if resp.status_code == 429:
-                logger.warning("[TWITTER] Rate limited, backing off")
-                await asyncio.sleep(60)
-                return
-            if resp.status_code != 200:
-                logger.warning(f"[TWITTER] Mentions API error: {resp.status_code} — {resp.text[:200]}")
-                return
+        if resp.status_code == 429:
+            logger.warning("[TWITTER] Rate limited, backing off")
+            await asyncio.sleep(60)
+            return
+        if resp.status_code != 200:
+            logger.warning(f"[TWITTER] Mentions API error: {resp.status_code} — {resp.text[:200]}")
+            return
 
-            data = resp.json()
-            tweets = data.get("data", [])
-            if not tweets:
-                return
+        data = resp.json()
+        tweets = data.get("data", [])
+        if not tweets:
+            return
 
-            # Build user lookup
-            includes = data.get("includes", {})
-            users_map = {u["id"]: u for u in includes.get("users", [])}
+        # Build user lookup
+        includes = data.get("includes", {})
+        users_map = {u["id"]: u for u in includes.get("users", [])}
 
-            # Update since_id to newest
-            self._since_id = tweets[0].get("id")
+        # Update since_id to newest
+        self._since_id = tweets[0].get("id")
 
-            for tweet in reversed(tweets):  # oldest first
-                tweet_id = tweet.get("id", "")
-                if tweet_id in self._seen_ids:
-                    continue
-                self._seen_ids.add(tweet_id)
+        for tweet in reversed(tweets):  # oldest first
+            tweet_id = tweet.get("id", "")
+            if tweet_id in self._seen_ids:
+                continue
+            self._seen_ids.add(tweet_id)
 
-                await self._dispatch_mention(tweet, users_map)
+            await self._dispatch_mention(tweet, users_map)
 
-            # Cap seen set
-            if len(self._seen_ids) > 500:
-                self._seen_ids = set(list(self._seen_ids)[-200:])
+        # Cap seen set
+        if len(self._seen_ids) > 500:
+            self._seen_ids = set(list(self._seen_ids)[-200:])
 
     async def _dispatch_mention(self, tweet: Dict[str, Any], users_map: Dict[str, Any]) -> None:
         if not self._message_callback:
@@ -373,12 +371,12 @@ class TwitterClient(BasePlatformClient):
         params = {"user.fields": "id,name,username,description,public_metrics"}
         auth = self._auth_header("GET", url, params)
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(url, headers={**auth}, params=params, timeout=15)
-                if resp.status_code == 200:
-                    data = resp.json().get("data", {})
-                    return {"ok": True, "result": data}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(url, headers={**auth}, params=params, timeout=15)
+            if resp.status_code == 200:
+                data = resp.json().get("data", {})
+                return {"ok": True, "result": data}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -391,12 +389,12 @@ class TwitterClient(BasePlatformClient):
 
         auth = self._auth_header("POST", url)
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(url, headers={**auth, "Content-Type": "application/json"}, json=payload, timeout=15)
-                if resp.status_code in (200, 201):
-                    data = resp.json().get("data", {})
-                    return {"ok": True, "result": {"id": data.get("id"), "text": data.get("text")}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.post(url, headers={**auth, "Content-Type": "application/json"}, json=payload, timeout=15)
+            if resp.status_code in (200, 201):
+                data = resp.json().get("data", {})
+                return {"ok": True, "result": {"id": data.get("id"), "text": data.get("text")}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -405,11 +403,11 @@ class TwitterClient(BasePlatformClient):
         url = f"{TWITTER_API}/tweets/{tweet_id}"
         auth = self._auth_header("DELETE", url)
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.delete(url, headers={**auth}, timeout=15)
-                if resp.status_code == 200:
-                    return {"ok": True, "result": {"deleted": True}}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.delete(url, headers={**auth}, timeout=15)
+            if resp.status_code == 200:
+                return {"ok": True, "result": {"deleted": True}}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -424,11 +422,11 @@ class TwitterClient(BasePlatformClient):
         params = {"max_results": str(max_results), "tweet.fields": "created_at,public_metrics,text"}
         auth = self._auth_header("GET", url, params)
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(url, headers={**auth}, params=params, timeout=15)
-                if resp.status_code == 200:
-                    return {"ok": True, "result": resp.json()}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(url, headers={**auth}, params=params, timeout=15)
+            if resp.status_code == 200:
+                return {"ok": True, "result": resp.json()}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -438,11 +436,11 @@ class TwitterClient(BasePlatformClient):
         params = {"query": query, "max_results": str(max_results), "tweet.fields": "created_at,author_id,public_metrics,text", "expansions": "author_id", "user.fields": "username"}
         auth = self._auth_header("GET", url, params)
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(url, headers={**auth}, params=params, timeout=15)
-                if resp.status_code == 200:
-                    return {"ok": True, "result": resp.json()}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(url, headers={**auth}, params=params, timeout=15)
+            if resp.status_code == 200:
+                return {"ok": True, "result": resp.json()}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -452,11 +450,11 @@ class TwitterClient(BasePlatformClient):
         url = f"{TWITTER_API}/users/{cred.user_id}/likes"
         auth = self._auth_header("POST", url)
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(url, headers={**auth, "Content-Type": "application/json"}, json={"tweet_id": tweet_id}, timeout=15)
-                if resp.status_code == 200:
-                    return {"ok": True, "result": resp.json().get("data", {})}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.post(url, headers={**auth, "Content-Type": "application/json"}, json={"tweet_id": tweet_id}, timeout=15)
+            if resp.status_code == 200:
+                return {"ok": True, "result": resp.json().get("data", {})}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -466,11 +464,11 @@ class TwitterClient(BasePlatformClient):
         url = f"{TWITTER_API}/users/{cred.user_id}/retweets"
         auth = self._auth_header("POST", url)
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(url, headers={**auth, "Content-Type": "application/json"}, json={"tweet_id": tweet_id}, timeout=15)
-                if resp.status_code == 200:
-                    return {"ok": True, "result": resp.json().get("data", {})}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.post(url, headers={**auth, "Content-Type": "application/json"}, json={"tweet_id": tweet_id}, timeout=15)
+            if resp.status_code == 200:
+                return {"ok": True, "result": resp.json().get("data", {})}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -480,11 +478,11 @@ class TwitterClient(BasePlatformClient):
         params = {"user.fields": "id,name,username,description,public_metrics"}
         auth = self._auth_header("GET", url, params)
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(url, headers={**auth}, params=params, timeout=15)
-                if resp.status_code == 200:
-                    return {"ok": True, "result": resp.json().get("data", {})}
-                return {"error": f"API error: {resp.status_code}", "details": resp.text}
+            client = self.async_http
+            resp = await client.get(url, headers={**auth}, params=params, timeout=15)
+            if resp.status_code == 200:
+                return {"ok": True, "result": resp.json().get("data", {})}
+            return {"error": f"API error: {resp.status_code}", "details": resp.text}
         except Exception as e:
             return {"error": str(e)}
 
@@ -3,11 +3,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-import httpx
-
 from app.external_comms.base import BasePlatformClient
 from app.external_comms.credentials import has_credential, load_credential, save_credential, remove_credential
 from app.external_comms.registry import register_client
@@ -52,7 +51,7 @@ class WhatsAppBusinessClient(BasePlatformClient):
 
     async def send_message(self, recipient: str, text: str, **kwargs) -> Dict[str, Any]:
         """Send a text message via WhatsApp Business Cloud API."""
-        return self.send_text(recipient, text)
+        return await asyncio.to_thread(self.send_text, recipient, text)
 
     # ------------------------------------------------------------------
     # Messaging
@@ -68,7 +67,7 @@ class WhatsAppBusinessClient(BasePlatformClient):
             "text": {"body": text},
         }
         try:
-            r = httpx.post(url, headers=self._headers(), json=payload, timeout=15)
+            r = self.http.post(url, headers=self._headers(), json=payload, timeout=15)
             data = r.json()
             if r.status_code in (200, 201):
                 return {"ok": True, "result": data}
@@ -85,7 +84,7 @@ class WhatsAppBusinessClient(BasePlatformClient):
             template["components"] = components
         payload = {"messaging_product": "whatsapp", "to": to, "type": "template", "template": template}
         try:
-            r = httpx.post(url, headers=self._headers(), json=payload, timeout=15)
+            r = self.http.post(url, headers=self._headers(), json=payload, timeout=15)
             data = r.json()
             if r.status_code in (200, 201):
                 return {"ok": True, "result": data}
@@ -101,7 +100,7 @@ class WhatsAppBusinessClient(BasePlatformClient):
             image["caption"] = caption
         payload = {"messaging_product": "whatsapp", "to": to, "type": "image", "image": image}
         try:
-            r = httpx.post(url, headers=self._headers(), json=payload, timeout=15)
+            r = self.http.post(url, headers=self._headers(), json=payload, timeout=15)
             data = r.json()
             if r.status_code in (200, 201):
                 return {"ok": True, "result": data}
@@ -120,7 +119,7 @@ class WhatsAppBusinessClient(BasePlatformClient):
             doc["caption"] = caption
         payload = {"messaging_product": "whatsapp", "to": to, "type": "document", "document": doc}
         try:
-            r = httpx.post(url, headers=self._headers(), json=payload, timeout=15)
+            r = self.http.post(url, headers=self._headers(), json=payload, timeout=15)
             data = r.json()
             if r.status_code in (200, 201):
                 return {"ok": True, "result": data}
@@ -133,7 +132,7 @@ class WhatsAppBusinessClient(BasePlatformClient):
         url = f"{GRAPH_API_BASE}/{cred.phone_number_id}/messages"
         payload = {"messaging_product": "whatsapp", "status": "read", "message_id": message_id}
         try:
-            r = httpx.post(url, headers=self._headers(), json=payload, timeout=15)
+            r = self.http.post(url, headers=self._headers(), json=payload, timeout=15)
             data = r.json()
             if r.status_code == 200:
                 return {"ok": True, "result": data}
@@ -147,7 +146,7 @@ class WhatsAppBusinessClient(BasePlatformClient):
 
     def get_media_url(self, media_id: str) -> Dict[str, Any]:
         try:
-            r = httpx.get(f"{GRAPH_API_BASE}/{media_id}", headers=self._headers(), timeout=15)
+            r = self.http.get(f"{GRAPH_API_BASE}/{media_id}", headers=self._headers(), timeout=15)
             data = r.json()
             if r.status_code == 200:
                 return {"ok": True, "result": {"url": data.get("url"), "mime_type": data.get("mime_type"), "file_size": data.get("file_size")}}
@@ -162,7 +161,7 @@ class WhatsAppBusinessClient(BasePlatformClient):
     def get_business_profile(self) -> Dict[str, Any]:
         cred = self._load()
         try:
-            r = httpx.get(f"{GRAPH_API_BASE}/{cred.phone_number_id}/whatsapp_business_profile",
+            r = self.http.get(f"{GRAPH_API_BASE}/{cred.phone_number_id}/whatsapp_business_profile",
                           headers=self._headers(), params={"fields": "about,address,description,email,profile_picture_url,websites,vertical"}, timeout=15)
             data = r.json()
             if r.status_code == 200:
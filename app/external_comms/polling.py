@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+"""
+app.external_comms.polling
+
+Shared adaptive poller and persisted poll cursors for platforms that
+listen by polling (GitHub, Jira, Gmail).
+
+``AdaptivePoller`` runs a platform's poll coroutine on an interval that
+adapts to activity:
+
+- every idle poll multiplies the interval by ``backoff`` up to
+  ``max_interval``; a poll that finds something drops it back to
+  ``min_interval`` (and a truncated page is followed up immediately)
+- the poll coroutine returns a ``PollResult`` that can carry a
+  server-requested delay (``Retry-After`` / exhausted rate limit, see
+  ``rate_limit_delay``) or minimum interval (GitHub's ``X-Poll-Interval``);
+  both are honored
+- consecutive errors back off exponentially from ``error_delay``
+
+Poll cursors (ETag, Last-Modified, ``updated`` timestamps, history IDs,
+recently seen IDs) are stored per platform and resource in
+``.credentials/poll_cursors.json`` so a restart resumes where the last run
+stopped instead of skipping (or re-dispatching) what happened in between.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import random
+import stat
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional
+
+try:
+    from app.logger import logger
+except Exception:
+    logger = logging.getLogger(__name__)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+CURSOR_FILE = "poll_cursors.json"
+# An unchanged cursor is still re-saved this often, so its age tracks the last poll
+CURSOR_REFRESH_INTERVAL = 300
+
+# Rate-limit reset values below this are relative seconds, above it unix timestamps
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+@dataclass
+class PollResult:
+    """Outcome of one poll, as returned by a poll coroutine."""
+
+    activity: int = 0                       # new items found (and dispatched)
+    more: bool = False                      # results were truncated; poll again right away
+    retry_after: Optional[float] = None     # server-requested delay before the next poll
+    min_interval: Optional[float] = None    # server-requested minimum poll interval
+
+
+PollFunction = Callable[[], Awaitable[Optional[PollResult]]]
+
+
+# ------------------------------------------------------------------
+# Response headers
+# ------------------------------------------------------------------
+
+def _parse_seconds(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value.strip())
+    except ValueError:
+        return None
+
+
+def _parse_retry_after(value: str, now: float) -> Optional[float]:
+    seconds = _parse_seconds(value)
+    if seconds is not None:
+        return max(0.0, seconds)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: str, now: float) -> Optional[float]:
+    """Seconds until a rate-limit reset given as epoch seconds, relative seconds or ISO 8601."""
+    seconds = _parse_seconds(value)
+    if seconds is not None:
+        return max(0.0, seconds - now) if seconds > _EPOCH_THRESHOLD else max(0.0, seconds)
+    try:
+        reset = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset.tzinfo is None:
+        reset = reset.replace(tzinfo=timezone.utc)
+    return max(0.0, reset.timestamp() - now)
+
+
+def rate_limit_delay(headers: Mapping[str, str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Delay the server asks for before the next request, from response headers.
+
+    Honors ``Retry-After`` (seconds or HTTP date) and ``X-RateLimit-Remaining``
+    / ``X-RateLimit-Reset``: an exhausted quota waits for the reset, a nearly
+    exhausted one spreads the remaining requests over the reset window.
+
+    Returns:
+        Seconds to wait, or None if the headers ask for nothing.
+    """
+    now = time.time() if now is None else now
+
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        delay = _parse_retry_after(retry_after, now)
+        if delay is not None:
+            return delay
+
+    remaining = _parse_seconds(headers.get("X-RateLimit-Remaining"))
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or not reset:
+        return None
+    window = _parse_reset(reset, now)
+    if window is None:
+        return None
+    if remaining <= 0:
+        return window
+    return window / remaining
+
+
+# ------------------------------------------------------------------
+# Poller
+# ------------------------------------------------------------------
+
+class AdaptivePoller:
+    """
+    Runs ``poll`` repeatedly in an asyncio task with an activity-driven interval.
+
+    ``poll`` returns a PollResult (None counts as an idle poll). Exceptions
+    are logged and retried with exponential backoff; CancelledError stops
+    the poller.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        poll: PollFunction,
+        min_interval: float,
+        max_interval: float,
+        backoff: float = 2.0,
+        error_delay: Optional[float] = None,
+        max_error_delay: float = 600.0,
+        jitter: float = 0.1,
+    ):
+        self.name = name
+        self._poll = poll
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.backoff = backoff
+        self.error_delay = error_delay if error_delay is not None else min_interval
+        self.max_error_delay = max(max_error_delay, self.error_delay)
+        self.jitter = jitter
+        self._interval = min_interval
+        self._server_min_interval = 0.0
+        self._errors = 0
+        self._deadline = 0.0
+        self._not_before = 0.0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {"polls": 0, "activity": 0, "errors": 0, "throttled": 0}
+
+    @property
+    def interval(self) -> float:
+        """Interval the next idle poll will wait."""
+        return self._interval
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start polling (no-op if already running). The first poll runs immediately."""
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def reset(self) -> None:
+        """Drop back to the minimum interval (e.g. after sending, when a reply is likely)."""
+        self._interval = self._floor()
+        self._reschedule(time.monotonic() + self._interval)
+
+    def poke(self) -> None:
+        """Poll as soon as allowed."""
+        self._interval = self._floor()
+        self._reschedule(time.monotonic())
+
+    def stats(self) -> Dict[str, Any]:
+        return {"interval": self._interval, "consecutive_errors": self._errors, **self._stats}
+
+    def _floor(self) -> float:
+        return max(self.min_interval, self._server_min_interval)
+
+    def _reschedule(self, deadline: float) -> None:
+        # Never earlier than a server-requested delay allows
+        self._deadline = max(min(self._deadline, deadline), self._not_before)
+        self._wakeup.set()
+
+    def next_delay(self, result: Optional[PollResult]) -> float:
+        """Update the interval from a poll result and return how long to wait before the next poll."""
+        result = result or PollResult()
+        if result.min_interval:
+            self._server_min_interval = min(result.min_interval, self.max_interval)
+
+        if result.more:
+            self._interval = self._floor()
+            delay = 0.0
+        else:
+            if result.activity:
+                self._interval = self._floor()
+            delay = max(self._interval * (1 + random.uniform(-self.jitter, self.jitter)), self._floor())
+            if not result.activity:
+                self._interval = min(max(self._interval * self.backoff, self._floor()), self.max_interval)
+
+        if result.retry_after is not None and result.retry_after > delay:
+            self._stats["throttled"] += 1
+            delay = result.retry_after
+            self._not_before = time.monotonic() + delay
+        return delay
+
+    def error_delay_for(self, errors: int) -> float:
+        """Delay after ``errors`` consecutive failed polls."""
+        return min(self.error_delay * self.backoff ** (errors - 1), self.max_error_delay)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                result = await self._poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._errors += 1
+                self._stats["errors"] += 1
+                delay = self.error_delay_for(self._errors)
+                logger.error(f"[{self.name}] Poll error: {e} (retrying in {delay:.0f}s)")
+            else:
+                self._errors = 0
+                self._stats["polls"] += 1
+                if result is not None:
+                    self._stats["activity"] += result.activity
+                delay = self.next_delay(result)
+
+            self._deadline = time.monotonic() + delay
+            while True:
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+            await asyncio.sleep(0)
+
+
+# ------------------------------------------------------------------
+# Persisted cursors
+# ------------------------------------------------------------------
+
+_cursor_lock = threading.Lock()
+_cursor_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def _cursor_path():
+    from app.external_comms.credentials import _get_credentials_dir
+    return _get_credentials_dir() / CURSOR_FILE
+
+
+def _read_cursors() -> Dict[str, Dict[str, Any]]:
+    global _cursor_cache
+    if _cursor_cache is None:
+        path = _cursor_path()
+        _cursor_cache = {}
+        if path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    _cursor_cache = data
+            except Exception as e:
+                logger.warning(f"Failed to load poll cursors: {e}")
+    return _cursor_cache
+
+
+def _write_cursors(cursors: Dict[str, Dict[str, Any]]) -> None:
+    path = _cursor_path()
+    tmp = path.with_suffix(".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cursors, f, indent=2, default=str)
+        try:
+            os.chmod(tmp, stat.S_IRUSR | stat.S_IWUSR)
+        except OSError:
+            pass  # Best-effort on platforms that don't support chmod
+        os.replace(tmp, path)
+    except Exception as e:
+        logger.error(f"Failed to save poll cursors: {e}")
+
+
+def load_cursor(platform_id: str, resource: str, max_age: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Load the saved cursor for one polled resource.
+
+    Args:
+        platform_id: e.g. "github"
+        resource: What is polled, including the account (e.g. "notifications:octocat").
+        max_age: Ignore cursors saved longer ago than this many seconds.
+
+    Returns:
+        The cursor dict (empty if none is saved or it is too old).
+    """
+    with _cursor_lock:
+        cursor = _read_cursors().get(platform_id, {}).get(resource)
+    if not isinstance(cursor, dict):
+        return {}
+    if max_age is not None and time.time() - cursor.get("saved_at", 0) > max_age:
+        return {}
+    return dict(cursor)
+
+
+def save_cursor(platform_id: str, resource: str, cursor: Dict[str, Any]) -> None:
+    """Save the cursor for one polled resource (skips the write if nothing changed)."""
+    with _cursor_lock:
+        cursors = _read_cursors()
+        current = cursors.get(platform_id, {}).get(resource)
+        if (
+            isinstance(current, dict)
+            and {k: v for k, v in current.items() if k != "saved_at"} == cursor
+            and time.time() - current.get("saved_at", 0) < CURSOR_REFRESH_INTERVAL
+        ):
+            return
+        cursors.setdefault(platform_id, {})[resource] = {**cursor, "saved_at": time.time()}
+        _write_cursors(cursors)
+
+
+def clear_cursors(platform_id: str) -> None:
+    """Forget every saved cursor of a platform."""
+    with _cursor_lock:
+        cursors = _read_cursors()
+        if cursors.pop(platform_id, None) is not None:
+            _write_cursors(cursors)
@@ -0,0 +1,475 @@
+"""
+Persistent GUI helper daemon running inside the desktop container.
+
+Every GUIHandler call used to start fresh ``docker exec`` processes (OS probe,
+``touch .Xauthority``, then ``python3`` with an injected script), paying
+container exec, interpreter start-up and mss/Pillow/pyautogui imports on
+every screenshot and action. GUIDaemon instead keeps one ``docker exec -i``
+stream open to a small Python program in the container that:
+
+- keeps the X connection (mss) and imported libraries warm between calls
+- serves screenshots, actions and OS info over one request channel
+- runs actions in a fresh namespace with their stdout/stderr captured, so
+  action output can never corrupt the protocol
+
+Protocol: one JSON request per line on stdin. Each response is one JSON
+header line on stdout, followed by ``size`` raw bytes (the PNG for
+screenshots).
+
+The daemon is restarted automatically if it dies. Requests that are safe to
+repeat (screenshots, info) are retried once on a fresh daemon; an action
+that was in flight when the daemon died is reported as failed instead of
+being run twice.
+"""
+
+import atexit
+import itertools
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from app.logger import logger
+except ImportError:
+    import logging
+    logger = logging.getLogger("GUIDaemon")
+
+# Set GUI_DAEMON_ENABLED=False to always use one docker exec per call
+GUI_DAEMON_ENABLED = os.getenv("GUI_DAEMON_ENABLED", "True") == "True"
+# Seconds to wait for a freshly started daemon to report ready
+GUI_DAEMON_START_TIMEOUT = 30.0
+# Seconds a screenshot / info request may take
+GUI_DAEMON_CALL_TIMEOUT = 30.0
+# Seconds an action may take before the daemon is considered hung
+GUI_DAEMON_ACTION_TIMEOUT = 300.0
+# After a failed start, wait this long before trying the daemon again
+GUI_DAEMON_RETRY_BACKOFF = 60.0
+
+# X11 environment for the KasmVNC desktop
+GUI_X11_ENV = {"DISPLAY": ":1", "XAUTHORITY": "/config/.Xauthority"}
+
+# Program run by the container's python3. Stdlib only at start-up; mss and
+# Pillow are imported on the first screenshot.
+_DAEMON_SOURCE = r'''
+import importlib
+import inspect
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import traceback
+
+os.environ.setdefault("DISPLAY", ":1")
+os.environ.setdefault("XAUTHORITY", "/config/.Xauthority")
+try:
+    open(os.environ["XAUTHORITY"], "a").close()
+except OSError:
+    pass
+
+# Private copies of the protocol pipes; fd 0/1/2 belong to the actions.
+_rpc_in = os.fdopen(os.dup(0), "rb")
+_rpc_out = os.fdopen(os.dup(1), "wb")
+_devnull = os.open(os.devnull, os.O_RDWR)
+_capture = tempfile.TemporaryFile()
+os.dup2(_devnull, 0)
+os.dup2(_devnull, 1)
+os.dup2(_devnull, 2)
+
+_OUTPUT_TAIL_BYTES = 16384
+
+
+class _MissingPackage(Exception):
+    pass
+
+
+def _reply(msg_id, result=None, error=None, code=None, blob=b""):
+    msg = {"id": msg_id, "size": len(blob)}
+    if error is not None:
+        msg["error"] = {"message": error, "code": code}
+    else:
+        msg["result"] = result
+    _rpc_out.write(json.dumps(msg).encode("utf-8") + b"\n")
+    if blob:
+        _rpc_out.write(blob)
+    _rpc_out.flush()
+
+
+def _info():
+    os_type = "windows" if sys.platform.startswith("win") else "linux" if sys.platform.startswith("linux") else sys.platform
+    return {"os": os_type, "platform": platform.platform(), "python": platform.python_version(), "pid": os.getpid()}
+
+
+_sct = None
+
+
+def _screenshot():
+    global _sct
+    try:
+        import mss
+        from PIL import Image
+    except ImportError:
+        raise _MissingPackage()
+    if _sct is None:
+        _sct = mss.mss()
+    try:
+        # Monitor 0 is the entire virtual desktop
+        shot = _sct.grab(_sct.monitors[0])
+    except Exception:
+        # Display restarted under us: reconnect once
+        try:
+            _sct.close()
+        except Exception:
+            pass
+        _sct = mss.mss()
+        shot = _sct.grab(_sct.monitors[0])
+    img = Image.frombytes("RGB", shot.size, shot.rgb)
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _run_action(action_code, input_data):
+    """Mirror of GUIHandler's one-shot action wrapper; returns (result, returncode)."""
+    local_ns = {"input_data": input_data, "json": json, "inspect": inspect, "sys": sys, "os": os, "traceback": traceback}
+    pre_exec_keys = set(local_ns.keys())
+    try:
+        exec(action_code, local_ns)
+
+        function_to_call = None
+        for key, value in local_ns.items():
+            if key not in pre_exec_keys and key != "__builtins__" and inspect.isfunction(value) and value.__module__ == local_ns.get("__name__", None):
+                function_to_call = value
+                break
+
+        if function_to_call is None:
+            return {"status": "error", "message": "No function definition found in action code."}, 1
+
+        result_dict = function_to_call(input_data)
+        if not isinstance(result_dict, dict):
+            result_dict = {"status": "success", "stdout": str(result_dict), "stderr": "", "note": "Action did not return a dict, wrapped output."}
+        json.dumps(result_dict)
+        return result_dict, 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 1
+        return {"status": "error", "message": "Action exited with code %s" % code}, code
+    except BaseException as e:
+        tb = traceback.format_exc()
+        return {"status": "error", "message": "Execution error: %r" % str(e), "stderr": tb}, 1
+
+
+def _capture_and_run(action_code, input_data):
+    _capture.seek(0)
+    _capture.truncate()
+    os.dup2(_capture.fileno(), 1)
+    os.dup2(_capture.fileno(), 2)
+    try:
+        return _run_action(action_code, input_data)
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+        os.dup2(_devnull, 1)
+        os.dup2(_devnull, 2)
+
+
+def _captured_output():
+    size = _capture.seek(0, 2)
+    _capture.seek(max(0, size - _OUTPUT_TAIL_BYTES))
+    return _capture.read().decode("utf-8", "replace")
+
+
+_reply(None, dict(_info(), ready=True))
+for line in _rpc_in:
+    if not line.strip():
+        continue
+    try:
+        request = json.loads(line.decode("utf-8"))
+    except ValueError:
+        continue
+    msg_id = request.get("id")
+    method = request.get("method")
+    params = request.get("params") or {}
+    try:
+        if method == "screenshot":
+            importlib.invalidate_caches()
+            _reply(msg_id, {"format": "png"}, blob=_screenshot())
+        elif method == "action":
+            importlib.invalidate_caches()
+            result, returncode = _capture_and_run(params["code"], params.get("input_data"))
+            _reply(msg_id, {"result": result, "returncode": returncode, "output": _captured_output()})
+        elif method == "info":
+            _reply(msg_id, _info())
+        elif method == "ping":
+            _reply(msg_id, {"pong": True})
+        else:
+            _reply(msg_id, error="unknown method %r" % method, code="unknown_method")
+    except _MissingPackage:
+        _reply(msg_id, error="missing package", code="missing_package")
+    except BaseException as e:
+        _reply(msg_id, error=repr(e))
+'''
+
+
+class GUIDaemonError(RuntimeError):
+    """A daemon request failed. ``code`` is set for errors reported by the daemon."""
+
+    def __init__(self, message: str, code: Optional[str] = None):
+        super().__init__(message)
+        self.code = code
+
+
+class GUIDaemonUnavailable(GUIDaemonError):
+    """The daemon could not be (re)started; the request was never sent."""
+
+
+class GUIDaemon:
+    """
+    Client for one in-container daemon. Thread-safe; requests are serialized,
+    as GUI input is anyway.
+    """
+
+    def __init__(self, container_id: str):
+        self.container_id = container_id
+        self.info: Dict[str, Any] = {}
+        self.restarts = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Optional[Tuple[dict, bytes]]]" = queue.Queue()
+        self._start()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = GUI_DAEMON_CALL_TIMEOUT,
+        retry: bool = True,
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """
+        Send one request and wait for its response.
+
+        Args:
+            method: "screenshot", "action", "info" or "ping".
+            params: Request parameters.
+            timeout: Seconds to wait for the response. On timeout the daemon
+                is killed (and restarted by the next call).
+            retry: Whether the request may be resent to a fresh daemon if this
+                one dies before answering. Must be False for actions.
+
+        Returns:
+            (result dict, attached bytes)
+
+        Raises:
+            GUIDaemonUnavailable: The daemon could not be started.
+            GUIDaemonError: The request failed or the daemon died mid-request.
+        """
+        with self._lock:
+            attempts = 2 if retry else 1
+            for attempt in range(attempts):
+                if not self.alive:
+                    self._restart()
+
+                request = {"id": next(self._ids), "method": method, "params": params or {}}
+                self._send(request)
+
+                try:
+                    header, blob = self._next_response(timeout)
+                except queue.Empty:
+                    self._kill()
+                    raise GUIDaemonError(f"GUI daemon did not answer '{method}' within {timeout:.0f}s")
+                if header is None:
+                    self._kill()
+                    if attempt + 1 < attempts:
+                        logger.warning(f"[GUIDaemon] Daemon died during '{method}'; retrying on a fresh one")
+                        continue
+                    raise GUIDaemonError(f"GUI daemon exited during '{method}'")
+
+                if header.get("error"):
+                    error = header["error"]
+                    raise GUIDaemonError(error.get("message", "unknown error"), error.get("code"))
+                return header.get("result") or {}, blob
+
+            raise GUIDaemonError(f"GUI daemon exited during '{method}'")
+
+    def _send(self, request: dict) -> None:
+        data = json.dumps(request).encode("utf-8") + b"\n"
+        for attempt in range(2):
+            try:
+                self._proc.stdin.write(data)
+                self._proc.stdin.flush()
+                return
+            except (BrokenPipeError, OSError, ValueError):
+                # Died between calls: nothing was executed, safe to resend
+                if attempt:
+                    break
+                self._restart()
+        self._kill()
+        raise GUIDaemonUnavailable(f"GUI daemon in '{self.container_id}' is not accepting requests")
+
+    def close(self) -> None:
+        with self._lock:
+            self._kill()
+
+    # ─────────────────────── Process management ─────────────────────────
+
+    def _start(self) -> None:
+        cmd = ["docker", "exec", "-i"]
+        for key, value in GUI_X11_ENV.items():
+            cmd += ["-e", f"{key}={value}"]
+        cmd += [self.container_id, "python3", "-u", "-c", _DAEMON_SOURCE]
+
+        self._responses = queue.Queue()
+        try:
+            self._proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            raise GUIDaemonUnavailable("The 'docker' command was not found on the host system.")
+
+        threading.Thread(
+            target=self._read_responses,
+            args=(self._proc, self._responses),
+            name=f"gui_daemon_reader:{self.container_id}",
+            daemon=True,
+        ).start()
+
+        try:
+            ready, _ = self._next_response(GUI_DAEMON_START_TIMEOUT)
+        except queue.Empty:
+            ready = None
+        if not ready or not (ready.get("result") or {}).get("ready"):
+            stderr = self._kill()
+            raise GUIDaemonUnavailable(f"GUI daemon failed to start in '{self.container_id}': {stderr}".strip())
+
+        self.info = ready["result"]
+        logger.debug(f"[GUIDaemon] Started in '{self.container_id}' (pid {self.info.get('pid')})")
+
+    def _restart(self) -> None:
+        self._kill()
+        self.restarts += 1
+        logger.info(f"[GUIDaemon] Restarting daemon in '{self.container_id}'")
+        self._start()
+
+    def _kill(self) -> str:
+        """Stop the docker exec client; returns whatever it wrote to stderr."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return ""
+        stderr = b""
+        try:
+            # Closing stdin makes the in-container daemon exit once idle
+            proc.stdin.close()
+        except Exception:
+            pass
+        try:
+            if proc.poll() is None:
+                proc.kill()
+            _, stderr = proc.communicate(timeout=5)
+        except Exception:
+            pass
+        return (stderr or b"").decode(errors="replace").strip()
+
+    def _next_response(self, timeout: float) -> Tuple[Optional[dict], bytes]:
+        item = self._responses.get(timeout=timeout)
+        if item is None:
+            return None, b""
+        return item
+
+    @staticmethod
+    def _read_responses(proc: subprocess.Popen, responses: "queue.Queue") -> None:
+        try:
+            while True:
+                line = proc.stdout.readline()
+                if not line:
+                    break
+                try:
+                    header = json.loads(line)
+                except ValueError:
+                    continue
+                size = header.get("size") or 0
+                blob = proc.stdout.read(size) if size else b""
+                if len(blob) < size:
+                    break
+                responses.put((header, blob))
+        except (OSError, ValueError):
+            pass
+        # EOF: the daemon exited
+        responses.put(None)
+
+
+# ─────────────────────── Registry ─────────────────────────
+
+_daemons: Dict[str, GUIDaemon] = {}
+_start_failures: Dict[str, float] = {}
+_registry_lock = threading.Lock()
+
+
+def get_gui_daemon(container_id: str) -> Optional[GUIDaemon]:
+    """
+    Get (starting if needed) the daemon for ``container_id``.
+
+    Returns None if the daemon is disabled or failed to start recently, in
+    which case callers fall back to one ``docker exec`` per call.
+    """
+    if not GUI_DAEMON_ENABLED:
+        return None
+    with _registry_lock:
+        daemon = _daemons.get(container_id)
+        if daemon is not None:
+            return daemon
+        failed_at = _start_failures.get(container_id)
+        if failed_at is not None and time.monotonic() - failed_at < GUI_DAEMON_RETRY_BACKOFF:
+            return None
+        try:
+            daemon = GUIDaemon(container_id)
+        except GUIDaemonError as e:
+            logger.warning(f"[GUIDaemon] {e}; using one docker exec per call")
+            _start_failures[container_id] = time.monotonic()
+            return None
+        _start_failures.pop(container_id, None)
+        _daemons[container_id] = daemon
+        return daemon
+
+
+def discard_gui_daemon(container_id: str) -> None:
+    """Stop and forget the daemon for ``container_id`` (it is started again on next use)."""
+    with _registry_lock:
+        daemon = _daemons.pop(container_id, None)
+    if daemon is not None:
+        daemon.close()
+
+
+def shutdown_gui_daemons() -> None:
+    with _registry_lock:
+        daemons = list(_daemons.values())
+        _daemons.clear()
+    for daemon in daemons:
+        daemon.close()
+
+
+def _reset_after_fork() -> None:
+    # A forked worker (ProcessPoolExecutor) must not share the parent's pipes
+    global _registry_lock
+    _registry_lock = threading.Lock()
+    _daemons.clear()
+    _start_failures.clear()
+
+
+atexit.register(shutdown_gui_daemons)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -1,10 +1,10 @@
 
 from __future__ import annotations
+import asyncio
 import json
 import ast
 import tempfile
 import os
-import hashlib
 from gradio_client import Client, file
 from typing import Dict, Optional, List, Tuple, Any
 from agent_core import Action
@@ -12,6 +12,16 @@ from app.state.agent_state import STATE
 from app.state.types import ReasoningResult
 from agent_core import TodoItem
 from app.gui.handler import GUIHandler
+from app.gui.screen_cache import (
+    DEFAULT_CELL_THRESHOLD,
+    DEFAULT_HASH_DISTANCE,
+    HIT,
+    REGION,
+    FrameSignature,
+    ScreenshotCache,
+    compute_signature,
+    crop_region,
+)
 from app.prompt import GUI_REASONING_PROMPT, GUI_QUERY_FOCUSED_PROMPT, GUI_PIXEL_POSITION_PROMPT, GUI_REASONING_PROMPT_OMNIPARSER
 from app.vlm_interface import VLMInterface
 from agent_core import ActionManager, ActionLibrary, ActionRouter
@@ -116,18 +126,22 @@ class GUIModule:
         self._coordinate_tolerance = 30  # Pixels within which coordinates are considered "same"
 
         # ==================================
-        #  OMNIPARSER CACHE
+        #  SCREENSHOT CACHE (VLM / OmniParser results)
         # ==================================
-        self._omniparser_cache: Dict[str, Any] = {
-            "screenshot_hash": None,
-            "image_description_list": None,
-            "annotated_image_bytes": None
-        }
+        self._screen_cache = ScreenshotCache(
+            hash_distance=gui_settings.get("screen_cache_hash_distance", DEFAULT_HASH_DISTANCE),
+            cell_threshold=gui_settings.get("screen_cache_cell_threshold", DEFAULT_CELL_THRESHOLD),
+            enabled=gui_settings.get("screen_cache", True),
+        )
 
     def set_tui_footage_callback(self, callback) -> None:
         """Set the TUI footage callback for screen display."""
         self._tui_footage_callback = callback
 
+    def get_screen_cache_stats(self) -> Dict[str, Any]:
+        """Hit rate and VLM tokens saved by the screenshot cache."""
+        return self._screen_cache.stats()
+
     def switch_to_gui_mode(self) -> None:
         STATE.update_gui_mode(True)
 
@@ -374,10 +388,12 @@ class GUIModule:
         """
         Perform the VLM flow.
         """
+        signature: FrameSignature = await asyncio.to_thread(compute_signature, png_bytes)
+
         # ==================================
         # 1. Get Image Description
         # ==================================
-        image_description: str = await self._get_image_description_vlm(png_bytes=png_bytes, query=query)
+        image_description: str = await self._describe_screen_cached(png_bytes, signature, query)
 
         # ==================================
         # 2. Perform Reasoning
@@ -388,7 +404,7 @@ class GUIModule:
         # ==================================
         # 3. Get Pixel Position
         # ==================================
-        pixel_position: List[int] = await self._get_pixel_position_vlm(image_bytes=png_bytes, element_to_find=action_query)
+        pixel_position: List[int] = await self._locate_element_cached(png_bytes, signature, action_query)
 
         # ==================================
         # 4. Construct Action Search Query
@@ -404,25 +420,19 @@ class GUIModule:
         # ==================================
         # 1. OmniParser Image Analysis
         # ==================================
-        # Check OmniParser cache - reuse if screenshot unchanged
-        current_hash = hashlib.md5(png_bytes).hexdigest()
-        if current_hash == self._omniparser_cache["screenshot_hash"]:
+        # Check OmniParser cache - reuse if screenshot effectively unchanged
+        signature: FrameSignature = await asyncio.to_thread(compute_signature, png_bytes)
+        outcome, entry, _ = self._screen_cache.lookup("omniparser", "", signature)
+        if outcome == HIT:
             # Cache hit - reuse previous results
-            image_description_list = self._omniparser_cache["image_description_list"]
-            annotated_image_bytes = self._omniparser_cache["annotated_image_bytes"]
+            image_description_list, annotated_image_bytes = entry.value
             logger.info("[GUI] Using cached OmniParser results (screenshot unchanged)")
         else:
             # Cache miss - call OmniParser and update cache
             image_description_list, annotated_image_bytes = await self._get_image_description_omniparser(png_bytes)
-            self._omniparser_cache = {
-                "screenshot_hash": current_hash,
-                "image_description_list": image_description_list,
-                "annotated_image_bytes": annotated_image_bytes
-            }
+            self._screen_cache.store("omniparser", "", signature, (image_description_list, annotated_image_bytes))
             logger.debug("[GUI] OmniParser cache updated with new screenshot")
 
-        image_description_list, annotated_image_bytes = await self._get_image_description_omniparser(png_bytes)
-
         # ==================================
         # 2. Reasoning
         # ==================================
@@ -451,6 +461,62 @@ class GUIModule:
     # VLM Helper Methods
     # ==================================
 
+    async def _describe_screen_cached(self, png_bytes: bytes, signature: FrameSignature, query: str) -> str:
+        """
+        Image description through the screenshot cache.
+
+        Reuses the previous description when the screen is effectively
+        unchanged; when only a small region changed, describes just that crop
+        and appends it to the previous description.
+        """
+        outcome, entry, region = self._screen_cache.lookup("description", query, signature, allow_region=True)
+        if outcome == HIT:
+            logger.info("[GUI] Reusing cached image description (screen unchanged)")
+            return entry.value
+
+        tokens_before = self._get_vlm_token_count()
+        if outcome == REGION:
+            logger.info(f"[GUI] Screen changed only in region {list(region)}; describing that crop")
+            crop_bytes = await asyncio.to_thread(crop_region, png_bytes, region)
+            region_description = await self._get_image_description_vlm(png_bytes=crop_bytes, query=query)
+            image_description = (
+                f"{entry.value}\n\n"
+                f"### Update\nSince the description above, the screen changed only within the region "
+                f"[x_min, y_min, x_max, y_max] = {list(region)} (screen pixels). Where they conflict, "
+                f"this description of that region supersedes the one above:\n{region_description}"
+            )
+            self._screen_cache.store(
+                "description", query, signature, image_description,
+                tokens=self._get_vlm_token_count() - tokens_before, region_update=True,
+            )
+            return image_description
+
+        image_description = await self._get_image_description_vlm(png_bytes=png_bytes, query=query)
+        self._screen_cache.store(
+            "description", query, signature, image_description,
+            tokens=self._get_vlm_token_count() - tokens_before,
+        )
+        return image_description
+
+    async def _locate_element_cached(self, png_bytes: bytes, signature: FrameSignature, element_to_find: str) -> List[Dict]:
+        """Pixel position through the screenshot cache (reused only for an unchanged screen)."""
+        outcome, entry, _ = self._screen_cache.lookup("pixel_position", element_to_find, signature)
+        if outcome == HIT:
+            logger.info("[GUI] Reusing cached element position (screen unchanged)")
+            return entry.value
+
+        tokens_before = self._get_vlm_token_count()
+        pixel_position = await self._get_pixel_position_vlm(image_bytes=png_bytes, element_to_find=element_to_find)
+        self._screen_cache.store(
+            "pixel_position", element_to_find, signature, pixel_position,
+            tokens=self._get_vlm_token_count() - tokens_before,
+        )
+        return pixel_position
+
+    @staticmethod
+    def _get_vlm_token_count() -> int:
+        return STATE.get_agent_property("token_count", 0) or 0
+
     @profile("gui_get_image_description_vlm", OperationCategory.LLM)
     async def _get_image_description_vlm(self, png_bytes: bytes, query: str) -> str:
         """
@@ -536,7 +602,7 @@ class GUIModule:
         """
         Get the pixel position of the element in the image.
         """
-        prompt = GUI_PIXEL_POSITION_PROMPT.format(element_to_find=element_to_find)
+        prompt = GUI_PIXEL_POSITION_PROMPT.format(element_index_to_find=element_to_find)
         system_prompt, _ = self.context_engine.make_prompt(
             user_flags={"query": False, "expected_output": False},
             system_flags={
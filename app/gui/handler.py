@@ -8,6 +8,12 @@ if TYPE_CHECKING:
     from app.gui.gui_module import GUIModule
     
 from app.state.agent_state import STATE
+from app.gui.daemon import (
+    GUI_DAEMON_ACTION_TIMEOUT,
+    GUIDaemonError,
+    GUIDaemonUnavailable,
+    get_gui_daemon,
+)
 
 # Adjust import path as needed for your project structure
 try:
@@ -38,6 +44,9 @@ class GUIHandler:
     # PNG file signature (first 4 bytes of a PNG file)
     _PNG_SIGNATURE = b'\x89PNG'
 
+    # Detected OS per container (a container's OS does not change)
+    _os_cache: Dict[str, str] = {}
+
     # --- Linux Screenshot Payload (Python) ---
     _LINUX_SCREENSHOT_PAYLOAD = """
 import sys, io, os
@@ -135,7 +144,12 @@ try {
             }
 
         os_type = cls._detect_os(container_id)
-        
+
+        if os_type == "linux":
+            result = cls._execute_action_via_daemon(container_id, action_code, input_data)
+            if result is not None:
+                return result
+
         # We wrap the raw action code in a script that handles data injection,
         # execution, and JSON serialization of results.
         wrapper_script = cls._generate_python_action_wrapper(action_code, input_data)
@@ -179,6 +193,10 @@ try {
     @classmethod
     def _get_linux_screen_with_auto_install(cls, container_id: str) -> bytes:
         """Handles Linux capture lifecycle, including auto-installing Pillow."""
+        img_bytes = cls._get_linux_screen_via_daemon(container_id)
+        if img_bytes is not None:
+            return img_bytes
+
         logger.debug("[GUIHandler] Attempting Linux capture...")
         x11_env = {"DISPLAY": ":1", "XAUTHORITY": "/config/.Xauthority"}
         # Ensure .Xauthority exists
@@ -216,6 +234,62 @@ try {
         )
         return cls._validate_screenshot_output(stdout, stderr, code)
 
+    # ==========================
+    # Persistent Daemon (Linux)
+    # ==========================
+
+    @classmethod
+    def _get_linux_screen_via_daemon(cls, container_id: str) -> Optional[bytes]:
+        """Captures through the in-container daemon. Returns None to fall back to docker exec."""
+        daemon = get_gui_daemon(container_id)
+        if daemon is None:
+            return None
+        try:
+            try:
+                _, img_bytes = daemon.call("screenshot")
+            except GUIDaemonError as e:
+                if e.code != "missing_package":
+                    raise
+                logger.debug(f"[GUIHandler] Missing package(s): '{cls._LINUX_REQUIRED_PKG}'. Installing...")
+                cls._install_linux_package(container_id, cls._LINUX_REQUIRED_PKG)
+                _, img_bytes = daemon.call("screenshot")
+        except GUIDaemonError as e:
+            logger.warning(f"[GUIHandler] Daemon screenshot failed ({e}); falling back to docker exec")
+            return None
+        return cls._validate_screenshot_output(img_bytes, b"", 0)
+
+    @classmethod
+    def _execute_action_via_daemon(cls, container_id: str, action_code: str, input_data: dict) -> Optional[Dict[str, Any]]:
+        """
+        Runs an action in the in-container daemon.
+
+        Returns None (fall back to docker exec) only when the action was
+        never sent; an action that failed mid-flight is reported, not re-run.
+        """
+        daemon = get_gui_daemon(container_id)
+        if daemon is None:
+            return None
+        try:
+            params = {"code": action_code, "input_data": json.loads(json.dumps(input_data))}
+        except (TypeError, ValueError):
+            # Not JSON-serializable; the exec wrapper passes it via repr()
+            return None
+
+        logger.debug(f"[GUIHandler] Running action via daemon in '{container_id}'...")
+        try:
+            reply, _ = daemon.call("action", params, timeout=GUI_DAEMON_ACTION_TIMEOUT, retry=False)
+        except GUIDaemonUnavailable as e:
+            logger.warning(f"[GUIHandler] GUI daemon unavailable ({e}); falling back to docker exec")
+            return None
+        except GUIDaemonError as e:
+            return {"status": "error", "message": f"GUI daemon failed: {e}", "returncode": -1}
+
+        return cls._validate_action_output(
+            json.dumps(reply.get("result") or {}).encode("utf-8"),
+            (reply.get("output") or "").encode("utf-8"),
+            reply.get("returncode", 0),
+        )
+
     # ==========================
     # Internal Helpers & Validators
     # ==========================
@@ -396,14 +470,22 @@ except Exception as e:
 
     @classmethod
     def _detect_os(cls, container_id: str) -> str:
-        """Probes container to guess OS type."""
+        """Probes container to guess OS type (cached per container)."""
+        cached = cls._os_cache.get(container_id)
+        if cached:
+            return cached
+
         # Try Linux
         _, _, code_linux = cls._run_docker_exec(container_id, ["/bin/sh", "-c", "uname"])
-        if code_linux == 0: return "linux"
+        if code_linux == 0:
+            cls._os_cache[container_id] = "linux"
+            return "linux"
         
         # Try Windows
         _, _, code_win = cls._run_docker_exec(container_id, ["cmd.exe", "/c", "ver"])
-        if code_win == 0: return "windows"
+        if code_win == 0:
+            cls._os_cache[container_id] = "windows"
+            return "windows"
         
         # Fallback/Testing assumption (Remove in production if detection is robust)
         logger.warning(f"Could not detect OS for {container_id}, defaulting to Linux based on previous examples.")
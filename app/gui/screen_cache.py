@@ -0,0 +1,232 @@
+"""
+Perceptual screenshot cache for the GUI loop's VLM calls.
+
+Consecutive GUI steps often look at the same screen (a wait, a failed click,
+a hover). Each screenshot gets a FrameSignature:
+
+- a 64-bit difference hash (dHash), used as a cheap "could be the same" test
+- a small grayscale thumbnail, compared cell by cell to confirm the frames
+  are effectively identical and, if not, to locate the changed region
+
+ScreenshotCache remembers the last VLM result per (kind, prompt key) together
+with the signature of the frame it was computed from. A lookup reports one of:
+
+- HIT: the frame is effectively identical; reuse the cached result
+- REGION: only a small part of the screen changed; the caller may send just
+  that crop to the VLM and merge the result
+- MISS: call the VLM on the full frame
+
+Without Pillow, signatures fall back to an exact digest: identical frames
+still hit, but nothing is cropped.
+"""
+
+import hashlib
+import io
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from agent_core import profiler, OperationCategory
+
+try:
+    from app.logger import logger
+except ImportError:
+    import logging
+    logger = logging.getLogger("ScreenshotCache")
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Max dHash bits that may differ for two frames to be compared further
+DEFAULT_HASH_DISTANCE = 6
+# A thumbnail cell whose mean luminance moved more than this (0-255) has changed
+DEFAULT_CELL_THRESHOLD = 4
+# Thumbnail resolution; each cell covers ~30x17 px of a 1920x1080 screen
+THUMB_SIZE = 64
+# Crop to the changed region only if it covers at most this fraction of the frame
+DEFAULT_MAX_REGION_FRACTION = 0.35
+# Partial updates merged into one entry before a full refresh is forced
+DEFAULT_MAX_REGION_UPDATES = 2
+
+HIT = "hit"
+REGION = "region"
+MISS = "miss"
+
+
+@dataclass(frozen=True)
+class FrameSignature:
+    digest: bytes
+    size: Tuple[int, int] = (0, 0)
+    dhash: Optional[int] = None
+    thumb: Optional[bytes] = None
+
+
+@dataclass
+class CacheEntry:
+    signature: FrameSignature
+    value: Any
+    tokens: int = 0
+    region_updates: int = 0
+
+
+def compute_signature(png_bytes: bytes) -> FrameSignature:
+    """Decode a screenshot and compute its signature (CPU-bound; run off the event loop)."""
+    digest = hashlib.blake2b(png_bytes, digest_size=16).digest()
+    if Image is None:
+        return FrameSignature(digest)
+    try:
+        with Image.open(io.BytesIO(png_bytes)) as image:
+            size = image.size
+            gray = image.convert("L")
+        thumb = gray.resize((THUMB_SIZE, THUMB_SIZE), Image.BOX)
+        small = thumb.resize((9, 8), Image.BOX).tobytes()
+        dhash = 0
+        for row in range(8):
+            for col in range(8):
+                dhash = (dhash << 1) | (small[row * 9 + col] > small[row * 9 + col + 1])
+        return FrameSignature(digest, size, dhash, thumb.tobytes())
+    except Exception as e:
+        logger.debug(f"[ScreenshotCache] Could not decode screenshot, using exact digest: {e}")
+        return FrameSignature(digest)
+
+
+def changed_cells(
+    previous: FrameSignature, current: FrameSignature, cell_threshold: int
+) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Bounding box, in thumbnail cells (x0, y0, x1, y1 exclusive), of the cells
+    that changed. Returns None if no cell changed.
+    """
+    x0, y0, x1, y1 = THUMB_SIZE, THUMB_SIZE, -1, -1
+    prev, cur = previous.thumb, current.thumb
+    for i in range(THUMB_SIZE * THUMB_SIZE):
+        if abs(prev[i] - cur[i]) > cell_threshold:
+            y, x = divmod(i, THUMB_SIZE)
+            x0, y0 = min(x0, x), min(y0, y)
+            x1, y1 = max(x1, x), max(y1, y)
+    if x1 < 0:
+        return None
+    return x0, y0, x1 + 1, y1 + 1
+
+
+def crop_region(png_bytes: bytes, region: Tuple[int, int, int, int]) -> bytes:
+    """Crop a screenshot to ``region`` (pixels) and re-encode it as PNG."""
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        out = io.BytesIO()
+        image.crop(region).save(out, format="PNG")
+    return out.getvalue()
+
+
+class ScreenshotCache:
+    """Last VLM result per (kind, key), reused while the screen is unchanged."""
+
+    def __init__(
+        self,
+        hash_distance: int = DEFAULT_HASH_DISTANCE,
+        cell_threshold: int = DEFAULT_CELL_THRESHOLD,
+        max_region_fraction: float = DEFAULT_MAX_REGION_FRACTION,
+        max_region_updates: int = DEFAULT_MAX_REGION_UPDATES,
+        enabled: bool = True,
+    ):
+        self.hash_distance = hash_distance
+        self.cell_threshold = cell_threshold
+        self.max_region_fraction = max_region_fraction
+        self.max_region_updates = max_region_updates
+        self.enabled = enabled
+        self._entries: Dict[Tuple[str, str], CacheEntry] = {}
+        self._stats = {HIT: 0, REGION: 0, MISS: 0, "saved_tokens": 0}
+
+    def lookup(
+        self, kind: str, key: str, signature: FrameSignature, allow_region: bool = False
+    ) -> Tuple[str, Optional[CacheEntry], Optional[Tuple[int, int, int, int]]]:
+        """
+        Compare ``signature`` with the frame the cached result was computed from.
+
+        Returns:
+            (HIT | REGION | MISS, cached entry or None, changed region in pixels
+            as (left, top, right, bottom) for REGION)
+        """
+        start = time.perf_counter()
+        entry = self._entries.get((kind, key)) if self.enabled else None
+        outcome, region = MISS, None
+        if entry is not None:
+            outcome, region = self._compare(entry, signature, allow_region)
+        if outcome == HIT:
+            self._stats["saved_tokens"] += entry.tokens
+
+        self._stats[outcome] += 1
+        profiler.record(
+            "gui_screen_cache_lookup",
+            (time.perf_counter() - start) * 1000,
+            OperationCategory.LLM,
+            {"kind": kind, "result": outcome, "saved_tokens": entry.tokens if outcome == HIT else 0},
+        )
+        return outcome, (entry if outcome != MISS else None), region
+
+    def store(
+        self, kind: str, key: str, signature: FrameSignature, value: Any,
+        tokens: int = 0, region_update: bool = False,
+    ) -> None:
+        """Remember ``value`` as the result for ``signature``."""
+        if not self.enabled:
+            return
+        previous = self._entries.get((kind, key))
+        if region_update and previous is not None:
+            # Saved: what a full call would have cost, minus what the crop cost
+            saved = max(0, previous.tokens - tokens)
+            self._stats["saved_tokens"] += saved
+            profiler.record(
+                "gui_screen_cache_region", 0.0, OperationCategory.LLM,
+                {"kind": kind, "saved_tokens": saved},
+            )
+            self._entries[(kind, key)] = CacheEntry(
+                signature, value, previous.tokens, previous.region_updates + 1
+            )
+        else:
+            self._entries[(kind, key)] = CacheEntry(signature, value, tokens)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._stats[HIT] + self._stats[REGION] + self._stats[MISS]
+        return {
+            "hits": self._stats[HIT],
+            "region_hits": self._stats[REGION],
+            "misses": self._stats[MISS],
+            "hit_rate": round(self._stats[HIT] / lookups, 3) if lookups else 0.0,
+            "saved_tokens": self._stats["saved_tokens"],
+        }
+
+    def _compare(
+        self, entry: CacheEntry, signature: FrameSignature, allow_region: bool
+    ) -> Tuple[str, Optional[Tuple[int, int, int, int]]]:
+        cached = entry.signature
+        if cached.digest == signature.digest:
+            return HIT, None
+        if cached.thumb is None or signature.thumb is None or cached.size != signature.size:
+            return MISS, None
+
+        if bin(cached.dhash ^ signature.dhash).count("1") > self.hash_distance:
+            return MISS, None
+        cells = changed_cells(cached, signature, self.cell_threshold)
+        if cells is None:
+            return HIT, None
+
+        if not allow_region or entry.region_updates >= self.max_region_updates:
+            return MISS, None
+        x0, y0, x1, y1 = cells
+        if (x1 - x0) * (y1 - y0) > self.max_region_fraction * THUMB_SIZE * THUMB_SIZE:
+            return MISS, None
+
+        # Cells -> pixels, padded by one cell so the crop has some context
+        width, height = signature.size
+        region = (
+            max(0, (x0 - 1) * width // THUMB_SIZE),
+            max(0, (y0 - 1) * height // THUMB_SIZE),
+            min(width, -(-(x1 + 1) * width // THUMB_SIZE)),
+            min(height, -(-(y1 + 1) * height // THUMB_SIZE)),
+        )
+        return REGION, region
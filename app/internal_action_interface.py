@@ -598,8 +598,10 @@ class InternalActionInterface:
             from app.skill import skill_manager
             from app.prompt import SKILL_SELECTION_PROMPT
 
-            # Get available skills
-            available_skills = skill_manager.list_skills_for_selection()
+            # Get available skills (prefiltered to the most relevant for this task)
+            available_skills = skill_manager.list_skills_for_selection(
+                query=f"{task_name}\n{task_description}"
+            )
 
             if not available_skills:
                 logger.debug("[SKILLS] No skills available for selection")
@@ -714,7 +716,8 @@ class InternalActionInterface:
             skill_action_sets_map = {}
             try:
                 from app.skill import skill_manager
-                for skill in skill_manager.get_enabled_skills():
+                # Only offer the skills most relevant to this task
+                for skill in skill_manager.prefilter_skills(f"{task_name}\n{task_description}"):
                     # Include action set recommendations in skill description
                     desc = skill.description
                     if skill.metadata.action_sets:
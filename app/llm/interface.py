@@ -3,13 +3,15 @@
 LLM interface for CraftBot.
 
 Re-exports LLMInterface from agent_core with CraftBot-specific hooks
-for state access (using STATE singleton) and usage reporting.
+for state access (using STATE singleton), usage reporting and Slow Mode
+rate limiting.
 """
 
 from typing import Any, Dict, Optional
 
 from agent_core.core.impl.llm import LLMInterface as _LLMInterface
 from agent_core.core.hooks.types import UsageEventData
+from app.rate_limiter import acquire_llm_call, acquire_llm_call_sync
 from app.state.agent_state import STATE
 
 
@@ -33,7 +35,7 @@ class LLMInterface(_LLMInterface):
     """LLMInterface configured for CraftBot's STATE singleton.
 
     Automatically injects the get_token_count and set_token_count hooks
-    that use CraftBot's global STATE object.
+    that use CraftBot's global STATE object, and the Slow Mode rate limiter.
     """
 
     def __init__(
@@ -58,4 +60,6 @@ class LLMInterface(_LLMInterface):
             get_token_count=_get_token_count,
             set_token_count=_set_token_count,
             report_usage=_report_usage,  # Report usage to local SQLite storage
+            acquire_rate_limit=acquire_llm_call_sync,  # Slow Mode (no-op when off)
+            acquire_rate_limit_async=acquire_llm_call,
         )
@@ -911,6 +911,22 @@ class LLMInterface:
             return False
 
     # ───────────────────────────  Public helpers  ────────────────────────────
+    def _acquire_rate_limit(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        session_id: Optional[str] = None,
+    ):
+        """Wait for the Slow Mode rate limiter; returns a settle callback or None when off."""
+        from agent_core import RateLimitRequest
+        from agent_core.core.impl.llm import current_llm_call_context
+        from app.rate_limiter import acquire_llm_call_sync
+
+        priority, context_session = current_llm_call_context()
+        return acquire_llm_call_sync(
+            RateLimitRequest(system_prompt, user_prompt, priority.value, session_id or context_session)
+        )
+
     def _generate_response_sync(
         self,
         system_prompt: Optional[str] = None,
@@ -924,37 +940,31 @@ class LLMInterface:
         if log_response:
             logger.info(f"[LLM SEND] system={system_prompt} | user={user_prompt}")
 
-        # Slow mode: throttle before making the API call
-        from app.config import is_slow_mode_enabled
-        _slow_mode_active = is_slow_mode_enabled()
-        if _slow_mode_active:
-            from agent_core.utils.token import count_tokens
-            from app.rate_limiter import get_rate_limiter
-            estimated = count_tokens(system_prompt or "") + count_tokens(user_prompt)
-            get_rate_limiter().wait_if_needed(estimated)
-
-        if self.provider == "openai":
-            response = self._generate_openai(system_prompt, user_prompt)
-        elif self.provider == "remote":
-            response = self._generate_ollama(system_prompt, user_prompt)
-        elif self.provider == "gemini":
-            response = self._generate_gemini(system_prompt, user_prompt)
-        elif self.provider == "byteplus":
-            response = self._generate_byteplus(system_prompt, user_prompt)
-        elif self.provider == "anthropic":
-            response = self._generate_anthropic(system_prompt, user_prompt)
-        else:  # pragma: no cover
-            raise RuntimeError(f"Unknown provider {self.provider!r}")
+        # Slow mode: wait for the rate limiter before making the API call
+        _settle = self._acquire_rate_limit(system_prompt, user_prompt)
+        tokens_used = 0
+        try:
+            if self.provider == "openai":
+                response = self._generate_openai(system_prompt, user_prompt)
+            elif self.provider == "remote":
+                response = self._generate_ollama(system_prompt, user_prompt)
+            elif self.provider == "gemini":
+                response = self._generate_gemini(system_prompt, user_prompt)
+            elif self.provider == "byteplus":
+                response = self._generate_byteplus(system_prompt, user_prompt)
+            elif self.provider == "anthropic":
+                response = self._generate_anthropic(system_prompt, user_prompt)
+            else:  # pragma: no cover
+                raise RuntimeError(f"Unknown provider {self.provider!r}")
+            tokens_used = response.get("tokens_used", 0)
+        finally:
+            # Settle even when the provider raises, so the estimate is refunded
+            if _settle is not None:
+                _settle(tokens_used)
 
         cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
-
-        tokens_used = response.get("tokens_used", 0)
         STATE.set_agent_property("token_count", STATE.get_agent_property("token_count", 0) + tokens_used)
 
-        if _slow_mode_active and tokens_used > 0:
-            from app.rate_limiter import get_rate_limiter
-            get_rate_limiter().record_usage(tokens_used)
-
         if log_response:
             logger.info(f"[LLM RECV] {cleaned}")
         return cleaned
@@ -1194,71 +1204,161 @@ class LLMInterface:
         if log_response:
             logger.info(f"[LLM SESSION] task={task_id} call_type={call_type} | user={user_prompt}")
 
-        # Slow mode: throttle before making the API call
-        from app.config import is_slow_mode_enabled
-        _slow_mode_active = is_slow_mode_enabled()
-        if _slow_mode_active:
-            from agent_core.utils.token import count_tokens
-            from app.rate_limiter import get_rate_limiter
-            estimated = count_tokens(user_prompt)
-            get_rate_limiter().wait_if_needed(estimated)
-
-        # Handle Gemini with explicit caching (per call_type)
-        if self.provider == "gemini" and self._gemini_cache_manager:
-            # Get stored system prompt or use provided one
-            session_key = f"{task_id}:{call_type}"
-            stored_system_prompt = self._session_system_prompts.get(session_key)
-            effective_system_prompt = system_prompt_for_new_session or stored_system_prompt
+        # Slow mode: wait for the rate limiter before making the API call
+        _settle = self._acquire_rate_limit(
+            self._session_system_prompts.get(f"{task_id}:{call_type}") or system_prompt_for_new_session,
+            user_prompt,
+            session_id=task_id,
+        )
+        _tokens_used = 0
+        try:
+            # Handle Gemini with explicit caching (per call_type)
+            if self.provider == "gemini" and self._gemini_cache_manager:
+                # Get stored system prompt or use provided one
+                session_key = f"{task_id}:{call_type}"
+                stored_system_prompt = self._session_system_prompts.get(session_key)
+                effective_system_prompt = system_prompt_for_new_session or stored_system_prompt
+
+                if not effective_system_prompt:
+                    raise ValueError(
+                        f"No system prompt for task {task_id}:{call_type}"
+                    )
 
-            if not effective_system_prompt:
-                raise ValueError(
-                    f"No system prompt for task {task_id}:{call_type}"
+                # Use Gemini with explicit caching (call_type passed for cache keying)
+                response = self._generate_gemini(effective_system_prompt, user_prompt, call_type=call_type)
+                cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
+                _tokens_used = response.get("tokens_used", 0)
+                STATE.set_agent_property(
+                    "token_count",
+                    STATE.get_agent_property("token_count", 0) + _tokens_used
                 )
+                if log_response:
+                    logger.info(f"[LLM RECV] {cleaned}")
+                return cleaned
+
+            # Handle OpenAI with call_type-based cache routing
+            if self.provider == "openai":
+                # Get stored system prompt or use provided one
+                session_key = f"{task_id}:{call_type}"
+                stored_system_prompt = self._session_system_prompts.get(session_key)
+                effective_system_prompt = system_prompt_for_new_session or stored_system_prompt
+
+                if not effective_system_prompt:
+                    raise ValueError(
+                        f"No system prompt for task {task_id}:{call_type}"
+                    )
 
-            # Use Gemini with explicit caching (call_type passed for cache keying)
-            response = self._generate_gemini(effective_system_prompt, user_prompt, call_type=call_type)
-            cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
-            _tokens_used = response.get("tokens_used", 0)
-            STATE.set_agent_property(
-                "token_count",
-                STATE.get_agent_property("token_count", 0) + _tokens_used
-            )
-            if _slow_mode_active and _tokens_used > 0:
-                from app.rate_limiter import get_rate_limiter
-                get_rate_limiter().record_usage(_tokens_used)
-            if log_response:
-                logger.info(f"[LLM RECV] {cleaned}")
-            return cleaned
+                # Use OpenAI with call_type for better cache routing via prompt_cache_key
+                response = self._generate_openai(effective_system_prompt, user_prompt, call_type=call_type)
+                cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
+                _tokens_used = response.get("tokens_used", 0)
+                STATE.set_agent_property(
+                    "token_count",
+                    STATE.get_agent_property("token_count", 0) + _tokens_used
+                )
+                if log_response:
+                    logger.info(f"[LLM RECV] {cleaned}")
+                return cleaned
 
-        # Handle OpenAI with call_type-based cache routing
-        if self.provider == "openai":
-            # Get stored system prompt or use provided one
-            session_key = f"{task_id}:{call_type}"
-            stored_system_prompt = self._session_system_prompts.get(session_key)
-            effective_system_prompt = system_prompt_for_new_session or stored_system_prompt
+            # Handle Anthropic with multi-turn KV caching
+            if self.provider == "anthropic" and self._anthropic_client:
+                session_key = f"{task_id}:{call_type}"
+                stored_system_prompt = self._session_system_prompts.get(session_key)
+                effective_system_prompt = system_prompt_for_new_session or stored_system_prompt
 
-            if not effective_system_prompt:
-                raise ValueError(
-                    f"No system prompt for task {task_id}:{call_type}"
+                if not effective_system_prompt:
+                    raise ValueError(
+                        f"No system prompt for task {task_id}:{call_type}"
+                    )
+
+                # Get or initialize multi-turn message history
+                if session_key not in self._anthropic_session_messages:
+                    self._anthropic_session_messages[session_key] = []
+
+                history = self._anthropic_session_messages[session_key]
+
+                # Build messages: history (with cache_control on last assistant) + new user msg
+                messages: List[dict] = []
+
+                # Copy history messages (strip old cache_control, we'll re-place it)
+                for msg in history:
+                    msg_copy = {"role": msg["role"]}
+                    content = msg["content"]
+                    if isinstance(content, list):
+                        # Strip cache_control from content blocks
+                        msg_copy["content"] = [
+                            {k: v for k, v in block.items() if k != "cache_control"}
+                            for block in content
+                        ]
+                    else:
+                        msg_copy["content"] = content
+                    messages.append(msg_copy)
+
+                # Place cache_control on the LAST assistant message for prefix caching
+                if messages:
+                    cache_control = {"type": "ephemeral"}
+                    if call_type:
+                        cache_control["ttl"] = "1h"
+                    for i in range(len(messages) - 1, -1, -1):
+                        if messages[i]["role"] == "assistant":
+                            content = messages[i]["content"]
+                            if isinstance(content, str):
+                                messages[i]["content"] = [
+                                    {"type": "text", "text": content, "cache_control": cache_control}
+                                ]
+                            elif isinstance(content, list):
+                                # Add cache_control to the last text block
+                                for j in range(len(content) - 1, -1, -1):
+                                    if content[j].get("type") == "text":
+                                        content[j]["cache_control"] = cache_control
+                                        break
+                            break
+
+                # Append the new user message
+                messages.append({"role": "user", "content": user_prompt})
+
+                logger.debug(
+                    f"[ANTHROPIC SESSION] {session_key}: {len(history)} history msgs, "
+                    f"sending {len(messages)} total msgs"
                 )
 
-            # Use OpenAI with call_type for better cache routing via prompt_cache_key
-            response = self._generate_openai(effective_system_prompt, user_prompt, call_type=call_type)
-            cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
-            _tokens_used = response.get("tokens_used", 0)
-            STATE.set_agent_property(
-                "token_count",
-                STATE.get_agent_property("token_count", 0) + _tokens_used
-            )
-            if _slow_mode_active and _tokens_used > 0:
-                from app.rate_limiter import get_rate_limiter
-                get_rate_limiter().record_usage(_tokens_used)
-            if log_response:
-                logger.info(f"[LLM RECV] {cleaned}")
-            return cleaned
+                # Call Anthropic with the full multi-turn messages
+                # Note: _generate_anthropic adds JSON prefill as the last message automatically
+                response = self._generate_anthropic(
+                    effective_system_prompt, user_prompt, call_type=call_type, messages=messages
+                )
+
+                # On success, accumulate user message + assistant response in history
+                # The response content already has '{' prepended from JSON prefill
+                assistant_content = response.get("content", "")
+                if assistant_content and "error" not in response:
+                    history.append({"role": "user", "content": user_prompt})
+                    history.append({"role": "assistant", "content": assistant_content})
+
+                cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
+                _tokens_used = response.get("tokens_used", 0)
+                STATE.set_agent_property(
+                    "token_count",
+                    STATE.get_agent_property("token_count", 0) + _tokens_used
+                )
+                if log_response:
+                    logger.info(f"[LLM RECV] {cleaned}")
+                return cleaned
+
+            # If not BytePlus (and not Gemini/OpenAI/Anthropic which are handled above), fall back to standard
+            if self.provider != "byteplus" or not self._byteplus_cache_manager:
+                # The standard call is admitted on its own; hand this permit back first
+                if _settle is not None:
+                    _settle, settle = None, _settle
+                    settle(0)
+                return self._generate_response_sync(
+                    system_prompt_for_new_session, user_prompt, log_response=False
+                )
 
-        # Handle Anthropic with multi-turn KV caching
-        if self.provider == "anthropic" and self._anthropic_client:
+            # Use SESSION cache for BytePlus - context grows with each call
+            # Round 1: system_prompt + static_prompt + event_1
+            # Round 2: event_2 (delta only)
+            # Round 3: event_3 (delta only)
             session_key = f"{task_id}:{call_type}"
             stored_system_prompt = self._session_system_prompts.get(session_key)
             effective_system_prompt = system_prompt_for_new_session or stored_system_prompt
@@ -1268,122 +1368,45 @@ class LLMInterface:
                     f"No system prompt for task {task_id}:{call_type}"
                 )
 
-            # Get or initialize multi-turn message history
-            if session_key not in self._anthropic_session_messages:
-                self._anthropic_session_messages[session_key] = []
+            # Store system prompt for future cache recreation if not stored
+            if session_key not in self._session_system_prompts:
+                self._session_system_prompts[session_key] = effective_system_prompt
 
-            history = self._anthropic_session_messages[session_key]
-
-            # Build messages: history (with cache_control on last assistant) + new user msg
-            messages: List[dict] = []
-
-            # Copy history messages (strip old cache_control, we'll re-place it)
-            for msg in history:
-                msg_copy = {"role": msg["role"]}
-                content = msg["content"]
-                if isinstance(content, list):
-                    # Strip cache_control from content blocks
-                    msg_copy["content"] = [
-                        {k: v for k, v in block.items() if k != "cache_control"}
-                        for block in content
-                    ]
+            try:
+                # Check if session cache exists
+                if self._byteplus_cache_manager.has_session(task_id, call_type):
+                    # Session exists - send only the user_prompt (delta events)
+                    logger.info(f"[SESSION CACHE] Using existing session for {session_key}, sending delta")
+                    result = self._byteplus_cache_manager.chat_with_session(
+                        task_id=task_id,
+                        call_type=call_type,
+                        user_prompt=user_prompt,
+                        temperature=self.temperature,
+                        max_tokens=self.max_tokens,
+                    )
+                    response = self._process_session_response(result, task_id, call_type, is_first_call=False)
                 else:
-                    msg_copy["content"] = content
-                messages.append(msg_copy)
-
-            # Place cache_control on the LAST assistant message for prefix caching
-            if messages:
-                cache_control = {"type": "ephemeral"}
-                if call_type:
-                    cache_control["ttl"] = "1h"
-                for i in range(len(messages) - 1, -1, -1):
-                    if messages[i]["role"] == "assistant":
-                        content = messages[i]["content"]
-                        if isinstance(content, str):
-                            messages[i]["content"] = [
-                                {"type": "text", "text": content, "cache_control": cache_control}
-                            ]
-                        elif isinstance(content, list):
-                            # Add cache_control to the last text block
-                            for j in range(len(content) - 1, -1, -1):
-                                if content[j].get("type") == "text":
-                                    content[j]["cache_control"] = cache_control
-                                    break
-                        break
-
-            # Append the new user message
-            messages.append({"role": "user", "content": user_prompt})
-
-            logger.debug(
-                f"[ANTHROPIC SESSION] {session_key}: {len(history)} history msgs, "
-                f"sending {len(messages)} total msgs"
-            )
-
-            # Call Anthropic with the full multi-turn messages
-            # Note: _generate_anthropic adds JSON prefill as the last message automatically
-            response = self._generate_anthropic(
-                effective_system_prompt, user_prompt, call_type=call_type, messages=messages
-            )
-
-            # On success, accumulate user message + assistant response in history
-            # The response content already has '{' prepended from JSON prefill
-            assistant_content = response.get("content", "")
-            if assistant_content and "error" not in response:
-                history.append({"role": "user", "content": user_prompt})
-                history.append({"role": "assistant", "content": assistant_content})
-
-            cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
-            _tokens_used = response.get("tokens_used", 0)
-            STATE.set_agent_property(
-                "token_count",
-                STATE.get_agent_property("token_count", 0) + _tokens_used
-            )
-            if _slow_mode_active and _tokens_used > 0:
-                from app.rate_limiter import get_rate_limiter
-                get_rate_limiter().record_usage(_tokens_used)
-            if log_response:
-                logger.info(f"[LLM RECV] {cleaned}")
-            return cleaned
-
-        # If not BytePlus (and not Gemini/OpenAI/Anthropic which are handled above), fall back to standard
-        if self.provider != "byteplus" or not self._byteplus_cache_manager:
-            return self._generate_response_sync(
-                system_prompt_for_new_session, user_prompt, log_response=False
-            )
-
-        # Use SESSION cache for BytePlus - context grows with each call
-        # Round 1: system_prompt + static_prompt + event_1
-        # Round 2: event_2 (delta only)
-        # Round 3: event_3 (delta only)
-        session_key = f"{task_id}:{call_type}"
-        stored_system_prompt = self._session_system_prompts.get(session_key)
-        effective_system_prompt = system_prompt_for_new_session or stored_system_prompt
+                    # No session - create one with full prompt (system + user)
+                    logger.info(f"[SESSION CACHE] Creating new session for {session_key}")
+                    result = self._byteplus_cache_manager.create_session_cache(
+                        task_id=task_id,
+                        call_type=call_type,
+                        system_prompt=effective_system_prompt,
+                        user_prompt=user_prompt,
+                        temperature=self.temperature,
+                        max_tokens=self.max_tokens,
+                    )
+                    response = self._process_session_response(result, task_id, call_type, is_first_call=True)
 
-        if not effective_system_prompt:
-            raise ValueError(
-                f"No system prompt for task {task_id}:{call_type}"
-            )
+            except BytePlusContextOverflowError as overflow_exc:
+                # Context exceeded maximum length - reset session and retry with fresh context
+                logger.warning(f"[SESSION CACHE] Context overflow for {session_key}, resetting session...")
 
-        # Store system prompt for future cache recreation if not stored
-        if session_key not in self._session_system_prompts:
-            self._session_system_prompts[session_key] = effective_system_prompt
+                # End the overflowed session
+                self._byteplus_cache_manager.end_session(task_id, call_type)
 
-        try:
-            # Check if session cache exists
-            if self._byteplus_cache_manager.has_session(task_id, call_type):
-                # Session exists - send only the user_prompt (delta events)
-                logger.info(f"[SESSION CACHE] Using existing session for {session_key}, sending delta")
-                result = self._byteplus_cache_manager.chat_with_session(
-                    task_id=task_id,
-                    call_type=call_type,
-                    user_prompt=user_prompt,
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens,
-                )
-                response = self._process_session_response(result, task_id, call_type, is_first_call=False)
-            else:
-                # No session - create one with full prompt (system + user)
-                logger.info(f"[SESSION CACHE] Creating new session for {session_key}")
+                # Create a fresh session with system prompt and current user prompt
+                logger.info(f"[SESSION CACHE] Creating fresh session for {session_key} after overflow")
                 result = self._byteplus_cache_manager.create_session_cache(
                     task_id=task_id,
                     call_type=call_type,
@@ -1394,44 +1417,29 @@ class LLMInterface:
                 )
                 response = self._process_session_response(result, task_id, call_type, is_first_call=True)
 
-        except BytePlusContextOverflowError as overflow_exc:
-            # Context exceeded maximum length - reset session and retry with fresh context
-            logger.warning(f"[SESSION CACHE] Context overflow for {session_key}, resetting session...")
-
-            # End the overflowed session
-            self._byteplus_cache_manager.end_session(task_id, call_type)
+            except Exception as e:
+                logger.warning(f"[SESSION CACHE] Failed: {e}, falling back to standard")
+                if _settle is not None:
+                    _settle, settle = None, _settle
+                    settle(0)
+                return self._generate_response_sync(
+                    effective_system_prompt, user_prompt, log_response=False
+                )
 
-            # Create a fresh session with system prompt and current user prompt
-            logger.info(f"[SESSION CACHE] Creating fresh session for {session_key} after overflow")
-            result = self._byteplus_cache_manager.create_session_cache(
-                task_id=task_id,
-                call_type=call_type,
-                system_prompt=effective_system_prompt,
-                user_prompt=user_prompt,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-            )
-            response = self._process_session_response(result, task_id, call_type, is_first_call=True)
+            cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
 
-        except Exception as e:
-            logger.warning(f"[SESSION CACHE] Failed: {e}, falling back to standard")
-            return self._generate_response_sync(
-                effective_system_prompt, user_prompt, log_response=False
+            _tokens_used = response.get("tokens_used", 0)
+            STATE.set_agent_property(
+                "token_count",
+                STATE.get_agent_property("token_count", 0) + _tokens_used
             )
-
-        cleaned = re.sub(self._CODE_BLOCK_RE, "", response.get("content", "").strip())
-
-        _tokens_used = response.get("tokens_used", 0)
-        STATE.set_agent_property(
-            "token_count",
-            STATE.get_agent_property("token_count", 0) + _tokens_used
-        )
-        if _slow_mode_active and _tokens_used > 0:
-            from app.rate_limiter import get_rate_limiter
-            get_rate_limiter().record_usage(_tokens_used)
-        if log_response:
-            logger.info(f"[LLM RECV] {cleaned}")
-        return cleaned
+            if log_response:
+                logger.info(f"[LLM RECV] {cleaned}")
+            return cleaned
+        finally:
+            # Settle on every path, including provider errors and empty content
+            if _settle is not None:
+                _settle(_tokens_used)
 
     def _process_session_response(
         self, result: Dict[str, Any], task_id: str, call_type: str, is_first_call: bool = False
@@ -1,85 +1,501 @@
 # -*- coding: utf-8 -*-
 """
-Sliding-window token rate limiter for Slow Mode.
+Token-bucket rate limiter for Slow Mode.
 
-When Slow Mode is enabled, this module throttles LLM calls to stay
-within a configurable tokens-per-minute (TPM) limit.
+When Slow Mode is enabled, this module throttles LLM calls to stay within a
+configurable tokens-per-minute (TPM) and, optionally, requests-per-minute
+(RPM) limit.
+
+Each limit is a token bucket that refills continuously at ``limit / 60`` per
+second, so admission is O(1) instead of re-summing a sliding window. A call
+is admitted for an *estimate* of its tokens (prompt tokens plus a running
+average of the completion size) and settled with its actual usage once the
+provider responds; overruns leave the bucket in debt, which later calls wait
+out.
+
+Calls are scheduled by priority (see ``LLMPriority``):
+
+- INTERACTIVE (replies the user is waiting on) may drain the buckets.
+- NORMAL calls leave ``RESERVE_FRACTION[NORMAL]`` of each bucket free and
+  BACKGROUND calls (memory processing, summarization) leave more, so a user
+  reply never waits behind a backlog of background work.
+
+Within a priority, waiting calls are served round-robin across sessions so
+one busy task cannot starve the others, and a call that cannot be admitted
+yet blocks the calls behind it (no small request overtakes a large one).
+
+Waiting works from both coroutines (``acquire``) and worker threads
+(``acquire_sync``); cancelling a waiting coroutine withdraws its request.
 """
 
+from __future__ import annotations
+
+import asyncio
 import logging
-import time
 import threading
-from collections import deque
-from typing import Tuple
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional
+
+from agent_core import LLMPriority, RateLimitRequest
+
+try:
+    from app.logger import logger  # type: ignore
+except Exception:  # pragma: no cover
+    logger = logging.getLogger(__name__)
+
+# Share of each bucket a priority class must leave for the classes above it
+RESERVE_FRACTION: Dict[LLMPriority, float] = {
+    LLMPriority.INTERACTIVE: 0.0,
+    LLMPriority.NORMAL: 0.2,
+    LLMPriority.BACKGROUND: 0.4,
+}
+# Scheduling order of the priority classes
+_PRIORITY_ORDER = (LLMPriority.INTERACTIVE, LLMPriority.NORMAL, LLMPriority.BACKGROUND)
+
+# Completion tokens assumed for a call before any usage has been observed
+DEFAULT_OUTPUT_ESTIMATE = 512
+# Weight of the newest call in the running completion-size estimate
+_OUTPUT_EWMA_ALPHA = 0.2
+# System prompt token counts kept (they repeat across calls)
+_PROMPT_COUNT_CACHE_SIZE = 32
+
+
+class _Bucket:
+    """Continuously refilling token bucket; the level may go negative (debt)."""
+
+    __slots__ = ("capacity", "rate", "level", "stamp")
+
+    def __init__(self, per_minute: int, now: float) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.stamp = now
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def resize(self, per_minute: int, now: float) -> None:
+        """Change the limit, keeping the fraction of capacity already used."""
+        self.refill(now)
+        used = self.capacity - self.level
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity - used
+
+    def cost(self, amount: float, reserve: float) -> float:
+        """Clamp a request so it fits below the reserve of an empty bucket."""
+        return min(amount, self.capacity * (1.0 - reserve))
+
+    def delay(self, amount: float, reserve: float) -> float:
+        """Seconds until ``amount`` can be taken leaving ``reserve`` of capacity free."""
+        deficit = amount + self.capacity * reserve - self.level
+        return deficit / self.rate if deficit > 0 else 0.0
 
-logger = logging.getLogger(__name__)
+
+class _Waiter:
+    """A queued admission request, woken from whichever thread grants it."""
+
+    __slots__ = ("tokens", "priority", "session", "charged", "granted", "cancelled", "_loop", "_future", "_event")
+
+    def __init__(self, tokens: int, priority: LLMPriority, session: str, *, sync: bool) -> None:
+        self.tokens = tokens
+        self.priority = priority
+        self.session = session
+        # Tokens taken from the bucket on admission (oversized calls are clamped)
+        self.charged = 0.0
+        self.granted = False
+        self.cancelled = False
+        if sync:
+            self._loop = None
+            self._future = None
+            self._event: Optional[threading.Event] = threading.Event()
+        else:
+            self._loop = asyncio.get_running_loop()
+            self._future: Optional[asyncio.Future] = self._loop.create_future()
+            self._event = None
+
+    def wake(self) -> None:
+        if self._event is not None:
+            self._event.set()
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._set_result)
+
+    def _set_result(self) -> None:
+        if not self._future.done():
+            self._future.set_result(None)
+
+    async def wait_async(self, timeout: Optional[float]) -> None:
+        await asyncio.wait((self._future,), timeout=timeout)
+        if self._future.done():
+            self._future = self._loop.create_future()
+
+    def wait_sync(self, timeout: Optional[float]) -> None:
+        self._event.wait(timeout)
+        self._event.clear()
+
+
+class RateLimitPermit:
+    """Admission of one call; settle it once with the tokens actually used."""
+
+    __slots__ = ("_limiter", "estimated_tokens", "charged", "prompt_tokens", "waited", "_settled")
+
+    def __init__(
+        self,
+        limiter: "TokenRateLimiter",
+        estimated_tokens: int,
+        charged: float,
+        prompt_tokens: int,
+        waited: float,
+    ) -> None:
+        self._limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        self.charged = charged
+        self.prompt_tokens = prompt_tokens
+        self.waited = waited
+        self._settled = False
+
+    def settle(self, tokens_used: int) -> None:
+        """Replace the admitted estimate with the actual usage (idempotent)."""
+        if self._settled:
+            return
+        self._settled = True
+        self._limiter._settle(self, tokens_used)
 
 
 class TokenRateLimiter:
-    """Sliding-window rate limiter for tokens per minute."""
+    """Priority-aware token-bucket limiter for tokens (and requests) per minute."""
 
-    def __init__(self):
-        self._window: deque[Tuple[float, int]] = deque()  # (timestamp, token_count)
+    def __init__(self, tpm_limit: Optional[int] = None, rpm_limit: Optional[int] = None) -> None:
+        # Fixed limits override the Slow Mode settings (used by scripts/tests)
+        self._fixed_tpm = tpm_limit
+        self._fixed_rpm = rpm_limit
         self._lock = threading.Lock()
+        self._tokens: Optional[_Bucket] = None
+        self._requests: Optional[_Bucket] = None
+        self._limits = (0, 0)
+        # priority -> session -> waiters, sessions in round-robin order
+        self._head: Optional[_Waiter] = None
+        self._queues: Dict[LLMPriority, "OrderedDict[str, Deque[_Waiter]]"] = {
+            priority: OrderedDict() for priority in _PRIORITY_ORDER
+        }
+        self._output_estimate = float(DEFAULT_OUTPUT_ESTIMATE)
+        self._prompt_counts: "OrderedDict[str, int]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, float]] = {
+            priority.value: {"admitted": 0, "waited": 0, "wait_s": 0.0, "cancelled": 0}
+            for priority in _PRIORITY_ORDER
+        }
+
+    # ───────────────────────────── Limits ─────────────────────────────
+
+    def _read_limits(self) -> tuple:
+        """Return (tpm, rpm) from the fixed limits or Slow Mode settings; 0 = unlimited."""
+        if self._fixed_tpm is not None or self._fixed_rpm is not None:
+            return self._fixed_tpm or 0, self._fixed_rpm or 0
+        from app.config import get_slow_mode_rpm_limit, get_slow_mode_tpm_limit
+        return get_slow_mode_tpm_limit(), get_slow_mode_rpm_limit()
+
+    def _sync_limits(self, now: float) -> None:
+        """Apply changed limits and refill the buckets (lock held)."""
+        limits = self._read_limits()
+        if limits != self._limits:
+            self._limits = limits
+            self._tokens = self._resized(self._tokens, limits[0], now)
+            self._requests = self._resized(self._requests, limits[1], now)
+        for bucket in (self._tokens, self._requests):
+            if bucket is not None:
+                bucket.refill(now)
+
+    @staticmethod
+    def _resized(bucket: Optional[_Bucket], per_minute: int, now: float) -> Optional[_Bucket]:
+        if per_minute <= 0:
+            return None
+        if bucket is None:
+            return _Bucket(per_minute, now)
+        bucket.resize(per_minute, now)
+        return bucket
+
+    # ─────────────────────────── Scheduling ───────────────────────────
+
+    def _delay(self, waiter: _Waiter) -> float:
+        reserve = RESERVE_FRACTION[waiter.priority]
+        delay = 0.0
+        if self._tokens is not None:
+            delay = self._tokens.delay(self._tokens.cost(waiter.tokens, reserve), reserve)
+        if self._requests is not None:
+            delay = max(delay, self._requests.delay(self._requests.cost(1, reserve), reserve))
+        return delay
+
+    def _take(self, waiter: _Waiter) -> None:
+        reserve = RESERVE_FRACTION[waiter.priority]
+        if self._tokens is not None:
+            waiter.charged = self._tokens.cost(waiter.tokens, reserve)
+            self._tokens.level -= waiter.charged
+        if self._requests is not None:
+            self._requests.level -= self._requests.cost(1, reserve)
 
-    def _get_tpm_limit(self) -> int:
-        """Read TPM limit from settings (single source of truth)."""
-        from app.config import get_slow_mode_tpm_limit
-        return get_slow_mode_tpm_limit()
+    def _dispatch(self, caller: Optional[_Waiter] = None, *, rearm: bool = False) -> Optional[float]:
+        """Admit queued calls in priority / round-robin order (lock held).
 
-    def _prune_window(self):
-        """Remove entries older than 60 seconds."""
-        cutoff = time.monotonic() - 60.0
-        while self._window and self._window[0][0] < cutoff:
-            self._window.popleft()
+        The first call that cannot be admitted yet (the head) owns the timer:
+        it is woken whenever it becomes the head, or with ``rearm`` after
+        capacity was returned, and re-polls when its delay has passed. Other
+        queued calls sleep until they are admitted or become the head.
+
+        Returns the head's delay in seconds if ``caller`` is the head, else None.
+        """
+        self._sync_limits(time.monotonic())
+        for priority in _PRIORITY_ORDER:
+            sessions = self._queues[priority]
+            while sessions:
+                session, waiters = next(iter(sessions.items()))
+                waiter = waiters[0]
+                if not waiter.cancelled:
+                    delay = self._delay(waiter)
+                    if delay > 0:
+                        if waiter is not caller and (rearm or waiter is not self._head):
+                            waiter.wake()
+                        self._head = waiter
+                        return delay if waiter is caller else None
+                    self._take(waiter)
+                    waiter.granted = True
+                    waiter.wake()
+                waiters.popleft()
+                if waiters:
+                    sessions.move_to_end(session)
+                else:
+                    del sessions[session]
+        self._head = None
+        return None
+
+    def _enqueue(self, waiter: _Waiter) -> Optional[float]:
+        with self._lock:
+            self._queues[waiter.priority].setdefault(waiter.session, deque()).append(waiter)
+            return self._dispatch(waiter)
+
+    def _poll(self, waiter: _Waiter) -> Optional[float]:
+        with self._lock:
+            if waiter.granted:
+                return None
+            return self._dispatch(waiter)
+
+    def _withdraw(self, waiter: _Waiter) -> None:
+        """Drop a cancelled request, returning its capacity if it was already admitted."""
+        with self._lock:
+            self._stats[waiter.priority.value]["cancelled"] += 1
+            if waiter.granted:
+                self._sync_limits(time.monotonic())
+                self._refund(waiter.charged, requests=1)
+            else:
+                waiter.cancelled = True
+            self._dispatch(rearm=True)
+
+    def _refund(self, tokens: float, requests: int = 0) -> None:
+        """Return capacity to the buckets (negative tokens charge an overrun)."""
+        if self._tokens is not None:
+            self._tokens.level = min(self._tokens.capacity, self._tokens.level + tokens)
+        if self._requests is not None and requests:
+            self._requests.level = min(self._requests.capacity, self._requests.level + requests)
+
+    def _admitted(self, waiter: _Waiter, prompt_tokens: int, waited: float, queued: bool) -> RateLimitPermit:
+        with self._lock:
+            stats = self._stats[waiter.priority.value]
+            stats["admitted"] += 1
+            if queued:
+                stats["waited"] += 1
+                stats["wait_s"] += waited
+        return RateLimitPermit(self, waiter.tokens, waiter.charged, prompt_tokens, waited)
+
+    def _log_wait(self, waiter: _Waiter, delay: Optional[float]) -> None:
+        tpm = self._limits[0]
+        used = int(self._tokens.capacity - self._tokens.level) if self._tokens is not None else 0
+        logger.info(
+            f"[SLOW MODE] Rate limit approaching ({used}/{tpm} TPM). Queued {waiter.priority.value} call "
+            f"of ~{waiter.tokens} tokens" + (f", waiting {delay:.1f}s..." if delay else "...")
+        )
+
+    # ─────────────────────────── Public API ───────────────────────────
+
+    async def acquire(
+        self,
+        estimated_tokens: int = 0,
+        *,
+        priority: LLMPriority = LLMPriority.NORMAL,
+        session_id: Optional[str] = None,
+        prompt_tokens: int = 0,
+    ) -> RateLimitPermit:
+        """Wait until a call of ``estimated_tokens`` may be sent.
+
+        Cancelling the awaiting task withdraws the request (or returns the
+        capacity if it had just been admitted).
+        """
+        waiter = _Waiter(max(0, int(estimated_tokens)), LLMPriority(priority), session_id or "", sync=False)
+        start = time.monotonic()
+        delay = self._enqueue(waiter)
+        queued = not waiter.granted
+        if queued:
+            self._log_wait(waiter, delay)
+        try:
+            while not waiter.granted:
+                await waiter.wait_async(delay)
+                delay = self._poll(waiter)
+        except BaseException:
+            self._withdraw(waiter)
+            raise
+        return self._admitted(waiter, prompt_tokens, time.monotonic() - start, queued)
+
+    def acquire_sync(
+        self,
+        estimated_tokens: int = 0,
+        *,
+        priority: LLMPriority = LLMPriority.NORMAL,
+        session_id: Optional[str] = None,
+        prompt_tokens: int = 0,
+    ) -> RateLimitPermit:
+        """Block the calling (worker) thread until a call may be sent."""
+        waiter = _Waiter(max(0, int(estimated_tokens)), LLMPriority(priority), session_id or "", sync=True)
+        start = time.monotonic()
+        delay = self._enqueue(waiter)
+        queued = not waiter.granted
+        if queued:
+            self._log_wait(waiter, delay)
+        try:
+            while not waiter.granted:
+                waiter.wait_sync(delay)
+                delay = self._poll(waiter)
+        except BaseException:
+            self._withdraw(waiter)
+            raise
+        return self._admitted(waiter, prompt_tokens, time.monotonic() - start, queued)
+
+    def _settle(self, permit: RateLimitPermit, tokens_used: int) -> None:
+        with self._lock:
+            self._sync_limits(time.monotonic())
+            self._refund(permit.charged - max(0, tokens_used))
+            if tokens_used > 0 and permit.prompt_tokens:
+                output = max(0, tokens_used - permit.prompt_tokens)
+                self._output_estimate += _OUTPUT_EWMA_ALPHA * (output - self._output_estimate)
+            # A refund may let queued calls through before their timers fire
+            self._dispatch(rearm=True)
+
+    def estimate_tokens(self, system_prompt: Optional[str], user_prompt: Optional[str]) -> tuple:
+        """Return (prompt tokens, estimated total tokens) for a call."""
+        from agent_core.utils.token import count_tokens
+
+        prompt = self._count_system_prompt(system_prompt) + count_tokens(user_prompt or "")
+        return prompt, prompt + int(self._output_estimate)
+
+    def _count_system_prompt(self, system_prompt: Optional[str]) -> int:
+        if not system_prompt:
+            return 0
+        counts = self._prompt_counts
+        with self._lock:
+            count = counts.get(system_prompt)
+            if count is not None:
+                counts.move_to_end(system_prompt)
+                return count
+        from agent_core.utils.token import count_tokens
+
+        count = count_tokens(system_prompt)
+        with self._lock:
+            counts[system_prompt] = count
+            if len(counts) > _PROMPT_COUNT_CACHE_SIZE:
+                counts.popitem(last=False)
+        return count
 
     def tokens_used_in_window(self) -> int:
-        """Return total tokens consumed in the current 60-second window."""
+        """Return the tokens currently drawn from the TPM bucket (0 when unlimited)."""
+        with self._lock:
+            self._sync_limits(time.monotonic())
+            if self._tokens is None:
+                return 0
+            return max(0, int(self._tokens.capacity - self._tokens.level))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return limits, bucket levels, queue depths and per-priority wait counters."""
         with self._lock:
-            self._prune_window()
-            return sum(t for _, t in self._window)
+            self._sync_limits(time.monotonic())
+            return {
+                "tpm_limit": self._limits[0],
+                "rpm_limit": self._limits[1],
+                "tokens_available": int(self._tokens.level) if self._tokens is not None else None,
+                "requests_available": round(self._requests.level, 2) if self._requests is not None else None,
+                "output_estimate": int(self._output_estimate),
+                "queued": {
+                    priority.value: sum(len(w) for w in self._queues[priority].values())
+                    for priority in _PRIORITY_ORDER
+                },
+                "priorities": {name: dict(values) for name, values in self._stats.items()},
+            }
+
+    # ─────────────────────── Compatibility API ────────────────────────
 
     def wait_if_needed(self, estimated_tokens: int = 0) -> float:
         """Block until there is capacity for estimated_tokens.
 
-        Returns the number of seconds waited.
+        Usage is charged separately with ``record_usage``. Returns the number
+        of seconds waited.
         """
-        tpm_limit = self._get_tpm_limit()
-        waited = 0.0
-        with self._lock:
-            while True:
-                self._prune_window()
-                used = sum(t for _, t in self._window)
-                if used + estimated_tokens <= tpm_limit:
-                    break
-                if not self._window:
-                    break
-                # Wait until the oldest entry expires from the window
-                oldest_ts = self._window[0][0]
-                wait_time = oldest_ts + 60.0 - time.monotonic() + 0.1
-                if wait_time <= 0:
-                    continue
-                # Release lock while sleeping so other threads aren't blocked
-                self._lock.release()
-                logger.info(
-                    f"[SLOW MODE] Rate limit approaching ({used}/{tpm_limit} TPM). "
-                    f"Waiting {wait_time:.1f}s..."
-                )
-                time.sleep(wait_time)
-                waited += wait_time
-                self._lock.acquire()
-        return waited
+        permit = self.acquire_sync(estimated_tokens)
+        permit.settle(0)
+        return permit.waited
 
     def record_usage(self, tokens: int):
         """Record that tokens were consumed just now."""
         if tokens > 0:
             with self._lock:
-                self._window.append((time.monotonic(), tokens))
+                self._sync_limits(time.monotonic())
+                self._refund(-tokens)
 
     def reset(self):
-        """Clear the sliding window."""
+        """Refill the buckets and re-read the limits; queued calls are re-evaluated."""
         with self._lock:
-            self._window.clear()
+            self._tokens = None
+            self._requests = None
+            self._limits = (0, 0)
+            self._dispatch(rearm=True)
+
+
+# ──────────────────────── LLMInterface hooks ────────────────────────
+
+def _admission(request: RateLimitRequest) -> Optional[tuple]:
+    """Return (prompt tokens, estimate, priority, session) if Slow Mode limits the call."""
+    from app.config import is_slow_mode_enabled
+
+    if not is_slow_mode_enabled():
+        return None
+    prompt, estimate = _rate_limiter.estimate_tokens(request.system_prompt, request.user_prompt)
+    return prompt, estimate, LLMPriority(request.priority), request.session_id
+
+
+async def acquire_llm_call(request: RateLimitRequest):
+    """acquire_rate_limit_async hook for LLMInterface (no-op unless Slow Mode is on)."""
+    from app.config import is_slow_mode_enabled
+
+    if not is_slow_mode_enabled():
+        return None
+    # Token counting of large prompts stays off the event loop
+    admission = await asyncio.to_thread(_admission, request)
+    if admission is None:
+        return None
+    prompt, estimate, priority, session_id = admission
+    permit = await _rate_limiter.acquire(
+        estimate, priority=priority, session_id=session_id, prompt_tokens=prompt
+    )
+    return permit.settle
+
+
+def acquire_llm_call_sync(request: RateLimitRequest):
+    """acquire_rate_limit hook for LLMInterface (no-op unless Slow Mode is on)."""
+    admission = _admission(request)
+    if admission is None:
+        return None
+    prompt, estimate, priority, session_id = admission
+    permit = _rate_limiter.acquire_sync(
+        estimate, priority=priority, session_id=session_id, prompt_tokens=prompt
+    )
+    return permit.settle
 
 
 # Module-level singleton
@@ -21,6 +21,7 @@ Usage:
 
 from .types import ScheduleExpression, ScheduledTask, SchedulerConfig
 from .parser import ScheduleParser, ScheduleParseError
+from .timer import TimerService
 from .manager import SchedulerManager
 
 __all__ = [
@@ -31,6 +32,8 @@ __all__ = [
     # Parser
     "ScheduleParser",
     "ScheduleParseError",
+    # Timers
+    "TimerService",
     # Manager
     "SchedulerManager",
 ]
@@ -2,7 +2,7 @@
 """
 Scheduler Manager
 
-Manages scheduled tasks with background asyncio loops.
+Manages scheduled tasks on a single heap-based timer service.
 Fires triggers into the TriggerQueue when schedules are due.
 """
 
@@ -18,20 +18,28 @@ from agent_core import Trigger, TriggerQueue
 from agent_core.utils.logger import logger
 
 from .parser import ScheduleParser, ScheduleParseError
+from .timer import DueTimers, TimerService
 from .types import ScheduledTask, ScheduleExpression, SchedulerConfig
 
+# A schedule dispatched this many seconds after its fire time (e.g. after the
+# machine was suspended) is fired once to catch up, then re-armed from now
+MISFIRE_GRACE_SECONDS = 60.0
+# Delay before retrying a schedule whose fire or next-time calculation failed
+ERROR_RETRY_SECONDS = 60.0
+
 
 class SchedulerManager:
     """
     Manager for scheduled tasks.
 
-    Creates background asyncio tasks for each enabled schedule.
-    Fires triggers into the TriggerQueue when schedules are due.
+    Arms one timer per enabled schedule on a shared TimerService (a min-heap
+    with a single sleeper task) and fires triggers into the TriggerQueue when
+    schedules are due.
     """
 
     def __init__(self):
         self._schedules: Dict[str, ScheduledTask] = {}
-        self._scheduler_tasks: Dict[str, asyncio.Task] = {}
+        self._timer = TimerService(self._dispatch_due)
         self._config_path: Optional[Path] = None
         self._trigger_queue: Optional[TriggerQueue] = None
         self._is_running: bool = False
@@ -71,7 +79,7 @@ class SchedulerManager:
         logger.info(f"[SCHEDULER] Initialized with {len(self._schedules)} schedule(s)")
 
     async def start(self) -> None:
-        """Start all scheduler loops."""
+        """Arm timers for all enabled schedules and start the timer service."""
         if self._is_running:
             logger.warning("[SCHEDULER] Already running")
             return
@@ -81,23 +89,18 @@ class SchedulerManager:
         async with self._lock:
             for schedule_id, schedule in self._schedules.items():
                 if schedule.enabled:
-                    await self._start_schedule_loop(schedule_id)
+                    self._arm_schedule(schedule_id)
+            self._timer.start()
 
-        logger.info(f"[SCHEDULER] Started {len(self._scheduler_tasks)} schedule loop(s)")
+        logger.info(f"[SCHEDULER] Started with {len(self._timer)} armed schedule(s)")
 
     async def shutdown(self) -> None:
-        """Stop all scheduler loops gracefully."""
+        """Stop the timer service gracefully."""
         self._is_running = False
 
         async with self._lock:
-            for task_id, task in list(self._scheduler_tasks.items()):
-                if not task.done():
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-                del self._scheduler_tasks[task_id]
+            await self._timer.stop()
+            self._timer.clear()
 
         logger.info("[SCHEDULER] Shutdown complete")
 
@@ -164,10 +167,9 @@ class SchedulerManager:
         # Add to schedules
         self._schedules[schedule_id] = task
 
-        # Start loop if running and enabled (BEFORE saving config)
-        # This ensures the loop is in _scheduler_tasks when reload() runs
+        # Arm the timer if running and enabled
         if self._is_running and enabled:
-            asyncio.create_task(self._start_schedule_loop(schedule_id))
+            self._arm_schedule(schedule_id)
 
         # Save config (triggers hot-reload via file watcher)
         self._save_config()
@@ -188,12 +190,8 @@ class SchedulerManager:
         if schedule_id not in self._schedules:
             return False
 
-        # Stop the loop if running
-        if schedule_id in self._scheduler_tasks:
-            task = self._scheduler_tasks[schedule_id]
-            if not task.done():
-                task.cancel()
-            del self._scheduler_tasks[schedule_id]
+        # Disarm the timer if armed
+        self._timer.cancel(schedule_id)
 
         # Remove from schedules
         del self._schedules[schedule_id]
@@ -221,7 +219,8 @@ class SchedulerManager:
         schedule = self._schedules[schedule_id]
 
         # Handle schedule expression update
-        if "schedule" in updates:
+        schedule_rescheduled = "schedule" in updates
+        if schedule_rescheduled:
             parsed = ScheduleParser.parse(updates.pop("schedule"))
             schedule.schedule = parsed
             schedule.next_run = ScheduleParser.calculate_next_fire_time(parsed)
@@ -231,15 +230,11 @@ class SchedulerManager:
             if hasattr(schedule, key):
                 setattr(schedule, key, value)
 
-        # Restart loop if enabled status changed
-        if "enabled" in updates:
-            if updates["enabled"] and schedule_id not in self._scheduler_tasks:
-                asyncio.create_task(self._start_schedule_loop(schedule_id))
-            elif not updates["enabled"] and schedule_id in self._scheduler_tasks:
-                task = self._scheduler_tasks[schedule_id]
-                if not task.done():
-                    task.cancel()
-                del self._scheduler_tasks[schedule_id]
+        # Re-arm (new expression or re-enabled) or disarm (disabled) the timer
+        if not schedule.enabled:
+            self._timer.cancel(schedule_id)
+        elif self._is_running and (schedule_rescheduled or schedule_id not in self._timer):
+            self._arm_schedule(schedule_id)
 
         # Save config
         self._save_config()
@@ -354,7 +349,8 @@ class SchedulerManager:
         return {
             "is_running": self._is_running,
             "total_schedules": len(self._schedules),
-            "active_loops": len(self._scheduler_tasks),
+            "armed_schedules": len(self._timer),
+            "timer": self._timer.stats(),
             "schedules": [
                 {
                     "id": s.id,
@@ -373,12 +369,11 @@ class SchedulerManager:
         """
         Hot-reload scheduler configuration from disk.
 
-        Stops all loops, clears schedules, re-reads config, and restarts.
+        Disarms all timers, clears schedules, re-reads config, and re-arms.
         """
         try:
-            # 1. Stop all existing loops
-            for schedule_id in list(self._scheduler_tasks.keys()):
-                await self._stop_schedule_loop(schedule_id)
+            # 1. Disarm all timers
+            self._timer.clear()
 
             # 2. Clear schedules
             self._schedules.clear()
@@ -391,11 +386,11 @@ class SchedulerManager:
                 logger.info("[SCHEDULER] Scheduler disabled in config")
                 return {"success": True, "message": "Scheduler disabled", "total": 0}
 
-            # 4. Add schedules and start loops
+            # 4. Add schedules and arm timers
             for task in config.schedules:
                 self._schedules[task.id] = task
                 if self._is_running and task.enabled:
-                    await self._start_schedule_loop(task.id)
+                    self._arm_schedule(task.id)
 
             logger.info(f"[SCHEDULER] Reloaded {len(self._schedules)} schedule(s)")
             return {
@@ -407,109 +402,57 @@ class SchedulerManager:
             logger.error(f"[SCHEDULER] Reload failed: {e}")
             return {"success": False, "message": str(e), "total": 0}
 
-    async def _stop_schedule_loop(self, schedule_id: str) -> None:
-        """Stop a background loop for a schedule."""
-        if schedule_id not in self._scheduler_tasks:
-            return
-
-        task = self._scheduler_tasks[schedule_id]
-        if not task.done():
-            try:
-                task.cancel()
-                await task
-            except (asyncio.CancelledError, RuntimeError, Exception):
-                pass  # Ignore all errors during cancellation
-
-        del self._scheduler_tasks[schedule_id]
-
     # ─────────────── Internal Methods ───────────────
 
-    async def _start_schedule_loop(self, schedule_id: str) -> None:
-        """Start a background loop for a schedule."""
-        if schedule_id in self._scheduler_tasks:
-            existing_task = self._scheduler_tasks[schedule_id]
-            if not existing_task.done():
-                return  # Already running
-            # Task exists but is done - clean up before creating new one
-            del self._scheduler_tasks[schedule_id]
-            logger.debug(f"[SCHEDULER] Cleaned up done task for: {schedule_id}")
-
-        task = asyncio.create_task(self._schedule_loop(schedule_id))
-        self._scheduler_tasks[schedule_id] = task
-
+    def _arm_schedule(self, schedule_id: str, from_time: Optional[float] = None) -> None:
+        """Calculate the next fire time of a schedule and (re-)arm its timer."""
         schedule = self._schedules[schedule_id]
-        logger.info(f"[SCHEDULER] Started loop for: {schedule_id} - {schedule.name}")
+        now = time.time()
+        try:
+            schedule.next_run = ScheduleParser.calculate_next_fire_time(
+                schedule.schedule, from_time=now if from_time is None else from_time
+            )
+        except Exception as e:
+            logger.error(f"[SCHEDULER] Cannot calculate next fire time for {schedule_id}: {e}")
+            schedule.next_run = now + ERROR_RETRY_SECONDS
+        self._timer.schedule(schedule_id, schedule.next_run)
 
-    async def _schedule_loop(self, schedule_id: str) -> None:
+    async def _dispatch_due(self, due: DueTimers, now: float) -> None:
         """
-        Background loop for a single schedule.
+        Fire every schedule whose timer came due in this wakeup and re-arm it.
 
-        Calculates delay to next fire time, sleeps, then fires the trigger.
+        A schedule that was due several times while the process was
+        suspended fires once, and its next fire time is computed from now.
         """
-        logger.info(f"[SCHEDULER] Loop starting for: {schedule_id}")
+        if len(due) > 1:
+            logger.info(f"[SCHEDULER] {len(due)} schedule(s) due together")
+
+        for schedule_id, deadline in due:
+            schedule = self._schedules.get(schedule_id)
+            if not schedule or not schedule.enabled or not self._is_running:
+                continue
+
+            late = now - deadline
+            if late > MISFIRE_GRACE_SECONDS:
+                logger.info(
+                    f"[SCHEDULER] {schedule_id} ({schedule.name}) missed its fire time by "
+                    f"{late / 60:.1f}min, firing once to catch up"
+                )
 
-        while self._is_running:
             try:
-                schedule = self._schedules.get(schedule_id)
-                if not schedule:
-                    logger.warning(f"[SCHEDULER] Schedule {schedule_id} not found, exiting loop")
-                    break
-                if not schedule.enabled:
-                    logger.info(f"[SCHEDULER] Schedule {schedule_id} disabled, exiting loop")
-                    break
-
-                # Calculate next fire time
-                now = time.time()
-                next_fire = ScheduleParser.calculate_next_fire_time(
-                    schedule.schedule, from_time=now
-                )
-                schedule.next_run = next_fire
-
-                # Calculate sleep duration
-                delay = next_fire - now
-                if delay > 0:
-                    next_fire_str = datetime.fromtimestamp(next_fire).strftime("%Y-%m-%d %H:%M:%S")
-                    logger.info(
-                        f"[SCHEDULER] {schedule_id} ({schedule.name}) sleeping until {next_fire_str} "
-                        f"({delay:.1f}s / {delay / 60:.1f}min)"
-                    )
-                    await asyncio.sleep(delay)
-
-                # Check if still running and schedule still exists
-                schedule = self._schedules.get(schedule_id)
-                logger.info(f"[SCHEDULER] {schedule_id} woke up, checking conditions before fire")
-                if not schedule:
-                    logger.warning(f"[SCHEDULER] {schedule_id} schedule was removed while sleeping")
-                    break
-                if not schedule.enabled:
-                    logger.info(f"[SCHEDULER] {schedule_id} was disabled while sleeping")
-                    break
-                if not self._is_running:
-                    logger.info(f"[SCHEDULER] {schedule_id} scheduler stopped while sleeping")
-                    break
-
-                # Fire the schedule
-                logger.info(f"[SCHEDULER] {schedule_id} about to fire!")
                 await self._fire_schedule(schedule)
-
-                # Small delay before recalculating (for interval schedules)
-                if schedule.schedule.schedule_type == "interval":
-                    await asyncio.sleep(0.1)
-                else:
-                    # For time-based schedules, sleep past the current minute
-                    await asyncio.sleep(60)
-
-            except asyncio.CancelledError:
-                logger.info(f"[SCHEDULER] Loop cancelled for: {schedule_id}")
-                break
             except Exception as e:
-                logger.error(f"[SCHEDULER] Error in loop for {schedule_id}: {e}")
+                logger.error(f"[SCHEDULER] Error firing {schedule_id}: {e}")
                 import traceback
                 logger.error(f"[SCHEDULER] Traceback: {traceback.format_exc()}")
-                # Wait before retrying to avoid tight error loops
-                await asyncio.sleep(60)
-
-        logger.info(f"[SCHEDULER] Loop exited for: {schedule_id}")
+                self._timer.schedule(schedule_id, now + ERROR_RETRY_SECONDS)
+                continue
+
+            # One-time schedules have nothing left to fire. Recurring ones are
+            # re-armed strictly after this deadline, even if the timer fired
+            # within the dispatch window just before it.
+            if schedule.schedule.schedule_type != "once" and schedule_id in self._schedules:
+                self._arm_schedule(schedule_id, from_time=max(now, deadline))
 
     async def _fire_schedule(self, schedule: ScheduledTask) -> None:
         """
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+Scheduler Timer Service
+
+One min-heap of (deadline, key) timers served by a single sleeper task,
+instead of one sleeping asyncio task per schedule.
+
+- schedule() is O(log n); cancel() is O(1) (cancelled entries are dropped
+  lazily when they reach the top of the heap, and the heap is compacted
+  once most of it is stale)
+- the sleeper only waits for the earliest deadline and is woken early when
+  a new earliest deadline is added
+- every timer due at a wakeup (within DISPATCH_WINDOW) is dispatched as one
+  batch
+- sleeps are capped at MAX_SLEEP: the event loop sleeps on the monotonic
+  clock, which does not advance while the machine is suspended, so a long
+  sleep would otherwise overshoot wall-clock deadlines by the suspend time.
+  Deadlines missed that way are dispatched with their original deadline so
+  the caller can see how late they are and coalesce the catch-up.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from agent_core.utils.logger import logger
+
+# Longest single sleep; bounds how late a timer can be noticed after a
+# suspend/resume or a wall-clock change
+MAX_SLEEP = 30.0
+# Timers due within this many seconds after a wakeup are dispatched with it
+# (about the event loop's timer resolution, so nothing fires noticeably early)
+DISPATCH_WINDOW = 0.005
+# Wall clock running ahead of the monotonic clock by more than this over one
+# sleep is reported as a suspend / clock jump
+CLOCK_JUMP_THRESHOLD = 5.0
+# Compact the heap when stale entries outnumber live ones (and exceed this)
+COMPACT_MIN_STALE = 64
+
+# (key, deadline) pairs; deadline is the unix timestamp the timer was armed for
+DueTimers = List[Tuple[str, float]]
+DispatchCallback = Callable[[DueTimers, float], Awaitable[None]]
+
+# Heap entry layout: [deadline, sequence, key, active]
+_DEADLINE, _SEQ, _KEY, _ACTIVE = range(4)
+
+
+class TimerService:
+    """
+    Wall-clock timers keyed by string, fired in batches by one asyncio task.
+
+    The dispatch callback receives the due (key, deadline) pairs and the
+    current time. A dispatched timer is disarmed; re-arm it with schedule().
+    """
+
+    def __init__(
+        self,
+        dispatch: DispatchCallback,
+        max_sleep: float = MAX_SLEEP,
+        dispatch_window: float = DISPATCH_WINDOW,
+    ):
+        self._dispatch = dispatch
+        self.max_sleep = max_sleep
+        self.dispatch_window = dispatch_window
+        self._heap: List[list] = []
+        self._entries: Dict[str, list] = {}
+        self._sequence = itertools.count()
+        self._stale = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {"wakeups": 0, "batches": 0, "dispatched": 0, "clock_jumps": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    # ─────────────── Timers ───────────────
+
+    def schedule(self, key: str, deadline: float) -> None:
+        """Arm ``key`` to fire at ``deadline`` (unix timestamp), replacing any existing timer."""
+        self._discard(key)
+        entry = [deadline, next(self._sequence), key, True]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._wakeup.set()
+
+    def cancel(self, key: str) -> bool:
+        """Disarm ``key``. Returns False if it was not armed."""
+        return self._discard(key)
+
+    def clear(self) -> None:
+        """Disarm every timer."""
+        self._heap.clear()
+        self._entries.clear()
+        self._stale = 0
+
+    def deadline(self, key: str) -> Optional[float]:
+        """Deadline ``key`` is armed for, or None."""
+        entry = self._entries.get(key)
+        return entry[_DEADLINE] if entry else None
+
+    def next_deadline(self) -> Optional[float]:
+        """Earliest armed deadline, or None if nothing is armed."""
+        heap = self._heap
+        while heap and not heap[0][_ACTIVE]:
+            heapq.heappop(heap)
+            self._stale -= 1
+        return heap[0][_DEADLINE] if heap else None
+
+    def pop_due(self, now: float) -> DueTimers:
+        """Disarm and return every timer due by ``now`` (plus the dispatch window), earliest first."""
+        due = []
+        limit = now + self.dispatch_window
+        heap = self._heap
+        while heap:
+            entry = heap[0]
+            if not entry[_ACTIVE]:
+                heapq.heappop(heap)
+                self._stale -= 1
+                continue
+            if entry[_DEADLINE] > limit:
+                break
+            heapq.heappop(heap)
+            del self._entries[entry[_KEY]]
+            due.append((entry[_KEY], entry[_DEADLINE]))
+        return due
+
+    def stats(self) -> Dict[str, int]:
+        return {"armed": len(self._entries), "heap_size": len(self._heap), **self._stats}
+
+    def _discard(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry[_ACTIVE] = False
+        self._stale += 1
+        if self._stale > COMPACT_MIN_STALE and self._stale * 2 > len(self._heap):
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        self._heap = [entry for entry in self._heap if entry[_ACTIVE]]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    # ─────────────── Sleeper ───────────────
+
+    def start(self) -> None:
+        """Start the sleeper task (no-op if already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the sleeper task. Armed timers are kept."""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                self._wakeup.clear()
+                now = time.time()
+                next_deadline = self.next_deadline()
+                timeout = self.max_sleep if next_deadline is None else min(next_deadline - now, self.max_sleep)
+
+                if timeout > 0:
+                    started_mono = time.monotonic()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    jump = (time.time() - now) - (time.monotonic() - started_mono)
+                    now = time.time()
+                    if jump > CLOCK_JUMP_THRESHOLD:
+                        self._stats["clock_jumps"] += 1
+                        logger.info(
+                            f"[SCHEDULER] Wall clock moved {jump:.0f}s ahead of the monotonic clock "
+                            f"(suspend or clock change), catching up on missed timers"
+                        )
+                self._stats["wakeups"] += 1
+
+                due = self.pop_due(now)
+                if due:
+                    self._stats["batches"] += 1
+                    self._stats["dispatched"] += len(due)
+                    await self._dispatch(due, now)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[SCHEDULER] Timer dispatch failed: {e}")
+                await asyncio.sleep(1)
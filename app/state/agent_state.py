@@ -1,10 +1,20 @@
 # -*- coding: utf-8 -*-
-"""Global runtime state for a single-user, single-agent process."""
+"""
+Runtime state for a single-user, single-agent process.
+
+``STATE`` resolves to the state of the session being reacted to. Reactions
+for different sessions run concurrently, so each one enters
+``session_state(session_id)``; code running inside that scope (including
+tasks and threads it starts) reads and writes that session's state.
+Outside any scope ``STATE`` is the process-wide state.
+"""
 
 import json
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 from app.state.types import AgentProperties
 from app.task import Task
 
@@ -16,6 +26,8 @@ class AgentState:
     event_stream: Optional[str] = None
     gui_mode: bool = False
     agent_properties: AgentProperties = AgentProperties(current_task_id="", action_count=0)
+    # Values of session_local attributes while this state is in scope
+    session_locals: Dict[Any, Any] = field(default_factory=dict, repr=False)
 
     def update_current_task(self, new_task: Optional[Task]) -> None:
         self.current_task = new_task
@@ -56,5 +68,91 @@ class AgentState:
         """
         return self.agent_properties.to_dict()
 
+
+# ---- Per-session scopes ----
+_GLOBAL_STATE = AgentState()
+_scoped_state: ContextVar[Optional[AgentState]] = ContextVar("agent_state", default=None)
+# Agent properties (action/token counts, current task id) outlive a single
+# reaction, so they are kept per session until the session is dropped
+_session_properties: Dict[str, AgentProperties] = {}
+
+
+def current_state() -> AgentState:
+    """Return the state of the enclosing session scope, or the process-wide state."""
+    return _scoped_state.get() or _GLOBAL_STATE
+
+
+@contextmanager
+def session_state(session_id: Optional[str]) -> Iterator[AgentState]:
+    """
+    Give the calling context its own state for ``session_id``.
+
+    Each scope starts with no current task or event stream (like the
+    process-wide state after ``refresh()``) and shares the session's agent
+    properties with earlier scopes for the same session.
+    """
+    if session_id:
+        properties = _session_properties.get(session_id)
+        if properties is None:
+            properties = AgentProperties(current_task_id=session_id, action_count=0)
+            _session_properties[session_id] = properties
+    else:
+        properties = AgentProperties(current_task_id="", action_count=0)
+
+    state = AgentState(agent_properties=properties)
+    token = _scoped_state.set(state)
+    try:
+        yield state
+    finally:
+        _scoped_state.reset(token)
+
+
+def drop_session_state(session_id: str) -> None:
+    """Forget the agent properties kept for a session that has ended."""
+    _session_properties.pop(session_id, None)
+
+
+class session_local:
+    """
+    Instance attribute that holds a separate value inside each session scope.
+
+    Outside any scope the value is stored on the instance as usual.
+    """
+
+    def __init__(self, default: Any = None):
+        self._default = default
+
+    def __set_name__(self, owner, name):
+        self._name = f"_{name}_global"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        state = _scoped_state.get()
+        if state is None:
+            return obj.__dict__.get(self._name, self._default)
+        return state.session_locals.get((id(obj), self._name), self._default)
+
+    def __set__(self, obj, value):
+        state = _scoped_state.get()
+        if state is None:
+            obj.__dict__[self._name] = value
+        else:
+            state.session_locals[(id(obj), self._name)] = value
+
+
+class _ScopedState:
+    """Proxy that forwards attribute access to :func:`current_state`."""
+
+    def __getattr__(self, name):
+        return getattr(current_state(), name)
+
+    def __setattr__(self, name, value):
+        setattr(current_state(), name, value)
+
+    def __repr__(self):
+        return repr(current_state())
+
+
 # ---- Global runtime state ----
-STATE = AgentState()
+STATE = _ScopedState()
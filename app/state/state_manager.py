@@ -5,7 +5,7 @@ from agent_core.core.state.types import MainState
 from agent_core.core.state.session import StateSession
 from agent_core.utils.file_utils import rotate_md_file_if_needed
 from app.state.types import AgentProperties
-from app.state.agent_state import STATE
+from app.state.agent_state import STATE, session_local
 from app.event_stream import EventStreamManager
 from app.task import Task, TodoItem
 from app.logger import logger
@@ -18,6 +18,9 @@ if TYPE_CHECKING:
 class StateManager:
     """Manages task state and runtime session data."""
 
+    # Task of the session being reacted to (see app.state.agent_state.session_state)
+    task: Optional[Task] = session_local()
+
     def __init__(
         self,
         event_stream_manager: EventStreamManager,
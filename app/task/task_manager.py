@@ -20,7 +20,7 @@ from agent_core.core.task import Task
 from app.database_interface import DatabaseInterface
 from app.event_stream import EventStreamManager
 from app.state.state_manager import StateManager
-from app.state.agent_state import STATE
+from app.state.agent_state import STATE, session_local
 from app.config import AGENT_WORKSPACE_ROOT, AGENT_FILE_SYSTEM_PATH
 from app.logger import logger
 
@@ -96,6 +96,10 @@ class TaskManager(_TaskManager):
     operates locally without network reporting.
     """
 
+    # Reactions for different sessions run concurrently, so the session that
+    # ``active`` resolves to is kept per session scope
+    _current_session_id: Optional[str] = session_local()
+
     def __init__(
         self,
         db_interface: DatabaseInterface,
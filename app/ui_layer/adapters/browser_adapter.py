@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import hashlib
 import json
 import os
 import shutil
@@ -16,6 +17,11 @@ from aiohttp.client_exceptions import ClientConnectionResetError
 from agent_core.utils.logger import logger
 from app.config import AGENT_WORKSPACE_ROOT
 from app.ui_layer.adapters.base import InterfaceAdapter
+from app.ui_layer.adapters.ws_fanout import (
+    ClientSendQueue,
+    FootageEncoderConfig,
+    encode_footage_frame,
+)
 from app.ui_layer.settings import (
     # General settings
     read_agent_file,
@@ -269,7 +275,7 @@ class BrowserChatComponent(ChatComponentProtocol):
                     task_session_id=message.task_session_id,
                     options=options_data,
                 )
-                self._storage.insert_message(stored)
+                await self._storage.insert_message_async(stored)
             except Exception:
                 pass
 
@@ -324,7 +330,7 @@ class BrowserChatComponent(ChatComponentProtocol):
         # Clear from storage
         if self._storage:
             try:
-                self._storage.clear_messages()
+                await self._storage.clear_messages_async()
             except Exception:
                 pass
 
@@ -435,7 +441,7 @@ class BrowserActionPanelComponent(ActionPanelProtocol):
             # Storage may not be available, continue without persistence
             pass
 
-    def _persist_item(self, item: ActionItem) -> None:
+    async def _persist_item(self, item: ActionItem) -> None:
         """Persist an action item to storage."""
         if self._storage:
             try:
@@ -452,7 +458,7 @@ class BrowserActionPanelComponent(ActionPanelProtocol):
                     output_data=item.output_data,
                     error_message=item.error_message,
                 )
-                self._storage.insert_item(stored)
+                await self._storage.insert_item_async(stored)
             except Exception:
                 pass
 
@@ -469,7 +475,7 @@ class BrowserActionPanelComponent(ActionPanelProtocol):
         self._items.append(item)
 
         # Persist to storage
-        self._persist_item(item)
+        await self._persist_item(item)
 
         await self._adapter._broadcast({
             "type": "action_add",
@@ -501,7 +507,7 @@ class BrowserActionPanelComponent(ActionPanelProtocol):
 
         if matched_item:
             # Persist update to storage
-            self._persist_item(matched_item)
+            await self._persist_item(matched_item)
 
             await self._adapter._broadcast({
                 "type": "action_update",
@@ -568,7 +574,7 @@ class BrowserActionPanelComponent(ActionPanelProtocol):
                 matched_item.error_message = error
 
             # Persist update to storage
-            self._persist_item(matched_item)
+            await self._persist_item(matched_item)
 
             await self._adapter._broadcast({
                 "type": "action_update",
@@ -600,7 +606,7 @@ class BrowserActionPanelComponent(ActionPanelProtocol):
 
         if matched_item:
             # Persist update to storage
-            self._persist_item(matched_item)
+            await self._persist_item(matched_item)
 
             await self._adapter._broadcast({
                 "type": "action_update",
@@ -620,7 +626,7 @@ class BrowserActionPanelComponent(ActionPanelProtocol):
         # Remove from storage
         if self._storage:
             try:
-                self._storage.delete_item(item_id)
+                await self._storage.delete_item_async(item_id)
             except Exception:
                 pass
 
@@ -636,7 +642,7 @@ class BrowserActionPanelComponent(ActionPanelProtocol):
         # Clear from storage
         if self._storage:
             try:
-                self._storage.clear_items()
+                await self._storage.clear_items_async()
             except Exception:
                 pass
 
@@ -729,19 +735,12 @@ class BrowserFootageComponent(FootageComponentProtocol):
         self._visible: bool = False
 
     async def update(self, image_bytes: bytes) -> None:
-        """Update footage - send as base64."""
-        import base64
-
-        b64 = base64.b64encode(image_bytes).decode("utf-8")
-        await self._adapter._broadcast({
-            "type": "footage_update",
-            "data": {
-                "image": f"data:image/png;base64,{b64}",
-            },
-        })
+        """Update footage - binary frames (base64 JSON for legacy clients)."""
+        await self._adapter._broadcast_footage(image_bytes)
 
     async def clear(self) -> None:
         """Clear footage."""
+        self._adapter._discard_pending_footage()
         await self._adapter._broadcast({
             "type": "footage_clear",
         })
@@ -779,7 +778,20 @@ class BrowserAdapter(InterfaceAdapter):
         self._footage = BrowserFootageComponent(self)
         self._app: Optional["web.Application"] = None
         self._ws_clients: Set = set()
+        # Per-client send queues (see ws_fanout)
+        self._ws_senders: Dict[Any, ClientSendQueue] = {}
         self._metrics_subscribers: Set = set()
+
+        # Footage frame processing (rate cap, optional JPEG, unchanged-frame skip)
+        jpeg_quality = os.environ.get("BROWSER_FOOTAGE_JPEG_QUALITY")
+        self._footage_config = FootageEncoderConfig(
+            max_fps=float(os.environ.get("BROWSER_FOOTAGE_MAX_FPS", 10)),
+            jpeg_quality=int(jpeg_quality) if jpeg_quality else None,
+        )
+        self._footage_last_digest: Optional[bytes] = None
+        self._footage_last_sent: float = 0.0
+        self._footage_pending: Optional[bytes] = None
+        self._footage_flush_handle: Optional[asyncio.TimerHandle] = None
         self._runner: Optional["web.AppRunner"] = None
         self._started_at: float = 0.0
         self._ws_prepare_failures: int = 0
@@ -1052,6 +1064,10 @@ A quick Q&A will now begin to understand your objectives to serve you better:"""
                 pass
 
         # Close all WebSocket connections
+        for sender in list(self._ws_senders.values()):
+            sender.close()
+            await sender.wait_closed()
+        self._ws_senders.clear()
         for ws in self._ws_clients.copy():
             await ws.close()
         self._ws_clients.clear()
@@ -1064,7 +1080,6 @@ A quick Q&A will now begin to understand your objectives to serve you better:"""
     async def _websocket_handler(self, request: "web.Request") -> "web.WebSocketResponse":
         """Handle WebSocket connections."""
         from aiohttp import web, WSMsgType
-        import asyncio
 
         ws = web.WebSocketResponse(
             max_msg_size=100 * 1024 * 1024,
@@ -1099,7 +1114,7 @@ A quick Q&A will now begin to understand your objectives to serve you better:"""
             return ws
         
         is_first_client = len(self._ws_clients) == 0
-        self._ws_clients.add(ws)
+        sender = ClientSendQueue(ws, binary_footage=request.query.get("footage") == "binary")
 
         # Trigger soft onboarding on first client connection so the UI
         # is ready to receive the task creation event.
@@ -1108,23 +1123,20 @@ A quick Q&A will now begin to understand your objectives to serve you better:"""
             if onboarding_manager.needs_soft_onboarding:
                 agent = self._controller.agent
                 if agent:
-                    import asyncio
                     asyncio.create_task(agent.trigger_soft_onboarding())
 
-        # Send initial state
+        # Send initial state (queued first, so it precedes any broadcast)
         try:
             initial_state = self._get_initial_state()
-            await ws.send_json({
+            sender.enqueue("init", json.dumps({
                 "type": "init",
                 "data": initial_state,
-            })
-        except (ConnectionResetError, ClientConnectionResetError, RuntimeError) as e:
-            # Gracefully handle connection closing
-            self._ws_clients.discard(ws)
-            return ws
+            }))
         except Exception as e:
-            self._ws_clients.discard(ws)
+            sender.close()
             return ws
+        self._ws_senders[ws] = sender
+        self._ws_clients.add(ws)
 
         # Message loop
         try:
@@ -1159,6 +1171,8 @@ A quick Q&A will now begin to understand your objectives to serve you better:"""
         finally:
             self._ws_clients.discard(ws)
             self._metrics_subscribers.discard(ws)
+            self._ws_senders.pop(ws, None)
+            sender.close()
 
         return ws
 
@@ -2665,7 +2679,7 @@ A quick Q&A will now begin to understand your objectives to serve you better:"""
             if self._chat and message_id:
                 if self._chat._storage:
                     try:
-                        self._chat._storage.update_option_selected(message_id, value)
+                        await self._chat._storage.update_option_selected_async(message_id, value)
                     except Exception:
                         pass
                 # Update in-memory message so refreshes reflect the selection
@@ -3645,7 +3659,8 @@ A quick Q&A will now begin to understand your objectives to serve you better:"""
             from app.ui_layer.settings.model_settings import set_slow_mode
             enabled = data.get("enabled", False)
             tpm_limit = data.get("tpmLimit")
-            result = set_slow_mode(enabled, tpm_limit)
+            rpm_limit = data.get("rpmLimit")
+            result = set_slow_mode(enabled, tpm_limit, rpm_limit)
             await self._broadcast({"type": "slow_mode_set", "data": result})
         except Exception as e:
             await self._broadcast({
@@ -4640,25 +4655,96 @@ A quick Q&A will now begin to understand your objectives to serve you better:"""
             })
 
     async def _broadcast(self, message: Dict[str, Any]) -> None:
-        """Broadcast message to all connected clients."""
-        if not self._ws_clients:
+        """Broadcast message to all connected clients.
+
+        Serializes once and enqueues on each client's send queue; never waits
+        on a slow client.
+        """
+        if not self._ws_senders:
             return
 
         json_msg = json.dumps(message)
-        disconnected = set()
+        msg_type = message.get("type", "")
+        for ws, sender in list(self._ws_senders.items()):
+            if not sender.enqueue(msg_type, json_msg):
+                self._drop_client(ws)
+
+    def _drop_client(self, ws) -> None:
+        """Forget a client whose send queue has closed."""
+        self._ws_senders.pop(ws, None)
+        self._ws_clients.discard(ws)
+        self._metrics_subscribers.discard(ws)
+
+    def get_fanout_stats(self) -> List[Dict[str, Any]]:
+        """Per-client delivery stats: sent, coalesced, pending, latency (ms)."""
+        return [
+            {**sender.stats.to_dict(), "pending": sender.pending, "binary_footage": sender.binary_footage}
+            for sender in self._ws_senders.values()
+        ]
 
-        for ws in self._ws_clients.copy():
-            try:
-                await ws.send_str(json_msg)
-            except (ClientConnectionResetError, ConnectionResetError, RuntimeError):
-                # Silently handle expected connection errors
-                disconnected.add(ws)
-            except Exception:
-                # Log unexpected errors
-                disconnected.add(ws)
+    # ─────────────────────────────────────────────────────────────────────
+    # Footage Frames
+    # ─────────────────────────────────────────────────────────────────────
 
-        # Clean up disconnected clients
-        self._ws_clients -= disconnected
+    async def _broadcast_footage(self, image_bytes: bytes) -> None:
+        """Send a footage frame, skipping unchanged frames and capping the frame rate."""
+        if not self._ws_senders or not image_bytes:
+            return
+
+        config = self._footage_config
+        if config.skip_unchanged:
+            digest = hashlib.blake2b(image_bytes, digest_size=16).digest()
+            if digest == self._footage_last_digest:
+                return
+            self._footage_last_digest = digest
+
+        min_interval = 1.0 / config.max_fps if config.max_fps > 0 else 0.0
+        wait = self._footage_last_sent + min_interval - time.monotonic()
+        if wait > 0:
+            # Too soon: keep only the newest frame and send it when the interval ends
+            self._footage_pending = image_bytes
+            if self._footage_flush_handle is None:
+                loop = asyncio.get_running_loop()
+                self._footage_flush_handle = loop.call_later(
+                    wait, lambda: asyncio.ensure_future(self._flush_pending_footage())
+                )
+            return
+
+        await self._send_footage(image_bytes)
+
+    async def _flush_pending_footage(self) -> None:
+        self._footage_flush_handle = None
+        image_bytes, self._footage_pending = self._footage_pending, None
+        if image_bytes is not None:
+            await self._send_footage(image_bytes)
+
+    def _discard_pending_footage(self) -> None:
+        """Drop any rate-capped frame so it cannot arrive after a clear."""
+        if self._footage_flush_handle is not None:
+            self._footage_flush_handle.cancel()
+            self._footage_flush_handle = None
+        self._footage_pending = None
+        self._footage_last_digest = None
+
+    async def _send_footage(self, image_bytes: bytes) -> None:
+        self._footage_last_sent = time.monotonic()
+        if self._footage_config.jpeg_quality is None:
+            frame = encode_footage_frame(image_bytes, None)
+        else:
+            frame = await asyncio.to_thread(
+                encode_footage_frame, image_bytes, self._footage_config.jpeg_quality
+            )
+
+        binary = None
+        for ws, sender in list(self._ws_senders.items()):
+            if sender.binary_footage:
+                if binary is None:
+                    binary = frame.binary()
+                payload = binary
+            else:
+                payload = frame.json()
+            if not sender.enqueue("footage_update", payload):
+                self._drop_client(ws)
 
     async def _broadcast_error_to_chat(self, error_message: str) -> None:
         """Broadcast an error message to the chat panel for debugging."""
@@ -4684,14 +4770,11 @@ A quick Q&A will now begin to understand your objectives to serve you better:"""
             try:
                 if self._metrics_subscribers:
                     metrics = self._metrics_collector.get_metrics()
-                    payload = {"type": "dashboard_metrics", "data": metrics.to_dict()}
-                    disconnected: Set = set()
+                    payload = json.dumps({"type": "dashboard_metrics", "data": metrics.to_dict()})
                     for ws in self._metrics_subscribers.copy():
-                        try:
-                            await ws.send_json(payload)
-                        except Exception:
-                            disconnected.add(ws)
-                    self._metrics_subscribers -= disconnected
+                        sender = self._ws_senders.get(ws)
+                        if sender is None or not sender.enqueue("dashboard_metrics", payload):
+                            self._metrics_subscribers.discard(ws)
                 await asyncio.sleep(2)  # Update every 2 seconds
             except asyncio.CancelledError:
                 break
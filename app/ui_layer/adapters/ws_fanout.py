@@ -0,0 +1,252 @@
+"""Per-client websocket send queues for the browser adapter.
+
+Broadcasting used to await ``send_str`` on every client in turn, so one slow
+browser tab delayed delivery to every other tab and to the broadcaster.
+Each client now gets a ``ClientSendQueue``: broadcasting only enqueues, and a
+drain task per client performs the actual sends.
+
+Delivery policy is chosen per message type:
+
+- lossless (default): every message is delivered, in order. If a client
+  falls ``max_pending`` messages behind it is disconnected; the browser
+  reconnects and receives a fresh ``init`` state.
+- latest-wins (``LATEST_WINS_TYPES``): a newer message of the same type
+  replaces an unsent older one, so slow clients skip stale frames instead
+  of accumulating them.
+
+Footage frames are sent as binary websocket frames to clients that opt in
+(``?footage=binary``):
+
+    byte 0      frame kind (FRAME_FOOTAGE)
+    byte 1      length N of the mime type
+    bytes 2..   mime type (ASCII), then the image bytes
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional, Union
+
+from agent_core.utils.logger import logger
+
+# Message types where only the newest unsent message matters
+LATEST_WINS_TYPES = frozenset({"footage_update", "dashboard_metrics"})
+
+# Lossless messages a client may fall behind by before it is disconnected
+MAX_PENDING_MESSAGES = 2000
+
+# Seconds a single send may take before the client is considered stalled
+SEND_TIMEOUT = 15.0
+
+# Binary frame kinds
+FRAME_FOOTAGE = 0x01
+
+
+def encode_binary_frame(kind: int, mime: str, payload: bytes) -> bytes:
+    """Build a binary frame: kind byte, mime length byte, mime, payload."""
+    mime_bytes = mime.encode("ascii")
+    return bytes((kind, len(mime_bytes))) + mime_bytes + payload
+
+
+@dataclass
+class _Entry:
+    msg_type: str
+    payload: Union[str, bytes]
+    enqueued_at: float
+    alive: bool = True
+
+
+@dataclass
+class FanoutStats:
+    """Delivery counters for one client."""
+
+    sent: int = 0
+    coalesced: int = 0
+    max_latency_ms: float = 0.0
+    total_latency_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "max_latency_ms": round(self.max_latency_ms, 2),
+            "avg_latency_ms": round(self.total_latency_ms / self.sent, 2) if self.sent else 0.0,
+        }
+
+
+class ClientSendQueue:
+    """Bounded, per-client send queue drained by its own task."""
+
+    def __init__(
+        self,
+        ws: Any,
+        *,
+        binary_footage: bool = False,
+        max_pending: int = MAX_PENDING_MESSAGES,
+        send_timeout: float = SEND_TIMEOUT,
+    ) -> None:
+        self.ws = ws
+        self.binary_footage = binary_footage
+        self.stats = FanoutStats()
+        self._max_pending = max_pending
+        self._send_timeout = send_timeout
+        self._queue: Deque[_Entry] = deque()
+        self._latest: Dict[str, _Entry] = {}
+        self._lossless_pending = 0
+        self._wakeup = asyncio.Event()
+        self._closed = False
+        self._task = asyncio.create_task(self._drain())
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def pending(self) -> int:
+        return self._lossless_pending + len(self._latest)
+
+    def enqueue(self, msg_type: str, payload: Union[str, bytes]) -> bool:
+        """
+        Queue a message without blocking.
+
+        Returns:
+            False if the client is closed or was disconnected for lagging.
+        """
+        if self._closed:
+            return False
+
+        entry = _Entry(msg_type, payload, time.perf_counter())
+        if msg_type in LATEST_WINS_TYPES:
+            previous = self._latest.get(msg_type)
+            if previous is not None:
+                # Drop the stale one; the new entry goes to the back so it
+                # still follows anything queued after the old one (e.g. a clear)
+                previous.alive = False
+                self.stats.coalesced += 1
+            self._latest[msg_type] = entry
+        else:
+            if self._lossless_pending >= self._max_pending:
+                logger.warning(
+                    f"[BROWSER ADAPTER] Client fell {self._lossless_pending} messages behind; disconnecting"
+                )
+                self.close()
+                return False
+            self._lossless_pending += 1
+
+        self._queue.append(entry)
+        self._wakeup.set()
+        return True
+
+    def close(self) -> None:
+        """Stop draining and close the websocket (in the background)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.clear()
+        self._latest.clear()
+        self._wakeup.set()
+        if self._task is not asyncio.current_task():
+            # Interrupt a send that is stuck on a slow client
+            self._task.cancel()
+
+    async def wait_closed(self) -> None:
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+    async def _drain(self) -> None:
+        try:
+            while not self._closed:
+                if not self._queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                entry = self._queue.popleft()
+                if entry.msg_type in LATEST_WINS_TYPES:
+                    if self._latest.get(entry.msg_type) is entry:
+                        del self._latest[entry.msg_type]
+                else:
+                    self._lossless_pending -= 1
+                if not entry.alive:
+                    continue
+
+                if isinstance(entry.payload, bytes):
+                    send = self.ws.send_bytes(entry.payload)
+                else:
+                    send = self.ws.send_str(entry.payload)
+                await asyncio.wait_for(send, timeout=self._send_timeout)
+
+                latency_ms = (time.perf_counter() - entry.enqueued_at) * 1000
+                self.stats.sent += 1
+                self.stats.total_latency_ms += latency_ms
+                self.stats.max_latency_ms = max(self.stats.max_latency_ms, latency_ms)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            # Connection reset / stalled client: stop sending to it
+            pass
+        finally:
+            self.close()
+            try:
+                await self.ws.close()
+            except Exception:
+                pass
+
+
+@dataclass
+class FootageEncoderConfig:
+    """Footage frame processing options for the browser adapter."""
+
+    # Frames per second sent to clients (0 disables the cap)
+    max_fps: float = 10.0
+    # Re-encode frames as JPEG at this quality (None keeps the original PNG)
+    jpeg_quality: Optional[int] = None
+    # Skip frames identical to the previous one
+    skip_unchanged: bool = True
+
+
+@dataclass
+class EncodedFrame:
+    """A footage frame ready to send."""
+
+    mime: str
+    data: bytes
+    _json: Optional[str] = field(default=None, repr=False)
+
+    def binary(self) -> bytes:
+        return encode_binary_frame(FRAME_FOOTAGE, self.mime, self.data)
+
+    def json(self) -> str:
+        """Legacy base64 JSON message, built once and only if some client needs it."""
+        if self._json is None:
+            import base64
+            import json
+
+            b64 = base64.b64encode(self.data).decode("utf-8")
+            self._json = json.dumps({
+                "type": "footage_update",
+                "data": {"image": f"data:{self.mime};base64,{b64}"},
+            })
+        return self._json
+
+
+def encode_footage_frame(image_bytes: bytes, jpeg_quality: Optional[int]) -> EncodedFrame:
+    """Optionally re-encode a PNG frame as JPEG (requires Pillow)."""
+    if jpeg_quality is None:
+        return EncodedFrame("image/png", image_bytes)
+    try:
+        import io
+        from PIL import Image
+
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            out = io.BytesIO()
+            image.convert("RGB").save(out, format="JPEG", quality=jpeg_quality)
+        return EncodedFrame("image/jpeg", out.getvalue())
+    except Exception as e:
+        logger.debug(f"[BROWSER ADAPTER] JPEG re-encoding unavailable, sending PNG: {e}")
+        return EncodedFrame("image/png", image_bytes)
@@ -197,6 +197,9 @@ const defaultState: WebSocketState = {
   livingUIStates: {},
 }
 
+// Binary websocket frame kinds (see app/ui_layer/adapters/ws_fanout.py)
+const FRAME_FOOTAGE = 0x01
+
 const WebSocketContext = createContext<WebSocketContextType | undefined>(undefined)
 
 export function WebSocketProvider({ children }: { children: ReactNode }) {
@@ -226,6 +229,26 @@ export function WebSocketProvider({ children }: { children: ReactNode }) {
     outboxRef.current.push(payloadStr)
   }, [])
 
+  // Footage arrives as binary frames: [kind][mime length][mime][image bytes].
+  // Each frame becomes a Blob URL; the previous one is revoked to free memory.
+  const footageUrlRef = useRef<string | null>(null)
+  const setFootageUrl = useCallback((url: string | null) => {
+    if (footageUrlRef.current && footageUrlRef.current.startsWith('blob:')) {
+      URL.revokeObjectURL(footageUrlRef.current)
+    }
+    footageUrlRef.current = url
+    setState(prev => ({ ...prev, footageUrl: url }))
+  }, [])
+
+  const handleBinaryFrame = useCallback((buffer: ArrayBuffer) => {
+    const bytes = new Uint8Array(buffer)
+    if (bytes.length < 2 || bytes[0] !== FRAME_FOOTAGE) return
+    const mimeEnd = 2 + bytes[1]
+    const mime = new TextDecoder().decode(bytes.subarray(2, mimeEnd))
+    const blob = new Blob([bytes.subarray(mimeEnd)], { type: mime })
+    setFootageUrl(URL.createObjectURL(blob))
+  }, [setFootageUrl])
+
   const connect = useCallback(() => {
     // Prevent duplicate connections (React StrictMode calls useEffect twice)
     if (isConnectingRef.current || wsRef.current?.readyState === WebSocket.OPEN) {
@@ -248,10 +271,11 @@ export function WebSocketProvider({ children }: { children: ReactNode }) {
     // UUID itself is not logged here — the server logs it on failure.
     const attemptId = newClientId()
     const baseUrl = getWsUrl()
-    const wsUrl = `${baseUrl}${baseUrl.includes('?') ? '&' : '?'}attempt=${attemptId}`
+    const wsUrl = `${baseUrl}${baseUrl.includes('?') ? '&' : '?'}attempt=${attemptId}&footage=binary`
 
     try {
       const ws = new WebSocket(wsUrl)
+      ws.binaryType = 'arraybuffer'
       wsRef.current = ws
 
       ws.onopen = () => {
@@ -272,6 +296,10 @@ export function WebSocketProvider({ children }: { children: ReactNode }) {
       }
 
       ws.onmessage = (event) => {
+        if (event.data instanceof ArrayBuffer) {
+          handleBinaryFrame(event.data)
+          return
+        }
         try {
           const msg: WSMessage = JSON.parse(event.data)
           handleMessage(msg)
@@ -319,7 +347,7 @@ export function WebSocketProvider({ children }: { children: ReactNode }) {
       const reconnectDelay = Math.min(1000 * Math.pow(1.5, reconnectCountRef.current), 30000)
       reconnectTimeoutRef.current = window.setTimeout(connect, reconnectDelay)
     }
-  }, [sendOrQueue])
+  }, [sendOrQueue, handleBinaryFrame])
 
   const handleMessage = useCallback((msg: WSMessage) => {
     switch (msg.type) {
@@ -470,12 +498,12 @@ export function WebSocketProvider({ children }: { children: ReactNode }) {
 
       case 'footage_update': {
         const { image } = msg.data as { image: string }
-        setState(prev => ({ ...prev, footageUrl: image }))
+        setFootageUrl(image)
         break
       }
 
       case 'footage_clear':
-        setState(prev => ({ ...prev, footageUrl: null }))
+        setFootageUrl(null)
         break
 
       case 'footage_visibility': {
@@ -961,7 +989,7 @@ export function WebSocketProvider({ children }: { children: ReactNode }) {
         break
       }
     }
-  }, [])
+  }, [setFootageUrl])
 
   useEffect(() => {
     connect()
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
+from agent_core.decorators import profiler, OperationCategory
 from agent_core.utils.logger import logger
 from app.ui_layer.events.event_bus import EventBus
 from app.ui_layer.events.event_types import UIEvent, UIEventType
@@ -31,6 +33,9 @@ class UIControllerConfig:
         enable_footage: Whether to enable footage display
         enable_action_panel: Whether to enable action panel
         max_event_history: Maximum events to keep in history
+        trigger_workers: Number of concurrent trigger consumers. Triggers for
+            different sessions run in parallel; triggers within one session
+            are always processed in order.
     """
 
     default_provider: str = "openai"
@@ -38,6 +43,7 @@ class UIControllerConfig:
     enable_footage: bool = True
     enable_action_panel: bool = True
     max_event_history: int = 1000
+    trigger_workers: int = 4
 
 
 class UIController:
@@ -98,7 +104,8 @@ class UIController:
         self._running = False
         self._adapter: Optional["InterfaceAdapter"] = None
         self._event_task: Optional[asyncio.Task] = None
-        self._trigger_task: Optional[asyncio.Task] = None
+        self._trigger_tasks: List[asyncio.Task] = []
+        self._busy_workers = 0
 
         # Register built-in commands
         self._register_builtin_commands()
@@ -167,8 +174,12 @@ class UIController:
         # Start event watching task
         self._event_task = asyncio.create_task(self._watch_agent_events())
 
-        # Start trigger consuming task
-        self._trigger_task = asyncio.create_task(self._consume_triggers())
+        # Start the pool of trigger consumers
+        worker_count = max(1, self._config.trigger_workers)
+        self._trigger_tasks = [
+            asyncio.create_task(self._consume_triggers(worker_id))
+            for worker_id in range(worker_count)
+        ]
 
     async def stop(self) -> None:
         """Stop the UI controller."""
@@ -185,12 +196,14 @@ class UIController:
             except asyncio.CancelledError:
                 pass
 
-        if self._trigger_task:
-            self._trigger_task.cancel()
+        for task in self._trigger_tasks:
+            task.cancel()
+        for task in self._trigger_tasks:
             try:
-                await self._trigger_task
+                await task
             except asyncio.CancelledError:
                 pass
+        self._trigger_tasks = []
 
     # ─────────────────────────────────────────────────────────────────────
     # Adapter Management
@@ -500,37 +513,73 @@ class UIController:
                     },
                 )
 
-    async def _consume_triggers(self) -> None:
-        """Consume triggers and run agent reactions."""
-        logger.info("[CONSUMER] Trigger consumer started")
+    async def _consume_triggers(self, worker_id: int = 0) -> None:
+        """
+        Consume triggers and run agent reactions.
+
+        Several consumers run concurrently. The trigger queue leases a session
+        to one consumer at a time, so reactions for the same session never
+        overlap.
+
+        Args:
+            worker_id: Index of this consumer in the worker pool (for logging).
+        """
+        logger.info(f"[CONSUMER-{worker_id}] Trigger consumer started")
         try:
             while self._running and self._agent.is_running:
                 try:
                     trigger = await self._agent.triggers.get()
-                    await self._agent.react(trigger)
+                    try:
+                        await self._run_trigger(worker_id, trigger)
+                    finally:
+                        await self._agent.triggers.release(trigger.session_id)
                 except asyncio.CancelledError:
                     raise
                 except Exception as e:
                     logger.error(
-                        f"[CONSUMER] Exception during trigger processing: {e!r}",
+                        f"[CONSUMER-{worker_id}] Exception during trigger processing: {e!r}",
                         exc_info=True,
                     )
                     await asyncio.sleep(0.1)
         except asyncio.CancelledError:
-            logger.info("[CONSUMER] Trigger consumer cancelled")
+            logger.info(f"[CONSUMER-{worker_id}] Trigger consumer cancelled")
             raise
         except BaseException as e:
             logger.error(
-                f"[CONSUMER] Trigger consumer died with unhandled {type(e).__name__}: {e!r}",
+                f"[CONSUMER-{worker_id}] Trigger consumer died with unhandled {type(e).__name__}: {e!r}",
                 exc_info=True,
             )
             raise
         finally:
             logger.info(
-                f"[CONSUMER] Trigger consumer exiting "
+                f"[CONSUMER-{worker_id}] Trigger consumer exiting "
                 f"(running={self._running}, agent_running={self._agent.is_running})"
             )
 
+    async def _run_trigger(self, worker_id: int, trigger) -> None:
+        """Run one reaction and report worker utilization to the profiler."""
+        self._busy_workers += 1
+        start = time.perf_counter()
+        try:
+            await self._agent.react(trigger)
+        finally:
+            busy_workers = self._busy_workers
+            self._busy_workers -= 1
+            if profiler.enabled:
+                worker_count = max(1, len(self._trigger_tasks))
+                profiler.record(
+                    "trigger_worker_react",
+                    (time.perf_counter() - start) * 1000,
+                    OperationCategory.TRIGGER,
+                    {
+                        "worker_id": worker_id,
+                        "session_id": trigger.session_id,
+                        "busy_workers": busy_workers,
+                        "worker_count": worker_count,
+                        "utilization": round(busy_workers / worker_count, 3),
+                    },
+                )
+
     # ─────────────────────────────────────────────────────────────────────
     # Command Registration
     # ─────────────────────────────────────────────────────────────────────
@@ -1,11 +1,17 @@
-"""Dashboard metrics collector for the browser interface."""
+"""Dashboard metrics collector for the browser interface.
+
+Call and task totals are aggregated as they are recorded, into running totals
+and rolling per-minute / per-hour buckets, so a dashboard refresh costs
+O(buckets) regardless of how many calls were made. System stats are sampled
+on their own thread and cached.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import time
 import threading
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -30,6 +36,18 @@ except ImportError:
 if TYPE_CHECKING:
     from app.agent_base import AgentBase
 
+# Rolling buckets: per-minute for the last-hour view, per-hour (local hours)
+# for today / this week / this month
+MINUTE_BUCKET_RETENTION = 120
+HOUR_BUCKET_RETENTION = 32 * 24
+
+# System stats sampling (seconds); disk usage changes slowly and is the
+# most expensive call, so it is sampled less often
+SYSTEM_SAMPLE_INTERVAL = 2.0
+DISK_SAMPLE_INTERVAL = 60.0
+# The sampler thread exits when nobody has read the stats for this long
+SYSTEM_SAMPLER_IDLE_TIMEOUT = 60.0
+
 
 # ─────────────────────────────────────────────────────────────────────
 # Pricing Data (USD per 1M tokens)
@@ -87,18 +105,6 @@ class LLMCallRecord:
     task_id: Optional[str] = None
 
 
-@dataclass
-class TaskRecord:
-    """Record of a completed task."""
-    task_id: str
-    name: str
-    status: str  # "completed" or "error"
-    start_time: float
-    end_time: float
-    total_cost: float
-    llm_call_count: int
-
-
 @dataclass
 class SystemMetrics:
     """Current system resource metrics."""
@@ -390,6 +396,153 @@ class FilteredDashboardMetrics:
         }
 
 
+# ─────────────────────────────────────────────────────────────────────
+# Rolling Buckets
+# ─────────────────────────────────────────────────────────────────────
+
+class RollingBuckets:
+    """
+    Sums of (requests, cost) per time bucket over a bounded window.
+
+    Buckets are either fixed-width (minutes) or local clock hours, so that
+    "since midnight" sums line up with bucket boundaries in any timezone.
+    """
+
+    def __init__(self, retention: int, width: Optional[float] = None) -> None:
+        self._width = width
+        # bucket start timestamp -> [requests, cost], oldest first
+        self._buckets: "deque[Tuple[float, List[float]]]" = deque(maxlen=retention)
+        self._current_end = 0.0
+
+    def add(self, timestamp: float, cost: float) -> None:
+        if self._buckets and self._buckets[-1][0] <= timestamp < self._current_end:
+            values = self._buckets[-1][1]
+        else:
+            start, self._current_end = self._bounds(timestamp)
+            if self._buckets and self._buckets[-1][0] == start:
+                values = self._buckets[-1][1]
+            else:
+                values = [0, 0.0]
+                self._buckets.append((start, values))
+        values[0] += 1
+        values[1] += cost
+
+    def since(self, since: float) -> Tuple[int, float]:
+        """(requests, cost) summed over buckets starting at or after ``since``."""
+        requests, cost = 0, 0.0
+        for start, values in reversed(self._buckets):
+            if start < since:
+                break
+            requests += values[0]
+            cost += values[1]
+        return requests, cost
+
+    def _bounds(self, timestamp: float) -> Tuple[float, float]:
+        if self._width:
+            start = timestamp - timestamp % self._width
+            return start, start + self._width
+        hour = datetime.fromtimestamp(timestamp).replace(minute=0, second=0, microsecond=0)
+        return hour.timestamp(), (hour + timedelta(hours=1)).timestamp()
+
+
+# ─────────────────────────────────────────────────────────────────────
+# System Sampler
+# ─────────────────────────────────────────────────────────────────────
+
+class SystemSampler:
+    """
+    Samples psutil system stats on a background thread.
+
+    ``get()`` returns the latest snapshot without touching psutil, so the
+    dashboard refresh never blocks on it. The thread starts on first read
+    and exits after SYSTEM_SAMPLER_IDLE_TIMEOUT seconds without reads.
+    """
+
+    def __init__(
+        self,
+        interval: float = SYSTEM_SAMPLE_INTERVAL,
+        disk_interval: float = DISK_SAMPLE_INTERVAL,
+    ) -> None:
+        self._interval = interval
+        self._disk_interval = disk_interval
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._snapshot = SystemMetrics()
+        self._last_read = 0.0
+        self._last_disk_check = 0.0
+        self._disk: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+        # Network tracking for rate calculation
+        self._last_network_check: Optional[Tuple[float, float, float]] = None
+
+    def get(self) -> SystemMetrics:
+        """Latest sampled system metrics."""
+        if not PSUTIL_AVAILABLE:
+            return SystemMetrics()
+        self._last_read = time.time()
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                # First read, or first after an idle stop: don't serve a stale snapshot
+                self._sample()
+                self._thread = threading.Thread(
+                    target=self._run, name="metrics_system_sampler", daemon=True
+                )
+                self._thread.start()
+        return self._snapshot
+
+    def _run(self) -> None:
+        while time.time() - self._last_read < SYSTEM_SAMPLER_IDLE_TIMEOUT:
+            time.sleep(self._interval)
+            self._sample()
+
+    def _sample(self) -> None:
+        try:
+            # CPU
+            cpu_percent = psutil.cpu_percent(interval=None)
+
+            # Memory
+            memory = psutil.virtual_memory()
+
+            # Disk
+            now = time.time()
+            if now - self._last_disk_check >= self._disk_interval:
+                disk = psutil.disk_usage("/")
+                self._disk = (disk.percent, disk.used / (1024 ** 3), disk.total / (1024 ** 3))
+                self._last_disk_check = now
+            disk_percent, disk_used_gb, disk_total_gb = self._disk
+
+            # Network
+            net_io = psutil.net_io_counters()
+            network_sent_mb = net_io.bytes_sent / (1024 * 1024)
+            network_recv_mb = net_io.bytes_recv / (1024 * 1024)
+
+            # Calculate network rate
+            sent_rate = 0.0
+            recv_rate = 0.0
+            if self._last_network_check:
+                last_time, last_sent, last_recv = self._last_network_check
+                elapsed = now - last_time
+                if elapsed > 0:
+                    sent_rate = ((network_sent_mb - last_sent) * 1024) / elapsed  # KB/s
+                    recv_rate = ((network_recv_mb - last_recv) * 1024) / elapsed
+            self._last_network_check = (now, network_sent_mb, network_recv_mb)
+
+            self._snapshot = SystemMetrics(
+                cpu_percent=cpu_percent,
+                memory_percent=memory.percent,
+                memory_used_mb=memory.used / (1024 * 1024),
+                memory_total_mb=memory.total / (1024 * 1024),
+                disk_percent=disk_percent,
+                disk_used_gb=disk_used_gb,
+                disk_total_gb=disk_total_gb,
+                network_sent_mb=network_sent_mb,
+                network_recv_mb=network_recv_mb,
+                network_sent_rate_kbps=sent_rate,
+                network_recv_rate_kbps=recv_rate,
+            )
+        except Exception:
+            pass
+
+
 # ─────────────────────────────────────────────────────────────────────
 # Metrics Collector
 # ─────────────────────────────────────────────────────────────────────
@@ -422,12 +575,20 @@ class MetricsCollector:
         # Startup time
         self._start_time = time.time()
 
-        # LLM call tracking
-        self._llm_calls: List[LLMCallRecord] = []
-        self._current_task_calls: Dict[str, List[LLMCallRecord]] = defaultdict(list)
+        # LLM call tracking (running totals and rolling buckets, not per-call lists)
+        self._last_llm_call: Optional[LLMCallRecord] = None
+        self._total_calls = 0
+        self._total_cost = 0.0
+        self._minute_buckets = RollingBuckets(MINUTE_BUCKET_RETENTION, width=60)
+        self._hour_buckets = RollingBuckets(HOUR_BUCKET_RETENTION)
+        # task_id -> [cost, call count] of calls made so far
+        self._current_task_calls: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0])
 
         # Task tracking
-        self._task_records: List[TaskRecord] = []
+        self._total_tasks = 0
+        self._completed_tasks = 0
+        self._failed_tasks = 0
+        self._completed_task_cost = 0.0
         self._running_tasks: Dict[str, float] = {}  # task_id -> start_time
         self._running_task_names: Dict[str, str] = {}  # task_id -> task_name
 
@@ -436,8 +597,8 @@ class MetricsCollector:
         self._total_output_tokens = 0
         self._total_cached_tokens = 0
 
-        # Network tracking for rate calculation
-        self._last_network_check: Optional[Tuple[float, float, float]] = None
+        # System stats, sampled on their own cadence
+        self._system_sampler = SystemSampler()
 
         # Hourly request tracking
         self._hourly_requests: List[int] = [0] * 24
@@ -522,13 +683,19 @@ class MetricsCollector:
         )
 
         with self._lock:
-            self._llm_calls.append(record)
+            self._last_llm_call = record
+            self._total_calls += 1
+            self._total_cost += total_cost
             self._total_input_tokens += input_tokens
             self._total_output_tokens += output_tokens
             self._total_cached_tokens += cached_tokens
+            self._minute_buckets.add(record.timestamp, total_cost)
+            self._hour_buckets.add(record.timestamp, total_cost)
 
             if task_id:
-                self._current_task_calls[task_id].append(record)
+                task_calls = self._current_task_calls[task_id]
+                task_calls[0] += total_cost
+                task_calls[1] += 1
 
             # Update hourly tracking
             current_hour = datetime.now().hour
@@ -540,6 +707,7 @@ class MetricsCollector:
         if self._usage_storage:
             try:
                 from app.usage.storage import UsageEvent
+                from app.usage.engine import log_write_errors
                 usage_event = UsageEvent(
                     service_type="llm",
                     provider=provider,
@@ -548,7 +716,9 @@ class MetricsCollector:
                     output_tokens=output_tokens,
                     cached_tokens=cached_tokens,
                 )
-                self._usage_storage.insert_event(usage_event)
+                log_write_errors(
+                    self._usage_storage.submit_event(usage_event), "Usage event insert"
+                )
             except Exception:
                 # Don't fail LLM tracking if storage fails
                 pass
@@ -570,25 +740,21 @@ class MetricsCollector:
             self._running_task_names.pop(task_id, None)
             end_time = time.time()
 
-            # Calculate total cost for this task
-            task_calls = self._current_task_calls.pop(task_id, [])
-            total_cost = sum(call.cost_usd for call in task_calls)
+            # Total cost for this task
+            total_cost, llm_call_count = self._current_task_calls.pop(task_id, (0.0, 0))
 
-            record = TaskRecord(
-                task_id=task_id,
-                name=name,
-                status=status,
-                start_time=start_time,
-                end_time=end_time,
-                total_cost=total_cost,
-                llm_call_count=len(task_calls),
-            )
-            self._task_records.append(record)
+            self._total_tasks += 1
+            if status == "completed":
+                self._completed_tasks += 1
+                self._completed_task_cost += total_cost
+            elif status == "error":
+                self._failed_tasks += 1
 
         # Persist to TaskStorage (outside lock to avoid blocking)
         if self._task_storage:
             try:
                 from app.usage.task_storage import TaskEvent
+                from app.usage.engine import log_write_errors
                 task_event = TaskEvent(
                     task_id=task_id,
                     task_name=name,
@@ -596,9 +762,11 @@ class MetricsCollector:
                     start_time=datetime.fromtimestamp(start_time),
                     end_time=datetime.fromtimestamp(end_time),
                     total_cost=total_cost,
-                    llm_call_count=len(task_calls),
+                    llm_call_count=llm_call_count,
+                )
+                log_write_errors(
+                    self._task_storage.submit_task(task_event), "Task event insert"
                 )
-                self._task_storage.insert_task(task_event)
             except Exception:
                 # Don't fail task tracking if storage fails
                 pass
@@ -650,60 +818,8 @@ class MetricsCollector:
     # ─────────────────────────────────────────────────────────────────────
 
     def _get_system_metrics(self) -> SystemMetrics:
-        """Get current system resource metrics."""
-        if not PSUTIL_AVAILABLE:
-            return SystemMetrics()
-
-        try:
-            # CPU
-            cpu_percent = psutil.cpu_percent(interval=None)
-
-            # Memory
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            memory_used_mb = memory.used / (1024 * 1024)
-            memory_total_mb = memory.total / (1024 * 1024)
-
-            # Disk
-            disk = psutil.disk_usage("/")
-            disk_percent = disk.percent
-            disk_used_gb = disk.used / (1024 * 1024 * 1024)
-            disk_total_gb = disk.total / (1024 * 1024 * 1024)
-
-            # Network
-            net_io = psutil.net_io_counters()
-            network_sent_mb = net_io.bytes_sent / (1024 * 1024)
-            network_recv_mb = net_io.bytes_recv / (1024 * 1024)
-
-            # Calculate network rate
-            now = time.time()
-            sent_rate = 0.0
-            recv_rate = 0.0
-
-            if self._last_network_check:
-                last_time, last_sent, last_recv = self._last_network_check
-                elapsed = now - last_time
-                if elapsed > 0:
-                    sent_rate = ((network_sent_mb - last_sent) * 1024) / elapsed  # KB/s
-                    recv_rate = ((network_recv_mb - last_recv) * 1024) / elapsed
-
-            self._last_network_check = (now, network_sent_mb, network_recv_mb)
-
-            return SystemMetrics(
-                cpu_percent=cpu_percent,
-                memory_percent=memory_percent,
-                memory_used_mb=memory_used_mb,
-                memory_total_mb=memory_total_mb,
-                disk_percent=disk_percent,
-                disk_used_gb=disk_used_gb,
-                disk_total_gb=disk_total_gb,
-                network_sent_mb=network_sent_mb,
-                network_recv_mb=network_recv_mb,
-                network_sent_rate_kbps=sent_rate,
-                network_recv_rate_kbps=recv_rate,
-            )
-        except Exception:
-            return SystemMetrics()
+        """Get the latest sampled system resource metrics."""
+        return self._system_sampler.get()
 
     def _get_thread_pool_metrics(self) -> ThreadPoolMetrics:
         """Get thread pool utilization metrics."""
@@ -858,13 +974,13 @@ class MetricsCollector:
 
             # Fallback: get from last LLM call
             with self._lock:
-                if self._llm_calls:
-                    last_call = self._llm_calls[-1]
-                    return ModelMetrics(
-                        provider=last_call.provider,
-                        model_id=last_call.model,
-                        model_name=self._get_friendly_model_name(last_call.model),
-                    )
+                last_call = self._last_llm_call
+            if last_call:
+                return ModelMetrics(
+                    provider=last_call.provider,
+                    model_id=last_call.model,
+                    model_name=self._get_friendly_model_name(last_call.model),
+                )
 
             return ModelMetrics()
         except Exception:
@@ -919,34 +1035,24 @@ class MetricsCollector:
 
         with self._lock:
             # Cost metrics
-            total_cost = sum(call.cost_usd for call in self._llm_calls)
-            cost_today = sum(
-                call.cost_usd for call in self._llm_calls
-                if call.timestamp >= today_ts
-            )
-            cost_week = sum(
-                call.cost_usd for call in self._llm_calls
-                if call.timestamp >= week_ts
-            )
-            cost_month = sum(
-                call.cost_usd for call in self._llm_calls
-                if call.timestamp >= month_ts
-            )
+            total_cost = self._total_cost
+            requests_today, cost_today = self._hour_buckets.since(today_ts)
+            _, cost_week = self._hour_buckets.since(week_ts)
+            _, cost_month = self._hour_buckets.since(month_ts)
 
-            num_calls = len(self._llm_calls)
+            num_calls = self._total_calls
             avg_cost_per_request = total_cost / num_calls if num_calls > 0 else 0
 
             # Task cost average
-            completed_tasks = [t for t in self._task_records if t.status == "completed"]
+            completed_count = self._completed_tasks
             avg_cost_per_task = (
-                sum(t.total_cost for t in completed_tasks) / len(completed_tasks)
-                if completed_tasks else 0
+                self._completed_task_cost / completed_count
+                if completed_count else 0
             )
 
             # Task metrics
-            total_tasks = len(self._task_records)
-            completed_count = len([t for t in self._task_records if t.status == "completed"])
-            failed_count = len([t for t in self._task_records if t.status == "error"])
+            total_tasks = self._total_tasks
+            failed_count = self._failed_tasks
             running_count = len(self._running_tasks)
 
             finished_tasks = completed_count + failed_count
@@ -956,14 +1062,7 @@ class MetricsCollector:
             )
 
             # Usage metrics
-            requests_last_hour = len([
-                call for call in self._llm_calls
-                if call.timestamp >= hour_ago
-            ])
-            requests_today = len([
-                call for call in self._llm_calls
-                if call.timestamp >= today_ts
-            ])
+            requests_last_hour, _ = self._minute_buckets.since(hour_ago)
 
             # Find peak hour
             peak_hour = 0
@@ -504,27 +504,35 @@ def get_slow_mode_settings() -> Dict[str, Any]:
         "success": True,
         "enabled": model.get("slow_mode", False),
         "tpm_limit": model.get("slow_mode_tpm_limit", 30000),
+        "rpm_limit": model.get("slow_mode_rpm_limit", 0),
     }
 
 
-def set_slow_mode(enabled: bool, tpm_limit: Optional[int] = None) -> Dict[str, Any]:
-    """Set slow mode on or off, optionally updating the TPM limit."""
+def set_slow_mode(
+    enabled: bool,
+    tpm_limit: Optional[int] = None,
+    rpm_limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Set slow mode on or off, optionally updating the TPM and RPM limits (RPM 0 = unlimited)."""
     settings = _load_settings()
     if "model" not in settings:
         settings["model"] = {}
     settings["model"]["slow_mode"] = enabled
     if tpm_limit is not None:
         settings["model"]["slow_mode_tpm_limit"] = max(1000, tpm_limit)
+    if rpm_limit is not None:
+        settings["model"]["slow_mode_rpm_limit"] = max(0, rpm_limit)
 
     if _save_settings(settings):
         from app.config import reload_settings
         reload_settings()
-        # Reset the rate limiter window on setting change
+        # Refill the rate limiter buckets on setting change
         from app.rate_limiter import get_rate_limiter
         get_rate_limiter().reset()
         return {
             "success": True,
             "enabled": enabled,
             "tpm_limit": settings["model"].get("slow_mode_tpm_limit", 30000),
+            "rpm_limit": settings["model"].get("slow_mode_rpm_limit", 0),
         }
     return {"success": False, "error": "Failed to save settings"}
@@ -6,6 +6,11 @@ Local usage tracking module for CraftBot.
 Provides SQLite-based storage for LLM/VLM token usage and task history.
 """
 
+from app.usage.engine import (
+    StorageEngine,
+    get_engine,
+)
+
 from app.usage.storage import (
     UsageEvent,
     UsageStorage,
@@ -37,6 +42,9 @@ from app.usage.action_storage import (
 )
 
 __all__ = [
+    # Engine
+    "StorageEngine",
+    "get_engine",
     # Storage
     "UsageEvent",
     "UsageStorage",
@@ -14,6 +14,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from app.usage.engine import get_engine
+
 try:
     from app.logger import logger
 except Exception:
@@ -82,12 +84,13 @@ class ActionStorage:
             db_path = str(usage_dir / "actions.db")
 
         self._db_path = db_path
+        self._engine = get_engine(db_path)
         self._init_db()
         logger.info(f"[ActionStorage] Initialized at {self._db_path}")
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS action_items (
@@ -132,26 +135,32 @@ class ActionStorage:
         Args:
             item: The StoredActionItem to insert or update.
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO action_items
-                (id, name, status, item_type, parent_id, created_at,
-                 completed_at, input_data, output_data, error_message)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                item.id,
-                item.name,
-                item.status,
-                item.item_type,
-                item.parent_id,
-                item.created_at,
-                item.completed_at,
-                item.input_data,
-                item.output_data,
-                item.error_message,
-            ))
-            conn.commit()
+        with self._engine.connect() as conn:
+            self._insert_item(conn, item)
+
+    async def insert_item_async(self, item: StoredActionItem) -> None:
+        """Insert or update an action item on the engine's writer thread."""
+        await self._engine.run(lambda conn: self._insert_item(conn, item))
+
+    @staticmethod
+    def _insert_item(conn: sqlite3.Connection, item: StoredActionItem) -> None:
+        conn.execute("""
+            INSERT OR REPLACE INTO action_items
+            (id, name, status, item_type, parent_id, created_at,
+             completed_at, input_data, output_data, error_message)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            item.id,
+            item.name,
+            item.status,
+            item.item_type,
+            item.parent_id,
+            item.created_at,
+            item.completed_at,
+            item.input_data,
+            item.output_data,
+            item.error_message,
+        ))
 
     def update_item_status(
         self,
@@ -174,7 +183,7 @@ class ActionStorage:
         Returns:
             True if item was updated, False if not found.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             # Build dynamic update query
@@ -213,7 +222,7 @@ class ActionStorage:
         Returns:
             List of StoredActionItem objects.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             query = """
@@ -254,7 +263,7 @@ class ActionStorage:
         Returns:
             List of recent items ordered by created_at ascending.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             # Get last N items ordered by created_at DESC, then reverse
             cursor.execute("""
@@ -295,7 +304,7 @@ class ActionStorage:
         Returns:
             StoredActionItem or None if not found.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT id, name, status, item_type, parent_id, created_at,
@@ -327,13 +336,20 @@ class ActionStorage:
         Returns:
             Number of items deleted.
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM action_items")
-            count = cursor.fetchone()[0]
-            cursor.execute("DELETE FROM action_items")
-            conn.commit()
-            return count
+        with self._engine.connect() as conn:
+            return self._clear_items(conn)
+
+    async def clear_items_async(self) -> int:
+        """Clear all items on the engine's writer thread."""
+        return await self._engine.run(self._clear_items)
+
+    @staticmethod
+    def _clear_items(conn: sqlite3.Connection) -> int:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM action_items")
+        count = cursor.fetchone()[0]
+        cursor.execute("DELETE FROM action_items")
+        return count
 
     def delete_item(self, item_id: str) -> bool:
         """
@@ -345,14 +361,20 @@ class ActionStorage:
         Returns:
             True if item was deleted, False if not found.
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "DELETE FROM action_items WHERE id = ?",
-                (item_id,)
-            )
-            conn.commit()
-            return cursor.rowcount > 0
+        with self._engine.connect() as conn:
+            return self._delete_item(conn, item_id)
+
+    async def delete_item_async(self, item_id: str) -> bool:
+        """Delete an item on the engine's writer thread."""
+        return await self._engine.run(lambda conn: self._delete_item(conn, item_id))
+
+    @staticmethod
+    def _delete_item(conn: sqlite3.Connection, item_id: str) -> bool:
+        cursor = conn.execute(
+            "DELETE FROM action_items WHERE id = ?",
+            (item_id,)
+        )
+        return cursor.rowcount > 0
 
     def mark_running_as_cancelled(self, exclude: Optional[set] = None) -> int:
         """
@@ -369,7 +391,7 @@ class ActionStorage:
             Number of items updated.
         """
         import time as time_module
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             if exclude:
                 placeholders = ",".join("?" for _ in exclude)
@@ -400,7 +422,7 @@ class ActionStorage:
         Returns:
             List of items (tasks + their actions) ordered by created_at ascending.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             # Get recent task IDs
             cursor.execute("""
@@ -456,7 +478,7 @@ class ActionStorage:
         Returns:
             List of items (tasks + their actions) ordered by created_at ascending.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             # Get older task IDs
             cursor.execute("""
@@ -498,14 +520,14 @@ class ActionStorage:
 
     def get_task_count(self) -> int:
         """Get total number of tasks (not actions)."""
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM action_items WHERE item_type = 'task'")
             return cursor.fetchone()[0]
 
     def get_item_count(self) -> int:
         """Get total number of items."""
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM action_items")
             return cursor.fetchone()[0]
@@ -517,7 +539,7 @@ class ActionStorage:
         Returns:
             Dictionary with storage info.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("SELECT COUNT(*) FROM action_items")
@@ -16,6 +16,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from app.usage.engine import get_engine
+
 try:
     from app.logger import logger
 except Exception:
@@ -80,12 +82,13 @@ class ChatStorage:
             db_path = str(usage_dir / "chat.db")
 
         self._db_path = db_path
+        self._engine = get_engine(db_path)
         self._init_db()
         logger.info(f"[ChatStorage] Initialized at {self._db_path}")
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS chat_messages (
@@ -144,25 +147,32 @@ class ChatStorage:
         Returns:
             The row ID of the inserted message.
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO chat_messages
-                (message_id, sender, content, style, timestamp, attachments, task_session_id, options, option_selected)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                message.message_id,
-                message.sender,
-                message.content,
-                message.style,
-                message.timestamp,
-                json.dumps(message.attachments) if message.attachments else None,
-                message.task_session_id,
-                json.dumps(message.options) if message.options else None,
-                message.option_selected,
-            ))
-            conn.commit()
-            return cursor.lastrowid
+        with self._engine.connect() as conn:
+            return self._insert_message(conn, message)
+
+    async def insert_message_async(self, message: StoredChatMessage) -> int:
+        """Insert a chat message on the engine's writer thread without blocking the event loop."""
+        return await self._engine.run(lambda conn: self._insert_message(conn, message))
+
+    @staticmethod
+    def _insert_message(conn: sqlite3.Connection, message: StoredChatMessage) -> int:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO chat_messages
+            (message_id, sender, content, style, timestamp, attachments, task_session_id, options, option_selected)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            message.message_id,
+            message.sender,
+            message.content,
+            message.style,
+            message.timestamp,
+            json.dumps(message.attachments) if message.attachments else None,
+            message.task_session_id,
+            json.dumps(message.options) if message.options else None,
+            message.option_selected,
+        ))
+        return cursor.lastrowid
 
     def get_messages(
         self,
@@ -179,7 +189,7 @@ class ChatStorage:
         Returns:
             List of StoredChatMessage objects.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT message_id, sender, content, style, timestamp, attachments, task_session_id, options, option_selected
@@ -214,7 +224,7 @@ class ChatStorage:
         Returns:
             List of recent messages ordered by timestamp ascending.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             # Get last N messages ordered by timestamp DESC, then reverse
             cursor.execute("""
@@ -250,13 +260,20 @@ class ChatStorage:
         Returns:
             Number of messages deleted.
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM chat_messages")
-            count = cursor.fetchone()[0]
-            cursor.execute("DELETE FROM chat_messages")
-            conn.commit()
-            return count
+        with self._engine.connect() as conn:
+            return self._clear_messages(conn)
+
+    async def clear_messages_async(self) -> int:
+        """Clear all messages on the engine's writer thread."""
+        return await self._engine.run(self._clear_messages)
+
+    @staticmethod
+    def _clear_messages(conn: sqlite3.Connection) -> int:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM chat_messages")
+        count = cursor.fetchone()[0]
+        cursor.execute("DELETE FROM chat_messages")
+        return count
 
     def update_option_selected(self, message_id: str, option_value: str) -> bool:
         """
@@ -269,14 +286,23 @@ class ChatStorage:
         Returns:
             True if the message was updated, False if not found.
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "UPDATE chat_messages SET option_selected = ? WHERE message_id = ?",
-                (option_value, message_id),
-            )
-            conn.commit()
-            return cursor.rowcount > 0
+        with self._engine.connect() as conn:
+            return self._update_option_selected(conn, message_id, option_value)
+
+    async def update_option_selected_async(self, message_id: str, option_value: str) -> bool:
+        """Mark a selected option on the engine's writer thread."""
+        return await self._engine.run(
+            lambda conn: self._update_option_selected(conn, message_id, option_value)
+        )
+
+    @staticmethod
+    def _update_option_selected(conn: sqlite3.Connection, message_id: str, option_value: str) -> bool:
+        cursor = conn.cursor()
+        cursor.execute(
+            "UPDATE chat_messages SET option_selected = ? WHERE message_id = ?",
+            (option_value, message_id),
+        )
+        return cursor.rowcount > 0
 
     def delete_message(self, message_id: str) -> bool:
         """
@@ -288,7 +314,7 @@ class ChatStorage:
         Returns:
             True if message was deleted, False if not found.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "DELETE FROM chat_messages WHERE message_id = ?",
@@ -312,7 +338,7 @@ class ChatStorage:
         Returns:
             List of messages ordered by timestamp ascending (oldest first).
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT message_id, sender, content, style, timestamp, attachments, task_session_id, options, option_selected
@@ -342,7 +368,7 @@ class ChatStorage:
 
     def get_message_count(self) -> int:
         """Get total number of messages."""
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM chat_messages")
             return cursor.fetchone()[0]
@@ -354,7 +380,7 @@ class ChatStorage:
         Returns:
             Dictionary with storage info.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("SELECT COUNT(*) FROM chat_messages")
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+app.usage.engine
+
+Shared SQLite access layer for the app/usage storages.
+
+Every storage used to open (and close) a fresh ``sqlite3`` connection per
+method call. StorageEngine replaces that with:
+
+- one persistent connection per thread (``connect()``), configured once with
+  WAL journaling and tuned pragmas; sqlite3's per-connection statement cache
+  then reuses prepared statements across calls
+- a dedicated writer thread (``submit()`` / ``run()``) that applies queued
+  writes in batches, one transaction per batch, so async callers never wait
+  on disk fsync in the event loop
+
+Engines are shared per database file via ``get_engine()``. ``split_hours()``
+helps storages answer time-range queries from hourly rollup tables.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+try:
+    from app.logger import logger
+except Exception:
+    logger = logging.getLogger(__name__)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+T = TypeVar("T")
+
+# Pragmas applied to every pooled connection
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    # WAL + NORMAL only fsyncs on checkpoint; committed data survives app crashes
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8000",
+    "PRAGMA foreign_keys=OFF",
+)
+
+# Prepared statements kept per connection (sqlite3's LRU statement cache)
+STATEMENT_CACHE_SIZE = 256
+
+# Writer thread: max operations per transaction and max wait to fill a batch
+WRITE_BATCH_SIZE = 200
+WRITE_BATCH_WINDOW = 0.005
+
+
+class StorageEngine:
+    """
+    Pooled connections and a batched writer for one SQLite database file.
+    """
+
+    def __init__(self, db_path: str):
+        self._db_path = db_path
+        self._local = threading.local()
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
+    # ─────────────────────── Connection Pool ──────────────────────────────
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Return this thread's pooled connection to the database.
+
+        The connection stays open for the lifetime of the thread. It can be
+        used exactly like a fresh ``sqlite3.connect()`` result, including as
+        a ``with`` block (which commits or rolls back, but does not close).
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=5.0,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    # ─────────────────────── Writer Thread ────────────────────────────────
+
+    def submit(self, fn: Callable[[sqlite3.Connection], T]) -> "Future[T]":
+        """
+        Queue a write for the writer thread.
+
+        ``fn`` receives the writer's connection and must not commit; the
+        writer commits once per batch. Each operation runs inside its own
+        savepoint, so a failing operation is rolled back without affecting
+        the rest of its batch.
+
+        Returns:
+            A future resolved with ``fn``'s result after the batch commits.
+        """
+        self._ensure_writer()
+        future: "Future[T]" = Future()
+        self._queue.put((fn, future))
+        return future
+
+    async def run(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Async facade over ``submit()``: await a write without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(fn))
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Block until every write submitted so far has committed."""
+        if self._writer is None:
+            return True
+        try:
+            self.submit(lambda conn: None).result(timeout)
+            return True
+        except Exception:
+            return False
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run_writer,
+                    name=f"sqlite_writer:{self._db_path}",
+                    daemon=True,
+                )
+                self._writer.start()
+
+    def _run_writer(self) -> None:
+        conn = self._open()
+        # Explicit transaction control so each batch is exactly one commit
+        conn.isolation_level = None
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < WRITE_BATCH_SIZE:
+                    batch.append(self._queue.get(timeout=WRITE_BATCH_WINDOW))
+            except queue.Empty:
+                pass
+
+            results = []
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                for fn, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    conn.execute("SAVEPOINT op")
+                    try:
+                        results.append((future, fn(conn), None))
+                        conn.execute("RELEASE op")
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO op")
+                        conn.execute("RELEASE op")
+                        results.append((future, None, e))
+                conn.execute("COMMIT")
+            except Exception as e:
+                logger.warning(f"[StorageEngine] Write batch failed for {self._db_path}: {e}")
+                try:
+                    conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+                for fn, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for future, result, error in results:
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+
+
+_engines: Dict[str, StorageEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(db_path: str) -> StorageEngine:
+    """Get the shared engine for a database file."""
+    with _engines_lock:
+        engine = _engines.get(db_path)
+        if engine is None:
+            engine = StorageEngine(db_path)
+            _engines[db_path] = engine
+        return engine
+
+
+# ─────────────────────── Hourly Rollups ───────────────────────────────
+
+# Rollup tables are keyed by the first 13 characters of the ISO timestamp
+# ("YYYY-MM-DDTHH"), i.e. the local hour the row falls in
+HOUR_KEY_LENGTH = 13
+
+
+def hour_key(moment: datetime) -> str:
+    return moment.isoformat()[:HOUR_KEY_LENGTH]
+
+
+def split_hours(
+    column: str,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+) -> Tuple[str, List[str], Optional[str], List[str]]:
+    """
+    Split a ``[start_date, end_date]`` filter on ``column`` into the whole
+    hours inside it, answered from an hourly rollup table (``hour`` column),
+    and the partial hours at its edges, answered from the raw rows.
+
+    Returns:
+        (rollup WHERE clause, its params, raw WHERE clause or None if no raw
+        rows are needed, its params)
+    """
+    if start_date and end_date and hour_key(start_date) == hour_key(end_date):
+        return "0", [], f"{column} >= ? AND {column} <= ?", [start_date.isoformat(), end_date.isoformat()]
+
+    rollup, rollup_params = ["1=1"], []
+    raw, raw_params = [], []
+    if start_date:
+        hour_start = start_date.replace(minute=0, second=0, microsecond=0)
+        rollup.append("hour > ?")
+        rollup_params.append(hour_key(start_date))
+        raw.append(f"({column} >= ? AND {column} < ?)")
+        raw_params += [start_date.isoformat(), (hour_start + timedelta(hours=1)).isoformat()]
+    if end_date:
+        hour_start = end_date.replace(minute=0, second=0, microsecond=0)
+        rollup.append("hour < ?")
+        rollup_params.append(hour_key(end_date))
+        raw.append(f"({column} >= ? AND {column} <= ?)")
+        raw_params += [hour_start.isoformat(), end_date.isoformat()]
+    return " AND ".join(rollup), rollup_params, " OR ".join(raw) or None, raw_params
+
+
+def log_write_errors(future: Future, context: str) -> None:
+    """Log failures of a fire-and-forget write submitted to the engine."""
+    def _done(f: Future) -> None:
+        if f.cancelled():
+            return
+        error = f.exception()
+        if error is not None:
+            logger.warning(f"[StorageEngine] {context} failed: {error}")
+    future.add_done_callback(_done)
@@ -171,7 +171,7 @@ class UsageReporter:
             return
 
         try:
-            count = self._storage.insert_events_batch(events)
+            count = await self._storage.insert_events_batch_async(events)
             self._total_reported += count
             logger.info(
                 f"[UsageReporter] Saved {count} usage events "
@@ -5,20 +5,32 @@ app.usage.session_storage
 SQLite-based storage for active session state (tasks + event streams).
 Provides persistence across agent restarts so that running tasks and their
 event context can be restored.
+
+Event streams and conversation history are written through SessionJournal,
+an append-only write-ahead journal: each logged EventRecord is appended as it
+happens and each summarization writes a compact checkpoint (new head summary
+plus deletion of the summarized records). A single background writer thread
+batches journal entries into executemany() calls, so persistence is
+O(new events) and survives crashes. Removals and full rewrites are queued on
+the same thread, so they stay ordered with pending appends without the
+caller (usually a coroutine on the event loop) waiting for a flush.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import queue
 import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from agent_core.core.task import Task
 from agent_core.core.event_stream.event import Event, EventRecord
 from agent_core.core.impl.event_stream.event_stream import EventStream
+from app.usage.engine import get_engine
 
 try:
     from app.logger import logger
@@ -33,6 +45,215 @@ MAIN_STREAM_ID = "__main__"
 # Tasks older than this (in hours) are considered stale and not restored
 STALE_TASK_HOURS = 24
 
+# Journal writer: max entries per transaction and max wait to fill a batch
+JOURNAL_BATCH_SIZE = 500
+JOURNAL_FLUSH_INTERVAL = 0.05
+
+
+class SessionJournal:
+    """
+    Append-only journal for event streams and conversation history.
+
+    Producers (EventStream / EventStreamManager) only enqueue entries; a
+    single daemon thread owns the SQLite connection and applies them in
+    order, coalescing consecutive entries of the same type into one
+    executemany() per transaction.
+
+    Journal entries:
+        append:        one event_records row for a newly logged record
+        checkpoint:    head_summary upsert plus deletion of dropped records
+        conv_append:   one conversation_history row plus trim to keep_last
+        conv_clear:    delete all conversation_history rows
+        write:         any other write, applied in order with the entries above
+        barrier:       signals flush() once everything before it is written
+
+    Next positions are kept in memory, seeded once from the database when the
+    journal starts, so producers never query SQLite.
+    """
+
+    def __init__(self, db_path: str):
+        self._engine = get_engine(db_path)
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._lock = threading.Lock()
+        # Next journal position per stream and for conversation history
+        self._positions: Dict[str, int] = self._load_positions()
+        self._conv_position: int = self._max_position(
+            "SELECT MAX(position) FROM conversation_history", ()
+        ) + 1
+        self._thread = threading.Thread(
+            target=self._run, name="session_journal", daemon=True
+        )
+        self._thread.start()
+
+    # ─────────────────────── Producer API ─────────────────────────────────
+
+    def append(self, stream_id: str, record: EventRecord) -> None:
+        """Journal a newly logged event record."""
+        with self._lock:
+            position = self._next_position(stream_id)
+        record._journal_seq = position
+        event_json = json.dumps(record.to_dict(), default=str)
+        self._queue.put(("append", stream_id, event_json, position))
+
+    def checkpoint(
+        self,
+        stream_id: str,
+        head_summary: Optional[str],
+        dropped: List[EventRecord],
+    ) -> None:
+        """Journal a new head summary and the records it replaced."""
+        positions = [r._journal_seq for r in dropped if r._journal_seq is not None]
+        self._queue.put(("checkpoint", stream_id, head_summary, positions))
+
+    def append_conversation(self, event: Event, keep_last: int) -> None:
+        """Journal a conversation message and trim history to ``keep_last``."""
+        with self._lock:
+            position = self._conv_position
+            self._conv_position += 1
+        event_json = json.dumps(event.to_dict(), default=str)
+        self._queue.put(("conv_append", event_json, position, position - keep_last))
+
+    def clear_conversation(self) -> None:
+        """Journal that conversation history was cleared."""
+        self._queue.put(("conv_clear",))
+
+    def write(self, apply: Callable[[sqlite3.Connection], None]) -> None:
+        """
+        Queue a write to run on the writer thread after everything queued so far.
+
+        Args:
+            apply: Called with the writer's connection inside its transaction.
+        """
+        self._queue.put(("write", apply))
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """
+        Block until every entry enqueued so far has been committed.
+
+        Returns:
+            True if the journal drained within ``timeout``.
+        """
+        done = threading.Event()
+        self._queue.put(("barrier", done))
+        return done.wait(timeout)
+
+    def reset(self) -> None:
+        """Restart positions (the underlying tables are being wiped)."""
+        with self._lock:
+            self._positions.clear()
+            self._conv_position = 0
+
+    def reset_conversation(self, next_position: int = 0) -> None:
+        """Restart conversation positions at ``next_position`` (history rewritten)."""
+        with self._lock:
+            self._conv_position = next_position
+
+    def forget_stream(self, stream_id: str, next_position: int = 0) -> None:
+        """Restart a stream's positions at ``next_position`` (removed or rewritten)."""
+        with self._lock:
+            if next_position:
+                self._positions[stream_id] = next_position
+            else:
+                self._positions.pop(stream_id, None)
+
+    def _next_position(self, stream_id: str) -> int:
+        """Allocate the next position for a stream. Caller holds ``_lock``."""
+        position = self._positions.get(stream_id, 0)
+        self._positions[stream_id] = position + 1
+        return position
+
+    def _load_positions(self) -> Dict[str, int]:
+        with self._engine.connect() as conn:
+            rows = conn.execute(
+                "SELECT stream_id, MAX(position) FROM event_records GROUP BY stream_id"
+            ).fetchall()
+        return {stream_id: position + 1 for stream_id, position in rows if position is not None}
+
+    def _max_position(self, sql: str, params: tuple) -> int:
+        with self._engine.connect() as conn:
+            row = conn.execute(sql, params).fetchone()
+        return row[0] if row and row[0] is not None else -1
+
+    # ─────────────────────── Writer Thread ────────────────────────────────
+
+    def _run(self) -> None:
+        # This thread's pooled connection (WAL, tuned pragmas)
+        conn = self._engine.connect()
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < JOURNAL_BATCH_SIZE:
+                    batch.append(self._queue.get(timeout=JOURNAL_FLUSH_INTERVAL))
+            except queue.Empty:
+                pass
+
+            barriers = [entry[1] for entry in batch if entry[0] == "barrier"]
+            try:
+                with conn:
+                    self._apply(conn, [entry for entry in batch if entry[0] != "barrier"])
+            except Exception as e:
+                logger.warning(f"[SessionJournal] Failed to write {len(batch)} entries: {e}")
+            for done in barriers:
+                done.set()
+
+    def _apply(self, conn: sqlite3.Connection, entries: List[tuple]) -> None:
+        """Apply entries in order, one executemany() per run of same-type entries."""
+        now = datetime.now(timezone.utc).isoformat()
+        i = 0
+        while i < len(entries):
+            kind = entries[i][0]
+            j = i
+            while j < len(entries) and entries[j][0] == kind:
+                j += 1
+            run = entries[i:j]
+            i = j
+
+            if kind == "append":
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO event_streams (stream_id, head_summary, updated_at)
+                    VALUES (?, NULL, ?)
+                    """,
+                    [(sid, now) for sid in {e[1] for e in run}],
+                )
+                conn.executemany(
+                    """
+                    INSERT INTO event_records (stream_id, event_json, position)
+                    VALUES (?, ?, ?)
+                    """,
+                    [(e[1], e[2], e[3]) for e in run],
+                )
+            elif kind == "checkpoint":
+                for _, stream_id, head_summary, positions in run:
+                    conn.execute(
+                        """
+                        INSERT INTO event_streams (stream_id, head_summary, updated_at)
+                        VALUES (?, ?, ?)
+                        ON CONFLICT(stream_id) DO UPDATE SET
+                            head_summary = excluded.head_summary,
+                            updated_at = excluded.updated_at
+                        """,
+                        (stream_id, head_summary, now),
+                    )
+                    conn.executemany(
+                        "DELETE FROM event_records WHERE stream_id = ? AND position = ?",
+                        [(stream_id, p) for p in positions],
+                    )
+            elif kind == "conv_append":
+                conn.executemany(
+                    "INSERT INTO conversation_history (event_json, position) VALUES (?, ?)",
+                    [(e[1], e[2]) for e in run],
+                )
+                conn.execute(
+                    "DELETE FROM conversation_history WHERE position <= ?",
+                    (run[-1][3],),
+                )
+            elif kind == "conv_clear":
+                conn.execute("DELETE FROM conversation_history")
+            elif kind == "write":
+                for _, apply in run:
+                    apply(conn)
+
 
 class SessionStorage:
     """
@@ -51,13 +272,14 @@ class SessionStorage:
             db_path = str(usage_dir / "sessions.db")
 
         self._db_path = db_path
+        self._engine = get_engine(db_path)
         self._init_db()
+        self.journal = SessionJournal(self._db_path)
         logger.info(f"[SessionStorage] Initialized at {self._db_path}")
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        with sqlite3.connect(self._db_path) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -102,6 +324,17 @@ class SessionStorage:
             # Clean up triggers table from previous versions (no longer used)
             cursor.execute("DROP TABLE IF EXISTS triggers")
 
+            # Drop journal rows for tasks that ended while entries were in flight
+            for table in ("event_records", "event_streams"):
+                cursor.execute(
+                    f"""
+                    DELETE FROM {table}
+                    WHERE stream_id != ?
+                    AND stream_id NOT IN (SELECT task_id FROM active_tasks)
+                    """,
+                    (MAIN_STREAM_ID,),
+                )
+
             conn.commit()
 
     # ─────────────────────── Task Persistence ───────────────────────────────
@@ -110,7 +343,7 @@ class SessionStorage:
         """Upsert a task into the active_tasks table."""
         now = datetime.now(timezone.utc).isoformat()
         task_json = json.dumps(task.to_dict(), default=str)
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             conn.execute(
                 """
                 INSERT INTO active_tasks (task_id, task_json, updated_at)
@@ -125,15 +358,19 @@ class SessionStorage:
 
     def remove_task(self, task_id: str) -> None:
         """Remove a task and its associated event stream from persistence."""
-        with sqlite3.connect(self._db_path) as conn:
+        # Queued behind pending journal entries so they cannot resurrect rows
+        self.journal.forget_stream(task_id)
+
+        def apply(conn: sqlite3.Connection) -> None:
             conn.execute("DELETE FROM active_tasks WHERE task_id = ?", (task_id,))
             conn.execute("DELETE FROM event_records WHERE stream_id = ?", (task_id,))
             conn.execute("DELETE FROM event_streams WHERE stream_id = ?", (task_id,))
-            conn.commit()
+
+        self.journal.write(apply)
 
     def get_all_active_tasks(self) -> List[Dict[str, Any]]:
         """Return all active tasks, filtering out stale ones."""
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT task_id, task_json, updated_at FROM active_tasks"
@@ -169,7 +406,7 @@ class SessionStorage:
 
         # Clean up stale tasks
         if stale_ids:
-            with sqlite3.connect(self._db_path) as conn:
+            with self._engine.connect() as conn:
                 for tid in stale_ids:
                     conn.execute("DELETE FROM active_tasks WHERE task_id = ?", (tid,))
                     conn.execute("DELETE FROM event_records WHERE stream_id = ?", (tid,))
@@ -182,9 +419,21 @@ class SessionStorage:
     # ─────────────────────── Event Stream Persistence ───────────────────────
 
     def persist_event_stream(self, stream_id: str, stream: EventStream) -> None:
-        """Persist an event stream's head_summary and tail_events."""
+        """
+        Persist a full snapshot of an event stream's head_summary and tail_events.
+
+        Streams attached to the journal are already persisted incrementally;
+        this full rewrite is only needed for streams that are not.
+        """
         now = datetime.now(timezone.utc).isoformat()
-        with sqlite3.connect(self._db_path) as conn:
+        head_summary = stream.head_summary
+        rows = []
+        for position, record in enumerate(stream.tail_events):
+            record._journal_seq = position
+            rows.append((stream_id, json.dumps(record.to_dict(), default=str), position))
+        self.journal.forget_stream(stream_id, next_position=len(rows))
+
+        def apply(conn: sqlite3.Connection) -> None:
             # Upsert stream metadata
             conn.execute(
                 """
@@ -194,25 +443,22 @@ class SessionStorage:
                     head_summary = excluded.head_summary,
                     updated_at = excluded.updated_at
                 """,
-                (stream_id, stream.head_summary, now),
+                (stream_id, head_summary, now),
             )
 
             # Replace all event records for this stream
             conn.execute(
                 "DELETE FROM event_records WHERE stream_id = ?", (stream_id,)
             )
+            conn.executemany(
+                """
+                INSERT INTO event_records (stream_id, event_json, position)
+                VALUES (?, ?, ?)
+                """,
+                rows,
+            )
 
-            for position, record in enumerate(stream.tail_events):
-                event_json = json.dumps(record.to_dict(), default=str)
-                conn.execute(
-                    """
-                    INSERT INTO event_records (stream_id, event_json, position)
-                    VALUES (?, ?, ?)
-                    """,
-                    (stream_id, event_json, position),
-                )
-
-            conn.commit()
+        self.journal.write(apply)
 
     def persist_main_stream(self, stream: EventStream) -> None:
         """Shorthand for persisting the main (non-task) event stream."""
@@ -220,10 +466,13 @@ class SessionStorage:
 
     def remove_event_stream(self, stream_id: str) -> None:
         """Remove a persisted event stream and its records."""
-        with sqlite3.connect(self._db_path) as conn:
+        self.journal.forget_stream(stream_id)
+
+        def apply(conn: sqlite3.Connection) -> None:
             conn.execute("DELETE FROM event_records WHERE stream_id = ?", (stream_id,))
             conn.execute("DELETE FROM event_streams WHERE stream_id = ?", (stream_id,))
-            conn.commit()
+
+        self.journal.write(apply)
 
     def get_event_stream(
         self, stream_id: str
@@ -231,10 +480,13 @@ class SessionStorage:
         """
         Restore an event stream's data.
 
+        The head summary is the latest checkpoint; the records are every
+        journaled record appended since that were not dropped by it.
+
         Returns:
             Tuple of (head_summary, list of EventRecord objects).
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             # Get head summary
@@ -248,17 +500,19 @@ class SessionStorage:
             # Get event records ordered by position
             cursor.execute(
                 """
-                SELECT event_json FROM event_records
+                SELECT event_json, position FROM event_records
                 WHERE stream_id = ?
                 ORDER BY position ASC
                 """,
                 (stream_id,),
             )
             records = []
-            for (event_json,) in cursor.fetchall():
+            for event_json, position in cursor.fetchall():
                 try:
                     data = json.loads(event_json)
-                    records.append(EventRecord.from_dict(data))
+                    record = EventRecord.from_dict(data)
+                    record._journal_seq = position
+                    records.append(record)
                 except (json.JSONDecodeError, KeyError, TypeError) as e:
                     logger.warning(
                         f"[SessionStorage] Skipping corrupt event record "
@@ -270,23 +524,33 @@ class SessionStorage:
     # ─────────────────────── Conversation History ───────────────────────────
 
     def persist_conversation_history(self, messages: List[Event]) -> None:
-        """Replace persisted conversation history with the current list."""
-        with sqlite3.connect(self._db_path) as conn:
+        """
+        Replace persisted conversation history with the current list.
+
+        Conversation messages are normally journaled as they are recorded;
+        this full rewrite is only needed when no journal is attached.
+        """
+        rows = [
+            (json.dumps(event.to_dict(), default=str), position)
+            for position, event in enumerate(messages)
+        ]
+
+        def apply(conn: sqlite3.Connection) -> None:
             conn.execute("DELETE FROM conversation_history")
-            for position, event in enumerate(messages):
-                event_json = json.dumps(event.to_dict(), default=str)
-                conn.execute(
-                    """
-                    INSERT INTO conversation_history (event_json, position)
-                    VALUES (?, ?)
-                    """,
-                    (event_json, position),
-                )
-            conn.commit()
+            conn.executemany(
+                """
+                INSERT INTO conversation_history (event_json, position)
+                VALUES (?, ?)
+                """,
+                rows,
+            )
+
+        self.journal.write(apply)
+        self.journal.reset_conversation(len(rows))
 
     def get_conversation_history(self) -> List[Event]:
         """Restore conversation history."""
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT event_json FROM conversation_history ORDER BY position ASC"
@@ -306,19 +570,26 @@ class SessionStorage:
 
     # ─────────────────────── Utilities ───────────────────────────────────────
 
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Block until all journaled stream and conversation changes are committed."""
+        return self.journal.flush(timeout)
+
     def clear_all(self) -> None:
         """Wipe all persisted session data."""
-        with sqlite3.connect(self._db_path) as conn:
+
+        def apply(conn: sqlite3.Connection) -> None:
             conn.execute("DELETE FROM active_tasks")
             conn.execute("DELETE FROM event_records")
             conn.execute("DELETE FROM event_streams")
             conn.execute("DELETE FROM conversation_history")
-            conn.commit()
+
+        self.journal.write(apply)
+        self.journal.reset()
         logger.info("[SessionStorage] Cleared all session data")
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get storage statistics."""
-        with sqlite3.connect(self._db_path) as conn:
+        """Get storage statistics (journal entries still in flight are not counted)."""
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM active_tasks")
             task_count = cursor.fetchone()[0]
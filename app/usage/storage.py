@@ -4,6 +4,10 @@ app.usage.storage
 
 SQLite-based storage for usage events.
 Provides local persistence for LLM/VLM token usage tracking.
+
+Per-hour totals are kept in the ``usage_hourly`` rollup table (maintained by
+an insert trigger), so summaries over days or months read one row per hour
+plus the raw events of the partial hours at the range edges.
 """
 
 from __future__ import annotations
@@ -12,11 +16,14 @@ import json
 import logging
 import os
 import sqlite3
+from concurrent.futures import Future
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from app.usage.engine import get_engine, split_hours
+
 try:
     from app.logger import logger
 except Exception:
@@ -75,12 +82,13 @@ class UsageStorage:
             db_path = str(usage_dir / "usage.db")
 
         self._db_path = db_path
+        self._engine = get_engine(db_path)
         self._init_db()
         logger.info(f"[UsageStorage] Initialized at {self._db_path}")
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS usage_events (
@@ -113,6 +121,45 @@ class UsageStorage:
                 ON usage_events(model)
             """)
 
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'usage_hourly'"
+            )
+            backfill = cursor.fetchone() is None
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS usage_hourly (
+                    hour TEXT PRIMARY KEY,
+                    total_calls INTEGER NOT NULL DEFAULT 0,
+                    input_tokens INTEGER NOT NULL DEFAULT 0,
+                    output_tokens INTEGER NOT NULL DEFAULT 0,
+                    cached_tokens INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_usage_hourly
+                AFTER INSERT ON usage_events
+                BEGIN
+                    INSERT INTO usage_hourly
+                    (hour, total_calls, input_tokens, output_tokens, cached_tokens)
+                    VALUES (substr(NEW.timestamp, 1, 13), 1, NEW.input_tokens,
+                            NEW.output_tokens, NEW.cached_tokens)
+                    ON CONFLICT(hour) DO UPDATE SET
+                        total_calls = total_calls + 1,
+                        input_tokens = input_tokens + excluded.input_tokens,
+                        output_tokens = output_tokens + excluded.output_tokens,
+                        cached_tokens = cached_tokens + excluded.cached_tokens;
+                END
+            """)
+            if backfill:
+                # Databases created before the rollup existed
+                cursor.execute("""
+                    INSERT INTO usage_hourly
+                    (hour, total_calls, input_tokens, output_tokens, cached_tokens)
+                    SELECT substr(timestamp, 1, 13), COUNT(*), SUM(input_tokens),
+                           SUM(output_tokens), SUM(cached_tokens)
+                    FROM usage_events
+                    GROUP BY substr(timestamp, 1, 13)
+                """)
+
             conn.commit()
 
     def insert_event(self, event: UsageEvent) -> int:
@@ -125,30 +172,23 @@ class UsageStorage:
         Returns:
             The row ID of the inserted event.
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO usage_events
-                (timestamp, service_type, provider, model, input_tokens,
-                 output_tokens, cached_tokens, duration_ms, call_type,
-                 session_id, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                event.timestamp.isoformat() if event.timestamp else datetime.now().isoformat(),
-                event.service_type,
-                event.provider,
-                event.model,
-                event.input_tokens,
-                event.output_tokens,
-                event.cached_tokens,
-                event.duration_ms,
-                event.call_type,
-                event.session_id,
-                json.dumps(event.metadata) if event.metadata else None,
-            ))
-            conn.commit()
+        with self._engine.connect() as conn:
+            cursor = conn.execute(self._INSERT_SQL, self._event_row(event))
             return cursor.lastrowid
 
+    def submit_event(self, event: UsageEvent) -> "Future[int]":
+        """
+        Queue a usage event on the engine's writer thread and return immediately.
+
+        Args:
+            event: The UsageEvent to insert.
+
+        Returns:
+            Future resolved with the row ID once the write commits.
+        """
+        row = self._event_row(event)
+        return self._engine.submit(lambda conn: conn.execute(self._INSERT_SQL, row).lastrowid)
+
     def insert_events_batch(self, events: List[UsageEvent]) -> int:
         """
         Insert multiple usage events in a batch.
@@ -162,34 +202,43 @@ class UsageStorage:
         if not events:
             return 0
 
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-            data = [
-                (
-                    e.timestamp.isoformat() if e.timestamp else datetime.now().isoformat(),
-                    e.service_type,
-                    e.provider,
-                    e.model,
-                    e.input_tokens,
-                    e.output_tokens,
-                    e.cached_tokens,
-                    e.duration_ms,
-                    e.call_type,
-                    e.session_id,
-                    json.dumps(e.metadata) if e.metadata else None,
-                )
-                for e in events
-            ]
-            cursor.executemany("""
-                INSERT INTO usage_events
-                (timestamp, service_type, provider, model, input_tokens,
-                 output_tokens, cached_tokens, duration_ms, call_type,
-                 session_id, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, data)
-            conn.commit()
+        with self._engine.connect() as conn:
+            conn.executemany(self._INSERT_SQL, [self._event_row(e) for e in events])
             return len(events)
 
+    async def insert_events_batch_async(self, events: List[UsageEvent]) -> int:
+        """Insert multiple usage events on the engine's writer thread."""
+        if not events:
+            return 0
+
+        data = [self._event_row(e) for e in events]
+        await self._engine.run(lambda conn: conn.executemany(self._INSERT_SQL, data))
+        return len(events)
+
+    _INSERT_SQL = """
+        INSERT INTO usage_events
+        (timestamp, service_type, provider, model, input_tokens,
+         output_tokens, cached_tokens, duration_ms, call_type,
+         session_id, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _event_row(e: UsageEvent) -> tuple:
+        return (
+            e.timestamp.isoformat() if e.timestamp else datetime.now().isoformat(),
+            e.service_type,
+            e.provider,
+            e.model,
+            e.input_tokens,
+            e.output_tokens,
+            e.cached_tokens,
+            e.duration_ms,
+            e.call_type,
+            e.session_id,
+            json.dumps(e.metadata) if e.metadata else None,
+        )
+
     def get_usage_summary(
         self,
         start_date: Optional[datetime] = None,
@@ -205,40 +254,39 @@ class UsageStorage:
         Returns:
             Dictionary with aggregated usage statistics.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        rollup_where, rollup_params, raw_where, raw_params = split_hours(
+            "timestamp", start_date, end_date
+        )
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
-            query = """
+            cursor.execute(f"""
                 SELECT
-                    COUNT(*) as total_calls,
-                    SUM(input_tokens) as total_input_tokens,
-                    SUM(output_tokens) as total_output_tokens,
-                    SUM(cached_tokens) as total_cached_tokens,
-                    SUM(input_tokens + output_tokens) as total_tokens,
-                    AVG(input_tokens + output_tokens) as avg_tokens_per_call
-                FROM usage_events
-                WHERE 1=1
-            """
-            params = []
-
-            if start_date:
-                query += " AND timestamp >= ?"
-                params.append(start_date.isoformat())
-            if end_date:
-                query += " AND timestamp <= ?"
-                params.append(end_date.isoformat())
-
-            cursor.execute(query, params)
-            row = cursor.fetchone()
-
-            return {
-                "total_calls": row[0] or 0,
-                "total_input_tokens": row[1] or 0,
-                "total_output_tokens": row[2] or 0,
-                "total_cached_tokens": row[3] or 0,
-                "total_tokens": row[4] or 0,
-                "avg_tokens_per_call": round(row[5] or 0, 2),
-            }
+                    SUM(total_calls), SUM(input_tokens), SUM(output_tokens), SUM(cached_tokens)
+                FROM usage_hourly
+                WHERE {rollup_where}
+            """, rollup_params)
+            totals = [value or 0 for value in cursor.fetchone()]
+
+            if raw_where:
+                cursor.execute(f"""
+                    SELECT
+                        COUNT(*), SUM(input_tokens), SUM(output_tokens), SUM(cached_tokens)
+                    FROM usage_events
+                    WHERE {raw_where}
+                """, raw_params)
+                totals = [total + (value or 0) for total, value in zip(totals, cursor.fetchone())]
+
+        total_calls, input_tokens, output_tokens, cached_tokens = totals
+        total_tokens = input_tokens + output_tokens
+        return {
+            "total_calls": total_calls,
+            "total_input_tokens": input_tokens,
+            "total_output_tokens": output_tokens,
+            "total_cached_tokens": cached_tokens,
+            "total_tokens": total_tokens,
+            "avg_tokens_per_call": round(total_tokens / total_calls, 2) if total_calls else 0,
+        }
 
     def get_usage_by_provider(
         self,
@@ -251,7 +299,7 @@ class UsageStorage:
         Returns:
             List of dictionaries with per-provider statistics.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             query = """
@@ -300,7 +348,7 @@ class UsageStorage:
         Returns:
             List of dictionaries with per-model statistics.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             query = """
@@ -355,39 +403,36 @@ class UsageStorage:
         Returns:
             List of 24 integers representing request counts per hour (0-23).
         """
-        with sqlite3.connect(self._db_path) as conn:
+        rollup_where, rollup_params, raw_where, raw_params = split_hours(
+            "timestamp", start_date, end_date
+        )
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
-            query = """
-                SELECT
-                    CAST(strftime('%H', timestamp) AS INTEGER) as hour,
-                    COUNT(*) as count
-                FROM usage_events
-                WHERE 1=1
-            """
-            params = []
-
-            if start_date:
-                query += " AND timestamp >= ?"
-                params.append(start_date.isoformat())
-            if end_date:
-                query += " AND timestamp <= ?"
-                params.append(end_date.isoformat())
-
-            query += " GROUP BY hour ORDER BY hour"
-
-            cursor.execute(query, params)
+            cursor.execute(f"""
+                SELECT CAST(substr(hour, 12, 2) AS INTEGER) as hour_of_day, SUM(total_calls)
+                FROM usage_hourly
+                WHERE {rollup_where}
+                GROUP BY hour_of_day
+            """, rollup_params)
             rows = cursor.fetchall()
 
-            # Initialize 24-hour array
-            distribution = [0] * 24
-            for row in rows:
-                hour = row[0]
-                count = row[1]
-                if 0 <= hour < 24:
-                    distribution[hour] = count
+            if raw_where:
+                cursor.execute(f"""
+                    SELECT CAST(strftime('%H', timestamp) AS INTEGER) as hour_of_day, COUNT(*)
+                    FROM usage_events
+                    WHERE {raw_where}
+                    GROUP BY hour_of_day
+                """, raw_params)
+                rows += cursor.fetchall()
 
-            return distribution
+        # Initialize 24-hour array
+        distribution = [0] * 24
+        for hour, count in rows:
+            if hour is not None and 0 <= hour < 24:
+                distribution[hour] += count
+
+        return distribution
 
     def get_daily_usage(self, days: int = 30) -> List[Dict[str, Any]]:
         """
@@ -401,7 +446,7 @@ class UsageStorage:
         """
         start_date = datetime.now() - timedelta(days=days)
 
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -440,7 +485,7 @@ class UsageStorage:
         Returns:
             List of recent usage events as dictionaries.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -485,7 +530,7 @@ class UsageStorage:
         """
         import csv
 
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -517,7 +562,7 @@ class UsageStorage:
         Returns:
             Dictionary with storage info.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("SELECT COUNT(*) FROM usage_events")
@@ -542,14 +587,25 @@ class UsageStorage:
         Returns:
             Number of events deleted.
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM usage_events")
-            count = cursor.fetchone()[0]
-            cursor.execute("DELETE FROM usage_events")
-            conn.commit()
-            logger.info(f"[UsageStorage] Cleared {count} usage events")
-            return count
+        with self._engine.connect() as conn:
+            count = self._clear_events(conn)
+        logger.info(f"[UsageStorage] Cleared {count} usage events")
+        return count
+
+    async def clear_events_async(self) -> int:
+        """Clear all usage events on the engine's writer thread, after any queued inserts."""
+        count = await self._engine.run(self._clear_events)
+        logger.info(f"[UsageStorage] Cleared {count} usage events")
+        return count
+
+    @staticmethod
+    def _clear_events(conn: sqlite3.Connection) -> int:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM usage_events")
+        count = cursor.fetchone()[0]
+        cursor.execute("DELETE FROM usage_events")
+        cursor.execute("DELETE FROM usage_hourly")
+        return count
 
 
 # Global storage instance
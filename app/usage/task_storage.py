@@ -4,6 +4,10 @@ app.usage.task_storage
 
 SQLite-based storage for task events.
 Provides local persistence for task execution history.
+
+Per-hour totals (keyed by task end time) are kept in the ``task_hourly``
+rollup table, maintained by an insert trigger, so summaries over long ranges
+do not scan every task.
 """
 
 from __future__ import annotations
@@ -11,11 +15,14 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from app.usage.engine import get_engine, split_hours
+
 try:
     from app.logger import logger
 except Exception:
@@ -73,12 +80,13 @@ class TaskStorage:
             db_path = str(usage_dir / "tasks.db")
 
         self._db_path = db_path
+        self._engine = get_engine(db_path)
         self._init_db()
         logger.info(f"[TaskStorage] Initialized at {self._db_path}")
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS task_events (
@@ -110,6 +118,55 @@ class TaskStorage:
                 ON task_events(task_id)
             """)
 
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task_hourly'"
+            )
+            backfill = cursor.fetchone() is None
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS task_hourly (
+                    hour TEXT PRIMARY KEY,
+                    total_tasks INTEGER NOT NULL DEFAULT 0,
+                    completed_tasks INTEGER NOT NULL DEFAULT 0,
+                    failed_tasks INTEGER NOT NULL DEFAULT 0,
+                    cancelled_tasks INTEGER NOT NULL DEFAULT 0,
+                    total_cost REAL NOT NULL DEFAULT 0.0,
+                    total_duration_ms INTEGER NOT NULL DEFAULT 0,
+                    total_llm_calls INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_task_hourly
+                AFTER INSERT ON task_events
+                BEGIN
+                    INSERT INTO task_hourly
+                    (hour, total_tasks, completed_tasks, failed_tasks, cancelled_tasks,
+                     total_cost, total_duration_ms, total_llm_calls)
+                    VALUES (substr(NEW.end_time, 1, 13), 1,
+                            NEW.status = 'completed', NEW.status = 'error', NEW.status = 'cancelled',
+                            NEW.total_cost, NEW.duration_ms, NEW.llm_call_count)
+                    ON CONFLICT(hour) DO UPDATE SET
+                        total_tasks = total_tasks + 1,
+                        completed_tasks = completed_tasks + excluded.completed_tasks,
+                        failed_tasks = failed_tasks + excluded.failed_tasks,
+                        cancelled_tasks = cancelled_tasks + excluded.cancelled_tasks,
+                        total_cost = total_cost + excluded.total_cost,
+                        total_duration_ms = total_duration_ms + excluded.total_duration_ms,
+                        total_llm_calls = total_llm_calls + excluded.total_llm_calls;
+                END
+            """)
+            if backfill:
+                # Databases created before the rollup existed
+                cursor.execute("""
+                    INSERT INTO task_hourly
+                    (hour, total_tasks, completed_tasks, failed_tasks, cancelled_tasks,
+                     total_cost, total_duration_ms, total_llm_calls)
+                    SELECT substr(end_time, 1, 13), COUNT(*),
+                           SUM(status = 'completed'), SUM(status = 'error'), SUM(status = 'cancelled'),
+                           SUM(total_cost), SUM(duration_ms), SUM(llm_call_count)
+                    FROM task_events
+                    GROUP BY substr(end_time, 1, 13)
+                """)
+
             conn.commit()
 
     def insert_task(self, task: TaskEvent) -> int:
@@ -122,27 +179,43 @@ class TaskStorage:
         Returns:
             The row ID of the inserted task.
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO task_events
-                (task_id, task_name, status, start_time, end_time,
-                 duration_ms, total_cost, llm_call_count, session_id, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                task.task_id,
-                task.task_name,
-                task.status,
-                task.start_time.isoformat() if isinstance(task.start_time, datetime) else task.start_time,
-                task.end_time.isoformat() if isinstance(task.end_time, datetime) else task.end_time,
-                task.duration_ms,
-                task.total_cost,
-                task.llm_call_count,
-                task.session_id,
-                json.dumps(task.metadata) if task.metadata else None,
-            ))
-            conn.commit()
-            return cursor.lastrowid
+        with self._engine.connect() as conn:
+            return conn.execute(self._INSERT_SQL, self._task_row(task)).lastrowid
+
+    def submit_task(self, task: TaskEvent) -> "Future[int]":
+        """
+        Queue a task event on the engine's writer thread and return immediately.
+
+        Args:
+            task: The TaskEvent to insert.
+
+        Returns:
+            Future resolved with the row ID once the write commits.
+        """
+        row = self._task_row(task)
+        return self._engine.submit(lambda conn: conn.execute(self._INSERT_SQL, row).lastrowid)
+
+    _INSERT_SQL = """
+        INSERT INTO task_events
+        (task_id, task_name, status, start_time, end_time,
+         duration_ms, total_cost, llm_call_count, session_id, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _task_row(task: TaskEvent) -> tuple:
+        return (
+            task.task_id,
+            task.task_name,
+            task.status,
+            task.start_time.isoformat() if isinstance(task.start_time, datetime) else task.start_time,
+            task.end_time.isoformat() if isinstance(task.end_time, datetime) else task.end_time,
+            task.duration_ms,
+            task.total_cost,
+            task.llm_call_count,
+            task.session_id,
+            json.dumps(task.metadata) if task.metadata else None,
+        )
 
     def get_task_summary(
         self,
@@ -159,51 +232,51 @@ class TaskStorage:
         Returns:
             Dictionary with aggregated task statistics.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        rollup_where, rollup_params, raw_where, raw_params = split_hours(
+            "end_time", start_date, end_date
+        )
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
-            query = """
+            cursor.execute(f"""
                 SELECT
-                    COUNT(*) as total_tasks,
-                    SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed_tasks,
-                    SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) as failed_tasks,
-                    SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END) as cancelled_tasks,
-                    SUM(total_cost) as total_cost,
-                    AVG(duration_ms) as avg_duration_ms,
-                    SUM(llm_call_count) as total_llm_calls
-                FROM task_events
-                WHERE 1=1
-            """
-            params = []
-
-            if start_date:
-                query += " AND end_time >= ?"
-                params.append(start_date.isoformat())
-            if end_date:
-                query += " AND end_time <= ?"
-                params.append(end_date.isoformat())
-
-            cursor.execute(query, params)
-            row = cursor.fetchone()
-
-            total = row[0] or 0
-            completed = row[1] or 0
-            failed = row[2] or 0
-
-            # Calculate success rate
-            finished = completed + failed
-            success_rate = (completed / finished * 100) if finished > 0 else 100.0
-
-            return {
-                "total_tasks": total,
-                "completed_tasks": completed,
-                "failed_tasks": failed,
-                "cancelled_tasks": row[3] or 0,
-                "success_rate": round(success_rate, 1),
-                "total_cost": round(row[4] or 0, 4),
-                "avg_duration_ms": round(row[5] or 0, 2),
-                "total_llm_calls": row[6] or 0,
-            }
+                    SUM(total_tasks), SUM(completed_tasks), SUM(failed_tasks),
+                    SUM(cancelled_tasks), SUM(total_cost), SUM(total_duration_ms),
+                    SUM(total_llm_calls)
+                FROM task_hourly
+                WHERE {rollup_where}
+            """, rollup_params)
+            totals = [value or 0 for value in cursor.fetchone()]
+
+            if raw_where:
+                cursor.execute(f"""
+                    SELECT
+                        COUNT(*),
+                        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END),
+                        SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END),
+                        SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END),
+                        SUM(total_cost), SUM(duration_ms), SUM(llm_call_count)
+                    FROM task_events
+                    WHERE {raw_where}
+                """, raw_params)
+                totals = [total + (value or 0) for total, value in zip(totals, cursor.fetchone())]
+
+        total, completed, failed, cancelled, total_cost, total_duration_ms, llm_calls = totals
+
+        # Calculate success rate
+        finished = completed + failed
+        success_rate = (completed / finished * 100) if finished > 0 else 100.0
+
+        return {
+            "total_tasks": total,
+            "completed_tasks": completed,
+            "failed_tasks": failed,
+            "cancelled_tasks": cancelled,
+            "success_rate": round(success_rate, 1),
+            "total_cost": round(total_cost, 4),
+            "avg_duration_ms": round(total_duration_ms / total, 2) if total else 0,
+            "total_llm_calls": llm_calls,
+        }
 
     def get_recent_tasks(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -215,7 +288,7 @@ class TaskStorage:
         Returns:
             List of recent task events as dictionaries.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -253,7 +326,7 @@ class TaskStorage:
         Returns:
             Dictionary with storage info.
         """
-        with sqlite3.connect(self._db_path) as conn:
+        with self._engine.connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("SELECT COUNT(*) FROM task_events")
@@ -278,14 +351,25 @@ class TaskStorage:
         Returns:
             Number of tasks deleted.
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM task_events")
-            count = cursor.fetchone()[0]
-            cursor.execute("DELETE FROM task_events")
-            conn.commit()
-            logger.info(f"[TaskStorage] Cleared {count} task events")
-            return count
+        with self._engine.connect() as conn:
+            count = self._clear_tasks(conn)
+        logger.info(f"[TaskStorage] Cleared {count} task events")
+        return count
+
+    async def clear_tasks_async(self) -> int:
+        """Clear all task events on the engine's writer thread, after any queued inserts."""
+        count = await self._engine.run(self._clear_tasks)
+        logger.info(f"[TaskStorage] Cleared {count} task events")
+        return count
+
+    @staticmethod
+    def _clear_tasks(conn: sqlite3.Connection) -> int:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM task_events")
+        count = cursor.fetchone()[0]
+        cursor.execute("DELETE FROM task_events")
+        cursor.execute("DELETE FROM task_hourly")
+        return count
 
 
 # Global storage instance
@@ -0,0 +1,514 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark the agent loop offline with scripted, replayed LLM responses.
+
+Each scenario is a chat message plus the LLM responses a model would give
+(action decisions, skill/action-set selection). The real ``AgentBase`` runs
+it end to end: chat routing, ``react`` -> ``ActionRouter`` action selection
+-> ``ActionManager`` execution -> follow-up triggers, with every LLM call
+answered by an ``LLMCassette``. Nothing touches the network.
+
+Every repeat uses a fresh agent and a restored agent file system. The first
+run is served from the script in order; its prompts are saved as a keyed
+fixture and the remaining repeats replay it, matching prompts by hash
+(timestamps and ids masked). A prompt that no longer matches is served by
+recording order and counted as prompt drift rather than failing the run.
+Reported per scenario:
+
+- wall time per scenario and per ``react``, and per stage from the profiler
+  (action selection, execution, LLM calls, trigger handling)
+- prompt sizes (characters and tokens) per LLM call
+- memory allocated while the scenario runs (tracemalloc peak, retained, top
+  allocation sites), measured in a separate pass so it doesn't skew timings
+
+Add synthetic LLM latency with ``--ttft`` / ``--token-latency`` to see how
+the loop behaves with realistic model delays; the default of zero measures
+the framework alone.
+
+The agent writes logs, Chroma and usage databases under the project root
+and the benchmark clears persisted sessions between runs, so it always runs
+in a temporary copy of the tree. Token counting needs tiktoken's
+encoding files cached locally (``TIKTOKEN_CACHE_DIR``); run anything that
+counts tokens once while online to fill the cache.
+
+Usage:
+    python scripts/bench_agent_loop.py
+    python scripts/bench_agent_loop.py --scenario complex_task --repeat 5
+    python scripts/bench_agent_loop.py --ttft 0.4 --token-latency 0.01 --json results.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+# Tree the agent runs from (a temporary copy) and the
+# pristine copy of its agent_file_system restored after every run
+PROJECT_ROOT = ROOT
+_agent_files: Optional[Path] = None
+
+# Stage -> profiled operations (see @profile in app/agent_base.py and agent_core)
+STAGES = {
+    "select_action": (
+        "agent_select_action",
+        "agent_select_action_in_task",
+        "agent_select_action_in_simple_task",
+    ),
+    "execute_actions": ("agent_execute_actions",),
+    "triggers": ("agent_create_new_trigger", "trigger_queue_put", "trigger_queue_get"),
+}
+MAX_REACTS = 50
+
+
+def decision(reasoning: str, *actions: tuple) -> str:
+    return json.dumps({
+        "reasoning": reasoning,
+        "actions": [{"action_name": name, "parameters": params} for name, params in actions],
+    })
+
+
+def todos(*items: tuple) -> Dict[str, Any]:
+    return {"todos": [{"content": content, "status": status} for content, status in items]}
+
+
+NO_SKILLS = json.dumps({"skills": [], "action_sets": []})
+
+
+@dataclass
+class Scenario:
+    name: str
+    message: str
+    responses: List[str]
+
+
+SCENARIOS = [
+    Scenario(
+        "chat_reply",
+        "hello there, what can you do?",
+        [decision("Greeting, reply directly.", ("send_message", {"message": "Hi! I can run tasks on this computer."}))],
+    ),
+    Scenario(
+        "simple_task",
+        "write a notes.txt with three bullet points from today's meeting",
+        [
+            decision("Needs a short task.", ("task_start", {
+                "task_name": "Write meeting notes",
+                "task_description": "Write notes.txt with three bullet points about the meeting.",
+                "task_mode": "simple",
+            })),
+            NO_SKILLS,
+            decision("Write the file.", ("write_file", {
+                "file_path": "notes.txt", "content": "- budget approved\n- launch moved\n- hire two engineers\n",
+            })),
+            decision("Check the result.", ("read_file", {"file_path": "notes.txt"})),
+            decision("Report back.", ("send_message", {"message": "notes.txt is written."})),
+            decision("Done.", ("task_end", {"status": "complete", "reason": "File written", "summary": "Wrote notes.txt"})),
+        ],
+    ),
+    Scenario(
+        "complex_task",
+        "survey this folder and write a short report with an index",
+        [
+            decision("Multi-step work.", ("task_start", {
+                "task_name": "Folder report",
+                "task_description": "List the folder, write report.md and index.md, then verify them.",
+                "task_mode": "complex",
+            })),
+            NO_SKILLS,
+            decision("Plan the work.", ("task_update_todos", todos(
+                ("Collect: list the folder", "in_progress"),
+                ("Execute: write report.md and index.md", "pending"),
+                ("Verify: read both files back", "pending"),
+            ))),
+            decision("Collect.", ("list_folder", {"path": "."})),
+            decision("Write the report.", ("write_file", {
+                "file_path": "report.md", "content": "# Folder report\n\nThe folder is in good shape.\n",
+            })),
+            decision("Write the index.", ("write_file", {"file_path": "index.md", "content": "- report.md\n"})),
+            decision(
+                "Verify both files in parallel.",
+                ("read_file", {"file_path": "report.md"}),
+                ("read_file", {"file_path": "index.md"}),
+            ),
+            decision("All done.", ("task_update_todos", todos(
+                ("Collect: list the folder", "completed"),
+                ("Execute: write report.md and index.md", "completed"),
+                ("Verify: read both files back", "completed"),
+            ))),
+            decision("Report back.", ("send_message", {"message": "report.md and index.md are written."})),
+            decision("Done.", ("task_end", {"status": "complete", "reason": "Report written", "summary": "Wrote the report"})),
+        ],
+    ),
+]
+
+
+# ------------------------------------------------------------------
+# Workspace
+# ------------------------------------------------------------------
+
+def prepare_workspace() -> tuple:
+    """Copy the tree to a scratch directory; returns (project root to import from, scratch directory)."""
+    scratch = Path(tempfile.mkdtemp(prefix="agent_loop_bench_"))
+    root = scratch / "project"
+    try:
+        shutil.copytree(
+            ROOT,
+            root,
+            ignore=shutil.ignore_patterns(
+                ".git", "__pycache__", "*.pyc", "logs", "chroma_db*", "node_modules", "assets", ".usage"
+            ),
+        )
+    except BaseException:
+        shutil.rmtree(scratch, ignore_errors=True)
+        raise
+    return root, scratch
+
+
+def load_agent(root: Path):
+    sys.path.insert(0, str(root))
+    from agent_core import ConfigRegistry, StateRegistry
+    from app.config import get_project_root
+    from app.state.agent_state import STATE
+
+    StateRegistry.register(lambda: STATE)
+    ConfigRegistry.register_workspace_root(str(get_project_root()))
+
+    from app.agent_base import AgentBase
+    return AgentBase
+
+
+def check_tokenizer() -> None:
+    from agent_core.utils.token import count_tokens
+    try:
+        count_tokens("tokenizer check")
+    except Exception as e:
+        sys.exit(
+            f"Token counting is unavailable offline ({type(e).__name__}). Set TIKTOKEN_CACHE_DIR "
+            "to a directory with tiktoken's cached encodings, or run once while online."
+        )
+
+
+# ------------------------------------------------------------------
+# Runs
+# ------------------------------------------------------------------
+
+def new_agent(AgentBase, cassette):
+    """Fresh agent answering LLM calls from ``cassette``."""
+    # The agent loads actions and config relative to the working directory
+    os.chdir(PROJECT_ROOT)
+    with contextlib.redirect_stdout(io.StringIO()):  # action re-registration notices
+        agent = AgentBase(llm_provider="openai", llm_api_key="offline", deferred_init=True)
+    agent.llm.use_cassette(cassette)
+    return agent
+
+
+async def run_scenario(agent, scenario: Scenario, workdir: Path) -> Dict[str, Any]:
+    """Send the scenario's message and run triggers until the queue is empty; returns timings."""
+    os.chdir(workdir)  # actions write their files in the scratch directory
+    react_ms: List[float] = []
+    start = time.perf_counter()
+    await agent._handle_chat_message({"text": scenario.message, "platform": "CraftBot Interface"})
+    while len(react_ms) < MAX_REACTS and await agent.triggers.size():
+        trigger = await asyncio.wait_for(agent.triggers.get(), timeout=30)
+        react_start = time.perf_counter()
+        try:
+            await agent.react(trigger)
+        finally:
+            await agent.triggers.release(trigger.session_id)
+        react_ms.append((time.perf_counter() - react_start) * 1000)
+    total_ms = (time.perf_counter() - start) * 1000
+    llm_ms = sum(call["latency_s"] for call in agent.llm.cassette.calls) * 1000
+    return {"total_ms": total_ms, "react_ms": react_ms, "llm_ms": llm_ms}
+
+
+async def reset(agent, workdir: Path) -> None:
+    """Leave nothing behind for the next run."""
+    from app.usage.session_storage import get_session_storage
+
+    await agent.triggers.clear()
+    # Pending EVENT.md lines would otherwise land after the workspace is removed
+    agent.event_stream_manager.flush_event_logs()
+    if agent.memory_file_watcher.is_running:
+        agent.memory_file_watcher.stop()
+    # Persisted sessions would otherwise be restored (conversation history, event
+    # streams); clear_all() is queued on the journal, so wait for it to land
+    storage = get_session_storage()
+    storage.clear_all()
+    storage.flush()
+    restore_agent_files()
+    for path in workdir.iterdir():
+        shutil.rmtree(path) if path.is_dir() else path.unlink()
+
+
+def keyed_fixture(cassette, path: Path) -> None:
+    """Save the calls a scripted run served as a fixture keyed by prompt hash."""
+    from agent_core.core.impl.llm.replay import normalize_prompt, prompt_key
+
+    with open(path, "w", encoding="utf-8") as f:
+        for call in cassette.calls:
+            system, user = call["system_prompt"], call["user_prompt"]
+            f.write(json.dumps({
+                "key": prompt_key(system, user),
+                "normalized_key": prompt_key(normalize_prompt(system), normalize_prompt(user)),
+                "kind": call["kind"],
+                "call_type": call["call_type"],
+                "user_preview": user[:200],
+                "content": call["content"],
+            }, ensure_ascii=False) + "\n")
+
+
+def prompt_stats(cassette) -> Dict[str, Any]:
+    from agent_core.utils.token import count_tokens
+
+    calls = []
+    for call in cassette.calls:
+        calls.append({
+            "kind": call["kind"],
+            "call_type": call["call_type"],
+            "system_chars": call["system_chars"],
+            "user_chars": call["user_chars"],
+            "system_tokens": count_tokens(call["system_prompt"] or ""),
+            "user_tokens": count_tokens(call["user_prompt"]),
+            "output_tokens": count_tokens(call["content"]),
+        })
+    return {
+        "calls": calls,
+        "input_tokens": sum(c["system_tokens"] + c["user_tokens"] for c in calls),
+        "output_tokens": sum(c["output_tokens"] for c in calls),
+    }
+
+
+def stage_stats(profiler, run: Dict[str, Any]) -> Dict[str, float]:
+    stats = profiler.get_stats()
+    stages = {
+        stage: sum(stats[op].total_ms for op in ops if op in stats)
+        for stage, ops in STAGES.items()
+    }
+    # Streamed calls aren't profiled individually; the cassette times every call
+    stages["llm"] = run["llm_ms"]
+    stages["outside_llm"] = run["total_ms"] - run["llm_ms"]
+    return stages
+
+
+async def measure_allocations(AgentBase, scenario: Scenario, cassette, args, workdir: Path) -> Dict[str, Any]:
+    """Run once under tracemalloc (agent construction and profiler excluded)."""
+    from agent_core.decorators.profiler import profiler
+
+    agent = new_agent(AgentBase, cassette)
+    profiler.enabled = False
+    tracemalloc.start(args.trace_frames)
+    before = tracemalloc.take_snapshot()
+    try:
+        await run_scenario(agent, scenario, workdir)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        profiler.enabled = True
+    await reset(agent, workdir)
+
+    filters = [tracemalloc.Filter(True, str(PROJECT_ROOT / "*"))]
+    top = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")[:args.top]
+    return {
+        "peak_kb": round(peak / 1024, 1),
+        "retained_kb": round(sum(s.size_diff for s in after.compare_to(before, "filename")) / 1024, 1),
+        "top": [
+            {
+                "site": f"{Path(s.traceback[0].filename).relative_to(PROJECT_ROOT)}:{s.traceback[0].lineno}",
+                "size_kb": round(s.size_diff / 1024, 1),
+                "count": s.count_diff,
+            }
+            for s in top
+        ],
+    }
+
+
+async def bench_scenario(AgentBase, scenario: Scenario, args, workdir: Path, fixtures: Path) -> Dict[str, Any]:
+    from agent_core import LLMCassette
+    from agent_core.decorators.profiler import profiler
+
+    latency = {"ttft": args.ttft, "token_latency": args.token_latency}
+    scripted = fixtures / f"{scenario.name}.script.jsonl"
+    with open(scripted, "w", encoding="utf-8") as f:
+        for content in scenario.responses:
+            f.write(json.dumps({"content": content}) + "\n")
+    recorded = fixtures / f"{scenario.name}.jsonl"
+
+    runs: List[Dict[str, Any]] = []
+    matches: List[Dict[str, Any]] = []
+    stages: Dict[str, List[float]] = {}
+    prompts: Dict[str, Any] = {}
+
+    # Run 0 follows the script; later runs replay its prompts by hash. Replays
+    # fall back to recording order (reported as drift) when a prompt changed,
+    # e.g. parallel actions finishing in a different order.
+    for i in range(args.repeat):
+        if i == 0:
+            cassette = LLMCassette(scripted, keep_prompts=True, **latency)
+        else:
+            cassette = LLMCassette(recorded, **latency)
+        agent = new_agent(AgentBase, cassette)
+        profiler.clear()
+        run = await run_scenario(agent, scenario, workdir)
+        await reset(agent, workdir)
+        stats = cassette.stats()
+        matches.append({k: stats[k] for k in ("exact", "normalized", "sequence", "misses", "unused")})
+        if i == 0:
+            keyed_fixture(cassette, recorded)
+            prompts = prompt_stats(cassette)
+        if i > 0 or args.repeat == 1:
+            runs.append(run)
+            for stage, ms in stage_stats(profiler, run).items():
+                stages.setdefault(stage, []).append(ms)
+
+    allocations = await measure_allocations(AgentBase, scenario, LLMCassette(recorded, **latency), args, workdir)
+
+    return {
+        "scenario": scenario.name,
+        "repeats": len(runs),
+        "reacts": len(runs[0]["react_ms"]),
+        "llm_calls": len(prompts["calls"]),
+        "total_ms": summarize([run["total_ms"] for run in runs]),
+        "react_ms": summarize([ms for run in runs for ms in run["react_ms"]]),
+        "stages_ms": {stage: summarize(values) for stage, values in stages.items()},
+        "operations": {name: s.to_dict() for name, s in profiler.get_stats().items()},
+        "prompts": prompts,
+        "matches": matches,
+        "allocations": allocations,
+    }
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {"median": 0.0, "min": 0.0, "max": 0.0}
+    return {
+        "median": round(statistics.median(values), 3),
+        "min": round(min(values), 3),
+        "max": round(max(values), 3),
+    }
+
+
+# ------------------------------------------------------------------
+# Report
+# ------------------------------------------------------------------
+
+def print_report(results: List[Dict[str, Any]], args) -> int:
+    failures = 0
+    print(f"\nAgent loop benchmark (ttft={args.ttft}s, token_latency={args.token_latency}s)")
+    for r in results:
+        print(f"\n== {r['scenario']}: {r['reacts']} react(s), {r['llm_calls']} LLM call(s), {r['repeats']} timed run(s)")
+        print(f"  wall time        {r['total_ms']['median']:9.1f} ms  (min {r['total_ms']['min']:.1f}, max {r['total_ms']['max']:.1f})")
+        print(f"  per react        {r['react_ms']['median']:9.1f} ms  (max {r['react_ms']['max']:.1f})")
+        for stage, summary in r["stages_ms"].items():
+            print(f"  {stage:<16} {summary['median']:9.1f} ms")
+
+        prompts = r["prompts"]
+        print(f"  prompts          {prompts['input_tokens']} input / {prompts['output_tokens']} output tokens")
+        for call in prompts["calls"]:
+            label = call["call_type"] or call["kind"]
+            print(
+                f"    {label:<32} system {call['system_chars']:>6} ch / {call['system_tokens']:>5} tok"
+                f"   user {call['user_chars']:>6} ch / {call['user_tokens']:>5} tok"
+            )
+
+        alloc = r["allocations"]
+        print(f"  allocations      peak {alloc['peak_kb']:.0f} KB, retained {alloc['retained_kb']:.0f} KB")
+        for site in alloc["top"]:
+            print(f"    {site['size_kb']:8.1f} KB  {site['count']:6d} blocks  {site['site']}")
+
+        scripted, replays = r["matches"][0], r["matches"][1:]
+        if scripted["misses"] or scripted["unused"]:
+            print(
+                f"  FAILED: the agent made {'more' if scripted['misses'] else 'fewer'} LLM calls "
+                "than the scenario scripts"
+            )
+            failures += 1
+        if replays:
+            total = {k: sum(m[k] for m in replays) for k in ("exact", "normalized", "sequence", "misses")}
+            status = "FAILED" if total["misses"] else "ok"
+            print(
+                f"  replay {status}: {total['exact']} exact, {total['normalized']} after masking "
+                f"timestamps/ids, {total['sequence']} by order (prompt drift), {total['misses']} missed"
+            )
+            failures += bool(total["misses"])
+    return failures
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenario", action="append", choices=[s.name for s in SCENARIOS],
+                        help="Scenario to run (repeatable; default all)")
+    parser.add_argument("--repeat", type=int, default=4, help="Runs per scenario; the first is scripted")
+    parser.add_argument("--ttft", type=float, default=0.0, help="Synthetic seconds before the first token")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="Synthetic seconds per output token")
+    parser.add_argument("--top", type=int, default=8, help="Allocation sites to show")
+    parser.add_argument("--trace-frames", type=int, default=1, help="tracemalloc frames per allocation")
+    parser.add_argument("--json", type=Path, help="Also write the results as JSON")
+    parser.add_argument("--keep", action="store_true", help="Keep the temporary workspace")
+    return parser.parse_args()
+
+
+def restore_agent_files() -> None:
+    """Put the agent file system back to its state before the first run."""
+    target = PROJECT_ROOT / "agent_file_system"
+    shutil.rmtree(target, ignore_errors=True)
+    shutil.copytree(_agent_files, target)
+
+
+async def main() -> int:
+    global PROJECT_ROOT, _agent_files
+    args = parse_args()
+    args.repeat = max(1, args.repeat)
+    os.environ["GUI_MODE_ENABLED"] = "False"
+
+    PROJECT_ROOT, scratch = prepare_workspace()
+    # Everything from here on may exit early (check_tokenizer() calls sys.exit)
+    try:
+        workdir = scratch / "work"
+        fixtures = scratch / "fixtures"
+        workdir.mkdir()
+        fixtures.mkdir()
+        _agent_files = scratch / "agent_file_system.orig"
+        shutil.copytree(PROJECT_ROOT / "agent_file_system", _agent_files)
+        print(f"Workspace: {scratch}")
+
+        AgentBase = load_agent(PROJECT_ROOT)
+        check_tokenizer()
+        from agent_core.decorators.profiler import profiler
+        profiler.enabled = True
+
+        selected = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+        results = []
+        try:
+            for scenario in selected:
+                print(f"Running {scenario.name} ...", flush=True)
+                results.append(await bench_scenario(AgentBase, scenario, args, workdir, fixtures))
+        finally:
+            restore_agent_files()
+    finally:
+        os.chdir(ROOT)
+        if not args.keep:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    failures = print_report(results, args)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.json}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark for markdown event logging (EVENT.md / EVENT_UNPROCESSED.md).
+
+Replays a burst of events through the previous per-event path (lock, stat
+and rotate check, open/append/close of both files) and through the
+group-commit EventLogWriter used by EventStreamManager, reporting the cost
+seen by the logging thread and the time until everything is on disk.
+
+Usage:
+    python scripts/bench_event_log.py                  # 10k-event burst
+    python scripts/bench_event_log.py --events 50000   # custom size
+    python scripts/bench_event_log.py --max-kb 256     # force segment rolls
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agent_core.core.impl.event_stream.log_writer import EventLogWriter
+from agent_core.utils.file_utils import rotate_md_file_if_needed
+
+FILES = ("EVENT.md", "EVENT_UNPROCESSED.md")
+
+
+def make_lines(count: int) -> List[str]:
+    return [
+        f"[2025/01/01 00:00:00] [agent message]: event {i} " + "lorem ipsum " * (i % 16) + "\n"
+        for i in range(count)
+    ]
+
+
+def legacy(directory: Path, lines: List[str], max_bytes: int) -> Tuple[float, float]:
+    """Previous implementation: every event stats, opens, appends and closes both files."""
+    lock = threading.Lock()
+    start = time.perf_counter()
+    for line in lines:
+        with lock:
+            for name in FILES:
+                path = directory / name
+                rotate_md_file_if_needed(path, max_bytes)
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(line)
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed
+
+
+def group_commit(directory: Path, lines: List[str], max_bytes: int) -> Tuple[float, float]:
+    """EventLogWriter: callers only enqueue; the writer thread batches the I/O."""
+    writer = EventLogWriter(directory, max_bytes=max_bytes)
+    start = time.perf_counter()
+    for line in lines:
+        for name in FILES:
+            writer.write(name, line)
+    enqueued = time.perf_counter() - start
+    writer.flush(timeout=None)
+    durable = time.perf_counter() - start
+    writer.close()
+    return enqueued, durable
+
+
+def run(fn: Callable, lines: List[str], max_bytes: int) -> Tuple[float, float]:
+    directory = Path(tempfile.mkdtemp(prefix="bench_event_log_"))
+    try:
+        return fn(directory, lines, max_bytes)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark markdown event logging")
+    parser.add_argument("--events", type=int, default=10_000, help="Events in the burst")
+    parser.add_argument("--max-kb", type=int, default=10 * 1024, help="Rotation threshold per file (KiB)")
+    args = parser.parse_args()
+
+    lines = make_lines(args.events)
+    max_bytes = args.max_kb * 1024
+
+    legacy_caller, legacy_total = run(legacy, lines, max_bytes)
+    group_caller, group_total = run(group_commit, lines, max_bytes)
+
+    def per_event_us(seconds: float) -> float:
+        return seconds / args.events * 1e6
+
+    print(f"Events: {args.events:,}  (2 files each, rotation at {args.max_kb:,} KiB)")
+    print("                   caller cost/event   time to disk")
+    print(f"  per-event open : {per_event_us(legacy_caller):12.2f} us   {legacy_total * 1000:9.1f} ms")
+    print(f"  group commit   : {per_event_us(group_caller):12.2f} us   {group_total * 1000:9.1f} ms")
+    print(f"  caller speedup : {legacy_caller / group_caller:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,417 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark streamed LLM responses against local stub provider APIs.
+
+The stub server speaks the wire formats of every provider LLMInterface
+streams from (OpenAI-compatible SSE, Anthropic message events, Gemini
+``streamGenerateContent`` SSE, Ollama NDJSON, BytePlus SSE) and their
+non-streaming counterparts. It answers after ``--ttft-ms`` and then emits
+one ~4 character token every ``--token-ms``, like a real model would.
+
+For each provider it compares:
+
+- the blocking call (``LLM_STREAMING=0``): the decision is available when
+  the whole response is
+- the native stream: time to first token and time until the incremental
+  JSON parser has completed the first ``action_name``
+
+and checks that both return the same text, that a stream failing before its
+first token falls back to the blocking call, and that ActionRouter stops a
+single-action response as soon as its action name turns out to be unknown.
+
+Usage:
+    python scripts/bench_llm_streaming.py
+    python scripts/bench_llm_streaming.py --ttft-ms 300 --token-ms 20 --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+MODEL = "bench-model"
+PROVIDERS = ("openai", "anthropic", "gemini", "remote", "byteplus")
+
+DECISION = {
+    "reasoning": "The user asked for a summary of the meeting notes, so reply with it directly.",
+    "actions": [
+        {
+            "action_name": "send_message",
+            "parameters": {
+                "message": (
+                    "Here is the summary of today's meeting: the release moves to Friday, "
+                    "the onboarding flow gets a second review, and the API rate limits are "
+                    "raised for the beta customers. Action items were assigned to each owner "
+                    "and will be tracked in the weekly sync."
+                ),
+            },
+        }
+    ],
+}
+INVALID_GUI_DECISION = {
+    "action_name": "type_into_window",
+    "parameters": {"text": "A long paragraph the agent wanted to type into the focused window. " * 6},
+}
+
+
+def _tokens(text: str, size: int = 4):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, ttft_s: float, token_s: float):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.ttft_s = ttft_s
+        self.token_s = token_s
+        self.response_text = json.dumps(DECISION)
+        self.fail_streams = False
+        self.requests = {"stream": 0, "blocking": 0}
+
+    @property
+    def base(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.endswith("/api/tags"):
+            self._send_json({"models": [{"name": MODEL}]})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        path = urlparse(self.path).path
+        streaming = bool(body.get("stream")) or ":streamGenerateContent" in path
+        self.server.requests["stream" if streaming else "blocking"] += 1
+        if streaming and self.server.fail_streams:
+            self._send_json({"error": {"message": "streaming unavailable"}}, status=503)
+            return
+
+        text = self.server.response_text
+        if path.startswith("/openai") or path.startswith("/byteplus"):
+            self._openai(body, text, streaming)
+        elif path.startswith("/anthropic"):
+            self._anthropic(text, streaming)
+        elif path.startswith("/gemini"):
+            self._gemini(text, streaming)
+        elif path.startswith("/ollama"):
+            self._ollama(text, streaming)
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    # ----- formats -----
+
+    def _openai(self, body, text, streaming):
+        usage = {"prompt_tokens": 1200, "completion_tokens": len(_tokens(text)), "total_tokens": 0}
+        if not streaming:
+            time.sleep(self.server.ttft_s + self.server.token_s * len(_tokens(text)))
+            self._send_json({
+                "id": "c1", "object": "chat.completion", "created": 0, "model": MODEL,
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": text}}],
+                "usage": usage,
+            })
+            return
+        events = [
+            {"id": "c1", "object": "chat.completion.chunk", "created": 0, "model": MODEL,
+             "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]}
+            for token in _tokens(text)
+        ]
+        if (body.get("stream_options") or {}).get("include_usage"):
+            events.append({"id": "c1", "object": "chat.completion.chunk", "created": 0,
+                           "model": MODEL, "choices": [], "usage": usage})
+        self._stream_sse([(None, e) for e in events] + [(None, "[DONE]")], tokens=len(events))
+
+    def _anthropic(self, text, streaming):
+        usage = {"input_tokens": 1200, "output_tokens": len(_tokens(text)),
+                 "cache_read_input_tokens": 0, "cache_creation_input_tokens": 0}
+        message = {"id": "m1", "type": "message", "role": "assistant", "model": MODEL,
+                   "content": [], "stop_reason": None, "stop_sequence": None,
+                   "usage": {**usage, "output_tokens": 1}}
+        if not streaming:
+            time.sleep(self.server.ttft_s + self.server.token_s * len(_tokens(text)))
+            self._send_json({**message, "content": [{"type": "text", "text": text}],
+                             "stop_reason": "end_turn", "usage": usage})
+            return
+        events = [
+            ("message_start", {"type": "message_start", "message": message}),
+            ("content_block_start", {"type": "content_block_start", "index": 0,
+                                     "content_block": {"type": "text", "text": ""}}),
+        ]
+        events += [
+            ("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                     "delta": {"type": "text_delta", "text": token}})
+            for token in _tokens(text)
+        ]
+        events += [
+            ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+            ("message_delta", {"type": "message_delta",
+                               "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                               "usage": {"output_tokens": usage["output_tokens"]}}),
+            ("message_stop", {"type": "message_stop"}),
+        ]
+        self._stream_sse(events, tokens=len(_tokens(text)))
+
+    def _gemini(self, text, streaming):
+        usage = {"promptTokenCount": 1200, "candidatesTokenCount": len(_tokens(text)),
+                 "totalTokenCount": 1200 + len(_tokens(text))}
+        if not streaming:
+            time.sleep(self.server.ttft_s + self.server.token_s * len(_tokens(text)))
+            self._send_json({"candidates": [{"content": {"parts": [{"text": text}]},
+                                             "finishReason": "STOP"}],
+                             "usageMetadata": usage})
+            return
+        events = [
+            (None, {"candidates": [{"content": {"role": "model", "parts": [{"text": token}]}}],
+                    "usageMetadata": {"promptTokenCount": 1200}})
+            for token in _tokens(text)
+        ]
+        events.append((None, {"candidates": [{"content": {"role": "model", "parts": [{"text": ""}]},
+                                              "finishReason": "STOP"}],
+                              "usageMetadata": usage}))
+        self._stream_sse(events, tokens=len(events) - 1)
+
+    def _ollama(self, text, streaming):
+        if not streaming:
+            time.sleep(self.server.ttft_s + self.server.token_s * len(_tokens(text)))
+            self._send_json({"model": MODEL, "response": text, "done": True,
+                             "prompt_eval_count": 1200, "eval_count": len(_tokens(text))})
+            return
+        self._start_chunked("application/x-ndjson")
+        time.sleep(self.server.ttft_s)
+        for token in _tokens(text):
+            self._write_chunk(json.dumps({"model": MODEL, "response": token, "done": False}) + "\n")
+            time.sleep(self.server.token_s)
+        self._write_chunk(json.dumps({"model": MODEL, "response": "", "done": True,
+                                      "prompt_eval_count": 1200,
+                                      "eval_count": len(_tokens(text))}) + "\n")
+        self._end_chunked()
+
+    # ----- transport -----
+
+    def _send_json(self, payload, status=200):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _start_chunked(self, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _write_chunk(self, text):
+        data = text.encode()
+        try:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            raise _ClientGone()
+
+    def _end_chunked(self):
+        try:
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _stream_sse(self, events, tokens):
+        self._start_chunked("text/event-stream")
+        time.sleep(self.server.ttft_s)
+        try:
+            for name, payload in events:
+                data = payload if isinstance(payload, str) else json.dumps(payload)
+                prefix = f"event: {name}\n" if name else ""
+                self._write_chunk(f"{prefix}data: {data}\n\n")
+                if tokens > 0:
+                    time.sleep(self.server.token_s)
+            self._end_chunked()
+        except _ClientGone:
+            self.close_connection = True
+
+    def handle_one_request(self):
+        try:
+            super().handle_one_request()
+        except _ClientGone:
+            self.close_connection = True
+
+
+class _ClientGone(Exception):
+    pass
+
+
+def make_interface(provider: str, server: StubServer):
+    from agent_core.core.impl.llm import LLMInterface
+    from agent_core.core.llm.google_gemini_client import GeminiClient
+
+    base = server.base
+    if provider == "openai":
+        os.environ["OPENAI_BASE_URL"] = f"{base}/openai"
+        llm = LLMInterface(provider="openai", model=MODEL, api_key="bench")
+    elif provider == "anthropic":
+        os.environ["ANTHROPIC_BASE_URL"] = f"{base}/anthropic"
+        llm = LLMInterface(provider="anthropic", model=MODEL, api_key="bench")
+    elif provider == "gemini":
+        llm = LLMInterface(provider="gemini", model=MODEL, api_key="bench")
+        llm._gemini_client = GeminiClient("bench", api_base=f"{base}/gemini")
+    elif provider == "remote":
+        llm = LLMInterface(provider="remote", model=MODEL, base_url=f"{base}/ollama")
+    else:
+        llm = LLMInterface(provider="byteplus", model=MODEL, api_key="bench", base_url=f"{base}/byteplus")
+    return llm
+
+
+async def time_to_action(llm) -> tuple:
+    """Stream one response; return (text, seconds to first token, to first action_name, to end)."""
+    from agent_core.core.impl.llm import IncrementalJSONParser
+
+    parser = IncrementalJSONParser()
+    start = time.perf_counter()
+    first = action = None
+    parts = []
+    async for delta in llm.generate_response_stream("system", "Summarise the meeting", log_response=False):
+        first = first if first is not None else time.perf_counter() - start
+        parts.append(delta)
+        if action is None and any(path[-1:] == ("action_name",) for path, _ in parser.feed(delta)):
+            action = time.perf_counter() - start
+    return "".join(parts), first, action, time.perf_counter() - start
+
+
+async def bench_provider(provider: str, server: StubServer, runs: int) -> bool:
+    llm = make_interface(provider, server)
+    ok = True
+
+    llm.streaming_enabled = False
+    blocking = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        blocking_text = await llm.generate_response_async("system", "Summarise the meeting", log_response=False)
+        blocking.append(time.perf_counter() - start)
+
+    llm.streaming_enabled = True
+    before = dict(server.requests)
+    firsts, actions, totals = [], [], []
+    for _ in range(runs):
+        text, first, action, total = await time_to_action(llm)
+        firsts.append(first)
+        actions.append(action)
+        totals.append(total)
+    streamed_requests = server.requests["stream"] - before["stream"]
+    fallbacks = server.requests["blocking"] - before["blocking"]
+
+    streamed_text = await llm.generate_response_async("system", "Summarise the meeting", log_response=False)
+    same = json.loads(streamed_text) == json.loads(blocking_text) == DECISION
+    ok &= same and streamed_requests == runs and fallbacks == 0
+
+    def avg(xs):
+        return sum(xs) / len(xs) * 1000
+
+    print(
+        f"  {provider:<10} blocking {avg(blocking):7.0f} ms | stream: first token {avg(firsts):6.0f} ms, "
+        f"action_name {avg(actions):6.0f} ms, done {avg(totals):6.0f} ms | "
+        f"same text: {'yes' if same else 'NO'} | native streams {streamed_requests}, fallbacks {fallbacks}"
+    )
+
+    # A stream rejected before its first token falls back to the blocking call
+    server.fail_streams = True
+    try:
+        text = await llm.generate_response_async("system", "Summarise the meeting", log_response=False)
+        fallback_ok = json.loads(text) == DECISION
+    except Exception as e:
+        fallback_ok = False
+        print(f"    fallback failed: {type(e).__name__}: {e}")
+    finally:
+        server.fail_streams = False
+    if not fallback_ok:
+        print(f"    {provider}: stream failure did NOT fall back to the blocking call")
+    return ok and fallback_ok
+
+
+async def bench_router_abort(server: StubServer) -> bool:
+    """A GUI decision with an unknown action name is cut off right after the name."""
+    from agent_core.core.impl.action.router import ActionRouter
+
+    class Library:
+        def retrieve_action(self, action_name):
+            return None
+
+    llm = make_interface("openai", server)
+    router = ActionRouter(Library(), llm, context_engine=None)
+    server.response_text = json.dumps(INVALID_GUI_DECISION)
+    try:
+        tokens = len(_tokens(server.response_text))
+        start = time.perf_counter()
+        raw, decision = await router._stream_decision("system", "click", stop_on_invalid_action=True)
+        elapsed = time.perf_counter() - start
+        full = server.ttft_s + tokens * server.token_s
+    finally:
+        server.response_text = json.dumps(DECISION)
+    ok = decision is not None and decision.get("action_name") == INVALID_GUI_DECISION["action_name"]
+    print(
+        f"  invalid GUI action rejected after {elapsed * 1000:.0f} ms "
+        f"(full response ~{full * 1000:.0f} ms, {len(raw)}/{len(server.response_text)} chars read) "
+        f"-> {decision}"
+    )
+    return ok
+
+
+async def main_async(args) -> int:
+    from agent_core.core.impl.llm import get_latency_metrics
+
+    server = StubServer(args.ttft_ms / 1000, args.token_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    tokens = len(_tokens(json.dumps(DECISION)))
+    print(
+        f"Stub provider: first token after {args.ttft_ms:.0f} ms, then {tokens} tokens "
+        f"every {args.token_ms:.0f} ms; {args.runs} runs per mode"
+    )
+
+    ok = True
+    for provider in PROVIDERS:
+        ok &= await bench_provider(provider, server, args.runs)
+    ok &= await bench_router_abort(server)
+
+    print(get_latency_metrics().get_summary())
+    server.shutdown()
+    print("All checks passed" if ok else "SOME CHECKS FAILED")
+    return 0 if ok else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streamed LLM responses against local stub APIs")
+    parser.add_argument("--ttft-ms", type=float, default=400.0, help="Simulated time to first token")
+    parser.add_argument("--token-ms", type=float, default=15.0, help="Simulated time per output token")
+    parser.add_argument("--runs", type=int, default=3, help="Calls per provider and mode")
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    os.environ.setdefault("LLM_STREAMING", "1")
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark concurrent MCP tool calls over the stdio transport.
+
+Starts a local stub MCP server (this script with ``--serve``) whose ``sleep``
+tool answers after a fixed delay, possibly out of order, then issues N
+concurrent ``MCPClient.call_tool`` calls against it. With a multiplexed
+transport the wall time approaches one tool delay; with one request in
+flight per server it grows linearly with N.
+
+The stub also emits a notification before each response so notification
+handling is exercised on the hot path.
+
+Usage:
+    python scripts/bench_mcp_stdio.py                     # 32 calls, 50 ms tool
+    python scripts/bench_mcp_stdio.py --calls 128 --delay-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SERVER_NAME = "bench_stub"
+
+
+# ───────────────────────── Stub MCP server ─────────────────────────
+
+def serve() -> None:
+    """Minimal MCP server: initialize, tools/list, tools/call (threaded, unordered replies)."""
+    write_lock = threading.Lock()
+
+    def send(message: dict) -> None:
+        with write_lock:
+            sys.stdout.write(json.dumps(message) + "\n")
+            sys.stdout.flush()
+
+    def call_tool(request: dict) -> None:
+        arguments = request.get("params", {}).get("arguments", {})
+        time.sleep(arguments.get("delay_ms", 0) / 1000)
+        send({"jsonrpc": "2.0", "method": "notifications/message", "params": {"level": "debug", "data": "done"}})
+        send({
+            "jsonrpc": "2.0",
+            "id": request["id"],
+            "result": {"content": [{"type": "text", "text": f"slept {arguments.get('delay_ms', 0)} ms"}]},
+        })
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        method = request.get("method")
+        if "id" not in request:
+            continue  # notifications (initialized, cancelled)
+        if method == "initialize":
+            send({"jsonrpc": "2.0", "id": request["id"], "result": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": SERVER_NAME, "version": "1.0.0"},
+            }})
+        elif method == "tools/list":
+            send({"jsonrpc": "2.0", "id": request["id"], "result": {"tools": [{
+                "name": "sleep",
+                "description": "Sleep for delay_ms milliseconds",
+                "inputSchema": {"type": "object", "properties": {"delay_ms": {"type": "integer"}}},
+            }]}})
+        elif method == "tools/call":
+            threading.Thread(target=call_tool, args=(request,), daemon=True).start()
+        else:
+            send({"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32601, "message": "Method not found"}})
+
+
+# ───────────────────────── Benchmark ─────────────────────────
+
+async def bench(calls: int, delay_ms: int) -> None:
+    from agent_core.core.impl.mcp import mcp_client
+
+    with tempfile.TemporaryDirectory(prefix="bench_mcp_") as tmpdir:
+        config_path = Path(tmpdir) / "mcp_config.json"
+        config_path.write_text(json.dumps({"mcp_servers": [{
+            "name": SERVER_NAME,
+            "transport": "stdio",
+            "command": sys.executable,
+            "args": [str(Path(__file__).resolve()), "--serve"],
+        }]}), encoding="utf-8")
+
+        await mcp_client.initialize(config_path)
+        if SERVER_NAME not in mcp_client.servers:
+            print("Stub MCP server failed to start")
+            return
+
+        try:
+            arguments = {"delay_ms": delay_ms}
+
+            start = time.perf_counter()
+            for _ in range(min(calls, 8)):
+                await mcp_client.call_tool(SERVER_NAME, "sleep", arguments)
+            sequential = (time.perf_counter() - start) / min(calls, 8) * calls
+
+            start = time.perf_counter()
+            results = await asyncio.gather(*[
+                mcp_client.call_tool(SERVER_NAME, "sleep", arguments) for _ in range(calls)
+            ])
+            concurrent = time.perf_counter() - start
+            failures = sum(1 for r in results if r.get("status") != "success")
+        finally:
+            await mcp_client.disconnect_all()
+
+    print(f"Calls: {calls}  tool delay: {delay_ms} ms")
+    print(f"  sequential (extrapolated) : {sequential * 1000:9.1f} ms")
+    print(f"  concurrent                : {concurrent * 1000:9.1f} ms")
+    print(f"  speedup                   : {sequential / concurrent:9.2f}x")
+    if failures:
+        print(f"  WARNING: {failures} call(s) failed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent MCP stdio tool calls")
+    parser.add_argument("--calls", type=int, default=32, help="Concurrent tool calls")
+    parser.add_argument("--delay-ms", type=int, default=50, help="Stub tool latency")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve()
+        return
+    asyncio.run(bench(args.calls, args.delay_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark platform HTTP clients against a local stub server.
+
+The stub server speaks HTTP/1.1 with keep-alive, counts the connections it
+accepts and delays each new connection by ``--handshake-ms`` to stand in for
+the TCP + TLS handshake a real API costs. Compares, for ``--requests``
+sequential requests made from async code:
+
+- a new AsyncClient per request (previous Telegram / GitHub / Jira pattern)
+- module-level ``httpx.get()`` called inside a coroutine (previous Discord /
+  Slack pattern), which blocks the event loop
+- the shared per-platform AsyncClient (``get_async_client``)
+- the shared sync Client from a worker thread (``get_sync_client`` via
+  ``asyncio.to_thread``), as platform ``send_message`` now does
+
+reporting wall time, connections opened and how long the event loop was
+blocked (measured by a ticker task that should wake every millisecond).
+
+Usage:
+    python scripts/bench_platform_http.py
+    python scripts/bench_platform_http.py --requests 500 --handshake-ms 50
+"""
+
+import argparse
+import asyncio
+import logging
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.external_comms.http import close_http_clients, get_async_client, get_sync_client
+
+TICK_S = 0.001
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, handshake_s: float, latency_s: float):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.handshake_s = handshake_s
+        self.latency_s = latency_s
+        self.connections = 0
+        self._count_lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/api"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server._count_lock:
+            self.server.connections += 1
+        time.sleep(self.server.handshake_s)
+
+    def do_GET(self):
+        time.sleep(self.server.latency_s)
+        body = b'{"ok": true}'
+        self.wfile.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+        )
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def measure(name: str, server: StubServer, requests: int, make_request) -> None:
+    """Run ``requests`` sequential requests while a ticker measures event-loop stalls."""
+    stalls = []
+    running = True
+
+    async def ticker():
+        while running:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK_S)
+            late = time.perf_counter() - start - TICK_S
+            if late > 0.002:
+                stalls.append(late)
+
+    tick_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    server.connections = 0
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await make_request()
+        assert response.status_code == 200
+        # Give the ticker a turn even when make_request never yields
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    running = False
+    await tick_task
+
+    print(
+        f"  {name:<28}: {elapsed * 1000:8.1f} ms ({elapsed / requests * 1000:5.2f} ms/req) | "
+        f"connections {server.connections:5d} | loop blocked {sum(stalls) * 1000:8.1f} ms "
+        f"(max {max(stalls, default=0) * 1000:5.1f} ms)"
+    )
+
+
+async def main_async(args) -> None:
+    server = StubServer(args.handshake_ms / 1000, args.latency_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = server.url
+    print(
+        f"{args.requests} sequential requests, stub handshake {args.handshake_ms:.0f} ms, "
+        f"latency {args.latency_ms:.0f} ms"
+    )
+
+    async def client_per_request():
+        async with httpx.AsyncClient() as client:
+            return await client.get(url)
+
+    async def sync_in_coroutine():
+        return httpx.get(url)
+
+    async def shared_async():
+        return await get_async_client("bench").get(url)
+
+    async def shared_sync_in_thread():
+        return await asyncio.to_thread(get_sync_client("bench").get, url)
+
+    await measure("AsyncClient per request", server, args.requests, client_per_request)
+    await measure("httpx.get() in coroutine", server, args.requests, sync_in_coroutine)
+    await measure("shared AsyncClient", server, args.requests, shared_async)
+    await measure("shared Client in to_thread", server, args.requests, shared_sync_in_thread)
+
+    await close_http_clients()
+    server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark platform HTTP clients against a local stub server")
+    parser.add_argument("--requests", type=int, default=200, help="Sequential requests per scenario")
+    parser.add_argument("--handshake-ms", type=float, default=30.0, help="Simulated connection setup cost")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated server processing time")
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
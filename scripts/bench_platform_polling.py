@@ -0,0 +1,476 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Check and benchmark the GitHub / Jira / Gmail watchers against a local stub API.
+
+The stub server implements just enough of each API for the watchers:
+GitHub ``/notifications`` (``since``, ETag / Last-Modified -> 304), Jira
+``/search/jql`` (``updated >= "..."`` in the user's time zone, oldest first)
+and the Gmail History API (``startHistoryId``, paging, 404 for expired IDs).
+Poll intervals are scaled down by ``--scale`` so minutes of polling run in
+seconds. For each platform it:
+
+- counts requests over an idle period, fixed interval vs adaptive
+- injects bursts of events and measures how long until they are dispatched
+- answers one poll with 429 / exhausted rate limit and checks the wait
+- stops the watcher, injects events, starts a fresh client and checks that
+  exactly the missed events are dispatched (cursors persisted to disk)
+
+Usage:
+    python scripts/bench_platform_polling.py
+    python scripts/bench_platform_polling.py --scale 0.02 --idle 20
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.external_comms import credentials, polling
+from app.external_comms.http import close_http_clients
+from app.external_comms.platforms import github, google_workspace, jira
+
+JIRA_TZ = "America/New_York"
+
+
+def iso_z(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def jira_time(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+# ------------------------------------------------------------------
+# Stub API
+# ------------------------------------------------------------------
+
+class StubState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.not_modified: Dict[str, int] = {}
+        self.request_times: Dict[str, List[float]] = {}
+        self.throttle: Dict[str, float] = {}   # platform -> seconds to ask for on the next poll
+        # GitHub: notification threads
+        self.notifications: Dict[str, Dict[str, Any]] = {}
+        # Jira: issues
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        # Gmail: history records and messages
+        self.history: List[Dict[str, Any]] = []
+        self.history_id = 1000
+        self.oldest_history_id = 1000
+        self.injected_at: Dict[str, float] = {}
+
+    def count(self, platform: str, status: int) -> None:
+        self.requests[platform] = self.requests.get(platform, 0) + 1
+        self.request_times.setdefault(platform, []).append(time.monotonic())
+        if status == 304:
+            self.not_modified[platform] = self.not_modified.get(platform, 0) + 1
+
+    # Event injection
+    def add_notification(self, thread_id: str) -> str:
+        now = datetime.now(timezone.utc)
+        with self.lock:
+            self.notifications[thread_id] = {
+                "id": thread_id,
+                "updated_at": iso_z(now),
+                "reason": "mention",
+                "subject": {"type": "Issue", "title": f"Thread {thread_id}", "url": ""},
+                "repository": {"full_name": "octo/repo"},
+            }
+            self.injected_at[f"github:{thread_id}"] = time.monotonic()
+        return thread_id
+
+    def add_issue(self, key: str) -> str:
+        now = datetime.now(timezone.utc)
+        with self.lock:
+            self.issues[key] = {
+                "key": key,
+                "fields": {"summary": f"Issue {key}", "updated": jira_time(now), "labels": [], "comment": {"comments": []}},
+            }
+            self.injected_at[f"jira:{key}"] = time.monotonic()
+        return key
+
+    def add_email(self, msg_id: str) -> str:
+        with self.lock:
+            self.history_id += 1
+            self.history.append({
+                "id": str(self.history_id),
+                "messagesAdded": [{"message": {"id": msg_id, "labelIds": ["INBOX"]}}],
+            })
+            self.injected_at[f"google_workspace:{msg_id}"] = time.monotonic()
+        return msg_id
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, state: StubState):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.state = state
+        self.started = datetime.now(timezone.utc).replace(microsecond=0)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, platform: str, status: int, body: Any = None, headers: Dict[str, str] = None) -> None:
+        self.server.state.count(platform, status)
+        payload = b"" if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _throttled(self, platform: str) -> bool:
+        state = self.server.state
+        with state.lock:
+            delay = state.throttle.pop(platform, None)
+        if delay is None:
+            return False
+        if platform == "github":
+            reset = str(int(time.time() + delay) + 1)
+            self._send(platform, 403, {"message": "API rate limit exceeded"},
+                       {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+        else:
+            self._send(platform, 429, {"message": "Too many requests"}, {"Retry-After": f"{delay:.2f}"})
+        return True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        if url.path == "/github/user":
+            return self._send("setup", 200, {"login": "octocat", "id": 1})
+        if url.path == "/github/notifications":
+            return self._github_notifications(query)
+        if url.path == "/jira/rest/api/3/myself":
+            return self._send("setup", 200, {"accountId": "acc-1", "displayName": "Stub", "timeZone": JIRA_TZ})
+        if url.path == "/gmail/v1/users/me/profile":
+            return self._send("setup", 200, {"emailAddress": "me@example.com", "historyId": str(self.server.state.history_id)})
+        if url.path == "/gmail/v1/users/me/history":
+            return self._gmail_history(query)
+        if url.path.startswith("/gmail/v1/users/me/messages/"):
+            msg_id = url.path.rsplit("/", 1)[1]
+            return self._send("fetch", 200, {
+                "id": msg_id, "threadId": msg_id, "snippet": "hi",
+                "payload": {"headers": [{"name": "From", "value": "Sender <s@example.com>"}, {"name": "Subject", "value": msg_id}]},
+            })
+        self._send("other", 404, {"message": "not found"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if url.path == "/jira/rest/api/3/search/jql":
+            return self._jira_search(body)
+        self._send("other", 404, {"message": "not found"})
+
+    def _github_notifications(self, query: Dict[str, str]) -> None:
+        if self._throttled("github"):
+            return
+        state = self.server.state
+        with state.lock:
+            items = [n for n in state.notifications.values() if n["updated_at"] >= query.get("since", "")]
+        items.sort(key=lambda n: n["updated_at"], reverse=True)
+        per_page = int(query.get("per_page", 50))
+        items = items[:per_page]
+        body = json.dumps(items).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        newest = max((n["updated_at"] for n in state.notifications.values()), default=None)
+        modified = datetime.strptime(newest, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc) if newest else self.server.started
+        headers = {"ETag": etag, "Last-Modified": format_datetime(modified, usegmt=True)}
+
+        if self.headers.get("If-None-Match") == etag:
+            return self._send("github", 304, None, headers)
+        since_header = self.headers.get("If-Modified-Since")
+        if since_header and not self.headers.get("If-None-Match") and parsedate_to_datetime(since_header) >= modified:
+            return self._send("github", 304, None, headers)
+        self._send("github", 200, items, headers)
+
+    def _jira_search(self, body: Dict[str, Any]) -> None:
+        if self._throttled("jira"):
+            return
+        state = self.server.state
+        jql = body.get("jql", "")
+        since_local = jql.split('updated >= "', 1)[1].split('"', 1)[0]
+        since = datetime.strptime(since_local, "%Y-%m-%d %H:%M").replace(tzinfo=ZoneInfo(JIRA_TZ))
+        with state.lock:
+            issues = [
+                i for i in state.issues.values()
+                if datetime.strptime(i["fields"]["updated"], "%Y-%m-%dT%H:%M:%S.%f%z") >= since
+            ]
+        issues.sort(key=lambda i: i["fields"]["updated"])
+        page = issues[: body.get("maxResults", 50)]
+        result = {"issues": page}
+        if len(issues) > len(page):
+            result["nextPageToken"] = "next"
+        self._send("jira", 200, result)
+
+    def _gmail_history(self, query: Dict[str, str]) -> None:
+        if self._throttled("google_workspace"):
+            return
+        state = self.server.state
+        start = int(query["startHistoryId"])
+        if start < state.oldest_history_id:
+            return self._send("google_workspace", 404, {"error": {"code": 404}})
+        offset = int(query.get("pageToken", 0))
+        with state.lock:
+            records = [r for r in state.history if int(r["id"]) > start]
+            current = state.history_id
+        page = records[offset: offset + 2]
+        result: Dict[str, Any] = {"historyId": str(current)}
+        if page:
+            result["history"] = page
+        if len(records) > offset + 2:
+            result["nextPageToken"] = str(offset + 2)
+        self._send("google_workspace", 200, result)
+
+
+# ------------------------------------------------------------------
+# Harness
+# ------------------------------------------------------------------
+
+PLATFORMS = {
+    "github": (github, github.GitHubClient),
+    "jira": (jira, jira.JiraClient),
+    "google_workspace": (google_workspace, google_workspace.GoogleWorkspaceClient),
+}
+DEFAULT_INTERVALS = {
+    name: (module.POLL_INTERVAL, module.MAX_POLL_INTERVAL, module.RETRY_DELAY)
+    for name, (module, _) in PLATFORMS.items()
+}
+
+
+def configure(scale: float, adaptive: bool) -> None:
+    for name, (module, _) in PLATFORMS.items():
+        low, high, retry = DEFAULT_INTERVALS[name]
+        module.POLL_INTERVAL = low * scale
+        module.MAX_POLL_INTERVAL = (high if adaptive else low) * scale
+        module.RETRY_DELAY = retry * scale
+
+
+class Listener:
+    def __init__(self, state: StubState):
+        self.state = state
+        self.dispatched: List[str] = []
+        self.latency: Dict[str, List[float]] = {}
+
+    def callback_for(self, platform: str):
+        async def callback(msg) -> None:
+            key = msg.raw.get("key") if platform == "jira" else msg.message_id
+            event = f"{platform}:{key}"
+            self.dispatched.append(event)
+            injected = self.state.injected_at.get(event)
+            if injected is not None:
+                self.latency.setdefault(platform, []).append(time.monotonic() - injected)
+        return callback
+
+
+async def start_clients(listener: Listener) -> Dict[str, Any]:
+    clients = {}
+    for name, (_, cls) in PLATFORMS.items():
+        client = cls()
+        await client.start_listening(listener.callback_for(name))
+        clients[name] = client
+    return clients
+
+
+async def stop_clients(clients: Dict[str, Any]) -> None:
+    for client in clients.values():
+        await client.stop_listening()
+
+
+def save_stub_credentials(base_url: str) -> None:
+    credentials.save_credential(github.CREDENTIAL_FILE, github.GitHubCredential(access_token="x"))
+    credentials.save_credential(jira.CREDENTIAL_FILE, jira.JiraCredential(domain=f"{base_url}/jira", email="e", api_token="t"))
+    credentials.save_credential(
+        google_workspace.CREDENTIAL_FILE,
+        google_workspace.GoogleCredential(access_token="x", email="me@example.com"),
+    )
+
+
+def reset_cursor_store(directory: Path) -> None:
+    # A fresh process: nothing cached, cursors (if any) only on disk
+    for path in directory.glob(polling.CURSOR_FILE):
+        path.unlink()
+    polling._cursor_cache = None
+
+
+async def idle_requests(state: StubState, args, adaptive: bool, directory: Path) -> Dict[str, int]:
+    configure(args.scale, adaptive)
+    reset_cursor_store(directory)
+    listener = Listener(state)
+    clients = await start_clients(listener)
+    state.requests.clear()
+    state.not_modified.clear()
+    await asyncio.sleep(args.idle)
+    counts = dict(state.requests)
+    not_modified = dict(state.not_modified)
+    await stop_clients(clients)
+    label = "adaptive" if adaptive else "fixed"
+    simulated_min = args.idle / args.scale / 60
+    for name in PLATFORMS:
+        print(
+            f"  {label:<8} {name:<17}: {counts.get(name, 0):4d} requests in {simulated_min:.0f} simulated min "
+            f"({not_modified.get(name, 0)} answered 304)"
+        )
+    return counts
+
+
+async def bursts(state: StubState, args, directory: Path) -> List[str]:
+    configure(args.scale, adaptive=True)
+    reset_cursor_store(directory)
+    listener = Listener(state)
+    clients = await start_clients(listener)
+    # Let the pollers back off to their idle interval first
+    await asyncio.sleep(args.idle / 2)
+    expected = []
+    for burst in range(3):
+        for i in range(4):
+            expected.append(f"github:{state.add_notification(f'b{burst}-{i}')}")
+            expected.append(f"jira:{state.add_issue(f'B-{burst * 10 + i}')}")
+            expected.append(f"google_workspace:{state.add_email(f'm{burst}-{i}')}")
+            await asyncio.sleep(args.scale * 2)
+        await asyncio.sleep(args.idle / 4)
+    await stop_clients(clients)
+
+    for name in PLATFORMS:
+        latency = listener.latency.get(name, [])
+        idle_s = DEFAULT_INTERVALS[name][1]
+        print(
+            f"  {name:<17}: {len(latency):2d} dispatched | latency median "
+            f"{statistics.median(latency) / args.scale:6.1f} s, max {max(latency) / args.scale:6.1f} s "
+            f"(simulated; idle interval {idle_s} s)"
+        )
+    missing = sorted(set(expected) - set(listener.dispatched))
+    duplicates = len(listener.dispatched) - len(set(listener.dispatched))
+    assert not missing, f"not dispatched: {missing}"
+    assert not duplicates, f"{duplicates} duplicate dispatches"
+    return listener.dispatched
+
+
+async def throttling(state: StubState, args, directory: Path) -> None:
+    configure(args.scale, adaptive=True)
+    listener = Listener(state)
+    clients = await start_clients(listener)
+    await asyncio.sleep(args.scale * 20)
+    wait = max(DEFAULT_INTERVALS[name][1] for name in PLATFORMS) * args.scale * 2
+    with state.lock:
+        for name in PLATFORMS:
+            state.throttle[name] = wait
+            state.request_times[name] = []
+    await asyncio.sleep(wait * 2.5)
+    await stop_clients(clients)
+    for name in PLATFORMS:
+        times = state.request_times[name]
+        gap = times[1] - times[0] if len(times) > 1 else float("nan")
+        print(f"  {name:<17}: asked to wait {wait:.2f}s, next poll after {gap:.2f}s")
+        assert gap >= wait * 0.95, f"{name} polled {gap:.2f}s after being asked to wait {wait:.2f}s"
+
+
+async def restart(state: StubState, args, directory: Path) -> None:
+    configure(args.scale, adaptive=True)
+    listener = Listener(state)
+    clients = await start_clients(listener)
+    state.add_notification("r-before")
+    state.add_issue("R-1")
+    state.add_email("r-before")
+    await asyncio.sleep(max(DEFAULT_INTERVALS[name][0] for name in PLATFORMS) * args.scale * 4)
+    await stop_clients(clients)
+    before = list(listener.dispatched)
+
+    # Events while the watchers are down
+    missed = [
+        f"github:{state.add_notification('r-missed')}",
+        f"jira:{state.add_issue('R-2')}",
+        f"google_workspace:{state.add_email('r-missed')}",
+    ]
+    polling._cursor_cache = None  # New process: cursors come from disk
+    listener = Listener(state)
+    clients = await start_clients(listener)
+    await asyncio.sleep(max(DEFAULT_INTERVALS[name][0] for name in PLATFORMS) * args.scale * 4)
+    await stop_clients(clients)
+    print(f"  before restart dispatched {sorted(before)}")
+    print(f"  after restart dispatched  {sorted(listener.dispatched)}")
+    assert sorted(listener.dispatched) == sorted(missed), "restart should dispatch exactly the missed events"
+
+    # Expired Gmail historyId: reset instead of failing every poll
+    state.add_email("r-expired")
+    state.oldest_history_id = state.history_id
+    polling._cursor_cache = None
+    listener = Listener(state)
+    clients = await start_clients(listener)
+    await asyncio.sleep(DEFAULT_INTERVALS["google_workspace"][0] * args.scale * 4)
+    poller_stats = clients["google_workspace"]._poller.stats()
+    await stop_clients(clients)
+    print(f"  expired historyId: {poller_stats['errors']} poll errors, history id now {clients['google_workspace']._history_id}")
+    assert poller_stats["errors"] == 0
+
+
+async def main_async(args) -> None:
+    state = StubState()
+    server = StubServer(state)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    github.GITHUB_API = f"{server.url}/github"
+    google_workspace.GMAIL_API_BASE = f"{server.url}/gmail/v1"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        credentials._credentials_dir = directory
+        save_stub_credentials(server.url)
+        print(f"Intervals scaled by {args.scale} (1 simulated second = {args.scale * 1000:.0f} ms)\n")
+
+        print(f"Idle polling for {args.idle:.0f}s:")
+        fixed = await idle_requests(state, args, adaptive=False, directory=directory)
+        adaptive = await idle_requests(state, args, adaptive=True, directory=directory)
+        for name in PLATFORMS:
+            print(f"  {name:<17}: {fixed.get(name, 0) / max(adaptive.get(name, 0), 1):4.1f}x fewer requests")
+
+        print("\nBursts after idling:")
+        await bursts(state, args, directory)
+        print("\nRate limiting:")
+        await throttling(state, args, directory)
+        print("\nRestart with persisted cursors:")
+        await restart(state, args, directory)
+        await close_http_clients()
+    server.shutdown()
+    print("\nAll checks passed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and benchmark platform watchers against a local stub API")
+    parser.add_argument("--scale", type=float, default=0.01, help="Real seconds per simulated second")
+    parser.add_argument("--idle", type=float, default=10.0, help="Real seconds of idle polling per scenario")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark scheduler timers with many schedules.
+
+Compares, for ``--schedules`` timers whose deadlines fall on ``--distinct``
+instants spread over ``--spread`` seconds (so groups of schedules fire
+together):
+
+- one sleeping asyncio task per schedule (previous SchedulerManager)
+- the shared heap-based TimerService
+
+reporting setup time, memory, event-loop wakeups, CPU time and how late
+each timer fired. Then measures TimerService re-arm/cancel cost and runs
+SchedulerManager end-to-end with interval schedules.
+
+Usage:
+    python scripts/bench_scheduler_timers.py
+    python scripts/bench_scheduler_timers.py --schedules 10000 --distinct 100 --spread 3
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agent_core.utils.logger import logger
+from app.scheduler import SchedulerManager, TimerService
+
+# First deadline is this far out, so arming 10k timers does not make them late
+LEAD_S = 0.5
+
+
+def deadlines(count: int, distinct: int, spread: float, start: float) -> List[float]:
+    instants = [start + LEAD_S + spread * i / distinct for i in range(distinct)]
+    return [random.choice(instants) for _ in range(count)]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def report(name: str, setup_s: float, peak: int, wakeups: int, cpu_s: float, late_ms: List[float]) -> None:
+    print(
+        f"  {name:<15}: setup {setup_s * 1000:7.1f} ms | peak mem {peak / 1024:7.0f} KiB | "
+        f"wakeups {wakeups:6d} | cpu {cpu_s * 1000:7.1f} ms | "
+        f"late p50 {statistics.median(late_ms):6.2f} ms  p99 {percentile(late_ms, 0.99):6.2f} ms"
+    )
+
+
+async def per_schedule_tasks(args) -> None:
+    """Previous behaviour: one task per schedule sleeping until its deadline."""
+    late_ms: List[float] = []
+
+    async def loop(deadline: float) -> None:
+        await asyncio.sleep(deadline - time.time())
+        late_ms.append((time.time() - deadline) * 1000)
+
+    fire_times = deadlines(args.schedules, args.distinct, args.spread, time.time())
+    tracemalloc.start()
+    cpu = time.process_time()
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(loop(d)) for d in fire_times]
+    setup_s = time.perf_counter() - start
+    await asyncio.gather(*tasks)
+    cpu_s = time.process_time() - cpu
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report("task per sched", setup_s, peak, len(tasks), cpu_s, late_ms)
+
+
+async def heap_timer(args) -> None:
+    late_ms: List[float] = []
+    done = asyncio.Event()
+
+    async def dispatch(due, now) -> None:
+        fired = time.time()
+        late_ms.extend((fired - deadline) * 1000 for _, deadline in due)
+        if len(late_ms) >= args.schedules:
+            done.set()
+
+    timer = TimerService(dispatch)
+    fire_times = deadlines(args.schedules, args.distinct, args.spread, time.time())
+    tracemalloc.start()
+    cpu = time.process_time()
+    start = time.perf_counter()
+    for i, deadline in enumerate(fire_times):
+        timer.schedule(f"s{i}", deadline)
+    timer.start()
+    setup_s = time.perf_counter() - start
+    await done.wait()
+    cpu_s = time.process_time() - cpu
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await timer.stop()
+    report("heap timer", setup_s, peak, timer.stats()["wakeups"], cpu_s, late_ms)
+    print(f"  {'':<15}  batches {timer.stats()['batches']} (avg {args.schedules / timer.stats()['batches']:.0f} timers each)")
+
+
+async def heap_operations(args) -> None:
+    async def dispatch(due, now) -> None:
+        pass
+
+    timer = TimerService(dispatch)
+    now = time.time()
+    keys = [f"s{i}" for i in range(args.schedules)]
+    for key in keys:
+        timer.schedule(key, now + random.uniform(60, 3600))
+
+    start = time.perf_counter()
+    for key in keys:
+        timer.schedule(key, now + random.uniform(60, 3600))
+    rearm_us = (time.perf_counter() - start) / len(keys) * 1e6
+
+    start = time.perf_counter()
+    for key in keys[: len(keys) // 2]:
+        timer.cancel(key)
+    cancel_us = (time.perf_counter() - start) / (len(keys) // 2) * 1e6
+
+    print(
+        f"  re-arm {rearm_us:.2f} us/op | cancel {cancel_us:.2f} us/op | "
+        f"heap after cancelling half: {timer.stats()['heap_size']} entries for {len(timer)} armed"
+    )
+
+
+class CountingQueue:
+    def __init__(self):
+        self.count = 0
+
+    async def put(self, trigger, skip_merge: bool = False) -> None:
+        self.count += 1
+
+
+async def manager_end_to_end(args) -> None:
+    queue = CountingQueue()
+    manager = SchedulerManager()
+    # No config path: measure timers, not the config file rewrite per add
+    manager._trigger_queue = queue
+
+    start = time.perf_counter()
+    for i in range(args.schedules):
+        manager.add_schedule(
+            name=f"bench {i}",
+            instruction="noop",
+            schedule_expression=f"every {1 + i % 3} seconds",
+            schedule_id=f"bench{i}",
+        )
+    add_s = time.perf_counter() - start
+
+    cpu = time.process_time()
+    start = time.perf_counter()
+    await manager.start()
+    start_s = time.perf_counter() - start
+    await asyncio.sleep(args.duration)
+    cpu_s = time.process_time() - cpu
+    status = manager.get_status()
+    await manager.shutdown()
+
+    expected = sum(int(args.duration // (1 + i % 3)) for i in range(args.schedules))
+    print(
+        f"  add {args.schedules} schedules {add_s * 1000:.0f} ms | start {start_s * 1000:.1f} ms | "
+        f"fired {queue.count} (expected ~{expected}) in {args.duration:.0f}s | cpu {cpu_s * 1000:.0f} ms | "
+        f"{status['timer']['batches']} batches"
+    )
+
+
+async def main_async(args) -> None:
+    print(
+        f"Schedules: {args.schedules}, {args.distinct} distinct fire times over {args.spread}s "
+        f"(~{args.schedules // args.distinct} firing together)"
+    )
+    random.seed(0)
+    await per_schedule_tasks(args)
+    random.seed(0)
+    await heap_timer(args)
+    print("\nTimerService operations:")
+    await heap_operations(args)
+    print("\nSchedulerManager end-to-end (every 1-3 seconds):")
+    await manager_end_to_end(args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scheduler timers with many schedules")
+    parser.add_argument("--schedules", type=int, default=10000, help="Number of schedules")
+    parser.add_argument("--distinct", type=int, default=200, help="Distinct fire times")
+    parser.add_argument("--spread", type=float, default=2.0, help="Seconds over which fire times are spread")
+    parser.add_argument("--duration", type=float, default=6.0, help="End-to-end run time in seconds")
+    args = parser.parse_args()
+    logger.remove()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
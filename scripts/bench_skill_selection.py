@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark skill discovery and the skill selection prompt.
+
+Compares, with every skill in ``skills/`` enabled:
+
+- discovery: YAML-parsing every SKILL.md (previous behaviour) vs. building
+  the skill index (cold) vs. loading from an up-to-date index (warm)
+- selection prompt: listing every enabled skill vs. the BM25 top-K
+  prefilter, in prompt tokens, plus the local cost of the prefilter
+
+Usage:
+    python scripts/bench_skill_selection.py
+    python scripts/bench_skill_selection.py --top-k 8 --skills-dir skills
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agent_core.core.impl.skill.config import SkillsConfig
+from agent_core.core.impl.skill.index import SkillIndex
+from agent_core.core.impl.skill.loader import SkillLoader
+from agent_core.core.impl.skill.manager import SkillManager
+
+QUERIES = [
+    ("Quarterly deck", "Turn the attached sales figures into a 10-slide presentation for the board"),
+    ("Invoice", "Extract the totals from these PDF invoices and put them into a spreadsheet"),
+    ("Weekly digest", "Collect the latest AI news and email me a short summary every Monday"),
+    ("Fix CI", "The GitHub Actions workflow fails on the lint step, find out why and open a PR"),
+    ("Blog post", "Write an SEO-friendly blog post about our product launch and publish it to WordPress"),
+    ("Store sync", "Update product prices in our WooCommerce store from the supplier CSV"),
+    ("Meeting notes", "Summarize yesterday's meeting transcript and create follow-up tasks in Notion"),
+    ("Scrape", "Open the competitor pricing page in a browser and capture the plan table"),
+]
+
+
+def count_tokens(text: str) -> int:
+    try:
+        import tiktoken
+        return len(tiktoken.get_encoding("cl100k_base").encode(text))
+    except Exception:
+        return len(text) // 4
+
+
+def skills_text(skills) -> str:
+    return "\n".join(f"- {name}: {desc}" for name, desc in skills.items())
+
+
+def timed(fn, repeat: int = 1):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill discovery and selection prompts")
+    parser.add_argument("--skills-dir", type=Path, default=Path(__file__).resolve().parent.parent / "skills")
+    parser.add_argument("--top-k", type=int, default=SkillManager.PREFILTER_TOP_K)
+    args = parser.parse_args()
+
+    config = SkillsConfig(project_skills_dir=args.skills_dir)
+    dirs = config.get_search_directories()
+
+    # ── Discovery ──
+    legacy, legacy_s = timed(lambda: SkillLoader.discover_skills(dirs, config), repeat=3)
+    with tempfile.TemporaryDirectory(prefix="bench_skills_") as tmpdir:
+        index_path = Path(tmpdir) / "skills_index.json"
+        _, cold_s = timed(lambda: SkillLoader.discover_skills(dirs, config, SkillIndex(index_path)))
+        skills, warm_s = timed(lambda: SkillLoader.discover_skills(dirs, config, SkillIndex(index_path)), repeat=3)
+        index = SkillIndex(index_path)
+        index.load()
+        index_kb = index_path.stat().st_size / 1024
+
+    print(f"Skills: {len(legacy)} (all enabled)")
+    print(f"  discovery, parse every SKILL.md : {legacy_s * 1000:8.1f} ms")
+    print(f"  discovery, build index (cold)   : {cold_s * 1000:8.1f} ms")
+    print(f"  discovery, from index (warm)    : {warm_s * 1000:8.1f} ms   (index {index_kb:.0f} KiB)")
+    print(f"  instructions loaded after warm discovery: {sum(s.instructions_loaded for s in skills)}")
+
+    # ── Selection prompt ──
+    manager = SkillManager()
+    manager._skills = {skill.name: skill for skill in skills}
+    manager._index = index
+
+    full_tokens = count_tokens(skills_text({s.name: s.description for s in skills}))
+    filtered_tokens, prefilter_ms = [], []
+    print(f"\nSelection prompt (skill list only), top-k = {args.top_k}:")
+    for name, description in QUERIES:
+        query = f"{name}\n{description}"
+        selected, seconds = timed(lambda: manager.list_skills_for_selection(query, args.top_k), repeat=5)
+        filtered_tokens.append(count_tokens(skills_text(selected)))
+        prefilter_ms.append(seconds * 1000)
+        print(f"  {name:<15} -> {', '.join(list(selected)[:4])}")
+
+    print(f"\n  all enabled skills : {full_tokens:7d} tokens")
+    print(f"  prefiltered (avg)  : {statistics.mean(filtered_tokens):7.0f} tokens "
+          f"({statistics.mean(filtered_tokens) / full_tokens:.1%})")
+    print(f"  prefilter latency  : {statistics.mean(prefilter_ms):7.2f} ms avg")
+
+
+if __name__ == "__main__":
+    main()
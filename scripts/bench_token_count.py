@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark for event-stream token accounting.
+
+Compares per-event token counting (one tiktoken ``encode`` per record, the
+path taken by ``log()``) against the batched path used when restoring a
+session (``prime_token_counts``).
+
+Usage:
+    python scripts/bench_token_count.py                  # 10k events
+    python scripts/bench_token_count.py --events 50000   # custom size
+    python scripts/bench_token_count.py --repeat 5       # best of 5 runs
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agent_core.core.event_stream.event import Event, EventRecord
+from agent_core.core.impl.event_stream.event_stream import (
+    get_cached_token_count,
+    prime_token_counts,
+)
+
+KINDS = ["action_start", "action_end", "screen", "agent message", "user message", "system"]
+WORDS = (
+    "open browser click button type text read file write file search result "
+    "status success error retry window focus scroll page download upload task"
+).split()
+
+
+def make_records(count: int, seed: int = 0) -> List[EventRecord]:
+    """Build synthetic event records with a realistic spread of message sizes."""
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    records = []
+    for i in range(count):
+        length = rng.choice((8, 16, 32, 64, 256))
+        message = " ".join(rng.choice(WORDS) for _ in range(length))
+        event = Event(message=message, kind=rng.choice(KINDS), severity="INFO")
+        records.append(EventRecord(event=event, ts=base + timedelta(seconds=i)))
+    return records
+
+
+def per_event(records: List[EventRecord]) -> int:
+    return sum(get_cached_token_count(r) for r in records)
+
+
+def batched(records: List[EventRecord]) -> int:
+    return prime_token_counts(records)
+
+
+def run(fn: Callable[[List[EventRecord]], int], count: int, repeat: int) -> tuple:
+    """Return (best seconds, token total) over ``repeat`` runs on fresh records."""
+    best = float("inf")
+    total = 0
+    for _ in range(repeat):
+        records = make_records(count)
+        start = time.perf_counter()
+        total = fn(records)
+        best = min(best, time.perf_counter() - start)
+    return best, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark event token counting")
+    parser.add_argument("--events", type=int, default=10_000, help="Number of synthetic events")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant (best is reported)")
+    args = parser.parse_args()
+
+    # Warm up the tokenizer so encoding-load time is not attributed to either path
+    per_event(make_records(10))
+
+    single_s, single_tokens = run(per_event, args.events, args.repeat)
+    batch_s, batch_tokens = run(batched, args.events, args.repeat)
+
+    print(f"Events: {args.events:,}  (best of {args.repeat})")
+    print(f"  per-event : {single_s * 1000:9.1f} ms  {args.events / single_s:12,.0f} events/s")
+    print(f"  batched   : {batch_s * 1000:9.1f} ms  {args.events / batch_s:12,.0f} events/s")
+    print(f"  speedup   : {single_s / batch_s:9.2f}x")
+    if single_tokens != batch_tokens:
+        print(f"  WARNING: token totals differ ({single_tokens} vs {batch_tokens})")
+
+
+if __name__ == "__main__":
+    main()
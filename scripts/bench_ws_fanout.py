@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark browser websocket fan-out with one throttled client.
+
+Broadcasts a burst of chat-sized messages and footage frames to several
+in-memory clients, one of which takes ``--slow-ms`` per send (a backgrounded
+or badly connected tab). Compares the previous sequential fan-out (await
+each client in turn) with the per-client send queues used by BrowserAdapter,
+reporting how long the broadcaster is blocked and the delivery latency seen
+by the healthy clients.
+
+Usage:
+    python scripts/bench_ws_fanout.py
+    python scripts/bench_ws_fanout.py --clients 8 --messages 500 --slow-ms 20 --interval-ms 1
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.ui_layer.adapters.ws_fanout import ClientSendQueue
+
+
+class FakeWebSocket:
+    """Records delivery latency; optionally slow to accept each frame."""
+
+    def __init__(self, delay_s: float = 0.0):
+        self.delay_s = delay_s
+        self.latencies_ms: List[float] = []
+
+    async def send_str(self, data: str) -> None:
+        await asyncio.sleep(self.delay_s)
+        sent_at = json.loads(data)["sent_at"]
+        self.latencies_ms.append((time.perf_counter() - sent_at) * 1000)
+
+    async def close(self) -> None:
+        pass
+
+
+def make_clients(count: int, slow_ms: float) -> List[FakeWebSocket]:
+    return [FakeWebSocket(slow_ms / 1000)] + [FakeWebSocket() for _ in range(count - 1)]
+
+
+def message(i: int) -> Dict:
+    kind = "footage_update" if i % 5 == 0 else "chat_message"
+    return {"type": kind, "data": {"content": "x" * 200}, "sent_at": time.perf_counter()}
+
+
+async def sequential(clients: List[FakeWebSocket], count: int, interval_s: float) -> float:
+    """Previous behaviour: serialize once, await each client in turn."""
+    blocked = 0.0
+    for i in range(count):
+        start = time.perf_counter()
+        payload = json.dumps(message(i))
+        for ws in clients:
+            await ws.send_str(payload)
+        blocked += time.perf_counter() - start
+        await asyncio.sleep(interval_s)
+    return blocked
+
+
+async def queued(clients: List[FakeWebSocket], count: int, interval_s: float) -> float:
+    """Per-client send queues: broadcast only enqueues."""
+    senders = [ClientSendQueue(ws) for ws in clients]
+    blocked = 0.0
+    for i in range(count):
+        start = time.perf_counter()
+        msg = message(i)
+        payload = json.dumps(msg)
+        for sender in senders:
+            sender.enqueue(msg["type"], payload)
+        blocked += time.perf_counter() - start
+        await asyncio.sleep(interval_s)
+
+    # Wait for healthy clients to finish (the slow one may still be behind)
+    while any(s.pending for s in senders[1:]):
+        await asyncio.sleep(0.001)
+    for sender in senders:
+        sender.close()
+        await sender.wait_closed()
+    return blocked
+
+
+def report(name: str, clients: List[FakeWebSocket], blocked: float, count: int) -> None:
+    healthy = [lat for ws in clients[1:] for lat in ws.latencies_ms]
+    healthy.sort()
+    p50 = statistics.median(healthy) if healthy else 0.0
+    p99 = healthy[int(len(healthy) * 0.99) - 1] if healthy else 0.0
+    print(
+        f"  {name:<11}: broadcaster blocked {blocked * 1000:9.1f} ms total "
+        f"({blocked / count * 1e6:8.1f} us/msg) | healthy p50 {p50:8.2f} ms  p99 {p99:8.2f} ms "
+        f"| slow client got {len(clients[0].latencies_ms)}/{count}"
+    )
+
+
+async def main_async(args) -> None:
+    print(
+        f"Clients: {args.clients} (1 throttled at {args.slow_ms} ms/send)  "
+        f"messages: {args.messages} every {args.interval_ms} ms"
+    )
+    interval_s = args.interval_ms / 1000
+
+    clients = make_clients(args.clients, args.slow_ms)
+    blocked = await sequential(clients, args.messages, interval_s)
+    report("sequential", clients, blocked, args.messages)
+
+    clients = make_clients(args.clients, args.slow_ms)
+    blocked = await queued(clients, args.messages, interval_s)
+    report("queued", clients, blocked, args.messages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark websocket fan-out with a throttled client")
+    parser.add_argument("--clients", type=int, default=5, help="Connected clients (one is throttled)")
+    parser.add_argument("--messages", type=int, default=200, help="Messages to broadcast")
+    parser.add_argument("--slow-ms", type=float, default=10.0, help="Per-send delay of the throttled client")
+    parser.add_argument("--interval-ms", type=float, default=2.0, help="Delay between broadcasts")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()